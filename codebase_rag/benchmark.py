@@ -0,0 +1,657 @@
+from __future__ import annotations
+
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from multiprocessing import get_context
+from pathlib import Path
+
+from loguru import logger
+
+from . import constants as cs
+from . import logs as ls
+from .config import settings
+from .graph_updater import (
+    CompactFunctionRegistryTrie,
+    FunctionRegistryTrie,
+    GraphUpdater,
+)
+from .parallel import quiet_worker_logging
+from .parser_loader import load_parsers
+from .profiling import IndexProfiler, ProfileEvent, set_active_profiler
+from .types_defs import (
+    BenchmarkRegression,
+    NodeType,
+    PropertyDict,
+    PropertyValue,
+    QualifiedName,
+)
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+class CountingIngestor:
+    def __init__(self) -> None:
+        self.nodes = 0
+        self.relationships = 0
+        self.calls = 0
+
+    def ensure_node_batch(self, label: str, properties: PropertyDict) -> None:
+        self.nodes += 1
+
+    def ensure_relationship_batch(
+        self,
+        from_spec: tuple[str, str, PropertyValue],
+        rel_type: str,
+        to_spec: tuple[str, str, PropertyValue],
+        properties: PropertyDict | None = None,
+    ) -> None:
+        self.relationships += 1
+        if rel_type == cs.RelationshipType.CALLS:
+            self.calls += 1
+
+    def flush_all(self) -> None:
+        pass
+
+
+@dataclass
+class SyntheticRepoSpec:
+    name: str
+    modules: int
+    classes_per_module: int = 3
+    methods_per_class: int = 3
+    functions_per_module: int = 3
+    call_density: int = 2
+    inheritance_depth: int = 4
+    languages: dict[cs.SupportedLanguage, float] = field(
+        default_factory=lambda: {cs.SupportedLanguage.PYTHON: 1.0}
+    )
+    seed: int = 0
+
+
+SCENARIOS: dict[cs.BenchmarkScenario, SyntheticRepoSpec] = {
+    cs.BenchmarkScenario.PYTHON_SMALL: SyntheticRepoSpec(
+        name=cs.BenchmarkScenario.PYTHON_SMALL, modules=50
+    ),
+    cs.BenchmarkScenario.PYTHON_MEDIUM: SyntheticRepoSpec(
+        name=cs.BenchmarkScenario.PYTHON_MEDIUM, modules=300
+    ),
+    cs.BenchmarkScenario.MIXED: SyntheticRepoSpec(
+        name=cs.BenchmarkScenario.MIXED,
+        modules=300,
+        languages={
+            cs.SupportedLanguage.PYTHON: 0.5,
+            cs.SupportedLanguage.JS: 0.3,
+            cs.SupportedLanguage.JAVA: 0.2,
+        },
+    ),
+    cs.BenchmarkScenario.DEEP_INHERITANCE: SyntheticRepoSpec(
+        name=cs.BenchmarkScenario.DEEP_INHERITANCE,
+        modules=200,
+        inheritance_depth=25,
+    ),
+    cs.BenchmarkScenario.DENSE_CALLS: SyntheticRepoSpec(
+        name=cs.BenchmarkScenario.DENSE_CALLS,
+        modules=150,
+        call_density=10,
+    ),
+}
+
+
+@dataclass
+class _ModulePlan:
+    index: int
+    language: cs.SupportedLanguage
+    base_module: int | None
+    calls: list[list[tuple[int, int]]]
+
+
+def _plan_modules(spec: SyntheticRepoSpec) -> list[_ModulePlan]:
+    rng = random.Random(spec.seed)
+    languages = list(spec.languages)
+    assigned = rng.choices(
+        languages, weights=[spec.languages[lang] for lang in languages], k=spec.modules
+    )
+    groups: dict[cs.SupportedLanguage, list[int]] = defaultdict(list)
+    for index, language in enumerate(assigned):
+        groups[language].append(index)
+
+    plans: list[_ModulePlan] = []
+    for index, language in enumerate(assigned):
+        group = groups[language]
+        position = group.index(index)
+        # (H) Class 0 of each module extends class 0 of the previous module in
+        # (H) its language, restarting every `inheritance_depth` modules.
+        base_module = (
+            group[position - 1]
+            if position % max(spec.inheritance_depth, 1) != 0
+            else None
+        )
+        others = [other for other in group if other != index]
+        calls = [
+            [
+                (rng.choice(others), rng.randrange(spec.functions_per_module))
+                for _ in range(spec.call_density if others else 0)
+            ]
+            for _ in range(spec.classes_per_module * spec.methods_per_class)
+        ]
+        plans.append(_ModulePlan(index, language, base_module, calls))
+    return plans
+
+
+def _class_name(module: int, index: int) -> str:
+    return cs.BENCHMARK_CLASS_NAME.format(module=module, index=index)
+
+
+def _function_name(module: int, index: int) -> str:
+    return cs.BENCHMARK_FUNCTION_NAME.format(module=module, index=index)
+
+
+def _method_name(index: int) -> str:
+    return cs.BENCHMARK_METHOD_NAME.format(index=index)
+
+
+def _imports(plan: _ModulePlan) -> dict[int, set[str]]:
+    imports: dict[int, set[str]] = defaultdict(set)
+    if plan.base_module is not None:
+        imports[plan.base_module].add(_class_name(plan.base_module, 0))
+    for method_calls in plan.calls:
+        for module, function in method_calls:
+            imports[module].add(_function_name(module, function))
+    return imports
+
+
+def _render_python(spec: SyntheticRepoSpec, plan: _ModulePlan) -> str:
+    parts = [
+        cs.BENCHMARK_PY_IMPORT.format(
+            package=cs.BENCHMARK_PY_PACKAGE,
+            module=cs.BENCHMARK_PY_MODULE.format(module=module),
+            names=", ".join(sorted(names)),
+        )
+        for module, names in sorted(_imports(plan).items())
+    ]
+    for c in range(spec.classes_per_module):
+        name = _class_name(plan.index, c)
+        if c == 0 and plan.base_module is not None:
+            base = _class_name(plan.base_module, 0)
+            parts.append(cs.BENCHMARK_PY_CLASS.format(name=name, base=base))
+        else:
+            parts.append(cs.BENCHMARK_PY_ROOT_CLASS.format(name=name))
+        for m in range(spec.methods_per_class):
+            parts.append(cs.BENCHMARK_PY_METHOD.format(name=_method_name(m)))
+            for module, function in plan.calls[c * spec.methods_per_class + m]:
+                target = _function_name(module, function)
+                parts.append(cs.BENCHMARK_PY_CALL.format(target=target))
+            parts.append(cs.BENCHMARK_PY_METHOD_END.format(value=m))
+    for f in range(spec.functions_per_module):
+        parts.append(
+            cs.BENCHMARK_PY_FUNCTION.format(
+                name=_function_name(plan.index, f),
+                cls=_class_name(plan.index, f % spec.classes_per_module),
+                method=_method_name(f % spec.methods_per_class),
+            )
+        )
+    return "".join(parts)
+
+
+def _render_js(spec: SyntheticRepoSpec, plan: _ModulePlan) -> str:
+    parts = [
+        cs.BENCHMARK_JS_IMPORT.format(
+            module=cs.BENCHMARK_JS_MODULE.format(module=module),
+            names=", ".join(sorted(names)),
+        )
+        for module, names in sorted(_imports(plan).items())
+    ]
+    for c in range(spec.classes_per_module):
+        name = _class_name(plan.index, c)
+        if c == 0 and plan.base_module is not None:
+            base = _class_name(plan.base_module, 0)
+            parts.append(cs.BENCHMARK_JS_CLASS.format(name=name, base=base))
+        else:
+            parts.append(cs.BENCHMARK_JS_ROOT_CLASS.format(name=name))
+        for m in range(spec.methods_per_class):
+            parts.append(cs.BENCHMARK_JS_METHOD.format(name=_method_name(m)))
+            for module, function in plan.calls[c * spec.methods_per_class + m]:
+                target = _function_name(module, function)
+                parts.append(cs.BENCHMARK_JS_CALL.format(target=target))
+            parts.append(cs.BENCHMARK_JS_METHOD_END.format(value=m))
+        parts.append(cs.BENCHMARK_JS_CLASS_END)
+    for f in range(spec.functions_per_module):
+        parts.append(
+            cs.BENCHMARK_JS_FUNCTION.format(
+                name=_function_name(plan.index, f),
+                cls=_class_name(plan.index, f % spec.classes_per_module),
+                method=_method_name(f % spec.methods_per_class),
+            )
+        )
+    return "".join(parts)
+
+
+def _render_java(spec: SyntheticRepoSpec, plan: _ModulePlan) -> str:
+    parts = [cs.BENCHMARK_JAVA_PACKAGE_DECL.format(package=cs.BENCHMARK_JAVA_PACKAGE)]
+    for c in range(spec.classes_per_module):
+        name = _class_name(plan.index, c)
+        if c == 0 and plan.base_module is not None:
+            base = _class_name(plan.base_module, 0)
+            parts.append(cs.BENCHMARK_JAVA_CLASS.format(name=name, base=base))
+        else:
+            parts.append(cs.BENCHMARK_JAVA_ROOT_CLASS.format(name=name))
+        for m in range(spec.methods_per_class):
+            parts.append(cs.BENCHMARK_JAVA_METHOD.format(name=_method_name(m)))
+            for module, function in plan.calls[c * spec.methods_per_class + m]:
+                parts.append(
+                    cs.BENCHMARK_JAVA_CALL.format(
+                        module=cs.BENCHMARK_JAVA_MODULE.format(module=module),
+                        target=_function_name(module, function),
+                    )
+                )
+            parts.append(cs.BENCHMARK_JAVA_METHOD_END.format(value=m))
+        parts.append(cs.BENCHMARK_JAVA_CLASS_END)
+    parts.append(
+        cs.BENCHMARK_JAVA_MODULE_CLASS.format(
+            name=cs.BENCHMARK_JAVA_MODULE.format(module=plan.index)
+        )
+    )
+    for f in range(spec.functions_per_module):
+        parts.append(
+            cs.BENCHMARK_JAVA_FUNCTION.format(
+                name=_function_name(plan.index, f),
+                cls=_class_name(plan.index, f % spec.classes_per_module),
+                method=_method_name(f % spec.methods_per_class),
+            )
+        )
+    parts.append(cs.BENCHMARK_JAVA_CLASS_END)
+    return "".join(parts)
+
+
+def _module_path(root: Path, plan: _ModulePlan) -> Path:
+    match plan.language:
+        case cs.SupportedLanguage.JS:
+            name = cs.BENCHMARK_JS_MODULE.format(module=plan.index)
+            return root / cs.BENCHMARK_JS_DIR / f"{name}{cs.EXT_JS}"
+        case cs.SupportedLanguage.JAVA:
+            name = cs.BENCHMARK_JAVA_MODULE.format(module=plan.index)
+            return root / cs.BENCHMARK_JAVA_DIR / f"{name}{cs.EXT_JAVA}"
+        case _:
+            name = cs.BENCHMARK_PY_MODULE.format(module=plan.index)
+            return root / cs.BENCHMARK_PY_PACKAGE / f"{name}{cs.EXT_PY}"
+
+
+def generate_synthetic_repo(root: Path, spec: SyntheticRepoSpec) -> int:
+    renderers = {
+        cs.SupportedLanguage.PYTHON: _render_python,
+        cs.SupportedLanguage.JS: _render_js,
+        cs.SupportedLanguage.JAVA: _render_java,
+    }
+    plans = _plan_modules(spec)
+    package_init = root / cs.BENCHMARK_PY_PACKAGE / cs.INIT_PY
+    package_init.parent.mkdir(parents=True, exist_ok=True)
+    package_init.write_text("", encoding=cs.ENCODING_UTF8)
+    for plan in plans:
+        path = _module_path(root, plan)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(renderers[plan.language](spec, plan), encoding=cs.ENCODING_UTF8)
+    logger.info(
+        ls.BENCHMARK_GENERATED.format(files=len(plans), scenario=spec.name, path=root)
+    )
+    return len(plans)
+
+
+def _peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # (H) ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    return peak / cs.BYTES_PER_MB if sys.platform == "darwin" else peak / 1024
+
+
+class _PassProfiler(IndexProfiler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.peak_rss_mb: dict[str, float] = {}
+
+    def add(self, event: ProfileEvent) -> None:
+        super().add(event)
+        if event.category == cs.ProfileCategory.PASS:
+            self.peak_rss_mb[event.name] = _peak_rss_mb()
+
+
+@dataclass
+class PassMetrics:
+    wall_seconds: float
+    cpu_seconds: float
+    peak_rss_mb: float
+
+
+@dataclass
+class BenchmarkResult:
+    scenario: str
+    files: int
+    nodes: int
+    relationships: int
+    calls: int
+    passes: dict[str, PassMetrics] = field(default_factory=dict)
+
+    @property
+    def files_per_second(self) -> float:
+        return _rate(self.files, self.passes.get(cs.PROFILE_PASS_DEFINITIONS))
+
+    @property
+    def calls_per_second(self) -> float:
+        return _rate(self.calls, self.passes.get(cs.PROFILE_PASS_CALLS))
+
+    def to_dict(self) -> dict:
+        return asdict(self) | {
+            cs.BENCHMARK_KEY_FILES_PER_SECOND: self.files_per_second,
+            cs.BENCHMARK_KEY_CALLS_PER_SECOND: self.calls_per_second,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> BenchmarkResult:
+        data = {
+            key: value
+            for key, value in data.items()
+            if key
+            not in (
+                cs.BENCHMARK_KEY_FILES_PER_SECOND,
+                cs.BENCHMARK_KEY_CALLS_PER_SECOND,
+            )
+        }
+        passes = {
+            name: PassMetrics(**metrics)
+            for name, metrics in data.pop(cs.BENCHMARK_KEY_PASSES).items()
+        }
+        return cls(**data, passes=passes)
+
+
+def _rate(count: int, metrics: PassMetrics | None) -> float:
+    if metrics is None or metrics.wall_seconds <= 0:
+        return 0.0
+    return count / metrics.wall_seconds
+
+
+def _run_once(repo: Path, spec: SyntheticRepoSpec, workers: int) -> BenchmarkResult:
+    parsers, queries = load_parsers()
+    ingestor = CountingIngestor()
+    updater = GraphUpdater(
+        ingestor=ingestor,
+        repo_path=repo,
+        parsers=parsers,
+        queries=queries,
+        workers=workers,
+    )
+    profiler = _PassProfiler()
+    set_active_profiler(profiler)
+    try:
+        updater.run()
+    finally:
+        set_active_profiler(None)
+    return BenchmarkResult(
+        scenario=spec.name,
+        files=spec.modules,
+        nodes=ingestor.nodes,
+        relationships=ingestor.relationships,
+        calls=ingestor.calls,
+        passes={
+            name: PassMetrics(
+                wall_seconds=total.wall,
+                cpu_seconds=total.cpu,
+                peak_rss_mb=profiler.peak_rss_mb.get(name, 0.0),
+            )
+            for (category, name), total in profiler.totals.items()
+            if category == cs.ProfileCategory.PASS
+        },
+    )
+
+
+def run_benchmark(
+    spec: SyntheticRepoSpec, workers: int = 1, repeat: int = 1
+) -> BenchmarkResult:
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = Path(tmp) / cs.BENCHMARK_REPO_NAME
+        generate_synthetic_repo(repo, spec)
+        runs = [_run_once(repo, spec, workers) for _ in range(max(repeat, 1))]
+    # (H) Keep the fastest run of each pass; peak RSS only grows within a
+    # (H) process, so the first run's figures are the meaningful ones.
+    best = runs[0]
+    for name, metrics in best.passes.items():
+        metrics.wall_seconds = min(run.passes[name].wall_seconds for run in runs)
+        metrics.cpu_seconds = min(run.passes[name].cpu_seconds for run in runs)
+    return best
+
+
+def run_benchmark_isolated(
+    spec: SyntheticRepoSpec, workers: int = 1, repeat: int = 1
+) -> BenchmarkResult:
+    # (H) A fresh interpreter per scenario keeps peak RSS from leaking between
+    # (H) scenarios and from the harness itself.
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=get_context(cs.MP_START_METHOD_SPAWN),
+        initializer=quiet_worker_logging,
+    ) as pool:
+        return pool.submit(run_benchmark, spec, workers, repeat).result()
+
+
+@dataclass
+class BenchmarkBaseline:
+    results: dict[str, BenchmarkResult] = field(default_factory=dict)
+    version: int = cs.BENCHMARK_VERSION
+
+    @classmethod
+    def load(cls, path: Path) -> BenchmarkBaseline | None:
+        if not path.is_file():
+            return None
+        data = json.loads(path.read_text(encoding=cs.ENCODING_UTF8))
+        if data.get(cs.BENCHMARK_KEY_VERSION) != cs.BENCHMARK_VERSION:
+            return None
+        return cls(
+            results={
+                scenario: BenchmarkResult.from_dict(result)
+                for scenario, result in data[cs.BENCHMARK_KEY_RESULTS].items()
+            }
+        )
+
+    def save(self, path: Path) -> None:
+        payload = {
+            cs.BENCHMARK_KEY_VERSION: self.version,
+            cs.BENCHMARK_KEY_RESULTS: {
+                scenario: result.to_dict() for scenario, result in self.results.items()
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, indent=2), encoding=cs.ENCODING_UTF8)
+        logger.info(
+            ls.BENCHMARK_BASELINE_SAVED.format(count=len(self.results), path=path)
+        )
+
+
+def find_regressions(
+    baseline: BenchmarkBaseline,
+    results: list[BenchmarkResult],
+    threshold_pct: float | None = None,
+    gated_passes: tuple[str, ...] = cs.BENCHMARK_GATED_PASSES,
+) -> list[BenchmarkRegression]:
+    threshold_pct = (
+        settings.BENCHMARK_REGRESSION_THRESHOLD_PCT
+        if threshold_pct is None
+        else threshold_pct
+    )
+    regressions: list[BenchmarkRegression] = []
+    for result in results:
+        previous = baseline.results.get(result.scenario)
+        if previous is None:
+            logger.warning(
+                ls.BENCHMARK_BASELINE_MISSING.format(scenario=result.scenario)
+            )
+            continue
+        for name in gated_passes:
+            before, after = previous.passes.get(name), result.passes.get(name)
+            # (H) Passes that take only milliseconds are dominated by noise.
+            if (
+                before is None
+                or after is None
+                or before.wall_seconds < settings.BENCHMARK_MIN_GATED_SECONDS
+            ):
+                continue
+            change_pct = (after.wall_seconds / before.wall_seconds - 1) * 100
+            if change_pct > threshold_pct:
+                regressions.append(
+                    BenchmarkRegression(
+                        scenario=result.scenario,
+                        pass_name=name,
+                        baseline_seconds=before.wall_seconds,
+                        current_seconds=after.wall_seconds,
+                        change_pct=change_pct,
+                    )
+                )
+    return regressions
+
+
+def log_result(result: BenchmarkResult) -> None:
+    logger.success(
+        ls.BENCHMARK_RESULT.format(
+            scenario=result.scenario,
+            files=result.files,
+            calls=result.calls,
+            files_per_second=result.files_per_second,
+            calls_per_second=result.calls_per_second,
+        )
+    )
+    for name, metrics in result.passes.items():
+        logger.success(
+            ls.BENCHMARK_PASS.format(
+                name=name,
+                wall=metrics.wall_seconds,
+                cpu=metrics.cpu_seconds,
+                rss=metrics.peak_rss_mb,
+            )
+        )
+
+
+REGISTRY_FACTORIES: dict[
+    cs.RegistryImplementation,
+    Callable[[], FunctionRegistryTrie | CompactFunctionRegistryTrie],
+] = {
+    cs.RegistryImplementation.TRIE: partial(FunctionRegistryTrie, suffix_trie=True),
+    cs.RegistryImplementation.TRIE_LAST_SEGMENT: partial(
+        FunctionRegistryTrie, suffix_trie=False
+    ),
+    cs.RegistryImplementation.COMPACT: CompactFunctionRegistryTrie,
+}
+
+
+@dataclass
+class RegistryMetrics:
+    implementation: str
+    entries: int
+    memory_mb: float
+    build_seconds: float
+    prefix_us: float
+    suffix_us: float
+    prefix_suffix_us: float
+
+
+def generate_qualified_names(
+    entries: int, project: str = cs.BENCHMARK_REPO_NAME
+) -> list[tuple[QualifiedName, NodeType]]:
+    names: list[tuple[QualifiedName, NodeType]] = []
+    module = 0
+    while len(names) < entries:
+        module_qn = cs.BENCHMARK_REGISTRY_MODULE_QN.format(
+            project=project,
+            package=module // cs.BENCHMARK_REGISTRY_MODULES_PER_PACKAGE,
+            module=module,
+        )
+        for c in range(cs.BENCHMARK_REGISTRY_CLASSES_PER_MODULE):
+            class_qn = f"{module_qn}.{cs.BENCHMARK_REGISTRY_CLASS_NAME.format(index=c)}"
+            names.append((class_qn, NodeType.CLASS))
+            for m in range(cs.BENCHMARK_REGISTRY_METHODS_PER_CLASS):
+                method = cs.BENCHMARK_REGISTRY_METHOD_NAME.format(index=m)
+                names.append((f"{class_qn}.{method}", NodeType.METHOD))
+        module += 1
+    return names[:entries]
+
+
+def _build_registry(
+    implementation: cs.RegistryImplementation,
+    names: list[tuple[QualifiedName, NodeType]],
+) -> FunctionRegistryTrie | CompactFunctionRegistryTrie:
+    registry = REGISTRY_FACTORIES[implementation]()
+    for qn, node_type in names:
+        registry.insert(qn, node_type)
+    # (H) The compact registry sorts buffered inserts on its first query, which
+    # (H) belongs to the build rather than to the query latencies.
+    registry.find_with_prefix(names[0][0])
+    return registry
+
+
+def _microseconds_per_call[T](run: Callable[[T], object], arguments: list[T]) -> float:
+    start = time.perf_counter()
+    for argument in arguments:
+        run(argument)
+    return (time.perf_counter() - start) * cs.MICROSECONDS_PER_SECOND / len(arguments)
+
+
+def benchmark_registry(
+    implementation: cs.RegistryImplementation,
+    entries: int,
+    queries: int = 100,
+    seed: int = 0,
+) -> RegistryMetrics:
+    names = generate_qualified_names(entries)
+    # (H) The qualified name strings are allocated before tracing starts, so
+    # (H) only what the registry itself adds on top of them is counted.
+    tracemalloc.start()
+    try:
+        registry = _build_registry(implementation, names)
+        memory = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del registry
+
+    start = time.perf_counter()
+    registry = _build_registry(implementation, names)
+    build_seconds = time.perf_counter() - start
+
+    sample = [qn for qn, _ in random.Random(seed).sample(names, min(queries, entries))]
+    parts = [qn.split(cs.SEPARATOR_DOT) for qn in sample]
+    class_prefixes = [cs.SEPARATOR_DOT.join(p[:-1]) for p in parts]
+    member_suffixes = [cs.SEPARATOR_DOT.join(p[-2:]) for p in parts]
+    module_scoped = [(cs.SEPARATOR_DOT.join(p[:3]), p[-1]) for p in parts]
+    return RegistryMetrics(
+        implementation=implementation,
+        entries=len(registry),
+        memory_mb=memory / cs.BYTES_PER_MB,
+        build_seconds=build_seconds,
+        prefix_us=_microseconds_per_call(registry.find_with_prefix, class_prefixes),
+        suffix_us=_microseconds_per_call(registry.find_ending_with, member_suffixes),
+        prefix_suffix_us=_microseconds_per_call(
+            lambda pair: registry.find_with_prefix_and_suffix(*pair), module_scoped
+        ),
+    )
+
+
+def log_registry_metrics(metrics: RegistryMetrics) -> None:
+    logger.success(
+        ls.BENCHMARK_REGISTRY_RESULT.format(
+            implementation=metrics.implementation,
+            entries=metrics.entries,
+            memory_mb=metrics.memory_mb,
+            build=metrics.build_seconds,
+            prefix=metrics.prefix_us,
+            suffix=metrics.suffix_us,
+            prefix_suffix=metrics.prefix_suffix_us,
+        )
+    )
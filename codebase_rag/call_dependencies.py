@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from pathlib import Path
+
+from . import constants as cs
+from .types_defs import FileCallSites, QualifiedName
+
+_CALL_NAME_TOKEN = re.compile(cs.CALL_NAME_TOKEN_PATTERN)
+
+
+def definition_simple_name(qn: QualifiedName) -> str:
+    return qn.split(cs.CHAR_PAREN_OPEN, 1)[0].rpartition(cs.SEPARATOR_DOT)[2]
+
+
+class CallDependencyIndex:
+    # (H) Reverse index from what a file's calls resolved to, and from the names
+    # (H) its call sites mention, back to the file. A change only invalidates the
+    # (H) CALLS of files that hit one of its symbols or could now bind to one.
+    def __init__(self) -> None:
+        self._targets: dict[Path, frozenset[QualifiedName]] = {}
+        self._names: dict[Path, frozenset[str]] = {}
+        self._callers_by_target: defaultdict[QualifiedName, set[Path]] = defaultdict(
+            set
+        )
+        self._callers_by_name: defaultdict[str, set[Path]] = defaultdict(set)
+
+    def clear(self) -> None:
+        self._targets.clear()
+        self._names.clear()
+        self._callers_by_target.clear()
+        self._callers_by_name.clear()
+
+    def record_call_sites(self, file_path: Path, call_sites: FileCallSites) -> None:
+        names = frozenset(
+            token
+            for caller in call_sites.callers
+            for site in caller.sites
+            for token in _CALL_NAME_TOKEN.findall(site.name)
+        )
+        _replace(self._names, self._callers_by_name, file_path, names)
+
+    def record_targets(self, file_path: Path, targets: Iterable[QualifiedName]) -> None:
+        _replace(self._targets, self._callers_by_target, file_path, frozenset(targets))
+
+    def forget(self, file_path: Path) -> None:
+        _replace(self._names, self._callers_by_name, file_path, frozenset())
+        _replace(self._targets, self._callers_by_target, file_path, frozenset())
+
+    def dependents(
+        self, affected_qns: set[QualifiedName], changed_names: set[str]
+    ) -> set[Path]:
+        dependents: set[Path] = set()
+        for qn in affected_qns:
+            dependents |= self._callers_by_target.get(qn, set())
+        for name in changed_names:
+            dependents |= self._callers_by_name.get(name, set())
+        return dependents
+
+
+def _replace[K](
+    forward: dict[Path, frozenset[K]],
+    reverse: defaultdict[K, set[Path]],
+    file_path: Path,
+    keys: frozenset[K],
+) -> None:
+    previous = forward.pop(file_path, frozenset())
+    for key in previous - keys:
+        if files := reverse.get(key):
+            files.discard(file_path)
+            if not files:
+                del reverse[key]
+    for key in keys - previous:
+        reverse[key].add(file_path)
+    if keys:
+        forward[file_path] = keys
@@ -1,4 +1,6 @@
 import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 import typer
@@ -9,6 +11,7 @@ from . import constants as cs
 from . import logs as ls
 from .config import load_cgrignore_patterns, settings
 from .graph_updater import GraphUpdater
+from .index_manifest import memgraph_manifest_path
 from .main import (
     app_context,
     connect_memgraph,
@@ -20,8 +23,11 @@ from .main import (
     update_model_settings,
 )
 from .parser_loader import load_parsers
+from .profiling import profiling_session
+from .services import IngestorProtocol
 from .services.protobuf_service import ProtobufFileIngestor
 from .tools.language import cli as language_cli
+from .utils.git_utils import git_changed_paths
 
 app = typer.Typer(
     name="graph-code",
@@ -52,6 +58,54 @@ def _info(msg: str) -> None:
         app_context.console.print(msg)
 
 
+@contextmanager
+def _open_ingestor(
+    output_proto_dir: str | None, split_index: bool, batch_size: int | None
+) -> Iterator[IngestorProtocol]:
+    if output_proto_dir is not None:
+        yield ProtobufFileIngestor(
+            output_path=output_proto_dir, split_index=split_index
+        )
+        return
+    with connect_memgraph(settings.resolve_batch_size(batch_size)) as ingestor:
+        ingestor.ensure_constraints()
+        yield ingestor
+
+
+def _manifest_updater(
+    ingestor: IngestorProtocol,
+    repo_path: Path,
+    output_proto_dir: str | None,
+    unignore_paths: frozenset[str] | None,
+    exclude_paths: frozenset[str] | None,
+    workers: int | None,
+    streaming: bool | None,
+    reset_manifest: bool = False,
+) -> GraphUpdater:
+    manifest_path = (
+        Path(output_proto_dir) / cs.MANIFEST_FILE_NAME
+        if output_proto_dir is not None
+        else memgraph_manifest_path(
+            repo_path, settings.MEMGRAPH_HOST, settings.MEMGRAPH_PORT
+        )
+    )
+    if reset_manifest:
+        manifest_path.unlink(missing_ok=True)
+
+    parsers, queries = load_parsers()
+    return GraphUpdater(
+        ingestor,
+        repo_path,
+        parsers,
+        queries,
+        unignore_paths,
+        exclude_paths,
+        workers,
+        manifest_path,
+        streaming,
+    )
+
+
 @app.command(help=ch.CMD_START)
 def start(
     repo_path: str | None = typer.Option(
@@ -94,6 +148,32 @@ def start(
         min=1,
         help=ch.HELP_BATCH_SIZE,
     ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        min=1,
+        help=ch.HELP_WORKERS,
+    ),
+    full_reindex: bool = typer.Option(
+        False,
+        "--full-reindex",
+        help=ch.HELP_FULL_REINDEX,
+    ),
+    streaming: bool | None = typer.Option(
+        None,
+        "--streaming/--no-streaming",
+        help=ch.HELP_STREAMING,
+    ),
+    profile: str | None = typer.Option(
+        None,
+        "--profile",
+        help=ch.HELP_PROFILE,
+    ),
+    profile_format: cs.ProfileFormat = typer.Option(
+        cs.ProfileFormat.JSON,
+        "--profile-format",
+        help=ch.HELP_PROFILE_FORMAT,
+    ),
     exclude: list[str] | None = typer.Option(
         None,
         "--exclude",
@@ -141,17 +221,18 @@ def start(
                 ingestor.clean_database()
             ingestor.ensure_constraints()
 
-            parsers, queries = load_parsers()
-
-            updater = GraphUpdater(
+            updater = _manifest_updater(
                 ingestor,
                 repo_to_update,
-                parsers,
-                queries,
+                None,
                 unignore_paths,
                 exclude_paths,
+                workers,
+                streaming,
+                reset_manifest=clean or full_reindex,
             )
-            updater.run()
+            with profiling_session(Path(profile) if profile else None, profile_format):
+                updater.run()
 
             if output:
                 _info(style(cs.CLI_MSG_EXPORTING_TO.format(path=output), cs.Color.CYAN))
@@ -187,6 +268,32 @@ def index(
         "--split-index",
         help=ch.HELP_SPLIT_INDEX,
     ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        min=1,
+        help=ch.HELP_WORKERS,
+    ),
+    full_reindex: bool = typer.Option(
+        False,
+        "--full-reindex",
+        help=ch.HELP_FULL_REINDEX,
+    ),
+    streaming: bool | None = typer.Option(
+        None,
+        "--streaming/--no-streaming",
+        help=ch.HELP_STREAMING,
+    ),
+    profile: str | None = typer.Option(
+        None,
+        "--profile",
+        help=ch.HELP_PROFILE,
+    ),
+    profile_format: cs.ProfileFormat = typer.Option(
+        cs.ProfileFormat.JSON,
+        "--profile-format",
+        help=ch.HELP_PROFILE_FORMAT,
+    ),
     exclude: list[str] | None = typer.Option(
         None,
         "--exclude",
@@ -215,15 +322,19 @@ def index(
         unignore_paths = cgrignore.unignore or None
 
     try:
-        ingestor = ProtobufFileIngestor(
-            output_path=output_proto_dir, split_index=split_index
-        )
-        parsers, queries = load_parsers()
-        updater = GraphUpdater(
-            ingestor, repo_to_index, parsers, queries, unignore_paths, exclude_paths
+        updater = _manifest_updater(
+            ProtobufFileIngestor(output_path=output_proto_dir, split_index=split_index),
+            repo_to_index,
+            output_proto_dir,
+            unignore_paths,
+            exclude_paths,
+            workers,
+            streaming,
+            reset_manifest=full_reindex,
         )
 
-        updater.run()
+        with profiling_session(Path(profile) if profile else None, profile_format):
+            updater.run()
         _info(style(cs.CLI_MSG_INDEXING_DONE, cs.Color.GREEN))
 
     except Exception as e:
@@ -234,6 +345,102 @@ def index(
         raise typer.Exit(1) from e
 
 
+@app.command(help=ch.CMD_UPDATE)
+def update(
+    paths: list[str] | None = typer.Argument(None, help=ch.HELP_UPDATE_PATHS),
+    repo_path: str | None = typer.Option(
+        None, "--repo-path", help=ch.HELP_REPO_PATH_UPDATE
+    ),
+    since: str | None = typer.Option(None, "--since", help=ch.HELP_SINCE),
+    output_proto_dir: str | None = typer.Option(
+        None,
+        "-o",
+        "--output-proto-dir",
+        help=ch.HELP_UPDATE_OUTPUT_PROTO_DIR,
+    ),
+    split_index: bool = typer.Option(
+        False,
+        "--split-index",
+        help=ch.HELP_SPLIT_INDEX,
+    ),
+    batch_size: int | None = typer.Option(
+        None,
+        "--batch-size",
+        min=1,
+        help=ch.HELP_BATCH_SIZE,
+    ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        min=1,
+        help=ch.HELP_WORKERS,
+    ),
+    streaming: bool | None = typer.Option(
+        None,
+        "--streaming/--no-streaming",
+        help=ch.HELP_STREAMING,
+    ),
+    profile: str | None = typer.Option(
+        None,
+        "--profile",
+        help=ch.HELP_PROFILE,
+    ),
+    profile_format: cs.ProfileFormat = typer.Option(
+        cs.ProfileFormat.JSON,
+        "--profile-format",
+        help=ch.HELP_PROFILE_FORMAT,
+    ),
+    exclude: list[str] | None = typer.Option(
+        None,
+        "--exclude",
+        help=ch.HELP_EXCLUDE_PATTERNS,
+    ),
+) -> None:
+    if since is None and not paths:
+        app_context.console.print(style(cs.CLI_ERR_UPDATE_NO_CHANGES, cs.Color.RED))
+        raise typer.Exit(1)
+
+    repo_to_update = Path(repo_path or settings.TARGET_REPO_PATH).resolve()
+    cgrignore = load_cgrignore_patterns(repo_to_update)
+    cli_excludes = frozenset(exclude) if exclude else frozenset()
+    exclude_paths = cli_excludes | cgrignore.exclude or None
+    unignore_paths = cgrignore.unignore or None
+
+    try:
+        changed_paths = [repo_to_update / path for path in paths or []]
+        if since is not None:
+            changed_paths.extend(git_changed_paths(repo_to_update, since))
+        _info(
+            style(
+                cs.CLI_MSG_UPDATING_INDEX.format(
+                    path=output_proto_dir or repo_to_update, count=len(changed_paths)
+                ),
+                cs.Color.GREEN,
+            )
+        )
+
+        with _open_ingestor(output_proto_dir, split_index, batch_size) as ingestor:
+            updater = _manifest_updater(
+                ingestor,
+                repo_to_update,
+                output_proto_dir,
+                unignore_paths,
+                exclude_paths,
+                workers,
+                streaming,
+            )
+            with profiling_session(Path(profile) if profile else None, profile_format):
+                updater.update(changed_paths)
+        _info(style(cs.CLI_MSG_GRAPH_UPDATED, cs.Color.GREEN))
+
+    except Exception as e:
+        app_context.console.print(
+            style(cs.CLI_ERR_INDEXING.format(error=e), cs.Color.RED)
+        )
+        logger.exception(ls.INDEXING_FAILED)
+        raise typer.Exit(1) from e
+
+
 @app.command(help=ch.CMD_EXPORT)
 def export(
     output: str = typer.Option(..., "-o", "--output", help=ch.HELP_OUTPUT_PATH),
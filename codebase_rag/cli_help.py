@@ -4,6 +4,7 @@ from enum import StrEnum
 class CLICommandName(StrEnum):
     START = "start"
     INDEX = "index"
+    UPDATE = "update"
     EXPORT = "export"
     OPTIMIZE = "optimize"
     MCP_SERVER = "mcp-server"
@@ -19,6 +20,7 @@ APP_DESCRIPTION = (
 
 CMD_START = "Start interactive chat session with your codebase"
 CMD_INDEX = "Index codebase to protobuf files for offline use"
+CMD_UPDATE = "Re-index only the files changed since a git revision or listed paths"
 CMD_EXPORT = "Export knowledge graph from Memgraph to JSON file"
 CMD_OPTIMIZE = "AI-guided codebase optimization session"
 CMD_MCP_SERVER = "Start the MCP server for Claude Code integration"
@@ -32,6 +34,25 @@ CMD_LANGUAGE_REMOVE = "Remove a language from the project."
 CMD_LANGUAGE_CLEANUP = "Clean up orphaned git modules that weren't properly removed."
 
 HELP_BATCH_SIZE = "Number of buffered nodes/relationships before flushing to Memgraph"
+HELP_WORKERS = (
+    "Number of worker processes used to extract definitions and resolve calls "
+    "(1 keeps the serial passes)"
+)
+HELP_STREAMING = (
+    "Stream files through extraction and ingestion with bounded queues and "
+    "re-parse files during call resolution instead of keeping every syntax tree "
+    "in memory. Only applies when writing to Memgraph, which flushes in batches; "
+    "protobuf output holds the whole graph until the end, so it ignores this "
+    "(defaults to INDEX_STREAMING in settings)"
+)
+HELP_PROFILE = (
+    "Write a profiling report with wall and CPU time per pass, language, file, "
+    "resolver strategy and flush batch to this path"
+)
+HELP_PROFILE_FORMAT = (
+    "Profiling report format: 'json' for a summary or 'chrome' for a trace "
+    "viewable in chrome://tracing or Perfetto"
+)
 HELP_MEMGRAPH_HOST = "Memgraph host"
 HELP_MEMGRAPH_PORT = "Memgraph port"
 HELP_ORCHESTRATOR = (
@@ -46,16 +67,34 @@ HELP_NO_CONFIRM = "Disable confirmation prompts for edit operations (YOLO mode)"
 
 HELP_REPO_PATH_RETRIEVAL = "Path to the target repository for code retrieval"
 HELP_REPO_PATH_INDEX = "Path to the target repository to index."
+HELP_REPO_PATH_UPDATE = "Path to the target repository to update."
 HELP_REPO_PATH_OPTIMIZE = "Path to the repository to optimize"
 HELP_REPO_PATH_WATCH = "Path to the repository to watch."
+HELP_WARM_START = (
+    "Rebuild the watcher's state from the graph already in Memgraph and re-parse "
+    "only files whose fingerprint changed, instead of running a full initial scan"
+)
 
 HELP_UPDATE_GRAPH = "Update the knowledge graph by parsing the repository"
+HELP_FULL_REINDEX = (
+    "Ignore the saved index manifest and re-parse every file "
+    "(by default only added, changed or removed files are re-parsed)"
+)
 HELP_CLEAN_DB = "Clean the database before updating (use when adding first repo)"
 HELP_OUTPUT_GRAPH = "Export graph to JSON file after updating (requires --update-graph)"
 HELP_OUTPUT_PATH = "Output file path for the exported graph"
 HELP_OUTPUT_PROTO_DIR = (
     "Required. Path to the output directory for the protobuf index file(s)."
 )
+HELP_SINCE = (
+    "Git revision or range to diff against (e.g. HEAD~1 or main..HEAD); "
+    "files it reports as added, modified, deleted or renamed are re-indexed"
+)
+HELP_UPDATE_PATHS = "Changed files to re-index, relative to the repository root."
+HELP_UPDATE_OUTPUT_PROTO_DIR = (
+    "Protobuf index directory to update in place; without it the Memgraph "
+    "graph is updated."
+)
 HELP_SPLIT_INDEX = "Write index to separate nodes.bin and relationships.bin files."
 HELP_FORMAT_JSON = "Export in JSON format"
 HELP_LANGUAGE_ARG = (
@@ -82,6 +121,7 @@ HELP_INTERACTIVE_SETUP = (
 CLI_COMMANDS: dict[CLICommandName, str] = {
     CLICommandName.START: CMD_START,
     CLICommandName.INDEX: CMD_INDEX,
+    CLICommandName.UPDATE: CMD_UPDATE,
     CLICommandName.EXPORT: CMD_EXPORT,
     CLICommandName.OPTIMIZE: CMD_OPTIMIZE,
     CLICommandName.MCP_SERVER: CMD_MCP_SERVER,
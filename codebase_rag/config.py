@@ -52,6 +52,10 @@ class AppConfig(BaseSettings):
     MEMGRAPH_HTTP_PORT: int = 7444
     LAB_PORT: int = 3000
     MEMGRAPH_BATCH_SIZE: int = 1000
+    INDEX_WORKERS: int = 1
+    INDEX_STREAMING: bool = False
+    FUNCTION_REGISTRY_COMPACT: bool = False
+    FUNCTION_REGISTRY_SUFFIX_TRIE: bool = False
     AGENT_RETRIES: int = 3
     ORCHESTRATOR_OUTPUT_RETRIES: int = 100
 
@@ -150,8 +154,17 @@ class AppConfig(BaseSettings):
 
     CACHE_MAX_ENTRIES: int = 1000
     CACHE_MAX_MEMORY_MB: int = 500
-    CACHE_EVICTION_DIVISOR: int = 10
-    CACHE_MEMORY_THRESHOLD_RATIO: float = 0.8
+    CACHE_BYTES_PER_NODE: int = 128
+
+    STREAMING_QUEUE_SIZE: int = 64
+    STREAMING_AST_CACHE_ENTRIES: int = 64
+
+    WATCHER_DEBOUNCE_SECONDS: float = 0.5
+
+    PROFILE_TOP_FILES: int = 20
+
+    BENCHMARK_REGRESSION_THRESHOLD_PCT: float = 10.0
+    BENCHMARK_MIN_GATED_SECONDS: float = 0.05
 
     OLLAMA_HEALTH_TIMEOUT: float = 5.0
 
@@ -230,6 +243,12 @@ class AppConfig(BaseSettings):
             raise ValueError(ex.BATCH_SIZE_POSITIVE)
         return resolved
 
+    def resolve_workers(self, workers: int | None) -> int:
+        resolved = self.INDEX_WORKERS if workers is None else workers
+        if resolved < 1:
+            raise ValueError(ex.WORKERS_POSITIVE)
+        return resolved
+
 
 settings = AppConfig()
 
@@ -168,6 +168,10 @@ KEY_START_LINE = "start_line"
 KEY_END_LINE = "end_line"
 KEY_PATH = "path"
 KEY_EXTENSION = "extension"
+KEY_CONTENT_HASH = "content_hash"
+KEY_SIZE = "size"
+KEY_MTIME_NS = "mtime_ns"
+KEY_LABEL = "label"
 KEY_MODULE_TYPE = "module_type"
 KEY_IMPLEMENTS_MODULE = "implements_module"
 KEY_PROPS = "props"
@@ -177,6 +181,9 @@ KEY_TO_VAL = "to_val"
 KEY_VERSION_SPEC = "version_spec"
 KEY_PREFIX = "prefix"
 KEY_PROJECT_NAME = "project_name"
+KEY_QUALIFIED_NAMES = "qualified_names"
+KEY_PATHS = "paths"
+KEY_LINE_DELTA = "line_delta"
 KEY_IS_EXTERNAL = "is_external"
 
 ERR_SUBSTR_ALREADY_EXISTS = "already exists"
@@ -205,6 +212,7 @@ ONEOF_FILE = "file"
 ONEOF_EXTERNAL_PACKAGE = "external_package"
 ONEOF_MODULE_IMPLEMENTATION = "module_implementation"
 ONEOF_MODULE_INTERFACE = "module_interface"
+PROTOBUF_PAYLOAD_ONEOF = "payload"
 
 # (H) CLI error and info messages
 CLI_ERR_OUTPUT_REQUIRES_UPDATE = (
@@ -214,6 +222,7 @@ CLI_ERR_ONLY_JSON = "Error: Currently only JSON format is supported."
 CLI_ERR_STARTUP = "Startup Error: {error}"
 CLI_ERR_CONFIG = "Configuration Error: {error}"
 CLI_ERR_INDEXING = "An error occurred during indexing: {error}"
+CLI_ERR_UPDATE_NO_CHANGES = "Error: pass --since REVISION or the paths to re-index."
 CLI_ERR_EXPORT_FAILED = "Failed to export graph: {error}"
 CLI_ERR_LOAD_GRAPH = "Failed to load graph: {error}"
 CLI_ERR_MCP_SERVER = "MCP Server Error: {error}"
@@ -226,6 +235,7 @@ CLI_MSG_APP_TERMINATED = "\nApplication terminated by user."
 CLI_MSG_INDEXING_AT = "Indexing codebase at: {path}"
 CLI_MSG_OUTPUT_TO = "Output will be written to: {path}"
 CLI_MSG_INDEXING_DONE = "Indexing process completed successfully!"
+CLI_MSG_UPDATING_INDEX = "Updating index at {path} for {count} changed paths"
 CLI_MSG_CONNECTING_MEMGRAPH = "Connecting to Memgraph to export graph..."
 CLI_MSG_EXPORTING_DATA = "Exporting graph data..."
 CLI_MSG_OPTIMIZATION_TERMINATED = "\nOptimization session terminated by user."
@@ -297,6 +307,11 @@ SEPARATOR_SLASH = "/"
 PATH_CURRENT_DIR = "."
 PATH_PARENT_DIR = ".."
 GLOB_ALL = "*"
+GLOB_CHARS = "*?["
+GLOB_CHARS_PATTERN = r"[*?\[]"
+CALL_NAME_TOKEN_PATTERN = r"[A-Za-z_$][\w$]*"
+MASKED_SOURCE_PATTERN = rb"[^\n]"
+REGEX_ALTERNATION = "|"
 PATH_RELATIVE_PREFIX = "./"
 PATH_PARENT_PREFIX = "../"
 CPP_IMPORT_PARTITION_PREFIX = "import :"
@@ -306,6 +321,8 @@ CPP_PARTITION_PREFIX = "partition_"
 TRIE_TYPE_KEY = "__type__"
 TRIE_QN_KEY = "__qn__"
 TRIE_INTERNAL_PREFIX = "__"
+TRIE_SEGMENT_CODE_BYTES = 4
+TRIE_SEGMENT_CODE_FORMAT = ">{count}I"
 
 
 class UniqueKeyType(StrEnum):
@@ -382,6 +399,14 @@ EXCLUDED_DEPENDENCY_NAMES = frozenset({"python", "php"})
 
 # (H) Byte size constants
 BYTES_PER_MB = 1024 * 1024
+SOURCE_DIFF_BLOCK_BYTES = 4096
+
+# (H) Parallel ingestion
+PARALLEL_CHUNKS_PER_WORKER = 4
+PARALLEL_MAX_CHUNK_SIZE = 64
+MP_START_METHOD_FORK = "fork"
+MP_START_METHOD_SPAWN = "spawn"
+LOG_LEVEL_WARNING = "WARNING"
 
 # (H) Property keys
 KEY_PARAMETERS = "parameters"
@@ -561,6 +586,20 @@ JS_TS_CLASS_NODES = ("class_declaration", "class")
 JS_TS_IMPORT_NODES = ("import_statement", "lexical_declaration", "export_statement")
 JS_TS_LANGUAGES = frozenset({SupportedLanguage.JS, SupportedLanguage.TS})
 
+# (H) Languages whose top-level definitions extract independently of each other
+SCOPED_EXTRACTION_LANGUAGES = frozenset({SupportedLanguage.PYTHON})
+
+# (H) Languages that build a local variable type map for call resolution
+LOCAL_TYPE_LANGUAGES = frozenset(
+    {
+        SupportedLanguage.PYTHON,
+        SupportedLanguage.JS,
+        SupportedLanguage.TS,
+        SupportedLanguage.JAVA,
+        SupportedLanguage.LUA,
+    }
+)
+
 # (H) C++ import node types
 CPP_IMPORT_NODES = ("preproc_include", "template_function", "declaration")
 
@@ -591,6 +630,7 @@ FIELD_FIELD = "field"
 FIELD_SUPERCLASS = "superclass"
 FIELD_SUPERCLASSES = "superclasses"
 FIELD_INTERFACES = "interfaces"
+FIELD_DEFINITION = "definition"
 
 # (H) Method name constants for getattr/hasattr
 METHOD_FIND_WITH_PREFIX = "find_with_prefix"
@@ -739,6 +779,7 @@ QUERY_CLASSES = "classes"
 QUERY_CALLS = "calls"
 QUERY_IMPORTS = "imports"
 QUERY_LOCALS = "locals"
+QUERY_JS_MODULE = "js_module"
 QUERY_CONFIG = "config"
 QUERY_LANGUAGE = "language"
 
@@ -834,6 +875,8 @@ PAYLOAD_QUALIFIED_NAME = "qualified_name"
 class EventType(StrEnum):
     MODIFIED = "modified"
     CREATED = "created"
+    DELETED = "deleted"
+    MOVED = "moved"
 
 
 CYPHER_DELETE_MODULE = "MATCH (m:Module {path: $path})-[*0..]->(c) DETACH DELETE m, c"
@@ -847,6 +890,7 @@ REALTIME_LOGGER_FORMAT = (
 )
 
 WATCHER_SLEEP_INTERVAL = 1
+WATCHER_THREAD_NAME = "cgr-watch-worker"
 LOG_LEVEL_INFO = "INFO"
 
 
@@ -1571,6 +1615,170 @@ IMPORT_CACHE_FILE = "stdlib_cache.json"
 IMPORT_CACHE_KEY = "cache"
 IMPORT_TIMESTAMPS_KEY = "timestamps"
 
+# (H) Incremental indexing manifest
+MANIFEST_VERSION = 2
+MANIFEST_FILE_NAME = "index_manifest.json"
+MANIFEST_FILE_SUFFIX = ".json"
+MANIFEST_CACHE_SUBDIR = "manifests"
+MANIFEST_DIGEST_SIZE = 16
+MANIFEST_KEY_VERSION = "version"
+MANIFEST_KEY_PROJECT = "project_name"
+MANIFEST_KEY_FILTER = "filter_key"
+MANIFEST_KEY_FILES = "files"
+
+# (H) Diff-driven updates
+GIT_DIFF_NAME_STATUS = (
+    "git",
+    "diff",
+    "--name-status",
+    "-z",
+    "--relative",
+    "--end-of-options",
+)
+GIT_STATUS_RENAMED = "R"
+GIT_STATUS_COPIED = "C"
+GIT_FIELD_SEPARATOR = "\0"
+
+
+# (H) Indexing profiler
+class ProfileFormat(StrEnum):
+    JSON = "json"
+    CHROME = "chrome"
+
+
+class ProfileCategory(StrEnum):
+    PASS = "pass"
+    FILE = "file"
+    STAGE = "stage"
+    RESOLVER = "resolver"
+    FLUSH = "flush"
+
+
+PROFILE_TRACED_CATEGORIES = frozenset(
+    {ProfileCategory.PASS, ProfileCategory.FILE, ProfileCategory.FLUSH}
+)
+PROFILE_PASS_CHANGE_DETECTION = "change_detection"
+PROFILE_PASS_STRUCTURE = "structure"
+PROFILE_PASS_DEFINITIONS = "definitions"
+PROFILE_PASS_CALLS = "calls"
+PROFILE_PASS_METHOD_OVERRIDES = "method_overrides"
+PROFILE_PASS_FLUSH = "flush"
+PROFILE_PASS_EMBEDDINGS = "embeddings"
+PROFILE_PASS_WATCH_EVENT = "watch_event"
+PROFILE_STAGE_PARSE = "parse"
+PROFILE_STAGE_REPARSE = "reparse"
+PROFILE_STAGE_IMPORTS = "imports"
+PROFILE_STAGE_TYPE_INFERENCE = "type_inference"
+PROFILE_FLUSH_NODES = "nodes"
+PROFILE_FLUSH_RELATIONSHIPS = "relationships"
+PROFILE_FLUSH_PROTOBUF = "protobuf"
+PROFILE_ARG_PATH = "path"
+PROFILE_ARG_LANGUAGE = "language"
+PROFILE_ARG_LABEL = "label"
+PROFILE_ARG_ROWS = "rows"
+PROFILE_KEY_WALL = "wall_seconds"
+PROFILE_KEY_CPU = "cpu_seconds"
+PROFILE_KEY_COUNT = "count"
+PROFILE_KEY_FILES = "files"
+PROFILE_KEY_NAME = "name"
+PROFILE_KEY_PASSES = "passes"
+PROFILE_KEY_LANGUAGES = "languages"
+PROFILE_KEY_SLOWEST_FILES = "slowest_files"
+PROFILE_KEY_STAGES = "stages"
+PROFILE_KEY_RESOLVER = "resolver_strategies"
+PROFILE_KEY_FLUSHES = "flushes"
+PROFILE_KEY_FLUSH_BATCHES = "flush_batches"
+PROFILE_KEY_ARGS = "args"
+PROFILE_DECIMALS = 6
+CHROME_TRACE_EVENTS = "traceEvents"
+CHROME_TRACE_UNIT = "displayTimeUnit"
+CHROME_TRACE_UNIT_MS = "ms"
+CHROME_TRACE_OTHER = "otherData"
+CHROME_TRACE_KEY_CATEGORY = "cat"
+CHROME_TRACE_KEY_PHASE = "ph"
+CHROME_TRACE_KEY_TIMESTAMP = "ts"
+CHROME_TRACE_KEY_DURATION = "dur"
+CHROME_TRACE_KEY_PID = "pid"
+CHROME_TRACE_KEY_TID = "tid"
+CHROME_TRACE_PHASE_COMPLETE = "X"
+CHROME_TRACE_THREAD_ID = 0
+MICROSECONDS_PER_SECOND = 1_000_000
+
+
+# (H) Ingestion benchmark
+class BenchmarkScenario(StrEnum):
+    PYTHON_SMALL = "python-small"
+    PYTHON_MEDIUM = "python-medium"
+    MIXED = "mixed"
+    DEEP_INHERITANCE = "deep-inheritance"
+    DENSE_CALLS = "dense-calls"
+
+
+BENCHMARK_VERSION = 1
+BENCHMARK_GATED_PASSES = (PROFILE_PASS_DEFINITIONS, PROFILE_PASS_CALLS)
+BENCHMARK_KEY_VERSION = "version"
+BENCHMARK_KEY_RESULTS = "results"
+BENCHMARK_KEY_PASSES = "passes"
+BENCHMARK_KEY_FILES_PER_SECOND = "files_per_second"
+BENCHMARK_KEY_CALLS_PER_SECOND = "calls_per_second"
+BENCHMARK_REPO_NAME = "bench"
+BENCHMARK_PY_PACKAGE = "pkg"
+BENCHMARK_JS_DIR = "web"
+BENCHMARK_JAVA_DIR = "src/bench"
+BENCHMARK_JAVA_PACKAGE = "bench"
+BENCHMARK_CLASS_NAME = "C{module}_{index}"
+BENCHMARK_METHOD_NAME = "m{index}"
+BENCHMARK_FUNCTION_NAME = "f{module}_{index}"
+BENCHMARK_PY_MODULE = "mod{module}"
+BENCHMARK_PY_IMPORT = "from {package}.{module} import {names}\n"
+BENCHMARK_PY_CLASS = "\n\nclass {name}({base}):\n"
+BENCHMARK_PY_ROOT_CLASS = "\n\nclass {name}:\n"
+BENCHMARK_PY_METHOD = "    def {name}(self):\n"
+BENCHMARK_PY_CALL = "        {target}()\n"
+BENCHMARK_PY_METHOD_END = "        return {value}\n"
+BENCHMARK_PY_FUNCTION = (
+    "\n\ndef {name}():\n    instance = {cls}()\n    return instance.{method}()\n"
+)
+BENCHMARK_JS_MODULE = "mod{module}"
+BENCHMARK_JS_IMPORT = "import {{ {names} }} from './{module}.js';\n"
+BENCHMARK_JS_CLASS = "\nexport class {name} extends {base} {{\n"
+BENCHMARK_JS_ROOT_CLASS = "\nexport class {name} {{\n"
+BENCHMARK_JS_METHOD = "  {name}() {{\n"
+BENCHMARK_JS_CALL = "    {target}();\n"
+BENCHMARK_JS_METHOD_END = "    return {value};\n  }}\n"
+BENCHMARK_JS_CLASS_END = "}\n"
+BENCHMARK_JS_FUNCTION = (
+    "\nexport function {name}() {{\n  const instance = new {cls}();\n"
+    "  return instance.{method}();\n}}\n"
+)
+BENCHMARK_JAVA_MODULE = "Mod{module}"
+BENCHMARK_JAVA_PACKAGE_DECL = "package {package};\n"
+BENCHMARK_JAVA_CLASS = "\nclass {name} extends {base} {{\n"
+BENCHMARK_JAVA_ROOT_CLASS = "\nclass {name} {{\n"
+BENCHMARK_JAVA_METHOD = "    public int {name}() {{\n"
+BENCHMARK_JAVA_CALL = "        {module}.{target}();\n"
+BENCHMARK_JAVA_METHOD_END = "        return {value};\n    }}\n"
+BENCHMARK_JAVA_CLASS_END = "}\n"
+BENCHMARK_JAVA_MODULE_CLASS = "\npublic class {name} {{\n"
+BENCHMARK_JAVA_FUNCTION = (
+    "    public static int {name}() {{\n        {cls} instance = new {cls}();\n"
+    "        return instance.{method}();\n    }}\n"
+)
+
+
+class RegistryImplementation(StrEnum):
+    TRIE = "trie"
+    TRIE_LAST_SEGMENT = "trie-last-segment"
+    COMPACT = "compact"
+
+
+BENCHMARK_REGISTRY_CLASSES_PER_MODULE = 8
+BENCHMARK_REGISTRY_METHODS_PER_CLASS = 12
+BENCHMARK_REGISTRY_MODULES_PER_PACKAGE = 40
+BENCHMARK_REGISTRY_MODULE_QN = "{project}.pkg{package}.mod{module}"
+BENCHMARK_REGISTRY_CLASS_NAME = "Class{index}"
+BENCHMARK_REGISTRY_METHOD_NAME = "method_{index}"
+
 # (H) Tree-sitter Python import node types
 TS_IMPORT_STATEMENT = "import_statement"
 TS_IMPORT_FROM_STATEMENT = "import_from_statement"
@@ -2128,6 +2336,7 @@ PY_SCORE_CONTAINS_BASE = 80
 # (H) Type inference defaults
 TYPE_INFERENCE_LIST = "list"
 TYPE_INFERENCE_BASE_MODEL = "BaseModel"
+PY_SCOPE_CACHE_MODULES = 8
 
 # (H) Type inference guard attribute
 ATTR_TYPE_INFERENCE_IN_PROGRESS = "_type_inference_in_progress"
@@ -2300,6 +2509,39 @@ CAPTURE_EXPORTS_PROP = "exports_prop"
 CAPTURE_EXPORT_NAME = "export_name"
 CAPTURE_EXPORT_FUNCTION = "export_function"
 
+
+class JsModulePattern(StrEnum):
+    COMMONJS_DESTRUCTURE = "commonjs_destructure"
+    OBJECT_METHOD = "object_method"
+    METHOD_DEF = "method_def"
+    COMMONJS_EXPORTS = "commonjs_exports"
+    COMMONJS_MODULE_EXPORTS = "commonjs_module_exports"
+    ES6_EXPORT_CONST = "es6_export_const"
+    ES6_EXPORT_FUNCTION = "es6_export_function"
+    OBJECT_ARROW = "object_arrow"
+    ASSIGNMENT_ARROW = "assignment_arrow"
+    ASSIGNMENT_FUNCTION = "assignment_function"
+    PROTOTYPE_INHERITANCE = "prototype_inheritance"
+    PROTOTYPE_METHOD = "prototype_method"
+
+
+# (H) The JS/TS definition passes share one cursor walk over this combined
+# (H) query; matches are routed back to the pass that owns their pattern.
+JS_MODULE_PATTERN_QUERIES: dict[JsModulePattern, str] = {
+    JsModulePattern.COMMONJS_DESTRUCTURE: JS_COMMONJS_DESTRUCTURE_QUERY,
+    JsModulePattern.OBJECT_METHOD: JS_OBJECT_METHOD_QUERY,
+    JsModulePattern.METHOD_DEF: JS_METHOD_DEF_QUERY,
+    JsModulePattern.COMMONJS_EXPORTS: JS_COMMONJS_EXPORTS_FUNCTION_QUERY,
+    JsModulePattern.COMMONJS_MODULE_EXPORTS: JS_COMMONJS_MODULE_EXPORTS_QUERY,
+    JsModulePattern.ES6_EXPORT_CONST: JS_ES6_EXPORT_CONST_QUERY,
+    JsModulePattern.ES6_EXPORT_FUNCTION: JS_ES6_EXPORT_FUNCTION_QUERY,
+    JsModulePattern.OBJECT_ARROW: JS_OBJECT_ARROW_QUERY,
+    JsModulePattern.ASSIGNMENT_ARROW: JS_ASSIGNMENT_ARROW_QUERY,
+    JsModulePattern.ASSIGNMENT_FUNCTION: JS_ASSIGNMENT_FUNCTION_QUERY,
+    JsModulePattern.PROTOTYPE_INHERITANCE: JS_PROTOTYPE_INHERITANCE_QUERY,
+    JsModulePattern.PROTOTYPE_METHOD: JS_PROTOTYPE_METHOD_QUERY,
+}
+
 # (H) Tree-sitter Rust node types
 TS_RS_SCOPED_TYPE_IDENTIFIER = "scoped_type_identifier"
 TS_RS_USE_AS_CLAUSE = "use_as_clause"
@@ -11,6 +11,39 @@ OPTIONAL MATCH (container)-[:DEFINES|DEFINES_METHOD*]->(defined)
 DETACH DELETE p, container, defined
 """
 
+CYPHER_DELETE_FILES_BY_PATH = """
+MATCH (f:File) WHERE f.path IN $paths
+DETACH DELETE f
+"""
+
+CYPHER_PROJECT_FILE_FINGERPRINTS = """
+MATCH (:Project {name: $project_name})-[:CONTAINS_PACKAGE|CONTAINS_FOLDER|CONTAINS_FILE*]->(f:File)
+WHERE f.content_hash IS NOT NULL
+RETURN DISTINCT f.path AS path, f.content_hash AS content_hash, f.size AS size,
+       f.mtime_ns AS mtime_ns
+"""
+
+CYPHER_PROJECT_MODULE_PATHS = """
+MATCH (m:Module) WHERE m.qualified_name STARTS WITH $prefix AND m.path IS NOT NULL
+RETURN m.qualified_name AS qualified_name, m.path AS path
+"""
+
+CYPHER_PROJECT_DEFINITIONS = """
+MATCH (n:Function|Method|Class|Interface|Enum|Type|Union)
+WHERE n.qualified_name STARTS WITH $prefix
+RETURN n.qualified_name AS qualified_name, n.name AS name, labels(n)[0] AS label
+"""
+
+CYPHER_PROJECT_INHERITANCE = """
+MATCH (c)-[:INHERITS]->(p) WHERE c.qualified_name STARTS WITH $prefix
+RETURN c.qualified_name AS from_val, p.qualified_name AS to_val
+"""
+
+CYPHER_PROJECT_CALLS = """
+MATCH (c)-[:CALLS]->(t) WHERE c.qualified_name STARTS WITH $prefix
+RETURN c.qualified_name AS from_val, t.qualified_name AS to_val
+"""
+
 CYPHER_EXAMPLE_DECORATED_FUNCTIONS = f"""MATCH (n:Function|Method)
 WHERE ANY(d IN n.decorators WHERE toLower(d) IN ['flow', 'task'])
 RETURN n.name AS name, n.qualified_name AS qualified_name, labels(n) AS type
@@ -98,6 +131,27 @@ def build_constraint_query(label: str, prop: str) -> str:
     return f"CREATE CONSTRAINT ON (n:{label}) ASSERT n.{prop} IS UNIQUE;"
 
 
+def _match_nodes_by_qn(label: str) -> str:
+    return f"UNWIND $qualified_names AS qn\nMATCH (n:{label} {{qualified_name: qn}})"
+
+
+def build_delete_nodes_by_qn_query(label: str) -> str:
+    return f"{_match_nodes_by_qn(label)}\nDETACH DELETE n"
+
+
+def build_delete_outgoing_by_qn_query(label: str, rel_type: str | None = None) -> str:
+    rel = f"r:{rel_type}" if rel_type else "r"
+    return f"{_match_nodes_by_qn(label)}-[{rel}]->()\nDELETE r"
+
+
+def build_shift_lines_by_qn_query(label: str) -> str:
+    return (
+        f"{_match_nodes_by_qn(label)}\nWHERE n.start_line IS NOT NULL\n"
+        "SET n.start_line = n.start_line + $line_delta, "
+        "n.end_line = n.end_line + $line_delta"
+    )
+
+
 def build_merge_node_query(label: str, id_key: str) -> str:
     return f"MERGE (n:{label} {{{id_key}: row.id}})\nSET n += row.props"
 
@@ -7,8 +7,10 @@ from functools import wraps
 
 from loguru import logger
 
+from . import constants as cs
 from . import exceptions as ex
 from . import logs as ls
+from .profiling import active_profiler
 from .types_defs import (
     LoadableProtocol,
     PathValidatorProtocol,
@@ -37,6 +39,24 @@ def timing_decorator[**P, T](func: Callable[P, T]) -> Callable[P, T]:
     return wrapper
 
 
+def profile_decorator[**P, T](
+    category: cs.ProfileCategory, name: str | None = None
+) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        span_name = name or func.__name__.lstrip("_")
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            if (profiler := active_profiler()) is None:
+                return func(*args, **kwargs)
+            with profiler.span(span_name, category):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
 def async_timing_decorator[**P, T](
     func: Callable[P, Awaitable[T]],
 ) -> Callable[P, Awaitable[T]]:
@@ -27,6 +27,8 @@ MODEL_FORMAT_INVALID = (
     "Model must be specified as 'provider:model' (e.g., openai:gpt-4o)."
 )
 BATCH_SIZE_POSITIVE = "batch_size must be a positive integer"
+WORKERS_POSITIVE = "workers must be a positive integer"
+PARALLEL_WORKER_NOT_INITIALIZED = "Parallel ingestion worker was not initialized"
 CONFIG = "{role} configuration error: {error}"
 
 # (H) Graph loading errors
@@ -36,6 +38,10 @@ NODES_NOT_LOADED = "Nodes should be loaded"
 RELATIONSHIPS_NOT_LOADED = "Relationships should be loaded"
 DATA_NOT_LOADED = "Data should be loaded"
 
+# (H) Git errors
+GIT_DIFF_FAILED = "git diff {revision} failed: {error}"
+GIT_DIFF_TRUNCATED = "git diff output ended mid-record at {record!r}"
+
 # (H) Parser errors
 NO_LANGUAGES = "No Tree-sitter languages available."
 
@@ -1,6 +1,18 @@
-import sys
+import struct
+from bisect import bisect_left
 from collections import OrderedDict, defaultdict
-from collections.abc import Callable, ItemsView, KeysView
+from collections.abc import (
+    Callable,
+    Collection,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    Mapping,
+)
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
 
 from loguru import logger
@@ -8,37 +20,121 @@ from tree_sitter import Node, Parser
 
 from . import constants as cs
 from . import logs as ls
+from .call_dependencies import CallDependencyIndex, definition_simple_name
 from .config import settings
+from .cypher_queries import (
+    CYPHER_DELETE_FILES_BY_PATH,
+    CYPHER_PROJECT_CALLS,
+    CYPHER_PROJECT_DEFINITIONS,
+    CYPHER_PROJECT_FILE_FINGERPRINTS,
+    CYPHER_PROJECT_INHERITANCE,
+    CYPHER_PROJECT_MODULE_PATHS,
+)
+from .index_manifest import (
+    FileChanges,
+    IndexManifest,
+    ManifestEntry,
+    files_mentioning,
+    find_dependents,
+    find_name_dependents,
+    fingerprint_file,
+    manifest_filter_key,
+)
 from .language_spec import LANGUAGE_FQN_SPECS, get_language_spec
+from .parallel import (
+    CallSnapshot,
+    FileDefinitions,
+    RecordingNameLookup,
+    RowRecordingIngestor,
+    bounded_map,
+    extract_file_definitions,
+    fork_available,
+    fork_context,
+    init_call_worker,
+    init_definition_worker,
+    iter_file_definitions,
+    parallel_chunk_size,
+    replay_rows,
+    resolve_file_calls,
+    set_call_snapshot,
+)
 from .parsers.factory import ProcessorFactory
-from .services import IngestorProtocol, QueryProtocol
+from .profiling import active_profiler, profile_span
+from .services import (
+    BatchFlushingIngestorProtocol,
+    IncrementalIngestorProtocol,
+    IngestorProtocol,
+    QueryProtocol,
+)
 from .types_defs import (
+    ASTCacheStats,
+    CallScope,
+    DefinitionMarks,
     EmbeddingQueryResult,
+    FileCallSites,
+    FileChange,
+    FilePatch,
     FunctionRegistry,
+    IngestRow,
+    InheritsRow,
     LanguageQueries,
+    NodesByLabel,
     NodeType,
+    PropertyDict,
     QualifiedName,
+    RelationshipRow,
+    RepoWalk,
     ResultRow,
     SimpleNameLookup,
     TrieNode,
 )
 from .utils.dependencies import has_semantic_dependencies
 from .utils.fqn_resolver import find_function_source_by_fqn
-from .utils.path_utils import should_skip_path
+from .utils.path_utils import walk_repo
 from .utils.source_extraction import extract_source_with_fallback
 
 
 class FunctionRegistryTrie:
-    def __init__(self, simple_name_lookup: SimpleNameLookup | None = None) -> None:
+    def __init__(
+        self,
+        simple_name_lookup: SimpleNameLookup | None = None,
+        suffix_trie: bool | None = None,
+    ) -> None:
         self.root: TrieNode = {}
         self._entries: FunctionRegistry = {}
+        # (H) Same trie keyed by segments in reverse order, so a suffix lookup
+        # (H) walks the suffix's segments and collects only the matching subtree.
+        # (H) It roughly doubles the registry's memory; without it, names are
+        # (H) bucketed by last segment and each bucket is filtered with endswith.
+        self._suffix_root: TrieNode | None = None
+        self._last_segment_index: dict[str, dict[QualifiedName, None]] | None = None
+        if (
+            settings.FUNCTION_REGISTRY_SUFFIX_TRIE
+            if suffix_trie is None
+            else suffix_trie
+        ):
+            self._suffix_root = {}
+        else:
+            self._last_segment_index = {}
         self._simple_name_lookup = simple_name_lookup
 
     def insert(self, qualified_name: QualifiedName, func_type: NodeType) -> None:
         self._entries[qualified_name] = func_type
-
         parts = qualified_name.split(cs.SEPARATOR_DOT)
-        current: TrieNode = self.root
+        self._insert_path(self.root, parts, qualified_name, func_type)
+        if self._suffix_root is not None:
+            self._insert_path(self._suffix_root, parts[::-1], qualified_name, func_type)
+        if self._last_segment_index is not None:
+            self._last_segment_index.setdefault(parts[-1], {})[qualified_name] = None
+
+    @staticmethod
+    def _insert_path(
+        root: TrieNode,
+        parts: list[str],
+        qualified_name: QualifiedName,
+        func_type: NodeType,
+    ) -> None:
+        current: TrieNode = root
 
         for part in parts:
             if part not in current:
@@ -72,6 +168,13 @@ class FunctionRegistryTrie:
 
         parts = qualified_name.split(cs.SEPARATOR_DOT)
         self._cleanup_trie_path(parts, self.root)
+        if self._suffix_root is not None:
+            self._cleanup_trie_path(parts[::-1], self._suffix_root)
+        if self._last_segment_index is not None:
+            bucket = self._last_segment_index[parts[-1]]
+            del bucket[qualified_name]
+            if not bucket:
+                del self._last_segment_index[parts[-1]]
 
     def _cleanup_trie_path(self, parts: list[str], node: TrieNode) -> bool:
         if not parts:
@@ -93,8 +196,11 @@ class FunctionRegistryTrie:
         return not has_children and not is_endpoint
 
     def _navigate_to_prefix(self, prefix: str) -> TrieNode | None:
-        parts = prefix.split(cs.SEPARATOR_DOT) if prefix else []
-        current: TrieNode = self.root
+        return self._navigate(self.root, _prefix_parts(prefix))
+
+    @staticmethod
+    def _navigate(root: TrieNode, parts: list[str]) -> TrieNode | None:
+        current: TrieNode = root
         for part in parts:
             if part not in current:
                 return None
@@ -151,21 +257,228 @@ class FunctionRegistryTrie:
         if self._simple_name_lookup is not None and suffix in self._simple_name_lookup:
             # (H) O(1) lookup using the simple_name_lookup index
             return list(self._simple_name_lookup[suffix])
-        # (H) Fallback to linear scan if no index available
-        return [qn for qn in self._entries.keys() if qn.endswith(f".{suffix}")]
+        if self._suffix_root is None:
+            return self._find_in_last_segment_bucket(suffix)
+        node = self._navigate(self._suffix_root, suffix.split(cs.SEPARATOR_DOT)[::-1])
+        if node is None:
+            return []
+        matches = self._collect_from_subtree(node, lambda qn: qn != suffix)
+        return [qn for qn, _ in matches]
+
+    def _find_in_last_segment_bucket(self, suffix: str) -> list[QualifiedName]:
+        assert self._last_segment_index is not None
+        bucket = self._last_segment_index.get(suffix.rpartition(cs.SEPARATOR_DOT)[2])
+        if not bucket:
+            return []
+        suffix_pattern = f".{suffix}"
+        return [qn for qn in bucket if qn.endswith(suffix_pattern)]
 
     def find_with_prefix(self, prefix: str) -> list[tuple[QualifiedName, NodeType]]:
         node = self._navigate_to_prefix(prefix)
         return [] if node is None else self._collect_from_subtree(node)
 
 
+def _newest[K, V](items: ItemsView[K, V], count: int) -> list[tuple[K, V]]:
+    newest = list(islice(reversed(items), count))
+    newest.reverse()
+    return newest
+
+
+def _group_by_label(nodes: Iterable[tuple[QualifiedName, str]]) -> NodesByLabel:
+    grouped: NodesByLabel = {}
+    for qn, label in nodes:
+        grouped.setdefault(label, []).append(qn)
+    return grouped
+
+
+def _kinds_by_label(kinds: Mapping[QualifiedName, NodeType | None]) -> NodesByLabel:
+    return _group_by_label(
+        (qn, kinds[qn] or cs.NodeLabel.MODULE) for qn in sorted(kinds)
+    )
+
+
+def _trailing_names(qn: QualifiedName) -> set[str]:
+    parts = qn.split(cs.SEPARATOR_DOT)
+    return {cs.SEPARATOR_DOT.join(parts[start:]) for start in range(len(parts))}
+
+
+def _prefix_parts(prefix: str) -> list[str]:
+    return prefix.split(cs.SEPARATOR_DOT) if prefix else []
+
+
+class CompactFunctionRegistryTrie:
+    def __init__(self, simple_name_lookup: SimpleNameLookup | None = None) -> None:
+        self._entries: FunctionRegistry = {}
+        # (H) Each distinct segment is interned once as a fixed-width code, so a
+        # (H) qualified name costs two small bytes keys instead of a dict per level.
+        self._segment_codes: dict[str, bytes] = {}
+        self._segments: list[str] = []
+        self._prefix_keys: list[bytes] = []
+        self._suffix_keys: list[bytes] = []
+        self._pending_prefix_keys: list[bytes] = []
+        self._pending_suffix_keys: list[bytes] = []
+        self._deleted_prefix_keys: set[bytes] = set()
+        self._deleted_suffix_keys: set[bytes] = set()
+        self._simple_name_lookup = simple_name_lookup
+
+    def _code(self, segment: str) -> bytes:
+        if (code := self._segment_codes.get(segment)) is None:
+            code = len(self._segments).to_bytes(cs.TRIE_SEGMENT_CODE_BYTES)
+            self._segment_codes[segment] = code
+            self._segments.append(segment)
+        return code
+
+    def _codes(self, parts: list[str]) -> list[bytes] | None:
+        codes: list[bytes] = []
+        for part in parts:
+            if (code := self._segment_codes.get(part)) is None:
+                return None
+            codes.append(code)
+        return codes
+
+    def _decode(self, key: bytes, reverse: bool = False) -> QualifiedName:
+        count = len(key) // cs.TRIE_SEGMENT_CODE_BYTES
+        codes = struct.unpack(cs.TRIE_SEGMENT_CODE_FORMAT.format(count=count), key)
+        parts = [self._segments[code] for code in codes]
+        if reverse:
+            parts.reverse()
+        return cs.SEPARATOR_DOT.join(parts)
+
+    def _sync(self) -> None:
+        # (H) Inserts and deletes are buffered and merged on the next query; both
+        # (H) come in bursts, so each sorted array is rebuilt once per burst.
+        if self._pending_prefix_keys:
+            self._prefix_keys.extend(self._pending_prefix_keys)
+            self._prefix_keys.sort()
+            self._pending_prefix_keys = []
+            self._suffix_keys.extend(self._pending_suffix_keys)
+            self._suffix_keys.sort()
+            self._pending_suffix_keys = []
+        if self._deleted_prefix_keys:
+            self._prefix_keys = [
+                key for key in self._prefix_keys if key not in self._deleted_prefix_keys
+            ]
+            self._deleted_prefix_keys = set()
+            self._suffix_keys = [
+                key for key in self._suffix_keys if key not in self._deleted_suffix_keys
+            ]
+            self._deleted_suffix_keys = set()
+
+    @staticmethod
+    def _scan(keys: list[bytes], prefix: bytes, min_length: int = 0) -> Iterator[bytes]:
+        for i in range(bisect_left(keys, prefix), len(keys)):
+            key = keys[i]
+            if not key.startswith(prefix):
+                return
+            if len(key) > min_length:
+                yield key
+
+    def insert(self, qualified_name: QualifiedName, func_type: NodeType) -> None:
+        if qualified_name not in self._entries:
+            codes = [
+                self._code(part) for part in qualified_name.split(cs.SEPARATOR_DOT)
+            ]
+            prefix_key = b"".join(codes)
+            suffix_key = b"".join(reversed(codes))
+            # (H) A name deleted since the last sync still has its keys in place.
+            if prefix_key in self._deleted_prefix_keys:
+                self._deleted_prefix_keys.discard(prefix_key)
+                self._deleted_suffix_keys.discard(suffix_key)
+            else:
+                self._pending_prefix_keys.append(prefix_key)
+                self._pending_suffix_keys.append(suffix_key)
+        self._entries[qualified_name] = func_type
+
+    def get(
+        self, qualified_name: QualifiedName, default: NodeType | None = None
+    ) -> NodeType | None:
+        return self._entries.get(qualified_name, default)
+
+    def __contains__(self, qualified_name: QualifiedName) -> bool:
+        return qualified_name in self._entries
+
+    def __getitem__(self, qualified_name: QualifiedName) -> NodeType:
+        return self._entries[qualified_name]
+
+    def __setitem__(self, qualified_name: QualifiedName, func_type: NodeType) -> None:
+        self.insert(qualified_name, func_type)
+
+    def __delitem__(self, qualified_name: QualifiedName) -> None:
+        if qualified_name not in self._entries:
+            return
+
+        del self._entries[qualified_name]
+
+        codes = self._codes(qualified_name.split(cs.SEPARATOR_DOT))
+        assert codes is not None
+        self._deleted_prefix_keys.add(b"".join(codes))
+        self._deleted_suffix_keys.add(b"".join(reversed(codes)))
+
+    def keys(self) -> KeysView[QualifiedName]:
+        return self._entries.keys()
+
+    def items(self) -> ItemsView[QualifiedName, NodeType]:
+        return self._entries.items()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def find_with_prefix_and_suffix(
+        self, prefix: str, suffix: str
+    ) -> list[QualifiedName]:
+        prefix_codes = self._codes(_prefix_parts(prefix))
+        suffix_codes = self._codes(suffix.split(cs.SEPARATOR_DOT))
+        if prefix_codes is None or suffix_codes is None:
+            return []
+        self._sync()
+        suffix_key = b"".join(suffix_codes)
+        return [
+            self._decode(key)
+            for key in self._scan(self._prefix_keys, b"".join(prefix_codes))
+            if key.endswith(suffix_key) and len(key) > len(suffix_key)
+        ]
+
+    def find_ending_with(self, suffix: str) -> list[QualifiedName]:
+        if self._simple_name_lookup is not None and suffix in self._simple_name_lookup:
+            return list(self._simple_name_lookup[suffix])
+        if (codes := self._codes(suffix.split(cs.SEPARATOR_DOT))) is None:
+            return []
+        self._sync()
+        suffix_key = b"".join(reversed(codes))
+        return [
+            self._decode(key, reverse=True)
+            for key in self._scan(self._suffix_keys, suffix_key, len(suffix_key))
+        ]
+
+    def find_with_prefix(self, prefix: str) -> list[tuple[QualifiedName, NodeType]]:
+        if (codes := self._codes(_prefix_parts(prefix))) is None:
+            return []
+        self._sync()
+        results: list[tuple[QualifiedName, NodeType]] = []
+        for key in self._scan(self._prefix_keys, b"".join(codes)):
+            qn = self._decode(key)
+            results.append((qn, self._entries[qn]))
+        return results
+
+
+def new_function_registry(
+    simple_name_lookup: SimpleNameLookup | None = None,
+) -> FunctionRegistryTrie | CompactFunctionRegistryTrie:
+    if settings.FUNCTION_REGISTRY_COMPACT:
+        return CompactFunctionRegistryTrie(simple_name_lookup=simple_name_lookup)
+    return FunctionRegistryTrie(simple_name_lookup=simple_name_lookup)
+
+
 class BoundedASTCache:
     def __init__(
         self,
         max_entries: int | None = None,
         max_memory_mb: int | None = None,
+        loader: Callable[[Path], tuple[Node, cs.SupportedLanguage] | None]
+        | None = None,
     ):
         self.cache: OrderedDict[Path, tuple[Node, cs.SupportedLanguage]] = OrderedDict()
+        self.loader = loader
         self.max_entries = (
             max_entries if max_entries is not None else settings.CACHE_MAX_ENTRIES
         )
@@ -173,51 +486,73 @@ class BoundedASTCache:
             max_memory_mb if max_memory_mb is not None else settings.CACHE_MAX_MEMORY_MB
         )
         self.max_memory_bytes = max_mem * cs.BYTES_PER_MB
+        self._sizes: dict[Path, int] = {}
+        self.estimated_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.reparses = 0
 
     def __setitem__(self, key: Path, value: tuple[Node, cs.SupportedLanguage]) -> None:
-        if key in self.cache:
-            del self.cache[key]
-
+        self._discard(key)
+        size = value[0].descendant_count * settings.CACHE_BYTES_PER_NODE
         self.cache[key] = value
+        self._sizes[key] = size
+        self.estimated_bytes += size
 
         self._enforce_limits()
 
     def __getitem__(self, key: Path) -> tuple[Node, cs.SupportedLanguage]:
-        value = self.cache[key]
-        self.cache.move_to_end(key)
+        if (value := self.get_or_load(key)) is None:
+            raise KeyError(key)
         return value
 
     def __delitem__(self, key: Path) -> None:
-        if key in self.cache:
-            del self.cache[key]
+        self._discard(key)
 
     def __contains__(self, key: Path) -> bool:
         return key in self.cache
 
+    def get_or_load(self, key: Path) -> tuple[Node, cs.SupportedLanguage] | None:
+        if key in self.cache:
+            self.hits += 1
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        self.misses += 1
+        if self.loader is None or (value := self.loader(key)) is None:
+            return None
+        self.reparses += 1
+        self[key] = value
+        return self.cache.get(key)
+
+    def _discard(self, key: Path) -> None:
+        if key in self.cache:
+            del self.cache[key]
+            self.estimated_bytes -= self._sizes.pop(key)
+
     def items(self) -> ItemsView[Path, tuple[Node, cs.SupportedLanguage]]:
         return self.cache.items()
 
-    def _enforce_limits(self) -> None:
-        while len(self.cache) > self.max_entries:
-            self.cache.popitem(last=False)  # (H) Remove least recently used
-
-        if self._should_evict_for_memory():
-            entries_to_remove = max(
-                1, len(self.cache) // settings.CACHE_EVICTION_DIVISOR
-            )
-            for _ in range(entries_to_remove):
-                if self.cache:
-                    self.cache.popitem(last=False)
+    @property
+    def stats(self) -> ASTCacheStats:
+        return ASTCacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            reparses=self.reparses,
+            entries=len(self.cache),
+            estimated_bytes=self.estimated_bytes,
+        )
 
-    def _should_evict_for_memory(self) -> bool:
-        try:
-            cache_size = sum(sys.getsizeof(v) for v in self.cache.values())
-            return cache_size > self.max_memory_bytes
-        except Exception:
-            return (
-                len(self.cache)
-                > self.max_entries * settings.CACHE_MEMORY_THRESHOLD_RATIO
-            )
+    def _enforce_limits(self) -> None:
+        # (H) Never evict the newest entry, so a single oversized tree stays usable.
+        while len(self.cache) > 1 and (
+            len(self.cache) > self.max_entries
+            or self.estimated_bytes > self.max_memory_bytes
+        ):
+            key, _ = self.cache.popitem(last=False)  # (H) Remove least recently used
+            self.estimated_bytes -= self._sizes.pop(key)
+            self.evictions += 1
 
 
 class GraphUpdater:
@@ -229,6 +564,11 @@ class GraphUpdater:
         queries: dict[cs.SupportedLanguage, LanguageQueries],
         unignore_paths: frozenset[str] | None = None,
         exclude_paths: frozenset[str] | None = None,
+        workers: int | None = None,
+        manifest_path: Path | None = None,
+        streaming: bool | None = None,
+        track_dependencies: bool = False,
+        incremental_parse: bool = False,
     ):
         self.ingestor = ingestor
         self.repo_path = repo_path
@@ -236,12 +576,42 @@ class GraphUpdater:
         self.queries = queries
         self.project_name = repo_path.resolve().name
         self.simple_name_lookup: SimpleNameLookup = defaultdict(set)
-        self.function_registry = FunctionRegistryTrie(
-            simple_name_lookup=self.simple_name_lookup
+        # (H) With a manifest, the serial pass reads each file's new simple names
+        # (H) back from the lookup's journal.
+        self._name_journal: list[tuple[str, QualifiedName]] | None = None
+        if manifest_path is not None:
+            lookup = RecordingNameLookup()
+            self.simple_name_lookup = lookup
+            self._name_journal = lookup.additions
+        self.function_registry = new_function_registry(self.simple_name_lookup)
+        self.streaming = settings.INDEX_STREAMING if streaming is None else streaming
+        # (H) Bounding the trees buys little while the ingestor itself holds
+        # (H) every row, so streaming needs one that writes batches as it goes.
+        if self.streaming and not isinstance(ingestor, BatchFlushingIngestorProtocol):
+            logger.warning(
+                ls.STREAMING_NEEDS_FLUSHING_INGESTOR.format(
+                    ingestor=type(ingestor).__name__
+                )
+            )
+            self.streaming = False
+        self._restored_files: dict[Path, str] = {}
+        # (H) Pass 3 works from call site records, so evicted trees are simply
+        # (H) re-parsed when needed; streaming keeps only a handful of them.
+        self.ast_cache = BoundedASTCache(
+            max_entries=settings.STREAMING_AST_CACHE_ENTRIES
+            if self.streaming
+            else None,
+            loader=self._load_source_file,
         )
-        self.ast_cache = BoundedASTCache()
+        self._call_sites: dict[Path, FileCallSites] = {}
+        self.call_dependencies = CallDependencyIndex() if track_dependencies else None
         self.unignore_paths = unignore_paths
         self.exclude_paths = exclude_paths
+        self.workers = settings.resolve_workers(workers)
+        self.manifest_path = manifest_path
+        self._manifest_entries: dict[str, ManifestEntry] | None = None
+        self._repo_walk: RepoWalk | None = None
+        self._changed_paths: set[str] | None = None
 
         self.factory = ProcessorFactory(
             ingestor=self.ingestor,
@@ -253,6 +623,7 @@ class GraphUpdater:
             ast_cache=self.ast_cache,
             unignore_paths=self.unignore_paths,
             exclude_paths=self.exclude_paths,
+            retain_sources=incremental_parse,
         )
 
     def _is_dependency_file(self, file_name: str, filepath: Path) -> bool:
@@ -266,92 +637,1012 @@ class GraphUpdater:
             cs.NODE_PROJECT, {cs.KEY_NAME: self.project_name}
         )
         logger.info(ls.ENSURING_PROJECT.format(name=self.project_name))
+        self._repo_walk = None
+        self._call_sites = {}
+        self._restored_files = {}
+        if self.call_dependencies is not None:
+            self.call_dependencies.clear()
+        if self.streaming:
+            logger.info(
+                ls.PASS_STREAMING.format(
+                    queue=settings.STREAMING_QUEUE_SIZE,
+                    cache=self.ast_cache.max_entries,
+                )
+            )
+
+        if self.manifest_path is not None:
+            manifest = IndexManifest.load(
+                self.manifest_path, self.project_name, self._manifest_filter_key()
+            )
+            if manifest is not None and self._run_incremental(manifest):
+                return
+            self._manifest_entries = {}
 
         logger.info(ls.PASS_1_STRUCTURE)
-        self.factory.structure_processor.identify_structure()
+        with profile_span(cs.PROFILE_PASS_STRUCTURE, cs.ProfileCategory.PASS):
+            self.factory.structure_processor.identify_structure(self._walk_repo())
 
         logger.info(ls.PASS_2_FILES)
-        self._process_files()
+        with profile_span(cs.PROFILE_PASS_DEFINITIONS, cs.ProfileCategory.PASS):
+            self._process_files()
 
+        self._finish_run()
+
+    def _finish_run(self) -> None:
         logger.info(ls.FOUND_FUNCTIONS.format(count=len(self.function_registry)))
         logger.info(ls.PASS_3_CALLS)
-        self._process_function_calls()
+        with profile_span(cs.PROFILE_PASS_CALLS, cs.ProfileCategory.PASS):
+            self._process_function_calls()
+        self._log_cache_stats()
 
-        self.factory.definition_processor.process_all_method_overrides()
+        with profile_span(cs.PROFILE_PASS_METHOD_OVERRIDES, cs.ProfileCategory.PASS):
+            self.factory.definition_processor.process_all_method_overrides()
 
         logger.info(ls.ANALYSIS_COMPLETE)
+        with profile_span(cs.PROFILE_PASS_FLUSH, cs.ProfileCategory.PASS):
+            self.ingestor.flush_all()
+        self._save_manifest()
+        if self._name_journal is not None:
+            self._name_journal.clear()
+
+        with profile_span(cs.PROFILE_PASS_EMBEDDINGS, cs.ProfileCategory.PASS):
+            self._generate_semantic_embeddings()
+
+    def _manifest_filter_key(self) -> str:
+        return manifest_filter_key(self.exclude_paths, self.unignore_paths)
+
+    def _manifest_key(self, filepath: Path) -> str:
+        return str(filepath.relative_to(self.repo_path))
+
+    def _save_manifest(self) -> None:
+        if self.manifest_path is None or self._manifest_entries is None:
+            return
+        IndexManifest(
+            project_name=self.project_name,
+            filter_key=self._manifest_filter_key(),
+            files=self._manifest_entries,
+        ).save(self.manifest_path)
+
+    def _run_incremental(self, manifest: IndexManifest) -> bool:
+        if not isinstance(self.ingestor, IncrementalIngestorProtocol):
+            logger.info(ls.INCREMENTAL_UNSUPPORTED)
+            return False
+        if not self._graph_matches_manifest(manifest):
+            logger.info(
+                ls.INCREMENTAL_GRAPH_OUT_OF_SYNC.format(project=self.project_name)
+            )
+            return False
+
+        with profile_span(cs.PROFILE_PASS_CHANGE_DETECTION, cs.ProfileCategory.PASS):
+            repo_files = {
+                self._manifest_key(filepath): filepath
+                for filepath in self._iter_repo_files()
+            }
+            current = {
+                key: self._fingerprint(key, filepath, manifest.files.get(key))
+                for key, filepath in repo_files.items()
+            }
+            changes = manifest.diff(current)
+        if not changes.has_changes:
+            logger.info(ls.INDEX_UP_TO_DATE.format(count=len(changes.unchanged)))
+            if changes.touched and self.manifest_path is not None:
+                manifest.save(self.manifest_path)
+            return True
+
+        if not self.ingestor.load_existing_graph():
+            logger.info(ls.INCREMENTAL_NO_EXISTING_GRAPH)
+            return False
+
+        self._update_incrementally(
+            self.ingestor, manifest, repo_files, current, changes
+        )
+        return True
+
+    def _graph_matches_manifest(self, manifest: IndexManifest) -> bool:
+        # (H) The manifest lives outside the graph, which may have been wiped or
+        # (H) re-indexed since; trust it only while the File nodes still agree.
+        if not isinstance(self.ingestor, QueryProtocol):
+            return True
+        stored = {
+            str(row[cs.KEY_PATH]): row[cs.KEY_CONTENT_HASH]
+            for row in self.ingestor.fetch_all(
+                CYPHER_PROJECT_FILE_FINGERPRINTS,
+                {cs.KEY_PROJECT_NAME: self.project_name},
+            )
+        }
+        return stored == {
+            key: entry.content_hash for key, entry in manifest.files.items()
+        }
+
+    def update(self, changed_paths: Iterable[Path]) -> None:
+        # (H) Only the listed paths are fingerprinted; every other file keeps its
+        # (H) manifest entry, so a fresh checkout is not re-hashed in full.
+        self._changed_paths = {
+            self._manifest_key(path)
+            for path in changed_paths
+            if path.is_relative_to(self.repo_path)
+        }
+        logger.info(ls.UPDATE_CHANGED_PATHS.format(count=len(self._changed_paths)))
+        if self.manifest_path is None or not self.manifest_path.is_file():
+            logger.info(ls.UPDATE_NO_MANIFEST)
+        try:
+            self.run()
+        finally:
+            self._changed_paths = None
+
+    def _fingerprint(
+        self, key: str, filepath: Path, previous: ManifestEntry | None
+    ) -> ManifestEntry:
+        if (
+            previous is not None
+            and self._changed_paths is not None
+            and key not in self._changed_paths
+        ):
+            return previous
+        return fingerprint_file(filepath, previous)
+
+    def _update_incrementally(
+        self,
+        ingestor: IncrementalIngestorProtocol,
+        manifest: IndexManifest,
+        repo_files: dict[str, Path],
+        current: dict[str, ManifestEntry],
+        changes: FileChanges,
+    ) -> None:
+        unchanged = set(changes.unchanged)
+        self._manifest_entries = {
+            key: manifest.files[key] if key in unchanged else entry
+            for key, entry in current.items()
+        }
+        for key in changes.unchanged:
+            self._restore_file_state(repo_files[key], manifest.files[key])
+
+        logger.info(ls.PASS_1_STRUCTURE)
+        with profile_span(cs.PROFILE_PASS_STRUCTURE, cs.ProfileCategory.PASS):
+            self.factory.structure_processor.identify_structure(self._walk_repo())
+
+        with profile_span(cs.PROFILE_PASS_DEFINITIONS, cs.ProfileCategory.PASS):
+            extracted = self._extract_files(
+                [repo_files[key] for key in (*changes.added, *changes.changed)]
+            )
+        old_kinds = {
+            key: manifest.files[key].owned_kinds()
+            for key in (*changes.changed, *changes.removed)
+        }
+        new_kinds = {
+            self._manifest_key(filepath): dict.fromkeys(definitions.module_qns)
+            | dict(definitions.registry_entries)
+            for filepath, definitions in extracted.items()
+        }
+        changed_names: set[tuple[str, QualifiedName]] = set()
+        for key in (*changes.added, *changes.changed, *changes.removed):
+            old_names = manifest.files[key].simple_names if key in old_kinds else []
+            new_names = (
+                extracted[repo_files[key]].simple_names
+                if repo_files.get(key) in extracted
+                else []
+            )
+            changed_names |= set(old_names) ^ set(new_names)
+        old_qns = {qn for kinds in old_kinds.values() for qn in kinds}
+        new_qns = {qn for kinds in new_kinds.values() for qn in kinds}
+
+        # (H) Importers of symbols that appeared or disappeared resolve their
+        # (H) imports differently, so they are re-extracted like changed files.
+        reimported = find_dependents(
+            manifest, changes.unchanged, old_qns ^ new_qns, imports_only=True
+        )
+        with profile_span(cs.PROFILE_PASS_DEFINITIONS, cs.ProfileCategory.PASS):
+            reimported_files = self._extract_files(
+                [repo_files[key] for key in reimported]
+            )
+        extracted |= reimported_files
+        for filepath, definitions in reimported_files.items():
+            key = self._manifest_key(filepath)
+            old_kinds[key] = manifest.files[key].owned_kinds()
+            new_kinds[key] = dict.fromkeys(definitions.module_qns) | dict(
+                definitions.registry_entries
+            )
+
+        stale: dict[QualifiedName, NodeType | None] = {}
+        reset: dict[QualifiedName, NodeType | None] = {}
+        for key, kinds in old_kinds.items():
+            survivors = new_kinds.get(key, {})
+            for qn, kind in kinds.items():
+                if qn in survivors and survivors[qn] == kind:
+                    reset[qn] = kind
+                else:
+                    stale[qn] = kind
+
+        candidates = sorted(unchanged.difference(reimported))
+        dependents = sorted(
+            set(find_dependents(manifest, candidates, old_qns | new_qns))
+            | set(
+                find_name_dependents(
+                    self.repo_path,
+                    manifest,
+                    candidates,
+                    {name for name, _ in changed_names},
+                )
+            )
+        )
+        logger.info(
+            ls.PASS_INCREMENTAL_CHANGES.format(
+                added=len(changes.added),
+                changed=len(changes.changed),
+                removed=len(changes.removed),
+                dependents=len(reimported) + len(dependents),
+            )
+        )
+
+        # (H) Clear what the previous run emitted for these files before the new
+        # (H) rows are replayed; call dependents only lose their outgoing CALLS.
+        ingestor.delete_nodes(_kinds_by_label(stale))
+        ingestor.reset_nodes(_kinds_by_label(reset))
+        ingestor.delete_file_nodes(changes.removed)
+        ingestor.delete_outgoing_calls(
+            _kinds_by_label(
+                {
+                    qn: kind
+                    for key in dependents
+                    for qn, kind in manifest.files[key].owned_kinds().items()
+                }
+            )
+        )
+
+        logger.info(ls.PASS_2_FILES)
+        touched = [
+            filepath
+            for key, filepath in repo_files.items()
+            if key not in unchanged or filepath in reimported_files
+        ]
+        source_languages = {
+            filepath: language
+            for filepath in touched
+            if filepath in extracted
+            and (language := self._get_source_language(filepath))
+        }
+        with profile_span(cs.PROFILE_PASS_DEFINITIONS, cs.ProfileCategory.PASS):
+            self._merge_files(
+                touched,
+                source_languages,
+                (extracted[filepath] for filepath in source_languages),
+            )
+
+            # (H) Unchanged files are parsed on demand when call resolution looks
+            # (H) into another module's AST.
+            for key in dependents:
+                if parsed := self._parse_source_file(repo_files[key]):
+                    self.add_file_to_state(repo_files[key], *parsed)
+
+        # (H) External modules have no file of their own; drop those that the
+        # (H) re-ingested files stopped importing and no other file still does.
+        imported = {
+            module_path
+            for entry in self._manifest_entries.values()
+            for module_path in entry.external_modules
+        }
+        orphaned = {
+            module_path
+            for key in old_kinds
+            for module_path in manifest.files[key].external_modules
+        } - imported
+        if orphaned:
+            ingestor.delete_nodes({cs.NodeLabel.MODULE: sorted(orphaned)})
+
+        self._finish_run()
+
+    def _extract_files(self, filepaths: list[Path]) -> dict[Path, FileDefinitions]:
+        source_languages = {
+            filepath: language
+            for filepath in filepaths
+            if (language := self._get_source_language(filepath))
+        }
+        return dict(zip(source_languages, self._extract_definitions(source_languages)))
+
+    def _restore_file_state(self, filepath: Path, entry: ManifestEntry) -> None:
+        self.factory.import_processor.import_mapping.update(entry.import_mapping)
+        self.factory.definition_processor.class_inheritance.update(
+            entry.class_inheritance
+        )
+        for module_qn in entry.module_qns:
+            self.factory.module_qn_to_file_path[module_qn] = filepath
+        for qn, func_type in entry.definitions:
+            self.function_registry[qn] = func_type
+        for simple_name, qn in entry.simple_names:
+            self.simple_name_lookup[simple_name].add(qn)
+
+    def warm_start(self) -> list[FileChange] | None:
+        if not isinstance(self.ingestor, QueryProtocol):
+            logger.info(ls.WARM_START_UNAVAILABLE.format(project=self.project_name))
+            return None
+        stored = {
+            str(row[cs.KEY_PATH]): ManifestEntry(
+                str(row[cs.KEY_CONTENT_HASH]),
+                int(row[cs.KEY_SIZE]),  # type: ignore[arg-type]
+                int(row[cs.KEY_MTIME_NS]),  # type: ignore[arg-type]
+            )
+            for row in self.ingestor.fetch_all(
+                CYPHER_PROJECT_FILE_FINGERPRINTS,
+                {cs.KEY_PROJECT_NAME: self.project_name},
+            )
+        }
+        if not stored:
+            logger.info(ls.WARM_START_UNAVAILABLE.format(project=self.project_name))
+            return None
+
+        logger.info(ls.WARM_START)
+        self._repo_walk = None
+        self._call_sites = {}
+        self._restored_files = {}
+        if self.call_dependencies is not None:
+            self.call_dependencies.clear()
+        with profile_span(cs.PROFILE_PASS_STRUCTURE, cs.ProfileCategory.PASS):
+            self.factory.structure_processor.identify_structure(self._walk_repo())
+
+        changes: list[FileChange] = []
+        with profile_span(cs.PROFILE_PASS_CHANGE_DETECTION, cs.ProfileCategory.PASS):
+            for filepath in self._iter_repo_files():
+                previous = stored.pop(self._manifest_key(filepath), None)
+                entry = fingerprint_file(filepath, previous)
+                if previous is None or previous.content_hash != entry.content_hash:
+                    if self._get_source_language(filepath):
+                        event_type = (
+                            cs.EventType.CREATED
+                            if previous is None
+                            else cs.EventType.MODIFIED
+                        )
+                        changes.append(FileChange(filepath, event_type))
+                    elif self._is_dependency_file(filepath.name, filepath):
+                        self.factory.definition_processor.process_dependencies(filepath)
+                elif (previous.size, previous.mtime_ns) == (entry.size, entry.mtime_ns):
+                    continue
+                self.ingest_file_node(filepath, entry)
+            # (H) Fingerprints left over belong to files that are gone.
+            removed = sorted(stored)
+            changes.extend(
+                FileChange(self.repo_path / key, cs.EventType.DELETED)
+                for key in removed
+                if self._get_source_language(self.repo_path / key)
+            )
+            if removed:
+                self.ingestor.execute_write(
+                    CYPHER_DELETE_FILES_BY_PATH, {cs.KEY_PATHS: removed}
+                )
+
+        with profile_span(cs.PROFILE_PASS_DEFINITIONS, cs.ProfileCategory.PASS):
+            definitions = self._restore_graph_state(self.ingestor)
         self.ingestor.flush_all()
+        logger.info(
+            ls.WARM_START_RESTORED.format(
+                definitions=definitions,
+                files=len(self._restored_files),
+                changes=len(changes),
+            )
+        )
+        return changes
+
+    def _restore_graph_state(self, ingestor: QueryProtocol) -> int:
+        # (H) The graph already holds what the index passes would rebuild: module
+        # (H) paths, definitions, inheritance and resolved calls. Import maps and
+        # (H) call sites are not stored, so each file gets those when it is parsed.
+        params: PropertyDict = {cs.KEY_PREFIX: f"{self.project_name}{cs.SEPARATOR_DOT}"}
+        for row in ingestor.fetch_all(CYPHER_PROJECT_MODULE_PATHS, params):
+            module_qn = str(row[cs.KEY_QUALIFIED_NAME])
+            filepath = self.repo_path / str(row[cs.KEY_PATH])
+            self.factory.module_qn_to_file_path[module_qn] = filepath
+            self._restored_files[filepath] = module_qn
+        modules = {
+            module_qn: filepath for filepath, module_qn in self._restored_files.items()
+        }
+
+        definitions = ingestor.fetch_all(CYPHER_PROJECT_DEFINITIONS, params)
+        for row in definitions:
+            qn = str(row[cs.KEY_QUALIFIED_NAME])
+            self.function_registry[qn] = NodeType(str(row[cs.KEY_LABEL]))
+            if name := row.get(cs.KEY_NAME):
+                self.simple_name_lookup[str(name)].add(qn)
+
+        parents: defaultdict[str, list[str]] = defaultdict(list)
+        for row in ingestor.fetch_all(CYPHER_PROJECT_INHERITANCE, params):
+            parents[str(row[cs.KEY_FROM_VAL])].append(str(row[cs.KEY_TO_VAL]))
+        self.factory.definition_processor.class_inheritance.update(parents)
+
+        if self.call_dependencies is not None:
+            targets: defaultdict[Path, set[QualifiedName]] = defaultdict(set)
+            for row in ingestor.fetch_all(CYPHER_PROJECT_CALLS, params):
+                if filepath := _owning_file(str(row[cs.KEY_FROM_VAL]), modules):
+                    targets[filepath].add(str(row[cs.KEY_TO_VAL]))
+            for filepath, file_targets in targets.items():
+                self.call_dependencies.record_targets(filepath, file_targets)
+        return len(definitions)
+
+    def _load_source_file(
+        self, filepath: Path
+    ) -> tuple[Node, cs.SupportedLanguage] | None:
+        parsed = self._parse_source_file(filepath)
+        module_qn = self._restored_files.pop(filepath, None)
+        if parsed is not None and module_qn is not None:
+            self.factory.import_processor.parse_imports(
+                parsed[0], module_qn, parsed[1], self.queries, ingest=False
+            )
+            self.add_file_to_state(filepath, *parsed)
+        return parsed
+
+    def ingest_file_node(
+        self, filepath: Path, fingerprint: ManifestEntry | None = None
+    ) -> None:
+        if fingerprint is None and self._manifest_entries is not None:
+            fingerprint = self._manifest_entries.get(self._manifest_key(filepath))
+        if fingerprint is None and filepath.is_file():
+            fingerprint = fingerprint_file(filepath, None)
+        self.factory.structure_processor.process_generic_file(
+            filepath, filepath.name, fingerprint
+        )
+
+    def _record_manifest_entry(
+        self,
+        filepath: Path,
+        language: cs.SupportedLanguage | None = None,
+        definitions: FileDefinitions | None = None,
+    ) -> None:
+        if self._manifest_entries is None:
+            return
+        key = self._manifest_key(filepath)
+        entry = self._manifest_entries.get(key) or fingerprint_file(filepath, None)
+        entry.language = language
+        if definitions is not None:
+            entry.module_qns = definitions.module_qns
+            entry.definitions = definitions.registry_entries
+            entry.simple_names = definitions.simple_names
+            entry.import_mapping = definitions.import_mapping
+            entry.class_inheritance = definitions.class_inheritance
+            external_modules = self.factory.import_processor.external_modules
+            entry.external_modules = sorted(
+                {
+                    module_path
+                    for module_qn in definitions.module_qns
+                    for module_path in external_modules.pop(module_qn, ())
+                }
+            )
+        self._manifest_entries[key] = entry
+
+    def _record_call_targets(self, file_path: Path, rows: list[IngestRow]) -> None:
+        if self._manifest_entries is None and self.call_dependencies is None:
+            return
+        targets = {
+            str(row.to_spec[2])
+            for row in rows
+            if isinstance(row, RelationshipRow)
+            and row.rel_type == cs.RelationshipType.CALLS
+        }
+        if self.call_dependencies is not None:
+            self.call_dependencies.record_targets(file_path, targets)
+        if self._manifest_entries is None:
+            return
+        if entry := self._manifest_entries.get(self._manifest_key(file_path)):
+            entry.call_targets = sorted(targets)
+
+    def add_file_to_state(
+        self, file_path: Path, root_node: Node, language: cs.SupportedLanguage
+    ) -> None:
+        self._restored_files.pop(file_path, None)
+        if not self.streaming:
+            self.ast_cache[file_path] = (root_node, language)
+        self._record_call_sites(
+            file_path,
+            self.factory.call_processor.extract_call_sites(
+                file_path, root_node, language, self.queries
+            ),
+        )
 
-        self._generate_semantic_embeddings()
+    def _record_call_sites(
+        self, file_path: Path, call_sites: FileCallSites | None
+    ) -> None:
+        # (H) Re-adding a file moves it to the end, like the AST cache used to.
+        self._call_sites.pop(file_path, None)
+        if call_sites is not None:
+            self._call_sites[file_path] = call_sites
+        if self.call_dependencies is not None:
+            if call_sites is None:
+                self.call_dependencies.forget(file_path)
+            else:
+                self.call_dependencies.record_call_sites(file_path, call_sites)
 
     def remove_file_from_state(self, file_path: Path) -> None:
         logger.debug(ls.REMOVING_STATE.format(path=file_path))
 
+        self._restored_files.pop(file_path, None)
+        self._call_sites.pop(file_path, None)
+        if self.call_dependencies is not None:
+            self.call_dependencies.forget(file_path)
         if file_path in self.ast_cache:
             del self.ast_cache[file_path]
             logger.debug(ls.REMOVED_FROM_CACHE)
 
+        qns_to_remove = self.file_definitions(file_path)
+        if qns_to_remove:
+            logger.debug(ls.REMOVING_QNS.format(count=len(qns_to_remove)))
+
+        for qn in qns_to_remove:
+            del self.function_registry[qn]
+            self._forget_simple_names(qn)
+
+    def file_definitions(self, file_path: Path) -> list[QualifiedName]:
+        return [
+            qn
+            for qn, _ in self.function_registry.find_with_prefix(
+                self._module_prefix(file_path)
+            )
+        ]
+
+    def _module_prefix(self, file_path: Path) -> str:
         relative_path = file_path.relative_to(self.repo_path)
         path_parts = (
             relative_path.parent.parts
             if file_path.name == cs.INIT_PY
             else relative_path.with_suffix("").parts
         )
-        module_qn_prefix = cs.SEPARATOR_DOT.join([self.project_name, *path_parts])
+        return cs.SEPARATOR_DOT.join([self.project_name, *path_parts])
 
-        qns_to_remove = set()
-
-        for qn in list(self.function_registry.keys()):
-            if qn.startswith(f"{module_qn_prefix}.") or qn == module_qn_prefix:
-                qns_to_remove.add(qn)
-                del self.function_registry[qn]
+    def patch_file(self, file_path: Path) -> FilePatch | None:
+        if (language := self._get_source_language(file_path)) is None:
+            return None
+        processor = self.factory.definition_processor
+        if (patch := processor.plan_patch(file_path, language, self.queries)) is None:
+            return None
 
-        if qns_to_remove:
-            logger.debug(ls.REMOVING_QNS.format(count=len(qns_to_remove)))
+        module_qn = self._module_prefix(file_path)
+        changed, shifted = set(patch.changed_names), set(patch.shifted_names)
+
+        def top_level_name(qn: QualifiedName) -> str:
+            return qn[len(module_qn) + 1 :].partition(cs.SEPARATOR_DOT)[0]
+
+        definitions = self.function_registry.find_with_prefix(module_qn)
+        old_types = {
+            qn: kind for qn, kind in definitions if top_level_name(qn) in changed
+        }
+        for qn in old_types:
+            del self.function_registry[qn]
+            self._forget_simple_names(qn)
+        if not processor.ingest_patch(
+            file_path,
+            language,
+            self.queries,
+            self.factory.structure_processor.structural_elements,
+            patch,
+        ):
+            return None
+        new_types = dict(self.function_registry.find_with_prefix(module_qn))
+        self.add_file_to_state(file_path, patch.root_node, language)
+        return FilePatch(
+            reset=_kinds_by_label(old_types),
+            deleted=_kinds_by_label(
+                {
+                    qn: kind
+                    for qn, kind in old_types.items()
+                    if new_types.get(qn) != kind
+                }
+            ),
+            shifted=_kinds_by_label(
+                {qn: kind for qn, kind in definitions if top_level_name(qn) in shifted}
+            )
+            if patch.line_delta
+            else {},
+            line_delta=patch.line_delta,
+        )
 
-        for simple_name, qn_set in self.simple_name_lookup.items():
-            original_count = len(qn_set)
-            new_qn_set = qn_set - qns_to_remove
-            if len(new_qn_set) < original_count:
-                self.simple_name_lookup[simple_name] = new_qn_set
-                logger.debug(ls.CLEANED_SIMPLE_NAME.format(name=simple_name))
+    def call_scope(
+        self,
+        changed_paths: list[Path],
+        old_qns: set[QualifiedName],
+        new_qns: set[QualifiedName],
+        patched_paths: Collection[Path] = (),
+    ) -> CallScope | None:
+        if self.call_dependencies is None:
+            return None
+        # (H) Callers of a changed file's symbols may resolve differently now, and
+        # (H) so may any call site naming a definition that appeared or vanished.
+        # (H) Patched files keep their nodes, so their old CALLS go as well.
+        changed = set(changed_paths)
+        names = {definition_simple_name(qn) for qn in old_qns ^ new_qns}
+        dependents = self.call_dependencies.dependents(old_qns | new_qns, names)
+        # (H) Files restored from the graph only know their resolved CALLS, so any
+        # (H) whose text mentions a changed name is parsed and re-resolved too.
+        if self._restored_files:
+            dependents.update(
+                files_mentioning(
+                    [
+                        file_path
+                        for file_path in self._restored_files
+                        if file_path not in changed and file_path not in dependents
+                    ],
+                    names,
+                )
+            )
+            for file_path in [
+                file_path
+                for file_path in dependents
+                if file_path in self._restored_files
+            ]:
+                self._load_source_file(file_path)
+        dependent_paths = [
+            file_path
+            for file_path in self._call_sites
+            if file_path in dependents and file_path not in changed
+        ]
+        logger.info(
+            ls.WATCHER_CALL_SCOPE.format(
+                changed=len(changed), dependents=len(dependent_paths)
+            )
+        )
+        return CallScope(
+            files=[
+                file_path
+                for file_path in self._call_sites
+                if file_path in changed or file_path in dependents
+            ],
+            callers=_group_by_label(
+                (caller.qualified_name, caller.label)
+                for file_path in [*patched_paths, *dependent_paths]
+                if file_path in self._call_sites
+                for caller in self._call_sites[file_path].callers
+            ),
+        )
 
-    def _process_files(self) -> None:
-        for filepath in self.repo_path.rglob("*"):
-            if filepath.is_file() and not should_skip_path(
-                filepath,
+    def _forget_simple_names(self, qn: QualifiedName) -> None:
+        # (H) simple_name_lookup backs find_ending_with, so every name is one or
+        # (H) more trailing segments of its qualified name, or of the name with
+        # (H) its signature stripped for methods like Java's pkg.Foo.bar(int);
+        # (H) probing those keeps removal proportional to the file.
+        for simple_name in _trailing_names(qn) | _trailing_names(
+            qn.partition(cs.CHAR_PAREN_OPEN)[0]
+        ):
+            qn_set = self.simple_name_lookup.get(simple_name)
+            if qn_set is None or qn not in qn_set:
+                continue
+            qn_set.discard(qn)
+            if not qn_set:
+                del self.simple_name_lookup[simple_name]
+            logger.debug(ls.CLEANED_SIMPLE_NAME.format(name=simple_name))
+
+    def _walk_repo(self) -> RepoWalk:
+        if self._repo_walk is None:
+            self._repo_walk = walk_repo(
                 self.repo_path,
                 exclude_paths=self.exclude_paths,
                 unignore_paths=self.unignore_paths,
-            ):
-                lang_config = get_language_spec(filepath.suffix)
-                if (
-                    lang_config
-                    and isinstance(lang_config.language, cs.SupportedLanguage)
-                    and lang_config.language in self.parsers
+            )
+        return self._repo_walk
+
+    def _iter_repo_files(self) -> Iterator[Path]:
+        yield from self._walk_repo().files
+
+    def _get_source_language(self, filepath: Path) -> cs.SupportedLanguage | None:
+        lang_config = get_language_spec(filepath.suffix)
+        if (
+            lang_config
+            and isinstance(lang_config.language, cs.SupportedLanguage)
+            and lang_config.language in self.parsers
+        ):
+            return lang_config.language
+        return None
+
+    def _process_files(self) -> None:
+        if self.workers > 1 or self.streaming:
+            filepaths = list(self._iter_repo_files())
+            source_languages = {
+                filepath: language
+                for filepath in filepaths
+                if (language := self._get_source_language(filepath))
+            }
+            self._merge_files(
+                filepaths, source_languages, self._extract_definitions(source_languages)
+            )
+            return
+
+        for filepath in self._iter_repo_files():
+            if language := self._get_source_language(filepath):
+                marks = self._definition_marks()
+                with profile_span(
+                    cs.PROFILE_PASS_DEFINITIONS,
+                    cs.ProfileCategory.FILE,
+                    path=str(filepath.relative_to(self.repo_path)),
+                    language=str(language),
                 ):
                     result = self.factory.definition_processor.process_file(
                         filepath,
-                        lang_config.language,
+                        language,
                         self.queries,
                         self.factory.structure_processor.structural_elements,
                     )
                     if result:
-                        root_node, language = result
-                        self.ast_cache[filepath] = (root_node, language)
-                elif self._is_dependency_file(filepath.name, filepath):
+                        self.add_file_to_state(filepath, *result)
+                self._record_manifest_entry(
+                    filepath,
+                    language,
+                    self._definitions_since(marks, bool(result)) if marks else None,
+                )
+            else:
+                if self._is_dependency_file(filepath.name, filepath):
                     self.factory.definition_processor.process_dependencies(filepath)
+                self._record_manifest_entry(filepath)
+
+            self.ingest_file_node(filepath)
 
-                self.factory.structure_processor.process_generic_file(
-                    filepath, filepath.name
+    def _definition_marks(self) -> DefinitionMarks | None:
+        if self._manifest_entries is None or self._name_journal is None:
+            return None
+        self._name_journal.clear()
+        return DefinitionMarks(
+            registered=len(self.function_registry),
+            modules=len(self.factory.module_qn_to_file_path),
+            classes=len(self.factory.definition_processor.class_inheritance),
+        )
+
+    def _definitions_since(
+        self, marks: DefinitionMarks, parsed: bool
+    ) -> FileDefinitions:
+        # (H) The serial pass shares one registry across files, so a file's share
+        # (H) is whatever was appended to each insertion-ordered map since its marks.
+        module_paths = self.factory.module_qn_to_file_path
+        module_qns = [
+            module_qn
+            for module_qn, _ in _newest(
+                module_paths.items(), len(module_paths) - marks.modules
+            )
+        ]
+        import_mapping = self.factory.import_processor.import_mapping
+        class_inheritance = self.factory.definition_processor.class_inheritance
+        return FileDefinitions(
+            parsed=parsed,
+            registry_entries=_newest(
+                self.function_registry.items(),
+                len(self.function_registry) - marks.registered,
+            ),
+            simple_names=list(self._name_journal or ()),
+            import_mapping={
+                module_qn: import_mapping[module_qn]
+                for module_qn in module_qns
+                if module_qn in import_mapping
+            },
+            class_inheritance=dict(
+                _newest(
+                    class_inheritance.items(), len(class_inheritance) - marks.classes
                 )
+            ),
+            module_qns=module_qns,
+        )
 
-    def _process_function_calls(self) -> None:
-        ast_cache_items = list(self.ast_cache.items())
-        for file_path, (root_node, language) in ast_cache_items:
-            self.factory.call_processor.process_calls_in_file(
-                file_path, root_node, language, self.queries
+    def _extract_definitions(
+        self, source_languages: dict[Path, cs.SupportedLanguage]
+    ) -> Iterator[FileDefinitions]:
+        structural_elements = self.factory.structure_processor.structural_elements
+        if self.workers == 1 or len(source_languages) <= 1:
+            # (H) Same isolated per-file extraction, without the pool.
+            yield from iter_file_definitions(
+                self.repo_path,
+                self.project_name,
+                structural_elements,
+                source_languages,
+            )
+            return
+
+        logger.info(
+            ls.PASS_2_PARALLEL.format(count=len(source_languages), workers=self.workers)
+        )
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=init_definition_worker,
+            initargs=(
+                self.repo_path,
+                self.project_name,
+                structural_elements,
+                active_profiler() is not None,
+            ),
+        ) as pool:
+            # (H) Both maps yield in submission order, so merging replays
+            # (H) ingestion in the same file order as the serial pass.
+            if self.streaming:
+                yield from bounded_map(
+                    pool,
+                    extract_file_definitions,
+                    source_languages.keys(),
+                    source_languages.values(),
+                    window=settings.STREAMING_QUEUE_SIZE,
+                )
+                return
+            yield from pool.map(
+                extract_file_definitions,
+                source_languages.keys(),
+                source_languages.values(),
+                chunksize=parallel_chunk_size(len(source_languages), self.workers),
+            )
+
+    def _merge_files(
+        self,
+        filepaths: list[Path],
+        source_languages: dict[Path, cs.SupportedLanguage],
+        results: Iterator[FileDefinitions],
+    ) -> None:
+        for filepath in filepaths:
+            if language := source_languages.get(filepath):
+                definitions = next(results)
+                self._merge_file_definitions(filepath, language, definitions)
+                self._record_manifest_entry(filepath, language, definitions)
+            else:
+                if self._is_dependency_file(filepath.name, filepath):
+                    self.factory.definition_processor.process_dependencies(filepath)
+                self._record_manifest_entry(filepath)
+
+            self.ingest_file_node(filepath)
+
+    def _parse_source_file(
+        self, filepath: Path
+    ) -> tuple[Node, cs.SupportedLanguage] | None:
+        language = self._get_source_language(filepath)
+        if language is None or not filepath.is_file():
+            return None
+        with profile_span(cs.PROFILE_STAGE_REPARSE, cs.ProfileCategory.STAGE):
+            tree = self.parsers[language].parse(filepath.read_bytes())
+        return tree.root_node, language
+
+    def _merge_file_definitions(
+        self,
+        filepath: Path,
+        language: cs.SupportedLanguage,
+        definitions: FileDefinitions,
+    ) -> None:
+        if definitions.profile is not None and (profiler := active_profiler()):
+            profiler.merge(definitions.profile)
+        import_processor = self.factory.import_processor
+        import_processor.import_mapping.update(definitions.import_mapping)
+        self.factory.definition_processor.class_inheritance.update(
+            definitions.class_inheritance
+        )
+        for module_qn in definitions.module_qns:
+            self.factory.module_qn_to_file_path[module_qn] = filepath
+
+        # (H) Register this file's definitions only as far as each deferred class
+        # (H) marker, so IMPORTS and parent classes resolve against exactly the
+        # (H) registry a serial run would see at that point.
+        rows = definitions.rows
+        start = registered = named = 0
+        for index, row in enumerate(rows):
+            if not isinstance(row, InheritsRow):
+                continue
+            replay_rows(rows[start:index], self.ingestor, import_processor)
+            self._register_definitions(
+                definitions, slice(registered, row.registered), slice(named, row.named)
+            )
+            registered, named, start = row.registered, row.named, index + 1
+            definitions.class_inheritance[row.class_qn] = (
+                self.factory.definition_processor.ingest_deferred_class_relationships(
+                    row
+                )
+            )
+        replay_rows(rows[start:], self.ingestor, import_processor)
+        self._register_definitions(
+            definitions, slice(registered, None), slice(named, None)
+        )
+
+        if definitions.parsed:
+            self._record_call_sites(filepath, definitions.call_sites)
+            if definitions.root_node is not None and not self.streaming:
+                self.ast_cache[filepath] = (definitions.root_node, language)
+
+    def _register_definitions(
+        self, definitions: FileDefinitions, entries: slice, names: slice
+    ) -> None:
+        for qn, func_type in definitions.registry_entries[entries]:
+            self.function_registry[qn] = func_type
+        for simple_name, qn in definitions.simple_names[names]:
+            self.simple_name_lookup[simple_name].add(qn)
+
+    def _log_cache_stats(self) -> None:
+        stats = self.ast_cache.stats
+        logger.info(
+            ls.AST_CACHE_STATS.format(
+                hits=stats.hits,
+                misses=stats.misses,
+                reparses=stats.reparses,
+                evictions=stats.evictions,
+                entries=stats.entries,
+                size_mb=stats.estimated_bytes / cs.BYTES_PER_MB,
+            )
+        )
+        resolution = self.factory.call_processor.resolution_cache_stats
+        lookups = resolution.hits + resolution.misses
+        logger.info(
+            ls.RESOLUTION_CACHE_STATS.format(
+                hits=resolution.hits,
+                misses=resolution.misses,
+                hit_rate=resolution.hits / lookups * 100 if lookups else 0.0,
+                entries=resolution.entries,
+            )
+        )
+
+    def _load_tree(self, file_path: Path) -> Node | None:
+        entry = self.ast_cache.get_or_load(file_path)
+        return entry[0] if entry is not None else None
+
+    def _process_function_calls(self, file_paths: list[Path] | None = None) -> None:
+        call_processor = self.factory.call_processor
+        call_processor.clear_resolution_cache()
+        if file_paths is None:
+            file_paths = list(self._call_sites)
+        logger.info(
+            ls.PASS_3_TREES.format(
+                needed=sum(
+                    call_processor.needs_tree(self._call_sites[file_path])
+                    for file_path in file_paths
+                ),
+                total=len(file_paths),
             )
+        )
+        if self.workers > 1 and len(file_paths) > 1:
+            if fork_available():
+                self._process_function_calls_parallel(file_paths)
+                return
+            logger.info(ls.PASS_3_FORK_UNAVAILABLE)
+
+        for file_path in file_paths:
+            load_root = partial(self._load_tree, file_path)
+            if self._manifest_entries is None and self.call_dependencies is None:
+                call_processor.resolve_call_sites(
+                    file_path, self._call_sites[file_path], load_root
+                )
+                continue
+            # (H) Capture each file's rows to remember which symbols it calls.
+            recorder = RowRecordingIngestor()
+            call_processor.ingestor = recorder
+            try:
+                call_processor.resolve_call_sites(
+                    file_path, self._call_sites[file_path], load_root
+                )
+            finally:
+                call_processor.ingestor = self.ingestor
+            replay_rows(recorder.rows, self.ingestor, self.factory.import_processor)
+            self._record_call_targets(file_path, recorder.rows)
+
+    def _process_function_calls_parallel(self, file_paths: list[Path]) -> None:
+        logger.info(
+            ls.PASS_3_PARALLEL.format(count=len(file_paths), workers=self.workers)
+        )
+        call_processor = self.factory.call_processor
+        set_call_snapshot(
+            CallSnapshot(call_processor, self._call_sites, self._load_tree)
+        )
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=fork_context(),
+                initializer=init_call_worker,
+            ) as pool:
+                # (H) Rows are replayed in record order, the same order the
+                # (H) serial pass emits them in.
+                results = (
+                    bounded_map(
+                        pool,
+                        resolve_file_calls,
+                        file_paths,
+                        window=settings.STREAMING_QUEUE_SIZE,
+                    )
+                    if self.streaming
+                    else pool.map(
+                        resolve_file_calls,
+                        file_paths,
+                        chunksize=parallel_chunk_size(len(file_paths), self.workers),
+                    )
+                )
+                for file_path, calls in zip(file_paths, results):
+                    if calls.profile is not None and (profiler := active_profiler()):
+                        profiler.merge(calls.profile)
+                    replay_rows(
+                        calls.rows, self.ingestor, self.factory.import_processor
+                    )
+                    self._record_call_targets(file_path, calls.rows)
+        finally:
+            set_call_snapshot(None)
 
     def _generate_semantic_embeddings(self) -> None:
         if not has_semantic_dependencies():
@@ -426,8 +1717,10 @@ class GraphUpdater:
         file_path_obj = self.repo_path / file_path
 
         ast_extractor = None
-        if file_path_obj in self.ast_cache:
-            root_node, language = self.ast_cache[file_path_obj]
+        # (H) Embeddings visit files in graph order, so loading on a miss would
+        # (H) re-parse and evict for each one; line ranges cover evicted files.
+        if (entry := self.ast_cache.cache.get(file_path_obj)) is not None:
+            root_node, language = entry
             fqn_config = LANGUAGE_FQN_SPECS.get(language)
 
             if fqn_config:
@@ -466,3 +1759,12 @@ class GraphUpdater:
             end_line=end_line if isinstance(end_line, int) else None,
             path=file_path if isinstance(file_path, str) else None,
         )
+
+
+def _owning_file(qn: QualifiedName, modules: dict[str, Path]) -> Path | None:
+    prefix = qn.split(cs.CHAR_PAREN_OPEN, 1)[0]
+    while prefix:
+        if filepath := modules.get(prefix):
+            return filepath
+        prefix = prefix.rpartition(cs.SEPARATOR_DOT)[0]
+    return None
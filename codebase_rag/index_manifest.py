@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from loguru import logger
+
+from . import constants as cs
+from . import logs as ls
+from .types_defs import NodeType, QualifiedName
+
+
+@dataclass
+class ManifestEntry:
+    content_hash: str
+    size: int
+    mtime_ns: int
+    language: cs.SupportedLanguage | None = None
+    module_qns: list[str] = field(default_factory=list)
+    definitions: list[tuple[QualifiedName, NodeType]] = field(default_factory=list)
+    simple_names: list[tuple[str, QualifiedName]] = field(default_factory=list)
+    import_mapping: dict[str, dict[str, str]] = field(default_factory=dict)
+    class_inheritance: dict[str, list[str]] = field(default_factory=dict)
+    call_targets: list[QualifiedName] = field(default_factory=list)
+    external_modules: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ManifestEntry:
+        entry = cls(**data)
+        if entry.language is not None:
+            entry.language = cs.SupportedLanguage(entry.language)
+        entry.definitions = [(qn, NodeType(kind)) for qn, kind in entry.definitions]
+        entry.simple_names = [(name, qn) for name, qn in entry.simple_names]
+        return entry
+
+    @property
+    def owned_qns(self) -> list[QualifiedName]:
+        return [*self.module_qns, *(qn for qn, _ in self.definitions)]
+
+    def owned_kinds(self) -> dict[QualifiedName, NodeType | None]:
+        return dict.fromkeys(self.module_qns) | dict(self.definitions)
+
+    def import_targets(self) -> set[str]:
+        return {
+            target
+            for mapping in self.import_mapping.values()
+            for target in mapping.values()
+        }
+
+
+@dataclass
+class FileChanges:
+    added: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    unchanged: list[str] = field(default_factory=list)
+    touched: bool = False
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+
+@dataclass
+class IndexManifest:
+    project_name: str
+    filter_key: str
+    version: int = cs.MANIFEST_VERSION
+    files: dict[str, ManifestEntry] = field(default_factory=dict)
+
+    @classmethod
+    def load(
+        cls, path: Path, project_name: str, filter_key: str
+    ) -> IndexManifest | None:
+        if not path.is_file():
+            return None
+        try:
+            data = json.loads(path.read_text(encoding=cs.ENCODING_UTF8))
+            manifest = cls(
+                project_name=data[cs.MANIFEST_KEY_PROJECT],
+                filter_key=data[cs.MANIFEST_KEY_FILTER],
+                version=data[cs.MANIFEST_KEY_VERSION],
+                files={
+                    rel_path: ManifestEntry.from_dict(entry)
+                    for rel_path, entry in data[cs.MANIFEST_KEY_FILES].items()
+                },
+            )
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(ls.MANIFEST_LOAD_FAILED.format(path=path, error=e))
+            return None
+
+        if (
+            manifest.version != cs.MANIFEST_VERSION
+            or manifest.project_name != project_name
+            or manifest.filter_key != filter_key
+        ):
+            logger.info(ls.MANIFEST_STALE.format(path=path))
+            return None
+        return manifest
+
+    def save(self, path: Path) -> None:
+        payload = {
+            cs.MANIFEST_KEY_VERSION: self.version,
+            cs.MANIFEST_KEY_PROJECT: self.project_name,
+            cs.MANIFEST_KEY_FILTER: self.filter_key,
+            cs.MANIFEST_KEY_FILES: {
+                rel_path: asdict(entry) for rel_path, entry in self.files.items()
+            },
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + cs.TMP_EXTENSION)
+        tmp_path.write_text(json.dumps(payload), encoding=cs.ENCODING_UTF8)
+        tmp_path.replace(path)
+        logger.info(ls.MANIFEST_SAVED.format(count=len(self.files), path=path))
+
+    def diff(self, current: dict[str, ManifestEntry]) -> FileChanges:
+        changes = FileChanges()
+        for rel_path, entry in current.items():
+            previous = self.files.get(rel_path)
+            if previous is None:
+                changes.added.append(rel_path)
+            elif previous.content_hash != entry.content_hash:
+                changes.changed.append(rel_path)
+            else:
+                changes.unchanged.append(rel_path)
+                if (previous.size, previous.mtime_ns) != (entry.size, entry.mtime_ns):
+                    previous.size, previous.mtime_ns = entry.size, entry.mtime_ns
+                    changes.touched = True
+        changes.removed = [p for p in self.files if p not in current]
+        return changes
+
+
+def manifest_filter_key(
+    exclude_paths: frozenset[str] | None, unignore_paths: frozenset[str] | None
+) -> str:
+    return json.dumps(
+        [sorted(exclude_paths or ()), sorted(unignore_paths or ())],
+        separators=(",", ":"),
+    )
+
+
+def fingerprint_file(path: Path, previous: ManifestEntry | None) -> ManifestEntry:
+    stat = path.stat()
+    if (
+        previous is not None
+        and previous.size == stat.st_size
+        and previous.mtime_ns == stat.st_mtime_ns
+    ):
+        # (H) Same size and mtime: trust the stored hash instead of re-reading.
+        return ManifestEntry(previous.content_hash, stat.st_size, stat.st_mtime_ns)
+    digest = hashlib.blake2b(path.read_bytes(), digest_size=cs.MANIFEST_DIGEST_SIZE)
+    return ManifestEntry(digest.hexdigest(), stat.st_size, stat.st_mtime_ns)
+
+
+def memgraph_manifest_path(repo_path: Path, host: str, port: int) -> Path:
+    repo_key = hashlib.blake2b(
+        f"{host}:{port}:{repo_path.resolve()}".encode(),
+        digest_size=cs.MANIFEST_DIGEST_SIZE,
+    ).hexdigest()
+    return (
+        Path.home()
+        / cs.IMPORT_CACHE_DIR
+        / cs.MANIFEST_CACHE_SUBDIR
+        / f"{repo_path.resolve().name}-{repo_key}{cs.MANIFEST_FILE_SUFFIX}"
+    )
+
+
+def find_dependents(
+    manifest: IndexManifest,
+    candidates: list[str],
+    affected_qns: set[QualifiedName],
+    imports_only: bool = False,
+) -> list[str]:
+    if not affected_qns:
+        return []
+    dependents: list[str] = []
+    for rel_path in candidates:
+        entry = manifest.files[rel_path]
+        if entry.language is None:
+            continue
+        if (
+            not imports_only and not affected_qns.isdisjoint(entry.call_targets)
+        ) or any(
+            _hits_affected(target, affected_qns) for target in entry.import_targets()
+        ):
+            dependents.append(rel_path)
+    return dependents
+
+
+def find_name_dependents(
+    repo_path: Path,
+    manifest: IndexManifest,
+    candidates: list[str],
+    names: set[str],
+) -> list[str]:
+    # (H) A new or removed definition can change how a bare call elsewhere
+    # (H) resolves, so re-resolve any file whose text mentions that name.
+    sources = [
+        rel_path
+        for rel_path in candidates
+        if manifest.files[rel_path].language is not None
+    ]
+    mentioning = set(
+        files_mentioning([repo_path / rel_path for rel_path in sources], names)
+    )
+    return [rel_path for rel_path in sources if repo_path / rel_path in mentioning]
+
+
+def files_mentioning(paths: list[Path], names: set[str]) -> list[Path]:
+    if not names:
+        return []
+    encoded = [name.encode(cs.ENCODING_UTF8) for name in names]
+    found: list[Path] = []
+    for path in paths:
+        try:
+            source = path.read_bytes()
+        except OSError:
+            continue
+        if any(name in source for name in encoded):
+            found.append(path)
+    return found
+
+
+def _hits_affected(target: str, affected_qns: set[QualifiedName]) -> bool:
+    parts = target.split(cs.SEPARATOR_DOT)
+    return any(
+        cs.SEPARATOR_DOT.join(parts[:i]) in affected_qns
+        for i in range(len(parts), 0, -1)
+    )
@@ -13,6 +13,60 @@ PASS_2_FILES = (
 )
 PASS_3_CALLS = "--- Pass 3: Processing Function Calls from AST Cache ---"
 PASS_4_EMBEDDINGS = "--- Pass 4: Generating semantic embeddings ---"
+PASS_2_PARALLEL = "  Extracting definitions from {count} files with {workers} workers"
+PASS_3_PARALLEL = "  Resolving calls in {count} files with {workers} workers"
+PASS_3_TREES = "  {needed} of {total} files need a syntax tree to resolve calls"
+PASS_STREAMING = (
+    "Streaming mode: at most {queue} files in flight, {cache} syntax trees retained"
+)
+STREAMING_NEEDS_FLUSHING_INGESTOR = (
+    "Streaming disabled: {ingestor} keeps the whole graph in memory until the "
+    "final flush"
+)
+PASS_INCREMENTAL_CHANGES = (
+    "--- Incremental update: {added} added, {changed} changed, "
+    "{removed} removed, {dependents} dependent files ---"
+)
+INDEX_UP_TO_DATE = "--- Index is up to date ({count} files unchanged) ---"
+INCREMENTAL_UNSUPPORTED = (
+    "Ingestor cannot update an existing graph in place; running a full index"
+)
+INCREMENTAL_NO_EXISTING_GRAPH = "No existing graph to update; running a full index"
+INCREMENTAL_GRAPH_OUT_OF_SYNC = (
+    "Graph for {project} no longer matches the index manifest; running a full index"
+)
+UPDATE_CHANGED_PATHS = "Updating the index for {count} changed paths"
+UPDATE_NO_MANIFEST = "No index manifest to update; running a full index"
+AST_CACHE_STATS = (
+    "  AST cache: {hits} hits, {misses} misses, {reparses} reparses, "
+    "{evictions} evictions, {entries} trees (~{size_mb:.1f} MB)"
+)
+RESOLUTION_CACHE_STATS = (
+    "  Call resolution cache: {hits} hits, {misses} misses "
+    "({hit_rate:.1f}% hit rate), {entries} entries"
+)
+BENCHMARK_GENERATED = "Generated {files} files for scenario '{scenario}' in {path}"
+BENCHMARK_RESULT = (
+    "{scenario}: {files} files, {calls} CALLS edges, "
+    "{files_per_second:.1f} files/s, {calls_per_second:.1f} calls/s"
+)
+BENCHMARK_PASS = "  {name:<18} wall={wall:8.3f}s cpu={cpu:8.3f}s peak_rss={rss:8.1f} MB"
+BENCHMARK_REGRESSION = (
+    "Regression in {scenario} / {name}: {baseline:.3f}s -> {current:.3f}s "
+    "(+{change:.1f}%)"
+)
+BENCHMARK_NO_REGRESSIONS = "No pass slowed down by more than {threshold:.1f}%"
+BENCHMARK_BASELINE_SAVED = "Saved benchmark baseline for {count} scenarios to {path}"
+BENCHMARK_BASELINE_MISSING = "No baseline for scenario '{scenario}'; skipping gate"
+BENCHMARK_REGISTRY_RESULT = (
+    "{implementation:<8} {entries} entries: {memory_mb:8.1f} MB, "
+    "build={build:.3f}s prefix={prefix:.1f}us suffix={suffix:.1f}us "
+    "prefix+suffix={prefix_suffix:.1f}us per query"
+)
+PROFILE_WRITTEN = "Profiling report written to {path}"
+PASS_3_FORK_UNAVAILABLE = (
+    "  Process fork is unavailable on this platform; resolving calls serially"
+)
 
 # (H) Analysis logs
 FOUND_FUNCTIONS = "\n--- Found {count} functions/methods in codebase ---"
@@ -33,6 +87,7 @@ DEF_PARSING_AST = "Parsing and Caching AST for {language}: {path}"
 DEF_UNSUPPORTED_LANGUAGE = "Unsupported language '{language}' for {path}"
 DEF_NO_PARSER = "No parser available for {language}"
 DEF_PARSE_FAILED = "Failed to parse or ingest {path}: {error}"
+DEF_PATCHING_AST = "Re-extracting {count} changed top-level definitions in {path}"
 DEF_PARSING_DEPENDENCY = "  Parsing dependency file: {path}"
 DEF_FOUND_DEPENDENCY = "    Found dependency: {name} (spec: {spec})"
 
@@ -54,6 +109,13 @@ EMBEDDING_SEARCH_FAILED = "Failed to search embeddings: {error}"
 # (H) Image logs
 IMAGE_COPIED = "Copied image to temporary path: {path}"
 
+# (H) Index manifest logs
+MANIFEST_LOAD_FAILED = "Ignoring unreadable index manifest {path}: {error}"
+MANIFEST_STALE = (
+    "Index manifest {path} was built with different settings; running a full index"
+)
+MANIFEST_SAVED = "Saved index manifest for {count} files to {path}"
+
 # (H) Protobuf service logs
 PROTOBUF_INIT = "ProtobufFileIngestor initialized to write to: {path}"
 PROTOBUF_NO_MESSAGE_CLASS = (
@@ -70,6 +132,9 @@ PROTOBUF_INVALID_REL = (
 )
 PROTOBUF_FLUSH_SUCCESS = "Successfully flushed {nodes} unique nodes and {rels} unique relationships to {path}"
 PROTOBUF_FLUSHING = "Flushing data to {path}..."
+PROTOBUF_LOADED_EXISTING = (
+    "Loaded existing graph with {nodes} nodes and {rels} relationships"
+)
 
 # (H) Parser loader logs
 BUILDING_BINDINGS = "Building Python bindings for {lang}..."
@@ -85,6 +150,9 @@ NO_LANG_ATTR = (
 SUBMODULE_LOAD_FAILED = "Failed to load {lang} from submodule bindings: {error}"
 LIB_NOT_AVAILABLE = "Tree-sitter library for {lang} not available."
 LOCALS_QUERY_FAILED = "Failed to create locals query for {lang}: {error}"
+JS_MODULE_QUERY_FAILED = (
+    "Failed to create JS/TS module pattern query for {lang}: {error}"
+)
 GRAMMAR_LOADED = "Successfully loaded {lang} grammar."
 GRAMMAR_LOAD_FAILED = "Failed to load {lang} grammar: {error}"
 INITIALIZED_PARSERS = "Initialized parsers for: {languages}"
@@ -102,8 +170,28 @@ CHANGE_DETECTED = "Change detected: {event_type} on {path}. Updating graph."
 DELETION_QUERY = "Ran deletion query for path: {path}"
 RECALC_CALLS = "Recalculating all function call relationships for consistency..."
 GRAPH_UPDATED = "Graph updated successfully for change in: {name}"
+GRAPH_UPDATED_BATCH = "Graph updated successfully for {count} changed files"
+WATCHER_EVENT_QUEUED = "Queued {event_type} on {path} ({depth} files pending)"
+WATCHER_BATCH_READY = (
+    "Applying {count} file changes coalesced from {events} events "
+    "(waited {waited:.2f}s)"
+)
+WATCHER_BATCH_APPLIED = (
+    "Applied {count} file changes in {seconds:.2f}s "
+    "({latency:.2f}s after the first event)"
+)
+WATCHER_CALL_SCOPE = (
+    "Re-resolving calls in {changed} changed and {dependents} dependent files"
+)
+WATCHER_BATCH_FAILED = "Failed to apply {count} file changes: {error}"
 INITIAL_SCAN = "Performing initial full codebase scan..."
 INITIAL_SCAN_DONE = "Initial scan complete. Starting real-time watcher."
+WARM_START = "Restoring in-memory state from the existing graph..."
+WARM_START_RESTORED = (
+    "Restored {definitions} definitions from {files} unchanged files; "
+    "re-parsing {changes} changed files"
+)
+WARM_START_UNAVAILABLE = "No fingerprinted graph for {project}; running a full scan"
 WATCHING = "Watching for changes in: {path}"
 LOGGER_CONFIGURED = "Logger configured for Real-Time Updater."
 
@@ -532,7 +620,6 @@ JS_PROTOTYPE_METHOD_DEFINES = "Prototype method: {constructor_qn} DEFINES {metho
 JS_PROTOTYPE_METHODS_FAILED = "Failed to detect prototype methods: {error}"
 JS_OBJECT_METHOD_FOUND = "  Found Object Method: {method_name} (qn: {method_qn})"
 JS_OBJECT_METHODS_PROCESS_FAILED = "Failed to process object literal methods: {error}"
-JS_OBJECT_METHODS_DETECT_FAILED = "Failed to detect object literal methods: {error}"
 JS_OBJECT_ARROW_FOUND = (
     "  Found Object Arrow Function: {function_name} (qn: {function_qn})"
 )
@@ -545,15 +632,12 @@ JS_ASSIGNMENT_FUNC_EXPR_FOUND = (
 JS_ASSIGNMENT_ARROW_QUERY_FAILED = (
     "Failed to process assignment arrow functions query: {error}"
 )
-JS_ASSIGNMENT_ARROW_DETECT_FAILED = (
-    "Failed to detect assignment arrow functions: {error}"
-)
 
 # (H) JS/TS module system logs
 JS_COMMONJS_DESTRUCTURE_FAILED = (
     "Failed to process CommonJS destructuring pattern: {error}"
 )
-JS_MISSING_IMPORT_PATTERNS_FAILED = "Failed to detect missing import patterns: {error}"
+JS_MODULE_PATTERNS_FAILED = "Failed to match JS/TS module patterns: {error}"
 JS_COMMONJS_VAR_DECLARATOR_FAILED = (
     "Failed to process variable declarator for CommonJS: {error}"
 )
@@ -564,7 +648,6 @@ JS_MISSING_IMPORT_PATTERN = (
 JS_COMMONJS_EXPORTS_QUERY_FAILED = "Failed to process CommonJS exports query: {error}"
 JS_COMMONJS_EXPORTS_DETECT_FAILED = "Failed to detect CommonJS exports: {error}"
 JS_ES6_EXPORTS_QUERY_FAILED = "Failed to process ES6 exports query: {error}"
-JS_ES6_EXPORTS_DETECT_FAILED = "Failed to detect ES6 exports: {error}"
 
 # (H) MCP tool logs
 MCP_INDEXING_REPO = "[MCP] Indexing repository at: {path}"
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import multiprocessing
+import sys
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+from tree_sitter import Node
+
+from . import constants as cs
+from . import exceptions as ex
+from .parser_loader import load_parsers
+from .parsers.call_processor import CallProcessor, CallSiteExtractor
+from .parsers.definition_processor import DefinitionProcessor
+from .parsers.import_processor import ImportProcessor
+from .profiling import (
+    IndexProfiler,
+    ProfileSample,
+    active_profiler,
+    profile_span,
+    set_active_profiler,
+)
+from .services import IngestorProtocol
+from .types_defs import (
+    DeferredClassName,
+    FileCallSites,
+    ImportsRow,
+    IngestRow,
+    InheritsRow,
+    NodeRow,
+    NodeType,
+    PropertyDict,
+    PropertyValue,
+    QualifiedName,
+    RelationshipRow,
+    SimpleNameLookup,
+)
+
+if TYPE_CHECKING:
+    from .graph_updater import FunctionRegistryTrie
+
+
+class RowRecordingIngestor:
+    def __init__(self) -> None:
+        self.rows: list[IngestRow] = []
+
+    def ensure_node_batch(self, label: str, properties: PropertyDict) -> None:
+        self.rows.append(NodeRow(label, properties))
+
+    def ensure_relationship_batch(
+        self,
+        from_spec: tuple[str, str, PropertyValue],
+        rel_type: str,
+        to_spec: tuple[str, str, PropertyValue],
+        properties: PropertyDict | None = None,
+    ) -> None:
+        self.rows.append(RelationshipRow(from_spec, rel_type, to_spec, properties))
+
+    def flush_all(self) -> None:
+        pass
+
+
+class _DeferredImportProcessor(ImportProcessor):
+    # (H) IMPORTS targets depend on the registry built from earlier files, so the
+    # (H) worker leaves a marker and the parent resolves them while merging.
+    def __init__(
+        self, repo_path: Path, project_name: str, recorder: RowRecordingIngestor
+    ) -> None:
+        super().__init__(repo_path=repo_path, project_name=project_name)
+        self.recorder = recorder
+
+    def ingest_import_relationships(
+        self, module_qn: str, language: cs.SupportedLanguage
+    ) -> None:
+        self.recorder.rows.append(ImportsRow(module_qn, language))
+
+
+class _DeferredDefinitionProcessor(DefinitionProcessor):
+    # (H) Parent classes may live in files this worker never sees, so their names
+    # (H) are left for the parent to resolve; the counts let it register exactly
+    # (H) the definitions a serial run would have seen at that point.
+    recorder: RowRecordingIngestor
+    name_additions: list[tuple[str, QualifiedName]]
+
+    def _resolve_to_qn(self, name: str, module_qn: str) -> str:
+        return DeferredClassName(name, module_qn)
+
+    def _ingest_class_relationships(
+        self,
+        class_qn: str,
+        module_qn: str,
+        node_type: NodeType,
+        is_exported: bool,
+        language: cs.SupportedLanguage,
+        parent_classes: list[str],
+        interfaces: list[str],
+    ) -> None:
+        self.class_inheritance[class_qn] = parent_classes
+        self.recorder.rows.append(
+            InheritsRow(
+                class_qn,
+                module_qn,
+                node_type,
+                is_exported,
+                language,
+                parent_classes,
+                interfaces,
+                registered=len(self.function_registry),
+                named=len(self.name_additions),
+            )
+        )
+
+
+class _RecordingNameSet(set[QualifiedName]):
+    def __init__(self, name: str, additions: list[tuple[str, QualifiedName]]) -> None:
+        super().__init__()
+        self.name = name
+        self.additions = additions
+
+    def add(self, qualified_name: QualifiedName) -> None:
+        if qualified_name not in self:
+            self.additions.append((self.name, qualified_name))
+        super().add(qualified_name)
+
+
+class RecordingNameLookup(defaultdict[str, set[QualifiedName]]):
+    # (H) Keeps insertion order so the parent can replay adds one by one; bulk
+    # (H) set.update() sizes the table differently and changes candidate order.
+    def __init__(self) -> None:
+        super().__init__(set)
+        self.additions: list[tuple[str, QualifiedName]] = []
+
+    def __missing__(self, key: str) -> set[QualifiedName]:
+        value = _RecordingNameSet(key, self.additions)
+        self[key] = value
+        return value
+
+
+def replay_rows(
+    rows: list[IngestRow],
+    ingestor: IngestorProtocol,
+    import_processor: ImportProcessor,
+) -> None:
+    for row in rows:
+        match row:
+            case ImportsRow(module_qn, language):
+                import_processor.ingest_import_relationships(module_qn, language)
+            case NodeRow(label, properties):
+                ingestor.ensure_node_batch(label, properties)
+            case RelationshipRow(from_spec, rel_type, to_spec, properties):
+                if properties is None:
+                    ingestor.ensure_relationship_batch(from_spec, rel_type, to_spec)
+                else:
+                    ingestor.ensure_relationship_batch(
+                        from_spec, rel_type, to_spec, properties
+                    )
+
+
+@dataclass
+class FileDefinitions:
+    parsed: bool
+    rows: list[IngestRow] = field(default_factory=list)
+    registry_entries: list[tuple[QualifiedName, NodeType]] = field(default_factory=list)
+    simple_names: list[tuple[str, QualifiedName]] = field(default_factory=list)
+    import_mapping: dict[str, dict[str, str]] = field(default_factory=dict)
+    class_inheritance: dict[str, list[str]] = field(default_factory=dict)
+    module_qns: list[str] = field(default_factory=list)
+    call_sites: FileCallSites | None = None
+    root_node: Node | None = None
+    profile: ProfileSample | None = None
+
+
+@dataclass
+class FileCalls:
+    rows: list[IngestRow]
+    profile: ProfileSample | None = None
+
+
+def parallel_chunk_size(file_count: int, workers: int) -> int:
+    chunk = file_count // (workers * cs.PARALLEL_CHUNKS_PER_WORKER)
+    return max(1, min(chunk, cs.PARALLEL_MAX_CHUNK_SIZE))
+
+
+def bounded_map[T](
+    pool: Executor,
+    fn: Callable[..., T],
+    *iterables: Iterable,
+    window: int,
+) -> Iterator[T]:
+    # (H) Unlike Executor.map, submits lazily and keeps at most `window` tasks
+    # (H) in flight, so finished results never pile up ahead of the consumer.
+    pending: deque[Future[T]] = deque()
+    for args in zip(*iterables):
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(pool.submit(fn, *args))
+    while pending:
+        yield pending.popleft().result()
+
+
+class _DefinitionWorker:
+    def __init__(
+        self,
+        repo_path: Path,
+        project_name: str,
+        structural_elements: dict[Path, str | None],
+    ) -> None:
+        _, self.queries = load_parsers()
+        self.repo_path = repo_path
+        self.structural_elements = structural_elements
+        self.import_processor = _DeferredImportProcessor(
+            repo_path, project_name, RowRecordingIngestor()
+        )
+        self.call_site_extractor = CallSiteExtractor(repo_path, project_name)
+        self.definition_processor = _DeferredDefinitionProcessor(
+            ingestor=RowRecordingIngestor(),
+            repo_path=repo_path,
+            project_name=project_name,
+            function_registry=self._new_registry(defaultdict(set)),
+            simple_name_lookup=defaultdict(set),
+            import_processor=self.import_processor,
+            module_qn_to_file_path={},
+        )
+
+    @staticmethod
+    def _new_registry(simple_name_lookup: SimpleNameLookup) -> FunctionRegistryTrie:
+        from .graph_updater import FunctionRegistryTrie
+
+        return FunctionRegistryTrie(simple_name_lookup=simple_name_lookup)
+
+    def extract(
+        self, file_path: Path, language: cs.SupportedLanguage
+    ) -> FileDefinitions:
+        # (H) Every file starts from empty state so results never depend on
+        # (H) which worker handled which file or in what order.
+        ingestor = RowRecordingIngestor()
+        simple_name_lookup = RecordingNameLookup()
+        registry = self._new_registry(simple_name_lookup)
+        module_qn_to_file_path: dict[str, Path] = {}
+
+        self.import_processor.ingestor = ingestor
+        self.import_processor.recorder = ingestor
+        self.import_processor.function_registry = registry
+        self.import_processor.stdlib_extractor.function_registry = registry
+        self.import_processor.import_mapping = {}
+
+        processor = self.definition_processor
+        processor.ingestor = ingestor
+        processor.function_registry = registry
+        processor.simple_name_lookup = simple_name_lookup
+        processor.recorder = ingestor
+        processor.name_additions = simple_name_lookup.additions
+        processor.module_qn_to_file_path = module_qn_to_file_path
+        processor.class_inheritance = {}
+
+        with profile_span(
+            cs.PROFILE_PASS_DEFINITIONS,
+            cs.ProfileCategory.FILE,
+            path=str(file_path.relative_to(self.repo_path)),
+            language=str(language),
+        ):
+            result = processor.process_file(
+                file_path, language, self.queries, self.structural_elements
+            )
+            call_sites = (
+                self.call_site_extractor.extract_call_sites(
+                    file_path, result[0], language, self.queries
+                )
+                if result
+                else None
+            )
+        return FileDefinitions(
+            parsed=result is not None,
+            rows=ingestor.rows,
+            registry_entries=list(registry.items()),
+            simple_names=simple_name_lookup.additions,
+            import_mapping=self.import_processor.import_mapping,
+            class_inheritance=processor.class_inheritance,
+            module_qns=list(module_qn_to_file_path),
+            call_sites=call_sites,
+            root_node=result[0] if result else None,
+        )
+
+
+_worker: _DefinitionWorker | None = None
+
+
+def quiet_worker_logging() -> None:
+    logger.remove()
+    logger.add(sys.stderr, level=cs.LOG_LEVEL_WARNING)
+
+
+def init_definition_worker(
+    repo_path: Path,
+    project_name: str,
+    structural_elements: dict[Path, str | None],
+    profile: bool = False,
+) -> None:
+    global _worker
+    quiet_worker_logging()
+    set_active_profiler(IndexProfiler() if profile else None)
+    _worker = _DefinitionWorker(repo_path, project_name, structural_elements)
+
+
+def extract_file_definitions(
+    file_path: Path, language: cs.SupportedLanguage
+) -> FileDefinitions:
+    if _worker is None:
+        raise RuntimeError(ex.PARALLEL_WORKER_NOT_INITIALIZED)
+    definitions = _worker.extract(file_path, language)
+    # (H) Tree-sitter nodes cannot be pickled; the parent works from the call
+    # (H) site records and re-parses only when a tree is actually needed.
+    definitions.root_node = None
+    if profiler := active_profiler():
+        definitions.profile = profiler.drain()
+    return definitions
+
+
+def iter_file_definitions(
+    repo_path: Path,
+    project_name: str,
+    structural_elements: dict[Path, str | None],
+    source_languages: Mapping[Path, cs.SupportedLanguage],
+) -> Iterator[FileDefinitions]:
+    worker = _DefinitionWorker(repo_path, project_name, structural_elements)
+    for file_path, language in source_languages.items():
+        yield worker.extract(file_path, language)
+
+
+@dataclass
+class CallSnapshot:
+    call_processor: CallProcessor
+    call_sites: Mapping[Path, FileCallSites]
+    load_tree: Callable[[Path], Node | None]
+
+
+# (H) Set by the parent right before forking; children inherit it read-only, so
+# (H) the registry, import maps and call site records are never pickled.
+_call_snapshot: CallSnapshot | None = None
+
+
+def fork_available() -> bool:
+    return cs.MP_START_METHOD_FORK in multiprocessing.get_all_start_methods()
+
+
+def fork_context() -> multiprocessing.context.BaseContext:
+    return multiprocessing.get_context(cs.MP_START_METHOD_FORK)
+
+
+def set_call_snapshot(snapshot: CallSnapshot | None) -> None:
+    global _call_snapshot
+    _call_snapshot = snapshot
+
+
+def init_call_worker() -> None:
+    quiet_worker_logging()
+    # (H) Forked children inherit the parent's profiler; start from an empty one
+    # (H) so only this worker's spans travel back with its results.
+    if active_profiler() is not None:
+        set_active_profiler(IndexProfiler())
+
+
+def resolve_file_calls(file_path: Path) -> FileCalls:
+    if _call_snapshot is None:
+        raise RuntimeError(ex.PARALLEL_WORKER_NOT_INITIALIZED)
+    snapshot = _call_snapshot
+    ingestor = RowRecordingIngestor()
+    processor = snapshot.call_processor
+    processor.ingestor = ingestor
+    processor.resolve_call_sites(
+        file_path,
+        snapshot.call_sites[file_path],
+        lambda: snapshot.load_tree(file_path),
+    )
+    profiler = active_profiler()
+    return FileCalls(ingestor.rows, profiler.drain() if profiler else None)
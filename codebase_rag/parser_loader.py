@@ -1,6 +1,7 @@
 import importlib
 import subprocess
 import sys
+from bisect import bisect_right
 from copy import deepcopy
 from pathlib import Path
 
@@ -11,7 +12,16 @@ from . import constants as cs
 from . import exceptions as ex
 from . import logs as ls
 from .language_spec import LANGUAGE_SPECS, LanguageSpec
-from .types_defs import LanguageImport, LanguageLoader, LanguageQueries
+from .types_defs import (
+    JsModuleQuery,
+    LanguageImport,
+    LanguageLoader,
+    LanguageQueries,
+)
+
+# (H) Compiling a query costs milliseconds and load_parsers runs once per
+# (H) updater and worker, so every query is compiled once per process.
+_COMPILED_QUERIES: dict[tuple[cs.SupportedLanguage, str], Query] = {}
 
 
 def _try_load_from_submodule(lang_name: cs.SupportedLanguage) -> LanguageLoader:
@@ -202,8 +212,19 @@ def _build_combined_import_pattern(lang_config: LanguageSpec) -> str:
     return " ".join(all_patterns)
 
 
-def _create_optional_query(language: Language, pattern: str | None) -> Query | None:
-    return Query(language, pattern) if pattern else None
+def compile_query(
+    language: Language, lang_name: cs.SupportedLanguage, pattern: str
+) -> Query:
+    key = (lang_name, pattern)
+    if (query := _COMPILED_QUERIES.get(key)) is None:
+        query = _COMPILED_QUERIES[key] = Query(language, pattern)
+    return query
+
+
+def _create_optional_query(
+    language: Language, lang_name: cs.SupportedLanguage, pattern: str | None
+) -> Query | None:
+    return compile_query(language, lang_name, pattern) if pattern else None
 
 
 def _create_locals_query(
@@ -213,12 +234,39 @@ def _create_locals_query(
     if not locals_pattern:
         return None
     try:
-        return Query(language, locals_pattern)
+        return compile_query(language, lang_name, locals_pattern)
     except Exception as e:
         logger.debug(ls.LOCALS_QUERY_FAILED.format(lang=lang_name, error=e))
         return None
 
 
+def _create_js_module_query(
+    language: Language, lang_name: cs.SupportedLanguage
+) -> JsModuleQuery | None:
+    if lang_name not in cs.JS_TS_LANGUAGES:
+        return None
+    patterns = tuple(cs.JS_MODULE_PATTERN_QUERIES)
+    texts = [cs.JS_MODULE_PATTERN_QUERIES[pattern] for pattern in patterns]
+    offsets: list[int] = []
+    position = 0
+    for text in texts:
+        offsets.append(position)
+        position += len(text.encode(cs.ENCODING_UTF8)) + 1
+    try:
+        query = compile_query(language, lang_name, "\n".join(texts))
+    except Exception as e:
+        logger.debug(ls.JS_MODULE_QUERY_FAILED.format(lang=lang_name, error=e))
+        return None
+    # (H) Map each pattern of the combined query back to the pass it came from.
+    return JsModuleQuery(
+        query,
+        tuple(
+            patterns[bisect_right(offsets, query.start_byte_for_pattern(index)) - 1]
+            for index in range(query.pattern_count)
+        ),
+    )
+
+
 def _create_language_queries(
     language: Language,
     parser: Parser,
@@ -237,11 +285,12 @@ def _create_language_queries(
     combined_import_patterns = _build_combined_import_pattern(lang_config)
 
     return LanguageQueries(
-        functions=_create_optional_query(language, function_patterns),
-        classes=_create_optional_query(language, class_patterns),
-        calls=_create_optional_query(language, call_patterns),
-        imports=_create_optional_query(language, combined_import_patterns),
+        functions=_create_optional_query(language, lang_name, function_patterns),
+        classes=_create_optional_query(language, lang_name, class_patterns),
+        calls=_create_optional_query(language, lang_name, call_patterns),
+        imports=_create_optional_query(language, lang_name, combined_import_patterns),
         locals=_create_locals_query(language, lang_name),
+        js_module=_create_js_module_query(language, lang_name),
         config=lang_config,
         language=language,
         parser=parser,
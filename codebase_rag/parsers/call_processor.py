@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+from collections.abc import Callable
 from pathlib import Path
 
 from loguru import logger
@@ -7,38 +9,35 @@ from tree_sitter import Node, QueryCursor
 
 from .. import constants as cs
 from .. import logs as ls
+from ..decorators import profile_decorator
 from ..language_spec import LanguageSpec
+from ..profiling import profile_span
 from ..services import IngestorProtocol
-from ..types_defs import FunctionRegistryTrieProtocol, LanguageQueries
+from ..types_defs import (
+    CallerSites,
+    CallSite,
+    FileCallSites,
+    FunctionRegistryTrieProtocol,
+    LanguageQueries,
+    ResolutionCacheStats,
+)
 from .call_resolver import CallResolver
 from .cpp import utils as cpp_utils
 from .import_processor import ImportProcessor
 from .type_inference import TypeInferenceEngine
-from .utils import get_function_captures, is_method_node
+from .utils import (
+    NodeSpanIndex,
+    capture_span_index,
+    find_node_by_span,
+    is_method_node,
+)
 
 
-class CallProcessor:
-    def __init__(
-        self,
-        ingestor: IngestorProtocol,
-        repo_path: Path,
-        project_name: str,
-        function_registry: FunctionRegistryTrieProtocol,
-        import_processor: ImportProcessor,
-        type_inference: TypeInferenceEngine,
-        class_inheritance: dict[str, list[str]],
-    ) -> None:
-        self.ingestor = ingestor
+class CallSiteExtractor:
+    def __init__(self, repo_path: Path, project_name: str) -> None:
         self.repo_path = repo_path
         self.project_name = project_name
 
-        self._resolver = CallResolver(
-            function_registry=function_registry,
-            import_processor=import_processor,
-            type_inference=type_inference,
-            class_inheritance=class_inheritance,
-        )
-
     def _get_node_name(self, node: Node, field: str = cs.FIELD_NAME) -> str | None:
         name_node = node.child_by_field_name(field)
         if not name_node:
@@ -46,16 +45,15 @@ class CallProcessor:
         text = name_node.text
         return None if text is None else text.decode(cs.ENCODING_UTF8)
 
-    def process_calls_in_file(
+    @profile_decorator(cs.ProfileCategory.STAGE)
+    def extract_call_sites(
         self,
         file_path: Path,
         root_node: Node,
         language: cs.SupportedLanguage,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
-    ) -> None:
+    ) -> FileCallSites | None:
         relative_path = file_path.relative_to(self.repo_path)
-        logger.debug(ls.CALL_PROCESSING_FILE.format(path=relative_path))
-
         try:
             module_qn = cs.SEPARATOR_DOT.join(
                 [self.project_name] + list(relative_path.with_suffix("").parts)
@@ -65,27 +63,37 @@ class CallProcessor:
                     [self.project_name] + list(relative_path.parent.parts)
                 )
 
-            self._process_calls_in_functions(root_node, module_qn, language, queries)
-            self._process_calls_in_classes(root_node, module_qn, language, queries)
-            self._process_module_level_calls(root_node, module_qn, language, queries)
-
+            lang_queries = queries[language]
+            functions = capture_span_index(
+                lang_queries[cs.QUERY_FUNCTIONS], root_node, cs.CAPTURE_FUNCTION
+            )
+            calls = capture_span_index(
+                lang_queries.get(cs.QUERY_CALLS), root_node, cs.CAPTURE_CALL
+            )
+            callers: list[CallerSites] = []
+            self._process_calls_in_functions(
+                functions, module_qn, language, queries, calls, callers
+            )
+            self._process_calls_in_classes(
+                root_node, module_qn, language, queries, functions, calls, callers
+            )
+            self._process_module_level_calls(root_node, module_qn, calls, callers)
         except Exception as e:
             logger.error(ls.CALL_PROCESSING_FAILED.format(path=file_path, error=e))
+            return None
+        return FileCallSites(module_qn, language, tuple(callers))
 
     def _process_calls_in_functions(
         self,
-        root_node: Node,
+        functions: NodeSpanIndex,
         module_qn: str,
         language: cs.SupportedLanguage,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
+        calls: NodeSpanIndex,
+        callers: list[CallerSites],
     ) -> None:
-        result = get_function_captures(root_node, language, queries)
-        if not result:
-            return
-
-        lang_config, captures = result
-        func_nodes = captures.get(cs.CAPTURE_FUNCTION, [])
-        for func_node in func_nodes:
+        lang_config = queries[language][cs.QUERY_CONFIG]
+        for func_node in functions.nodes:
             if not isinstance(func_node, Node):
                 continue
             if self._is_method(func_node, lang_config):
@@ -100,13 +108,8 @@ class CallProcessor:
             if func_qn := self._build_nested_qualified_name(
                 func_node, module_qn, func_name, lang_config
             ):
-                self._ingest_function_calls(
-                    func_node,
-                    func_qn,
-                    cs.NodeLabel.FUNCTION,
-                    module_qn,
-                    language,
-                    queries,
+                self._collect_caller_sites(
+                    func_node, func_qn, cs.NodeLabel.FUNCTION, calls, callers
                 )
 
     def _get_rust_impl_class_name(self, class_node: Node) -> str | None:
@@ -133,31 +136,19 @@ class CallProcessor:
         self,
         body_node: Node,
         class_qn: str,
-        module_qn: str,
-        language: cs.SupportedLanguage,
-        queries: dict[cs.SupportedLanguage, LanguageQueries],
+        functions: NodeSpanIndex,
+        calls: NodeSpanIndex,
+        callers: list[CallerSites],
     ) -> None:
-        method_query = queries[language][cs.QUERY_FUNCTIONS]
-        if not method_query:
-            return
-        method_cursor = QueryCursor(method_query)
-        method_captures = method_cursor.captures(body_node)
-        method_nodes = method_captures.get(cs.CAPTURE_FUNCTION, [])
-        for method_node in method_nodes:
+        for method_node in functions.within(body_node):
             if not isinstance(method_node, Node):
                 continue
             method_name = self._get_node_name(method_node)
             if not method_name:
                 continue
             method_qn = f"{class_qn}{cs.SEPARATOR_DOT}{method_name}"
-            self._ingest_function_calls(
-                method_node,
-                method_qn,
-                cs.NodeLabel.METHOD,
-                module_qn,
-                language,
-                queries,
-                class_qn,
+            self._collect_caller_sites(
+                method_node, method_qn, cs.NodeLabel.METHOD, calls, callers, class_qn
             )
 
     def _process_calls_in_classes(
@@ -166,6 +157,9 @@ class CallProcessor:
         module_qn: str,
         language: cs.SupportedLanguage,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
+        functions: NodeSpanIndex,
+        calls: NodeSpanIndex,
+        callers: list[CallerSites],
     ) -> None:
         query = queries[language][cs.QUERY_CLASSES]
         if not query:
@@ -183,18 +177,18 @@ class CallProcessor:
             class_qn = f"{module_qn}{cs.SEPARATOR_DOT}{class_name}"
             if body_node := class_node.child_by_field_name(cs.FIELD_BODY):
                 self._process_methods_in_class(
-                    body_node, class_qn, module_qn, language, queries
+                    body_node, class_qn, functions, calls, callers
                 )
 
     def _process_module_level_calls(
         self,
         root_node: Node,
         module_qn: str,
-        language: cs.SupportedLanguage,
-        queries: dict[cs.SupportedLanguage, LanguageQueries],
+        calls: NodeSpanIndex,
+        callers: list[CallerSites],
     ) -> None:
-        self._ingest_function_calls(
-            root_node, module_qn, cs.NodeLabel.MODULE, module_qn, language, queries
+        self._collect_caller_sites(
+            root_node, module_qn, cs.NodeLabel.MODULE, calls, callers
         )
 
     def _get_call_target_name(self, call_node: Node) -> str | None:
@@ -251,80 +245,44 @@ class CallProcessor:
                     return f"{cs.IIFE_ARROW_PREFIX}{child.start_point[0]}_{child.start_point[1]}"
         return None
 
-    def _ingest_function_calls(
+    def _collect_caller_sites(
         self,
         caller_node: Node,
         caller_qn: str,
         caller_type: str,
-        module_qn: str,
-        language: cs.SupportedLanguage,
-        queries: dict[cs.SupportedLanguage, LanguageQueries],
+        calls: NodeSpanIndex,
+        callers: list[CallerSites],
         class_context: str | None = None,
     ) -> None:
-        calls_query = queries[language].get(cs.QUERY_CALLS)
-        if not calls_query:
-            return
-
-        local_var_types = self._resolver.type_inference.build_local_variable_type_map(
-            caller_node, module_qn, language
-        )
-
-        cursor = QueryCursor(calls_query)
-        captures = cursor.captures(caller_node)
-        call_nodes = captures.get(cs.CAPTURE_CALL, [])
-
-        logger.debug(
-            ls.CALL_FOUND_NODES.format(
-                count=len(call_nodes), language=language, caller=caller_qn
-            )
-        )
-
-        for call_node in call_nodes:
+        sites: list[CallSite] = []
+        for call_node in calls.within(caller_node):
             if not isinstance(call_node, Node):
                 continue
 
             # (H) tree-sitter finds ALL call nodes including nested; no recursive processing needed
 
-            call_name = self._get_call_target_name(call_node)
-            if not call_name:
-                continue
-
-            if (
-                language == cs.SupportedLanguage.JAVA
-                and call_node.type == cs.TS_METHOD_INVOCATION
-            ):
-                callee_info = self._resolver.resolve_java_method_call(
-                    call_node, module_qn, local_var_types
+            if call_name := self._get_call_target_name(call_node):
+                sites.append(
+                    CallSite(
+                        sys.intern(call_name),
+                        call_node.type,
+                        call_node.start_byte,
+                        call_node.end_byte,
+                    )
                 )
-            else:
-                callee_info = self._resolver.resolve_function_call(
-                    call_name, module_qn, local_var_types, class_context
-                )
-            if callee_info:
-                callee_type, callee_qn = callee_info
-            elif builtin_info := self._resolver.resolve_builtin_call(call_name):
-                callee_type, callee_qn = builtin_info
-            elif operator_info := self._resolver.resolve_cpp_operator_call(
-                call_name, module_qn
-            ):
-                callee_type, callee_qn = operator_info
-            else:
-                continue
-            logger.debug(
-                ls.CALL_FOUND.format(
-                    caller=caller_qn,
-                    call_name=call_name,
-                    callee_type=callee_type,
-                    callee_qn=callee_qn,
+        if sites:
+            callers.append(
+                CallerSites(
+                    caller_qn,
+                    caller_type,
+                    class_context,
+                    caller_node.type,
+                    caller_node.start_byte,
+                    caller_node.end_byte,
+                    tuple(sites),
                 )
             )
 
-            self.ingestor.ensure_relationship_batch(
-                (caller_type, cs.KEY_QUALIFIED_NAME, caller_qn),
-                cs.RelationshipType.CALLS,
-                (callee_type, cs.KEY_QUALIFIED_NAME, callee_qn),
-            )
-
     def _build_nested_qualified_name(
         self,
         func_node: Node,
@@ -361,3 +319,180 @@ class CallProcessor:
 
     def _is_method(self, func_node: Node, lang_config: LanguageSpec) -> bool:
         return is_method_node(func_node, lang_config)
+
+
+class CallProcessor(CallSiteExtractor):
+    def __init__(
+        self,
+        ingestor: IngestorProtocol,
+        repo_path: Path,
+        project_name: str,
+        function_registry: FunctionRegistryTrieProtocol,
+        import_processor: ImportProcessor,
+        type_inference: TypeInferenceEngine,
+        class_inheritance: dict[str, list[str]],
+    ) -> None:
+        super().__init__(repo_path, project_name)
+        self.ingestor = ingestor
+
+        self._resolver = CallResolver(
+            function_registry=function_registry,
+            import_processor=import_processor,
+            type_inference=type_inference,
+            class_inheritance=class_inheritance,
+        )
+
+    def clear_resolution_cache(self) -> None:
+        self._resolver.clear_cache()
+
+    @property
+    def resolution_cache_stats(self) -> ResolutionCacheStats:
+        return self._resolver.cache_stats
+
+    def process_calls_in_file(
+        self,
+        file_path: Path,
+        root_node: Node,
+        language: cs.SupportedLanguage,
+        queries: dict[cs.SupportedLanguage, LanguageQueries],
+    ) -> None:
+        if call_sites := self.extract_call_sites(
+            file_path, root_node, language, queries
+        ):
+            self.resolve_call_sites(file_path, call_sites, lambda: root_node)
+
+    def resolve_call_sites(
+        self,
+        file_path: Path,
+        call_sites: FileCallSites,
+        load_root: Callable[[], Node | None],
+    ) -> None:
+        relative_path = file_path.relative_to(self.repo_path)
+        logger.debug(ls.CALL_PROCESSING_FILE.format(path=relative_path))
+
+        # (H) Bare names resolve from the records alone; the tree is only loaded
+        # (H) for callers whose calls can depend on local variable types.
+        root_node: Node | None = None
+        with profile_span(
+            cs.PROFILE_PASS_CALLS,
+            cs.ProfileCategory.FILE,
+            path=str(relative_path),
+            language=str(call_sites.language),
+        ):
+            try:
+                for caller in call_sites.callers:
+                    if root_node is None and self._needs_tree(
+                        caller, call_sites.language
+                    ):
+                        root_node = load_root()
+                    self._resolve_caller_sites(caller, call_sites, root_node)
+            except Exception as e:
+                logger.error(ls.CALL_PROCESSING_FAILED.format(path=file_path, error=e))
+
+    def needs_tree(self, call_sites: FileCallSites) -> bool:
+        return any(
+            self._needs_tree(caller, call_sites.language)
+            for caller in call_sites.callers
+        )
+
+    def _needs_tree(self, caller: CallerSites, language: cs.SupportedLanguage) -> bool:
+        # (H) Other languages have no local type map, so the tree adds nothing.
+        if language not in cs.LOCAL_TYPE_LANGUAGES:
+            return False
+        return any(
+            self._is_java_invocation(site, language)
+            or self._resolver.needs_local_types(site.name)
+            for site in caller.sites
+        )
+
+    def _is_java_invocation(
+        self, site: CallSite, language: cs.SupportedLanguage
+    ) -> bool:
+        return (
+            language == cs.SupportedLanguage.JAVA
+            and site.node_type == cs.TS_METHOD_INVOCATION
+        )
+
+    def _resolve_caller_sites(
+        self,
+        caller: CallerSites,
+        call_sites: FileCallSites,
+        root_node: Node | None,
+    ) -> None:
+        module_qn, language = call_sites.module_qn, call_sites.language
+        logger.debug(
+            ls.CALL_FOUND_NODES.format(
+                count=len(caller.sites), language=language, caller=caller.qualified_name
+            )
+        )
+
+        local_var_types: dict[str, str] | None = None
+        for site in caller.sites:
+            is_java_invocation = self._is_java_invocation(site, language)
+            if local_var_types is None and (
+                is_java_invocation or self._resolver.needs_local_types(site.name)
+            ):
+                local_var_types = self._build_local_types(
+                    caller, module_qn, language, root_node
+                )
+
+            if is_java_invocation:
+                call_node = (
+                    find_node_by_span(
+                        root_node, site.node_type, site.start_byte, site.end_byte
+                    )
+                    if root_node
+                    else None
+                )
+                if call_node is None:
+                    continue
+                callee_info = self._resolver.resolve_java_method_call(
+                    call_node, module_qn, local_var_types or {}
+                )
+            else:
+                callee_info = self._resolver.resolve_function_call(
+                    site.name, module_qn, local_var_types, caller.class_context
+                )
+            if callee_info:
+                callee_type, callee_qn = callee_info
+            elif builtin_info := self._resolver.resolve_builtin_call(site.name):
+                callee_type, callee_qn = builtin_info
+            elif operator_info := self._resolver.resolve_cpp_operator_call(
+                site.name, module_qn
+            ):
+                callee_type, callee_qn = operator_info
+            else:
+                continue
+            logger.debug(
+                ls.CALL_FOUND.format(
+                    caller=caller.qualified_name,
+                    call_name=site.name,
+                    callee_type=callee_type,
+                    callee_qn=callee_qn,
+                )
+            )
+
+            self.ingestor.ensure_relationship_batch(
+                (caller.label, cs.KEY_QUALIFIED_NAME, caller.qualified_name),
+                cs.RelationshipType.CALLS,
+                (callee_type, cs.KEY_QUALIFIED_NAME, callee_qn),
+            )
+
+    @profile_decorator(cs.ProfileCategory.STAGE, name=cs.PROFILE_STAGE_TYPE_INFERENCE)
+    def _build_local_types(
+        self,
+        caller: CallerSites,
+        module_qn: str,
+        language: cs.SupportedLanguage,
+        root_node: Node | None,
+    ) -> dict[str, str]:
+        if root_node is None:
+            return {}
+        caller_node = find_node_by_span(
+            root_node, caller.node_type, caller.start_byte, caller.end_byte
+        )
+        if caller_node is None:
+            return {}
+        return self._resolver.type_inference.build_local_variable_type_map(
+            caller_node, module_qn, language
+        )
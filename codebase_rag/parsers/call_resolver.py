@@ -7,7 +7,14 @@ from tree_sitter import Node
 
 from .. import constants as cs
 from .. import logs as ls
-from ..types_defs import FunctionRegistryTrieProtocol, NodeType
+from ..decorators import profile_decorator
+from ..types_defs import (
+    FunctionRegistryTrieProtocol,
+    NodeType,
+    ResolutionCacheKey,
+    ResolutionCacheStats,
+)
+from .class_ingest import ClassHierarchy
 from .import_processor import ImportProcessor
 from .py import resolve_class_name
 from .type_inference import TypeInferenceEngine
@@ -24,7 +31,47 @@ class CallResolver:
         self.function_registry = function_registry
         self.import_processor = import_processor
         self.type_inference = type_inference
-        self.class_inheritance = class_inheritance
+        self.class_inheritance = ClassHierarchy.of(class_inheritance)
+        self._resolution_cache: dict[ResolutionCacheKey, tuple[str, str] | None] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def clear_cache(self) -> None:
+        # (H) The registry, import mappings and inheritance only change between
+        # (H) call passes, so the cache is dropped whenever a pass starts.
+        self._resolution_cache.clear()
+        self.type_inference.clear_caches()
+
+    @property
+    def cache_stats(self) -> ResolutionCacheStats:
+        return ResolutionCacheStats(
+            hits=self.cache_hits,
+            misses=self.cache_misses,
+            entries=len(self._resolution_cache),
+        )
+
+    def _cache_key(
+        self,
+        call_name: str,
+        module_qn: str,
+        local_var_types: dict[str, str] | None,
+        class_context: str | None,
+    ) -> ResolutionCacheKey:
+        # (H) Only super calls read the class context, and only the types of the
+        # (H) receivers the call name starts with are ever looked up.
+        receiver_types: tuple[tuple[str, str], ...] = ()
+        if local_var_types and self._has_separator(call_name):
+            receiver_types = tuple(
+                (receiver, local_var_types[receiver])
+                for match in re.finditer(r"::|[.:]", call_name)
+                if (receiver := call_name[: match.start()]) in local_var_types
+            )
+        return ResolutionCacheKey(
+            call_name=call_name,
+            module_qn=module_qn,
+            class_context=class_context if self._is_super_call(call_name) else None,
+            receiver_types=receiver_types,
+        )
 
     def _resolve_class_qn_from_type(
         self, var_type: str, import_map: dict[str, str], module_qn: str
@@ -49,6 +96,24 @@ class CallResolver:
         module_qn: str,
         local_var_types: dict[str, str] | None = None,
         class_context: str | None = None,
+    ) -> tuple[str, str] | None:
+        key = self._cache_key(call_name, module_qn, local_var_types, class_context)
+        if key in self._resolution_cache:
+            self.cache_hits += 1
+            return self._resolution_cache[key]
+        self.cache_misses += 1
+        result = self._resolve_function_call(
+            call_name, module_qn, local_var_types, class_context
+        )
+        self._resolution_cache[key] = result
+        return result
+
+    def _resolve_function_call(
+        self,
+        call_name: str,
+        module_qn: str,
+        local_var_types: dict[str, str] | None,
+        class_context: str | None,
     ) -> tuple[str, str] | None:
         if result := self._try_resolve_iife(call_name, module_qn):
             return result
@@ -69,6 +134,7 @@ class CallResolver:
 
         return self._try_resolve_via_trie(call_name, module_qn)
 
+    @profile_decorator(cs.ProfileCategory.RESOLVER)
     def _try_resolve_iife(
         self, call_name: str, module_qn: str
     ) -> tuple[str, str] | None:
@@ -91,6 +157,7 @@ class CallResolver:
             or call_name.startswith(f"{cs.KEYWORD_SUPER}()")
         )
 
+    @profile_decorator(cs.ProfileCategory.RESOLVER)
     def _try_resolve_via_imports(
         self,
         call_name: str,
@@ -153,6 +220,11 @@ class CallResolver:
             parts, call_name, import_map, module_qn, local_var_types
         )
 
+    def needs_local_types(self, call_name: str) -> bool:
+        # (H) Local variable types are only consulted for qualified calls; bare
+        # (H) names resolve through imports, the module and the registry.
+        return self._has_separator(call_name)
+
     def _has_separator(self, call_name: str) -> bool:
         return (
             cs.SEPARATOR_DOT in call_name
@@ -193,6 +265,7 @@ class CallResolver:
                 return self.function_registry[wildcard_qn], wildcard_qn
         return None
 
+    @profile_decorator(cs.ProfileCategory.RESOLVER)
     def _try_resolve_same_module(
         self, call_name: str, module_qn: str
     ) -> tuple[str, str] | None:
@@ -204,6 +277,7 @@ class CallResolver:
             return self.function_registry[same_module_func_qn], same_module_func_qn
         return None
 
+    @profile_decorator(cs.ProfileCategory.RESOLVER)
     def _try_resolve_via_trie(
         self, call_name: str, module_qn: str
     ) -> tuple[str, str] | None:
@@ -479,6 +553,7 @@ class CallResolver:
 
         return None
 
+    @profile_decorator(cs.ProfileCategory.RESOLVER)
     def resolve_builtin_call(self, call_name: str) -> tuple[str, str] | None:
         if call_name in cs.JS_BUILTIN_PATTERNS:
             return (cs.NodeLabel.FUNCTION, f"{cs.BUILTIN_PREFIX}.{call_name}")
@@ -499,6 +574,7 @@ class CallResolver:
 
         return None
 
+    @profile_decorator(cs.ProfileCategory.RESOLVER)
     def resolve_cpp_operator_call(
         self, call_name: str, module_qn: str
     ) -> tuple[str, str] | None:
@@ -530,6 +606,7 @@ class CallResolver:
         )
         return method_calls >= 1 and len(parts) >= 2
 
+    @profile_decorator(cs.ProfileCategory.RESOLVER)
     def _resolve_chained_call(
         self,
         call_name: str,
@@ -583,6 +660,7 @@ class CallResolver:
 
         return None
 
+    @profile_decorator(cs.ProfileCategory.RESOLVER)
     def _resolve_super_call(
         self, call_name: str, class_context: str | None = None
     ) -> tuple[str, str] | None:
@@ -630,25 +708,10 @@ class CallResolver:
         if class_qn not in self.class_inheritance:
             return None
 
-        queue = list(self.class_inheritance.get(class_qn, []))
-        visited = set(queue)
-
-        while queue:
-            parent_class_qn = queue.pop(0)
-            parent_method_qn = f"{parent_class_qn}.{method_name}"
-
-            if parent_method_qn in self.function_registry:
-                return (
-                    self.function_registry[parent_method_qn],
-                    parent_method_qn,
-                )
-
-            if parent_class_qn in self.class_inheritance:
-                for grandparent_qn in self.class_inheritance[parent_class_qn]:
-                    if grandparent_qn not in visited:
-                        visited.add(grandparent_qn)
-                        queue.append(grandparent_qn)
-
+        if parent_method_qn := self.class_inheritance.find_inherited_member(
+            class_qn, method_name, self.function_registry
+        ):
+            return self.function_registry[parent_method_qn], parent_method_qn
         return None
 
     def _calculate_import_distance(
@@ -678,6 +741,7 @@ class CallResolver:
             class_name, module_qn, self.import_processor, self.function_registry
         )
 
+    @profile_decorator(cs.ProfileCategory.RESOLVER)
     def resolve_java_method_call(
         self,
         call_node: Node,
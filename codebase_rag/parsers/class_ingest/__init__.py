@@ -1,3 +1,4 @@
+from .ancestry import ClassHierarchy
 from .mixin import ClassIngestMixin
 
-__all__ = ["ClassIngestMixin"]
+__all__ = ["ClassHierarchy", "ClassIngestMixin"]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from collections import defaultdict, deque
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING
+
+from ... import constants as cs
+
+if TYPE_CHECKING:
+    from ...types_defs import FunctionRegistryTrieProtocol
+
+
+class ClassHierarchy(dict[str, list[str]]):
+    # (H) Maps a class to its direct parents and memoizes each class's linearized
+    # (H) ancestry (breadth-first, nearest first, duplicates dropped). Parent
+    # (H) lists must be replaced rather than mutated so the memo stays in sync.
+    def __init__(self, parents: Mapping[str, list[str]] | None = None) -> None:
+        super().__init__()
+        self._ancestors: dict[str, tuple[str, ...]] = {}
+        self._descendants: defaultdict[str, set[str]] = defaultdict(set)
+        if parents:
+            self.update(parents)
+
+    @classmethod
+    def of(cls, class_inheritance: Mapping[str, list[str]]) -> ClassHierarchy:
+        if isinstance(class_inheritance, ClassHierarchy):
+            return class_inheritance
+        return cls(class_inheritance)
+
+    def __setitem__(self, class_qn: str, parents: list[str]) -> None:
+        super().__setitem__(class_qn, parents)
+        self._invalidate(class_qn)
+
+    def __delitem__(self, class_qn: str) -> None:
+        super().__delitem__(class_qn)
+        self._invalidate(class_qn)
+
+    def __reduce__(self) -> tuple[type[ClassHierarchy], tuple[dict[str, list[str]]]]:
+        return (type(self), (dict(self),))
+
+    def update(  # type: ignore[override]
+        self,
+        other: Mapping[str, list[str]] | Iterable[tuple[str, list[str]]] = (),
+        /,
+        **kwargs: list[str],
+    ) -> None:
+        items = other.items() if isinstance(other, Mapping) else other
+        for class_qn, parents in items:
+            self[class_qn] = parents
+        for class_qn, parents in kwargs.items():
+            self[class_qn] = parents
+
+    def pop(self, class_qn: str, *default: list[str]) -> list[str]:  # type: ignore[override]
+        parents = super().pop(class_qn, *default)
+        self._invalidate(class_qn)
+        return parents
+
+    def clear(self) -> None:
+        super().clear()
+        self._ancestors.clear()
+        self._descendants.clear()
+
+    def ancestors(self, class_qn: str) -> tuple[str, ...]:
+        if (cached := self._ancestors.get(class_qn)) is not None:
+            return cached
+
+        order: list[str] = []
+        queue = deque([class_qn])
+        visited = {class_qn}
+        while queue:
+            for parent_qn in self.get(queue.popleft(), ()):
+                if parent_qn not in visited:
+                    visited.add(parent_qn)
+                    order.append(parent_qn)
+                    queue.append(parent_qn)
+
+        ancestry = tuple(order)
+        self._ancestors[class_qn] = ancestry
+        for ancestor_qn in ancestry:
+            self._descendants[ancestor_qn].add(class_qn)
+        return ancestry
+
+    def find_inherited_member(
+        self,
+        class_qn: str,
+        member_name: str,
+        function_registry: FunctionRegistryTrieProtocol,
+    ) -> str | None:
+        for ancestor_qn in self.ancestors(class_qn):
+            member_qn = f"{ancestor_qn}{cs.SEPARATOR_DOT}{member_name}"
+            if member_qn in function_registry:
+                return member_qn
+        return None
+
+    def _invalidate(self, class_qn: str) -> None:
+        if not self._ancestors:
+            return
+        self._ancestors.pop(class_qn, None)
+        for descendant_qn in self._descendants.pop(class_qn, ()):
+            self._ancestors.pop(descendant_qn, None)
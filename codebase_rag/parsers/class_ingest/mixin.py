@@ -9,15 +9,22 @@ from tree_sitter import Node, QueryCursor
 
 from ... import constants as cs
 from ... import logs
-from ...types_defs import ASTNode, PropertyDict
+from ...types_defs import (
+    ASTNode,
+    DeferredClassName,
+    InheritsRow,
+    NodeType,
+    PropertyDict,
+)
 from ..java import utils as java_utils
 from ..py import resolve_class_name
 from ..rs import utils as rs_utils
-from ..utils import ingest_method, safe_decode_text
+from ..utils import NodeSpanIndex, ingest_method, safe_decode_text
 from . import cpp_modules
 from . import identity as id_
 from . import method_override as mo
 from . import node_type as nt
+from . import parent_extraction as pe
 from . import relationships as rel
 
 if TYPE_CHECKING:
@@ -74,6 +81,7 @@ class ClassIngestMixin:
         module_qn: str,
         language: cs.SupportedLanguage,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
+        functions: NodeSpanIndex,
     ) -> None:
         lang_queries = queries[language]
         if not (query := lang_queries[cs.QUERY_CLASSES]):
@@ -96,9 +104,9 @@ class ClassIngestMixin:
                     class_node,
                     module_qn,
                     language,
-                    lang_queries,
                     lang_config,
                     file_path,
+                    functions,
                 )
 
         self._process_inline_modules(module_nodes, module_qn, lang_config)
@@ -108,14 +116,12 @@ class ClassIngestMixin:
         class_node: Node,
         module_qn: str,
         language: cs.SupportedLanguage,
-        lang_queries: LanguageQueries,
         lang_config: LanguageSpec,
         file_path: Path | None,
+        functions: NodeSpanIndex,
     ) -> None:
         if language == cs.SupportedLanguage.RUST and class_node.type == cs.TS_IMPL_ITEM:
-            self._ingest_rust_impl_methods(
-                class_node, module_qn, language, lang_queries
-            )
+            self._ingest_rust_impl_methods(class_node, module_qn, language, functions)
             return
 
         identity = id_.resolve_class_identity(
@@ -147,41 +153,84 @@ class ClassIngestMixin:
         if class_name:
             self.simple_name_lookup[class_name].add(class_qn)
 
+        parent_classes = pe.extract_parent_classes(
+            class_node, module_qn, self.import_processor, self._resolve_to_qn
+        )
+        interfaces = (
+            pe.extract_implemented_interfaces(
+                class_node, module_qn, self._resolve_to_qn
+            )
+            if class_node.type == cs.TS_CLASS_DECLARATION
+            else []
+        )
+        self._ingest_class_relationships(
+            class_qn,
+            module_qn,
+            node_type,
+            is_exported,
+            language,
+            parent_classes,
+            interfaces,
+        )
+        self._ingest_class_methods(class_node, class_qn, language, functions)
+
+    def _ingest_class_relationships(
+        self,
+        class_qn: str,
+        module_qn: str,
+        node_type: NodeType,
+        is_exported: bool,
+        language: cs.SupportedLanguage,
+        parent_classes: list[str],
+        interfaces: list[str],
+    ) -> None:
         rel.create_class_relationships(
-            class_node,
             class_qn,
             module_qn,
             node_type,
             is_exported,
             language,
+            parent_classes,
+            interfaces,
             self.class_inheritance,
             self.ingestor,
-            self.import_processor,
-            self._resolve_to_qn,
             self.function_registry,
         )
-        self._ingest_class_methods(class_node, class_qn, language, lang_queries)
+
+    def ingest_deferred_class_relationships(self, row: InheritsRow) -> list[str]:
+        parent_classes = [self._resolve_deferred(name) for name in row.parent_classes]
+        self._ingest_class_relationships(
+            row.class_qn,
+            row.module_qn,
+            row.node_type,
+            row.is_exported,
+            row.language,
+            parent_classes,
+            [self._resolve_deferred(name) for name in row.interfaces],
+        )
+        return parent_classes
+
+    def _resolve_deferred(self, name: str) -> str:
+        if isinstance(name, DeferredClassName):
+            return self._resolve_to_qn(name.name, name.module_qn)
+        return name
 
     def _ingest_rust_impl_methods(
         self,
         class_node: Node,
         module_qn: str,
         language: cs.SupportedLanguage,
-        lang_queries: LanguageQueries,
+        functions: NodeSpanIndex,
     ) -> None:
         if not (impl_target := rs_utils.extract_impl_target(class_node)):
             return
 
         class_qn = f"{module_qn}.{impl_target}"
         body_node = class_node.child_by_field_name("body")
-        method_query = lang_queries[cs.QUERY_FUNCTIONS]
-
-        if not body_node or not method_query:
+        if not body_node:
             return
 
-        method_cursor = QueryCursor(method_query)
-        method_captures = method_cursor.captures(body_node)
-        for method_node in method_captures.get(cs.CAPTURE_FUNCTION, []):
+        for method_node in functions.within(body_node):
             if isinstance(method_node, Node):
                 ingest_method(
                     method_node,
@@ -199,16 +248,13 @@ class ClassIngestMixin:
         class_node: Node,
         class_qn: str,
         language: cs.SupportedLanguage,
-        lang_queries: LanguageQueries,
+        functions: NodeSpanIndex,
     ) -> None:
         body_node = class_node.child_by_field_name("body")
-        method_query = lang_queries[cs.QUERY_FUNCTIONS]
-        if not body_node or not method_query:
+        if not body_node:
             return
 
-        method_cursor = QueryCursor(method_query)
-        method_captures = method_cursor.captures(body_node)
-        for method_node in method_captures.get(cs.CAPTURE_FUNCTION, []):
+        for method_node in functions.within(body_node):
             if not isinstance(method_node, Node):
                 continue
 
@@ -280,8 +326,6 @@ class ClassIngestMixin:
         )
 
     def _extract_cpp_base_class_name(self, parent_text: str) -> str:
-        from . import parent_extraction as pe
-
         return pe.extract_cpp_base_class_name(parent_text)
 
     def _get_node_type_for_inheritance(self, qualified_name: str) -> str:
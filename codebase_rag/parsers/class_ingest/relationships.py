@@ -1,36 +1,27 @@
 from __future__ import annotations
 
-from collections.abc import Callable
 from typing import TYPE_CHECKING
 
-from tree_sitter import Node
-
 from ... import constants as cs
 from ...types_defs import NodeType
-from . import parent_extraction as pe
 
 if TYPE_CHECKING:
     from ...services import IngestorProtocol
     from ...types_defs import FunctionRegistryTrieProtocol
-    from ..import_processor import ImportProcessor
 
 
 def create_class_relationships(
-    class_node: Node,
     class_qn: str,
     module_qn: str,
     node_type: NodeType,
     is_exported: bool,
     language: cs.SupportedLanguage,
+    parent_classes: list[str],
+    interfaces: list[str],
     class_inheritance: dict[str, list[str]],
     ingestor: IngestorProtocol,
-    import_processor: ImportProcessor,
-    resolve_to_qn: Callable[[str, str], str],
     function_registry: FunctionRegistryTrieProtocol,
 ) -> None:
-    parent_classes = pe.extract_parent_classes(
-        class_node, module_qn, import_processor, resolve_to_qn
-    )
     class_inheritance[class_qn] = parent_classes
 
     ingestor.ensure_relationship_batch(
@@ -51,11 +42,8 @@ def create_class_relationships(
             node_type, class_qn, parent_class_qn, function_registry, ingestor
         )
 
-    if class_node.type == cs.TS_CLASS_DECLARATION:
-        for interface_qn in pe.extract_implemented_interfaces(
-            class_node, module_qn, resolve_to_qn
-        ):
-            create_implements_relationship(node_type, class_qn, interface_qn, ingestor)
+    for interface_qn in interfaces:
+        create_implements_relationship(node_type, class_qn, interface_qn, ingestor)
 
 
 def get_node_type_for_inheritance(
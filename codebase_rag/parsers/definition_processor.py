@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -7,15 +8,26 @@ from loguru import logger
 
 from .. import constants as cs
 from .. import logs as ls
-from ..types_defs import ASTNode, FunctionRegistryTrieProtocol, SimpleNameLookup
-from .class_ingest import ClassIngestMixin
+from ..config import settings
+from ..profiling import profile_span
+from ..types_defs import (
+    ASTNode,
+    FunctionRegistryTrieProtocol,
+    SimpleNameLookup,
+    SourceTree,
+    TopLevelPatch,
+)
+from .class_ingest import ClassHierarchy, ClassIngestMixin
 from .dependency_parser import parse_dependencies
 from .function_ingest import FunctionIngestMixin
 from .handlers import get_handler
+from .incremental import reparse, top_level_patch
 from .js_ts.ingest import JsTsIngestMixin
-from .utils import safe_decode_with_fallback
+from .utils import capture_span_index, safe_decode_with_fallback
 
 if TYPE_CHECKING:
+    from tree_sitter import Parser, Tree
+
     from ..services import IngestorProtocol
     from ..types_defs import LanguageQueries
     from .handlers import LanguageHandler
@@ -38,6 +50,7 @@ class DefinitionProcessor(
         simple_name_lookup: SimpleNameLookup,
         import_processor: ImportProcessor,
         module_qn_to_file_path: dict[str, Path],
+        retain_sources: bool = False,
     ):
         super().__init__()
         self.ingestor = ingestor
@@ -47,8 +60,11 @@ class DefinitionProcessor(
         self.simple_name_lookup = simple_name_lookup
         self.import_processor = import_processor
         self.module_qn_to_file_path = module_qn_to_file_path
-        self.class_inheritance: dict[str, list[str]] = {}
+        self.class_inheritance: dict[str, list[str]] = ClassHierarchy()
         self._handler = get_handler(cs.SupportedLanguage.PYTHON)
+        self.source_trees: OrderedDict[Path, SourceTree] | None = (
+            OrderedDict() if retain_sources else None
+        )
 
     def process_file(
         self,
@@ -59,8 +75,7 @@ class DefinitionProcessor(
     ) -> tuple[ASTNode, cs.SupportedLanguage] | None:
         if isinstance(file_path, str):
             file_path = Path(file_path)
-        relative_path = file_path.relative_to(self.repo_path)
-        relative_path_str = str(relative_path)
+        relative_path_str = str(file_path.relative_to(self.repo_path))
         logger.info(
             ls.DEF_PARSING_AST.format(language=language, path=relative_path_str)
         )
@@ -74,73 +89,184 @@ class DefinitionProcessor(
                 )
                 return None
 
-            self._handler = get_handler(language)
             source_bytes = file_path.read_bytes()
-            lang_queries = queries[language]
-            parser = lang_queries.get(cs.KEY_PARSER)
+            parser = queries[language].get(cs.KEY_PARSER)
             if not parser:
                 logger.warning(ls.DEF_NO_PARSER.format(language=language))
                 return None
 
-            tree = parser.parse(source_bytes)
+            with profile_span(cs.PROFILE_STAGE_PARSE, cs.ProfileCategory.STAGE):
+                tree = self._parse_source(file_path, parser, source_bytes)
             root_node = tree.root_node
-
-            module_qn = cs.SEPARATOR_DOT.join(
-                [self.project_name] + list(relative_path.with_suffix("").parts)
+            self._ingest_definitions(
+                file_path, language, queries, structural_elements, root_node
             )
-            if file_path.name in (cs.INIT_PY, cs.MOD_RS):
-                module_qn = cs.SEPARATOR_DOT.join(
-                    [self.project_name] + list(relative_path.parent.parts)
-                )
-            self.module_qn_to_file_path[module_qn] = file_path
-
-            self.ingestor.ensure_node_batch(
-                cs.NodeLabel.MODULE,
-                {
-                    cs.KEY_QUALIFIED_NAME: module_qn,
-                    cs.KEY_NAME: file_path.name,
-                    cs.KEY_PATH: relative_path_str,
-                },
+            return (root_node, language)
+
+        except Exception as e:
+            logger.error(ls.DEF_PARSE_FAILED.format(path=file_path, error=e))
+            return None
+
+    def plan_patch(
+        self,
+        file_path: Path,
+        language: cs.SupportedLanguage,
+        queries: dict[cs.SupportedLanguage, LanguageQueries],
+    ) -> TopLevelPatch | None:
+        if (
+            self.source_trees is None
+            or language not in cs.SCOPED_EXTRACTION_LANGUAGES
+            or file_path.name == cs.INIT_PY
+            or (previous := self.source_trees.get(file_path)) is None
+            or language not in queries
+            or not (parser := queries[language].get(cs.KEY_PARSER))
+        ):
+            return None
+        try:
+            source_bytes = file_path.read_bytes()
+            with profile_span(cs.PROFILE_STAGE_PARSE, cs.ProfileCategory.STAGE):
+                tree, edit = reparse(parser, previous, source_bytes)
+            self._retain_source(file_path, SourceTree(source_bytes, tree))
+            return top_level_patch(
+                previous, tree, source_bytes, edit, queries[language][cs.QUERY_CONFIG]
             )
+        except Exception as e:
+            logger.error(ls.DEF_PARSE_FAILED.format(path=file_path, error=e))
+            return None
 
-            parent_rel_path = relative_path.parent
-            parent_container_qn = structural_elements.get(parent_rel_path)
-            parent_label, parent_key, parent_val = (
-                (cs.NodeLabel.PACKAGE, cs.KEY_QUALIFIED_NAME, parent_container_qn)
-                if parent_container_qn
-                else (
-                    (cs.NodeLabel.FOLDER, cs.KEY_PATH, str(parent_rel_path))
-                    if parent_rel_path != Path(".")
-                    else (cs.NodeLabel.PROJECT, cs.KEY_NAME, self.project_name)
-                )
+    def ingest_patch(
+        self,
+        file_path: Path,
+        language: cs.SupportedLanguage,
+        queries: dict[cs.SupportedLanguage, LanguageQueries],
+        structural_elements: dict[Path, str | None],
+        patch: TopLevelPatch,
+    ) -> bool:
+        logger.info(
+            ls.DEF_PATCHING_AST.format(
+                count=len(patch.changed_names),
+                path=file_path.relative_to(self.repo_path),
             )
-            self.ingestor.ensure_relationship_batch(
-                (parent_label, parent_key, parent_val),
-                cs.RelationshipType.CONTAINS_MODULE,
-                (cs.NodeLabel.MODULE, cs.KEY_QUALIFIED_NAME, module_qn),
+        )
+        try:
+            # (H) Unchanged definitions are blanked out, so extraction only
+            # (H) revisits the changed ones plus the module-level statements.
+            with profile_span(cs.PROFILE_STAGE_PARSE, cs.ProfileCategory.STAGE):
+                masked_tree = queries[language][cs.KEY_PARSER].parse(
+                    patch.masked_source
+                )
+            self._ingest_definitions(
+                file_path, language, queries, structural_elements, masked_tree.root_node
             )
+            return True
+        except Exception as e:
+            logger.error(ls.DEF_PARSE_FAILED.format(path=file_path, error=e))
+            return False
 
-            self.import_processor.parse_imports(root_node, module_qn, language, queries)
-            self._ingest_missing_import_patterns(
-                root_node, module_qn, language, queries
-            )
-            if language == cs.SupportedLanguage.CPP:
-                self._ingest_cpp_module_declarations(root_node, module_qn, file_path)
-            self._ingest_all_functions(root_node, module_qn, language, queries)
-            self._ingest_classes_and_methods(root_node, module_qn, language, queries)
-            self._ingest_object_literal_methods(root_node, module_qn, language, queries)
-            self._ingest_commonjs_exports(root_node, module_qn, language, queries)
-            self._ingest_es6_exports(root_node, module_qn, language, queries)
-            self._ingest_assignment_arrow_functions(
-                root_node, module_qn, language, queries
+    def forget_source(self, file_path: Path) -> None:
+        if self.source_trees is not None:
+            self.source_trees.pop(file_path, None)
+
+    def _parse_source(
+        self, file_path: Path, parser: Parser, source_bytes: bytes
+    ) -> Tree:
+        if self.source_trees is None:
+            return parser.parse(source_bytes)
+        previous = self.source_trees.get(file_path)
+        if previous is None:
+            tree = parser.parse(source_bytes)
+        elif previous.source == source_bytes:
+            tree = previous.tree
+        else:
+            tree, _ = reparse(parser, previous, source_bytes)
+        self._retain_source(file_path, SourceTree(source_bytes, tree))
+        return tree
+
+    def _retain_source(self, file_path: Path, source_tree: SourceTree) -> None:
+        if self.source_trees is None:
+            return
+        self.source_trees.pop(file_path, None)
+        self.source_trees[file_path] = source_tree
+        while len(self.source_trees) > settings.CACHE_MAX_ENTRIES:
+            self.source_trees.popitem(last=False)
+
+    def _ingest_definitions(
+        self,
+        file_path: Path,
+        language: cs.SupportedLanguage,
+        queries: dict[cs.SupportedLanguage, LanguageQueries],
+        structural_elements: dict[Path, str | None],
+        root_node: ASTNode,
+    ) -> None:
+        self._handler = get_handler(language)
+        lang_queries = queries[language]
+        relative_path = file_path.relative_to(self.repo_path)
+        relative_path_str = str(relative_path)
+        module_qn = cs.SEPARATOR_DOT.join(
+            [self.project_name] + list(relative_path.with_suffix("").parts)
+        )
+        if file_path.name in (cs.INIT_PY, cs.MOD_RS):
+            module_qn = cs.SEPARATOR_DOT.join(
+                [self.project_name] + list(relative_path.parent.parts)
             )
-            self._ingest_prototype_inheritance(root_node, module_qn, language, queries)
+        self.module_qn_to_file_path[module_qn] = file_path
 
-            return (root_node, language)
+        self.ingestor.ensure_node_batch(
+            cs.NodeLabel.MODULE,
+            {
+                cs.KEY_QUALIFIED_NAME: module_qn,
+                cs.KEY_NAME: file_path.name,
+                cs.KEY_PATH: relative_path_str,
+            },
+        )
 
-        except Exception as e:
-            logger.error(ls.DEF_PARSE_FAILED.format(path=file_path, error=e))
-            return None
+        parent_rel_path = relative_path.parent
+        parent_container_qn = structural_elements.get(parent_rel_path)
+        parent_label, parent_key, parent_val = (
+            (cs.NodeLabel.PACKAGE, cs.KEY_QUALIFIED_NAME, parent_container_qn)
+            if parent_container_qn
+            else (
+                (cs.NodeLabel.FOLDER, cs.KEY_PATH, str(parent_rel_path))
+                if parent_rel_path != Path(".")
+                else (cs.NodeLabel.PROJECT, cs.KEY_NAME, self.project_name)
+            )
+        )
+        self.ingestor.ensure_relationship_batch(
+            (parent_label, parent_key, parent_val),
+            cs.RelationshipType.CONTAINS_MODULE,
+            (cs.NodeLabel.MODULE, cs.KEY_QUALIFIED_NAME, module_qn),
+        )
+
+        with profile_span(cs.PROFILE_STAGE_IMPORTS, cs.ProfileCategory.STAGE):
+            self.import_processor.parse_imports(root_node, module_qn, language, queries)
+        functions = capture_span_index(
+            lang_queries[cs.QUERY_FUNCTIONS], root_node, cs.CAPTURE_FUNCTION
+        )
+        module_captures = self._js_module_captures(root_node, language, queries)
+        self._ingest_missing_import_patterns(
+            root_node, module_qn, language, queries, module_captures
+        )
+        if language == cs.SupportedLanguage.CPP:
+            self._ingest_cpp_module_declarations(root_node, module_qn, file_path)
+        self._ingest_all_functions(functions, module_qn, language, queries)
+        self._ingest_classes_and_methods(
+            root_node, module_qn, language, queries, functions
+        )
+        self._ingest_object_literal_methods(
+            root_node, module_qn, language, queries, module_captures
+        )
+        self._ingest_commonjs_exports(
+            root_node, module_qn, language, queries, module_captures
+        )
+        self._ingest_es6_exports(
+            root_node, module_qn, language, queries, module_captures
+        )
+        self._ingest_assignment_arrow_functions(
+            root_node, module_qn, language, queries, module_captures
+        )
+        self._ingest_prototype_inheritance(
+            root_node, module_qn, language, queries, module_captures
+        )
 
     def process_dependencies(self, filepath: Path) -> None:
         logger.info(ls.DEF_PARSING_DEPENDENCY.format(path=filepath))
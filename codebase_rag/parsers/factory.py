@@ -27,6 +27,7 @@ class ProcessorFactory:
         ast_cache: ASTCacheProtocol,
         unignore_paths: frozenset[str] | None = None,
         exclude_paths: frozenset[str] | None = None,
+        retain_sources: bool = False,
     ) -> None:
         self.ingestor = ingestor
         self.repo_path = repo_path
@@ -37,6 +38,7 @@ class ProcessorFactory:
         self.ast_cache = ast_cache
         self.unignore_paths = unignore_paths
         self.exclude_paths = exclude_paths
+        self.retain_sources = retain_sources
 
         self.module_qn_to_file_path: dict[str, Path] = {}
 
@@ -81,6 +83,7 @@ class ProcessorFactory:
                 simple_name_lookup=self.simple_name_lookup,
                 import_processor=self.import_processor,
                 module_qn_to_file_path=self.module_qn_to_file_path,
+                retain_sources=self.retain_sources,
             )
         return self._definition_processor
 
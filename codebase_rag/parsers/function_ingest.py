@@ -22,7 +22,7 @@ from .cpp import utils as cpp_utils
 from .lua import utils as lua_utils
 from .rs import utils as rs_utils
 from .utils import (
-    get_function_captures,
+    NodeSpanIndex,
     ingest_method,
     is_method_node,
     safe_decode_text,
@@ -57,19 +57,15 @@ class FunctionIngestMixin:
 
     def _ingest_all_functions(
         self,
-        root_node: Node,
+        functions: NodeSpanIndex,
         module_qn: str,
         language: cs.SupportedLanguage,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
     ) -> None:
-        result = get_function_captures(root_node, language, queries)
-        if not result:
-            return
-
-        lang_config, captures = result
+        lang_config = queries[language][cs.QUERY_CONFIG]
         file_path = self.module_qn_to_file_path.get(module_qn)
 
-        for func_node in captures.get(cs.CAPTURE_FUNCTION, []):
+        for func_node in functions.nodes:
             if not isinstance(func_node, Node):
                 logger.warning(
                     ls.FUNC_EXPECTED_NODE.format(
@@ -35,6 +35,7 @@ class ImportProcessor:
         self.ingestor = ingestor
         self.function_registry = function_registry
         self.import_mapping: dict[str, dict[str, str]] = {}
+        self.external_modules: dict[str, set[str]] = {}
         self.stdlib_extractor = StdlibExtractor(function_registry)
 
         load_persistent_cache()
@@ -63,6 +64,7 @@ class ImportProcessor:
         module_qn: str,
         language: cs.SupportedLanguage,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
+        ingest: bool = True,
     ) -> None:
         if language not in queries:
             return
@@ -102,36 +104,42 @@ class ImportProcessor:
                 )
             )
 
-            if self.ingestor:
-                for full_name in self.import_mapping[module_qn].values():
-                    module_path = self._resolve_module_path(
-                        full_name, module_qn, language
-                    )
-
-                    self.ingestor.ensure_relationship_batch(
-                        (
-                            cs.NodeLabel.MODULE,
-                            cs.KEY_QUALIFIED_NAME,
-                            module_qn,
-                        ),
-                        cs.RelationshipType.IMPORTS,
-                        (
-                            cs.NodeLabel.MODULE,
-                            cs.KEY_QUALIFIED_NAME,
-                            module_path,
-                        ),
-                    )
-                    logger.debug(
-                        ls.IMP_CREATED_RELATIONSHIP.format(
-                            from_module=module_qn,
-                            to_module=module_path,
-                            full_name=full_name,
-                        )
-                    )
+            if ingest:
+                self.ingest_import_relationships(module_qn, language)
 
         except Exception as e:
             logger.warning(ls.IMP_PARSE_FAILED.format(module=module_qn, error=e))
 
+    def ingest_import_relationships(
+        self, module_qn: str, language: cs.SupportedLanguage
+    ) -> None:
+        if not self.ingestor:
+            return
+        self.external_modules[module_qn] = set()
+        for full_name in self.import_mapping[module_qn].values():
+            module_path = self._resolve_module_path(full_name, module_qn, language)
+
+            self.ingestor.ensure_relationship_batch(
+                (
+                    cs.NodeLabel.MODULE,
+                    cs.KEY_QUALIFIED_NAME,
+                    module_qn,
+                ),
+                cs.RelationshipType.IMPORTS,
+                (
+                    cs.NodeLabel.MODULE,
+                    cs.KEY_QUALIFIED_NAME,
+                    module_path,
+                ),
+            )
+            logger.debug(
+                ls.IMP_CREATED_RELATIONSHIP.format(
+                    from_module=module_qn,
+                    to_module=module_path,
+                    full_name=full_name,
+                )
+            )
+
     def _parse_python_imports(self, captures: dict, module_qn: str) -> None:
         for import_node in captures.get(cs.CAPTURE_IMPORT, []) + captures.get(
             cs.CAPTURE_IMPORT_FROM, []
@@ -219,9 +227,12 @@ class ImportProcessor:
     def _is_local_rust_import(self, import_path: str) -> bool:
         return import_path.startswith(cs.RUST_CRATE_PREFIX)
 
-    def _ensure_external_module_node(self, module_path: str, full_name: str) -> None:
+    def _ensure_external_module_node(
+        self, module_path: str, full_name: str, module_qn: str
+    ) -> None:
         if not self.ingestor or not module_path:
             return
+        self.external_modules.setdefault(module_qn, set()).add(module_path)
         if cs.SEPARATOR_DOUBLE_COLON in module_path:
             name = module_path.rsplit(cs.SEPARATOR_DOUBLE_COLON, 1)[-1]
         else:
@@ -255,7 +266,7 @@ class ImportProcessor:
             cs.SEPARATOR_DOUBLE_COLON.join(parts[:-1]) if len(parts) > 1 else parts[0]
         )
 
-        self._ensure_external_module_node(module_path, import_path)
+        self._ensure_external_module_node(module_path, import_path, module_qn)
         return module_path
 
     def _resolve_module_path(
@@ -282,7 +293,7 @@ class ImportProcessor:
 
         module_path = self.stdlib_extractor.extract_module_path(full_name, language)
         if not module_path.startswith(project_prefix):
-            self._ensure_external_module_node(module_path, full_name)
+            self._ensure_external_module_node(module_path, full_name, module_qn)
         return module_path
 
     def _handle_python_import_from_statement(
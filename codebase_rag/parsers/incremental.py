@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+from tree_sitter import Node, Parser, Point, Tree
+
+from .. import constants as cs
+from ..types_defs import SourceEdit, SourceTree, TopLevelPatch
+from .utils import safe_decode_text
+
+if TYPE_CHECKING:
+    from ..models import LanguageSpec
+
+_MASKED_BYTE = re.compile(cs.MASKED_SOURCE_PATTERN)
+
+
+def source_edit(old: bytes, new: bytes) -> SourceEdit:
+    limit = min(len(old), len(new))
+    prefix = _common_prefix(old, new, limit)
+    suffix = _common_prefix(old[::-1], new[::-1], limit - prefix)
+    return SourceEdit(prefix, len(old) - suffix, len(new) - suffix)
+
+
+def _common_prefix(a: bytes, b: bytes, limit: int) -> int:
+    # (H) Compare in blocks so the scan stays in C up to the first mismatch.
+    start = 0
+    while start < limit:
+        end = min(start + cs.SOURCE_DIFF_BLOCK_BYTES, limit)
+        if a[start:end] != b[start:end]:
+            while a[start] == b[start]:
+                start += 1
+            return start
+        start = end
+    return limit
+
+
+def byte_point(source: bytes, offset: int) -> Point:
+    row = source.count(b"\n", 0, offset)
+    return Point(row, offset - source.rfind(b"\n", 0, offset) - 1)
+
+
+def reparse(
+    parser: Parser, previous: SourceTree, source: bytes
+) -> tuple[Tree, SourceEdit]:
+    edit = source_edit(previous.source, source)
+    # (H) Edit a copy: the previous tree's nodes may still be referenced.
+    tree = previous.tree.copy()
+    tree.edit(
+        start_byte=edit.start_byte,
+        old_end_byte=edit.old_end_byte,
+        new_end_byte=edit.new_end_byte,
+        start_point=byte_point(previous.source, edit.start_byte),
+        old_end_point=byte_point(previous.source, edit.old_end_byte),
+        new_end_point=byte_point(source, edit.new_end_byte),
+    )
+    return parser.parse(source, tree), edit
+
+
+def top_level_patch(
+    previous: SourceTree,
+    tree: Tree,
+    source: bytes,
+    edit: SourceEdit,
+    spec: LanguageSpec,
+) -> TopLevelPatch | None:
+    # (H) Top-level nodes outside the edit keep their text, so their definitions
+    # (H) are unchanged apart from a line shift. Only a window of whole named
+    # (H) definitions, the same ones before and after, can be re-extracted alone.
+    old_nodes = previous.tree.root_node.children
+    new_nodes = tree.root_node.children
+    limit = min(len(old_nodes), len(new_nodes))
+    byte_delta = edit.new_end_byte - edit.old_end_byte
+
+    lead = 0
+    while (
+        lead < limit
+        and old_nodes[lead].end_byte < edit.start_byte
+        and _same_span(old_nodes[lead], new_nodes[lead], 0)
+    ):
+        lead += 1
+    trail = 0
+    while (
+        trail < limit - lead
+        and old_nodes[-1 - trail].start_byte > edit.old_end_byte
+        and _same_span(old_nodes[-1 - trail], new_nodes[-1 - trail], byte_delta)
+    ):
+        trail += 1
+
+    old_window = _definitions(old_nodes[lead : len(old_nodes) - trail], spec)
+    new_window = _definitions(new_nodes[lead : len(new_nodes) - trail], spec)
+    if old_window is None or old_window != new_window:
+        return None
+    names = [name for name, _ in _named_definitions(new_nodes, spec)]
+    if len(names) != len(set(names)):
+        return None
+
+    after = new_nodes[len(new_nodes) - trail :]
+    return TopLevelPatch(
+        root_node=tree.root_node,
+        masked_source=mask_source(
+            source,
+            [node for node in (*new_nodes[:lead], *after) if _definition(node, spec)],
+        ),
+        changed_names=[name for name, _ in new_window],
+        shifted_names=[name for name, _ in _named_definitions(after, spec)],
+        line_delta=source.count(b"\n", edit.start_byte, edit.new_end_byte)
+        - previous.source.count(b"\n", edit.start_byte, edit.old_end_byte),
+    )
+
+
+def mask_source(source: bytes, hidden: Sequence[Node]) -> bytes:
+    # (H) Blank every byte but newlines so offsets and lines stay put.
+    masked = bytearray(source)
+    for node in hidden:
+        masked[node.start_byte : node.end_byte] = _MASKED_BYTE.sub(
+            b" ", source[node.start_byte : node.end_byte]
+        )
+    return bytes(masked)
+
+
+def _same_span(old: Node, new: Node, byte_delta: int) -> bool:
+    return (
+        old.type == new.type
+        and old.start_byte + byte_delta == new.start_byte
+        and old.end_byte + byte_delta == new.end_byte
+    )
+
+
+def _definitions(
+    nodes: Sequence[Node], spec: LanguageSpec
+) -> list[tuple[str, str]] | None:
+    definitions: list[tuple[str, str]] = []
+    for node in nodes:
+        if (definition := _definition(node, spec)) is None:
+            return None
+        definitions.append(definition)
+    return definitions
+
+
+def _named_definitions(
+    nodes: Sequence[Node], spec: LanguageSpec
+) -> list[tuple[str, str]]:
+    return [definition for node in nodes if (definition := _definition(node, spec))]
+
+
+def _definition(node: Node, spec: LanguageSpec) -> tuple[str, str] | None:
+    if node.type == cs.TS_PY_DECORATED_DEFINITION:
+        if (inner := node.child_by_field_name(cs.FIELD_DEFINITION)) is None:
+            return None
+        node = inner
+    if node.type not in spec.function_node_types + spec.class_node_types:
+        return None
+    name = safe_decode_text(node.child_by_field_name(spec.name_field))
+    return (name, node.type) if name else None
@@ -8,14 +8,14 @@ from loguru import logger
 
 from ... import constants as cs
 from ... import logs as ls
-from ...types_defs import ASTNode, NodeType
-from ..utils import safe_decode_text
-from .utils import extract_method_call_info, get_class_context_from_qn
+from ...types_defs import ASTNode, JavaClassMembers, JavaMemberIndex, NodeType
+from .utils import extract_method_call_info
 
 if TYPE_CHECKING:
     from pathlib import Path
 
     from ...types_defs import ASTCacheProtocol, FunctionRegistryTrieProtocol
+    from ..class_ingest import ClassHierarchy
     from ..import_processor import ImportProcessor
 
 
@@ -27,6 +27,10 @@ class JavaMethodResolverMixin:
     ast_cache: ASTCacheProtocol
     class_inheritance: dict[str, list[str]]
     _fqn_to_module_qn: dict[str, list[str]]
+    _supertypes: ClassHierarchy
+    _interfaces: dict[str, list[str]]
+    _member_index: dict[str, JavaMemberIndex]
+    _module_callables: dict[str, JavaMemberIndex]
 
     @abstractmethod
     def _resolve_java_type_name(self, type_name: str, module_qn: str) -> str: ...
@@ -47,6 +51,9 @@ class JavaMethodResolverMixin:
     @abstractmethod
     def _get_implemented_interfaces(self, class_qn: str) -> list[str]: ...
 
+    @abstractmethod
+    def _java_class_members(self, class_qn: str) -> JavaClassMembers | None: ...
+
     @abstractmethod
     def _get_current_class_name(self, module_qn: str) -> str | None: ...
 
@@ -101,19 +108,15 @@ class JavaMethodResolverMixin:
     def _resolve_static_or_local_method(
         self, method_name: str, module_qn: str
     ) -> tuple[str, str] | None:
-        return next(
-            (
-                (entity_type, qn)
-                for qn, entity_type in self.function_registry.find_with_prefix(
-                    module_qn
-                )
-                if entity_type in cs.JAVA_CALLABLE_ENTITY_TYPES
-                and qn.split(cs.CHAR_PAREN_OPEN)[0].endswith(
-                    f"{cs.SEPARATOR_DOT}{method_name}"
-                )
-            ),
-            None,
-        )
+        if (callables := self._module_callables.get(module_qn)) is None:
+            callables = self._module_callables[module_qn] = {}
+            for qn, entity_type in self.function_registry.find_with_prefix(module_qn):
+                if entity_type in cs.JAVA_CALLABLE_ENTITY_TYPES:
+                    name = qn.split(cs.CHAR_PAREN_OPEN)[0].rpartition(cs.SEPARATOR_DOT)[
+                        2
+                    ]
+                    callables.setdefault(name, (entity_type, qn))
+        return callables.get(method_name)
 
     def _resolve_instance_method(
         self, object_type: str, method_name: str, module_qn: str
@@ -149,16 +152,19 @@ class JavaMethodResolverMixin:
     def _search_method_in_class(
         self, class_qn: str, method_name: str
     ) -> tuple[str, str] | None:
-        for qn, method_type in self._find_registry_entries_under(class_qn):
-            if qn == class_qn:
-                continue
-            suffix = qn[len(class_qn) :]
-            if not suffix.startswith(cs.SEPARATOR_DOT):
-                continue
-            member = suffix[1:]
-            if self._is_matching_method(member, method_name):
-                return method_type, qn
-        return None
+        return self._class_members(class_qn).get(method_name)
+
+    def _class_members(self, class_qn: str) -> JavaMemberIndex:
+        # (H) Overloads are keyed by bare name and the first registry entry wins,
+        # (H) so one prefix walk per class answers every later method lookup.
+        if (members := self._member_index.get(class_qn)) is None:
+            members = self._member_index[class_qn] = {}
+            for qn, method_type in self._find_registry_entries_under(class_qn):
+                suffix = qn[len(class_qn) :]
+                if suffix.startswith(cs.SEPARATOR_DOT):
+                    name = suffix[1:].split(cs.CHAR_PAREN_OPEN, 1)[0]
+                    members.setdefault(name, (method_type, qn))
+        return members
 
     def _search_method_in_alternate_modules(
         self, class_qn: str, method_name: str, current_module_qn: str | None
@@ -202,23 +208,35 @@ class JavaMethodResolverMixin:
             or member == f"{method_name}{cs.EMPTY_PARENS}"
         )
 
+    def _superclass_chain(self, class_qn: str) -> tuple[str, ...]:
+        # (H) Superclasses come from the AST, so each class is looked up once and
+        # (H) the chain is linearized by the shared hierarchy memo.
+        current_qn = class_qn
+        while current_qn not in self._supertypes:
+            superclass_qn = self._get_superclass_name(current_qn)
+            self._supertypes[current_qn] = [superclass_qn] if superclass_qn else []
+            if not superclass_qn:
+                break
+            current_qn = superclass_qn
+        return self._supertypes.ancestors(class_qn)
+
     def _find_inherited_method(
         self, class_qn: str, method_name: str, module_qn: str
     ) -> tuple[str, str] | None:
-        if not (superclass_qn := self._get_superclass_name(class_qn)):
-            return None
-
-        if method_result := self._find_method_with_any_signature(
-            superclass_qn, method_name, module_qn
-        ):
-            return method_result
-
-        return self._find_inherited_method(superclass_qn, method_name, module_qn)
+        for superclass_qn in self._superclass_chain(class_qn):
+            if method_result := self._find_method_with_any_signature(
+                superclass_qn, method_name, module_qn
+            ):
+                return method_result
+        return None
 
     def _find_interface_method(
         self, class_qn: str, method_name: str, module_qn: str
     ) -> tuple[str, str] | None:
-        for interface_qn in self._get_implemented_interfaces(class_qn):
+        if (interfaces := self._interfaces.get(class_qn)) is None:
+            interfaces = self._get_implemented_interfaces(class_qn)
+            self._interfaces[class_qn] = interfaces
+        for interface_qn in interfaces:
             if method_result := self._find_method_with_any_signature(
                 interface_qn, method_name, module_qn
             ):
@@ -257,49 +275,12 @@ class JavaMethodResolverMixin:
         if not class_qn or not method_name:
             return None
 
-        ctx = get_class_context_from_qn(
-            class_qn, self.module_qn_to_file_path, self.ast_cache
-        )
-        if not ctx:
+        members = self._java_class_members(class_qn)
+        if not members or not (return_type := members.return_types.get(method_name)):
             return None
 
-        return self._find_method_return_type_in_ast(
-            ctx.root_node, ctx.target_class_name, method_name, ctx.module_qn
-        )
-
-    def _find_method_return_type_in_ast(
-        self, node: ASTNode, class_name: str, method_name: str, module_qn: str
-    ) -> str | None:
-        if node.type == cs.TS_CLASS_DECLARATION:
-            if (
-                name_node := node.child_by_field_name(cs.KEY_NAME)
-            ) and safe_decode_text(name_node) == class_name:
-                if body_node := node.child_by_field_name(cs.FIELD_BODY):
-                    return self._search_methods_in_class_body(
-                        body_node, method_name, module_qn
-                    )
-
-        for child in node.children:
-            if result := self._find_method_return_type_in_ast(
-                child, class_name, method_name, module_qn
-            ):
-                return result
-
-        return None
-
-    def _search_methods_in_class_body(
-        self, body_node: ASTNode, method_name: str, module_qn: str
-    ) -> str | None:
-        for child in body_node.children:
-            if child.type == cs.TS_METHOD_DECLARATION:
-                if (
-                    name_node := child.child_by_field_name(cs.KEY_NAME)
-                ) and safe_decode_text(name_node) == method_name:
-                    if (type_node := child.child_by_field_name(cs.KEY_TYPE)) and (
-                        return_type := safe_decode_text(type_node)
-                    ):
-                        return self._resolve_java_type_name(return_type, module_qn)
-        return None
+        module_qn = class_qn.rpartition(cs.SEPARATOR_DOT)[0]
+        return self._resolve_java_type_name(return_type, module_qn)
 
     def _heuristic_method_return_type(self, method_call: str) -> str | None:
         method_lower = method_call.lower()
@@ -8,9 +8,12 @@ from ... import logs as ls
 from ...types_defs import (
     ASTNode,
     FunctionRegistryTrieProtocol,
+    JavaClassIndex,
+    JavaMemberIndex,
     LanguageQueries,
     SimpleNameLookup,
 )
+from ..class_ingest import ClassHierarchy
 from ..import_processor import ImportProcessor
 from .method_resolver import JavaMethodResolverMixin
 from .type_resolver import JavaTypeResolverMixin
@@ -50,9 +53,21 @@ class JavaTypeInferenceEngine(
 
         self._lookup_cache: dict[str, str | None] = {}
         self._lookup_in_progress: set[str] = set()
+        self._supertypes = ClassHierarchy()
+        self._interfaces: dict[str, list[str]] = {}
+        self._class_index: dict[Path, JavaClassIndex] = {}
+        self._member_index: dict[str, JavaMemberIndex] = {}
+        self._module_callables: dict[str, JavaMemberIndex] = {}
 
         self._fqn_to_module_qn: dict[str, list[str]] = self._build_fqn_lookup_map()
 
+    def clear_caches(self) -> None:
+        self._supertypes.clear()
+        self._interfaces.clear()
+        self._class_index.clear()
+        self._member_index.clear()
+        self._module_callables.clear()
+
     def _build_fqn_lookup_map(self) -> dict[str, list[str]]:
         fqn_map: dict[str, list[str]] = {}
 
@@ -2,10 +2,9 @@ from collections.abc import Iterable
 from typing import TYPE_CHECKING
 
 from ... import constants as cs
-from ...types_defs import ASTNode, NodeType
+from ...types_defs import ASTNode, JavaClassIndex, JavaClassMembers, NodeType
 from .utils import (
     find_package_start_index,
-    get_class_context_from_qn,
     get_root_node_from_module_qn,
     safe_decode_text,
 )
@@ -23,6 +22,7 @@ class JavaTypeResolverMixin:
     module_qn_to_file_path: dict[str, "Path"]
     ast_cache: "ASTCacheProtocol"
     _fqn_to_module_qn: dict[str, list[str]]
+    _class_index: dict["Path", JavaClassIndex]
 
     def _module_qn_to_java_fqn(self, module_qn: str) -> str | None:
         parts = module_qn.split(cs.SEPARATOR_DOT)
@@ -133,36 +133,90 @@ class JavaTypeResolverMixin:
 
         return type_name
 
-    def _get_superclass_name(self, class_qn: str) -> str | None:
-        ctx = get_class_context_from_qn(
-            class_qn, self.module_qn_to_file_path, self.ast_cache
-        )
-        if not ctx:
+    def _java_classes(self, module_qn: str) -> JavaClassIndex:
+        file_path = self.module_qn_to_file_path.get(module_qn)
+        if (
+            file_path is None
+            or (entry := self.ast_cache.get_or_load(file_path)) is None
+        ):
+            return {}
+        if (classes := self._class_index.get(file_path)) is None:
+            classes = self._class_index[file_path] = self._index_java_classes(entry[0])
+        return classes
+
+    def _java_class_members(self, class_qn: str) -> JavaClassMembers | None:
+        module_qn, _, class_name = class_qn.rpartition(cs.SEPARATOR_DOT)
+        if not module_qn:
             return None
+        return self._java_classes(module_qn).get(class_name)
+
+    def _index_java_classes(self, root_node: ASTNode) -> JavaClassIndex:
+        # (H) One walk per file records, for every class name, the first declared
+        # (H) superclass, the first non-empty interface list and the first typed
+        # (H) declaration of each method, in the order a per-lookup search finds them.
+        classes: JavaClassIndex = {}
+        stack: list[ASTNode] = [root_node]
+        while stack:
+            node = stack.pop()
+            if node.type == cs.TS_CLASS_DECLARATION and (
+                class_name := safe_decode_text(node.child_by_field_name(cs.FIELD_NAME))
+            ):
+                classes[class_name] = self._index_class_declaration(
+                    node, classes.get(class_name) or JavaClassMembers(None, (), {})
+                )
+            stack.extend(reversed(node.children))
+        return classes
+
+    def _index_class_declaration(
+        self, class_node: ASTNode, members: JavaClassMembers
+    ) -> JavaClassMembers:
+        if members.superclass is None and (
+            superclass_node := class_node.child_by_field_name(cs.FIELD_SUPERCLASS)
+        ):
+            members = members._replace(
+                superclass=self._extract_type_name_from_node(superclass_node)
+            )
 
-        return self._find_superclass_using_ast(
-            ctx.root_node, ctx.target_class_name, ctx.module_qn
-        )
+        if not members.interfaces and (
+            interfaces_node := class_node.child_by_field_name(cs.FIELD_INTERFACES)
+        ):
+            interface_names: list[str] = []
+            self._extract_interface_names(interfaces_node, interface_names)
+            members = members._replace(interfaces=tuple(interface_names))
+
+        if body_node := class_node.child_by_field_name(cs.FIELD_BODY):
+            for child in body_node.children:
+                if child.type != cs.TS_METHOD_DECLARATION:
+                    continue
+                if (
+                    method_name := safe_decode_text(
+                        child.child_by_field_name(cs.KEY_NAME)
+                    )
+                ) and (
+                    return_type := safe_decode_text(
+                        child.child_by_field_name(cs.KEY_TYPE)
+                    )
+                ):
+                    members.return_types.setdefault(method_name, return_type)
+
+        return members
+
+    def _get_superclass_name(self, class_qn: str) -> str | None:
+        module_qn = class_qn.rpartition(cs.SEPARATOR_DOT)[0]
+        return self._resolve_superclass(self._java_class_members(class_qn), module_qn)
 
     def _find_superclass_using_ast(
         self, node: ASTNode, target_class_name: str, module_qn: str
     ) -> str | None:
-        if node.type == cs.TS_CLASS_DECLARATION:
-            if (
-                name_node := node.child_by_field_name(cs.FIELD_NAME)
-            ) and safe_decode_text(name_node) == target_class_name:
-                if superclass_node := node.child_by_field_name(cs.FIELD_SUPERCLASS):
-                    if superclass_name := self._extract_type_name_from_node(
-                        superclass_node
-                    ):
-                        return self._resolve_java_type_name(superclass_name, module_qn)
-
-        for child in node.children:
-            if result := self._find_superclass_using_ast(
-                child, target_class_name, module_qn
-            ):
-                return result
+        return self._resolve_superclass(
+            self._index_java_classes(node).get(target_class_name), module_qn
+        )
 
+    def _resolve_superclass(
+        self, members: JavaClassMembers | None, module_qn: str
+    ) -> str | None:
+        if members and members.superclass:
+            return self._resolve_java_type_name(members.superclass, module_qn)
         return None
 
     def _extract_type_name_from_node(self, parent_node: ASTNode) -> str | None:
@@ -176,55 +230,35 @@ class JavaTypeResolverMixin:
         return None
 
     def _get_implemented_interfaces(self, class_qn: str) -> list[str]:
-        parts = class_qn.split(cs.SEPARATOR_DOT)
-        if len(parts) < 2:
-            return []
-
-        module_qn = cs.SEPARATOR_DOT.join(parts[:-1])
-        target_class_name = parts[-1]
-
-        file_path = self.module_qn_to_file_path.get(module_qn)
-        if file_path is None or file_path not in self.ast_cache:
-            return []
-
-        root_node, _ = self.ast_cache[file_path]
-
-        return self._find_interfaces_using_ast(root_node, target_class_name, module_qn)
+        module_qn = class_qn.rpartition(cs.SEPARATOR_DOT)[0]
+        return self._resolve_interfaces(self._java_class_members(class_qn), module_qn)
 
     def _find_interfaces_using_ast(
         self, node: ASTNode, target_class_name: str, module_qn: str
     ) -> list[str]:
-        if node.type == cs.TS_CLASS_DECLARATION:
-            if (
-                name_node := node.child_by_field_name(cs.FIELD_NAME)
-            ) and safe_decode_text(name_node) == target_class_name:
-                if interfaces_node := node.child_by_field_name(cs.FIELD_INTERFACES):
-                    interface_list: list[str] = []
-                    self._extract_interface_names(
-                        interfaces_node, interface_list, module_qn
-                    )
-                    return interface_list
-
-        for child in node.children:
-            if result := self._find_interfaces_using_ast(
-                child, target_class_name, module_qn
-            ):
-                return result
+        return self._resolve_interfaces(
+            self._index_java_classes(node).get(target_class_name), module_qn
+        )
 
-        return []
+    def _resolve_interfaces(
+        self, members: JavaClassMembers | None, module_qn: str
+    ) -> list[str]:
+        if not members:
+            return []
+        return [
+            self._resolve_java_type_name(interface_name, module_qn)
+            for interface_name in members.interfaces
+        ]
 
     def _extract_interface_names(
-        self, interfaces_node: ASTNode, interface_list: list[str], module_qn: str
+        self, interfaces_node: ASTNode, interface_names: list[str]
     ) -> None:
         for child in interfaces_node.children:
             if child.type == cs.TS_TYPE_IDENTIFIER:
                 if interface_name := safe_decode_text(child):
-                    resolved_interface = self._resolve_java_type_name(
-                        interface_name, module_qn
-                    )
-                    interface_list.append(resolved_interface)
+                    interface_names.append(interface_name)
             elif child.children:
-                self._extract_interface_names(child, interface_list, module_qn)
+                self._extract_interface_names(child, interface_names)
 
     def _get_current_class_name(self, module_qn: str) -> str | None:
         root_node = get_root_node_from_module_qn(
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import TYPE_CHECKING, NamedTuple
+from typing import TYPE_CHECKING
 
 from tree_sitter import Node
 
@@ -21,12 +21,6 @@ if TYPE_CHECKING:
     from ...types_defs import ASTCacheProtocol
 
 
-class ClassContext(NamedTuple):
-    module_qn: str
-    target_class_name: str
-    root_node: Node
-
-
 def get_root_node_from_module_qn(
     module_qn: str,
     module_qn_to_file_path: dict[str, Path],
@@ -38,34 +32,13 @@ def get_root_node_from_module_qn(
         return None
 
     file_path = module_qn_to_file_path.get(module_qn)
-    if file_path is None or file_path not in ast_cache:
+    if file_path is None or (entry := ast_cache.get_or_load(file_path)) is None:
         return None
 
-    root_node, _ = ast_cache[file_path]
+    root_node, _ = entry
     return root_node
 
 
-def get_class_context_from_qn(
-    class_qn: str,
-    module_qn_to_file_path: dict[str, Path],
-    ast_cache: ASTCacheProtocol,
-) -> ClassContext | None:
-    parts = class_qn.split(cs.SEPARATOR_DOT)
-    if len(parts) < 2:
-        return None
-
-    module_qn = cs.SEPARATOR_DOT.join(parts[:-1])
-    target_class_name = parts[-1]
-
-    root_node = get_root_node_from_module_qn(
-        module_qn, module_qn_to_file_path, ast_cache, min_parts=1
-    )
-    if root_node is None:
-        return None
-
-    return ClassContext(module_qn, target_class_name, root_node)
-
-
 def extract_package_name(package_node: ASTNode) -> str | None:
     if package_node.type != cs.TS_PACKAGE_DECLARATION:
         return None
@@ -462,10 +462,13 @@ class JavaVariableAnalyzerMixin:
         target_class_name = parts[-1]
 
         file_path = self.module_qn_to_file_path.get(target_module_qn)
-        if file_path is None or file_path not in self.ast_cache:
+        if (
+            file_path is None
+            or (entry := self.ast_cache.get_or_load(file_path)) is None
+        ):
             return None
 
-        root_node, _ = self.ast_cache[file_path]
+        root_node, _ = entry
 
         return self._find_field_type_in_class(
             root_node, target_class_name, field_name, target_module_qn
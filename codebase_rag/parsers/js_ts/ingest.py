@@ -5,7 +5,6 @@ from pathlib import Path
 from typing import TYPE_CHECKING
 
 from loguru import logger
-from tree_sitter import Query, QueryCursor
 
 from ... import constants as cs
 from ... import logs as lg
@@ -18,12 +17,11 @@ from ...types_defs import (
 )
 from ..utils import safe_decode_text, safe_decode_with_fallback
 from .module_system import JsTsModuleSystemMixin
-from .utils import get_js_ts_language_obj
 
 if TYPE_CHECKING:
     from ...language_spec import LanguageSpec
     from ...services import IngestorProtocol
-    from ...types_defs import LanguageQueries
+    from ...types_defs import JsModuleCaptures, LanguageQueries
     from ..handlers import LanguageHandler
     from ..import_processor import ImportProcessor
 
@@ -58,45 +56,31 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
         module_qn: str,
         language: cs.SupportedLanguage,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
+        module_captures: JsModuleCaptures | None = None,
     ) -> None:
-        if language not in cs.JS_TS_LANGUAGES:
-            return
-
-        self._ingest_prototype_inheritance_links(
-            root_node, module_qn, language, queries
-        )
-
-        self._ingest_prototype_method_assignments(
-            root_node, module_qn, language, queries
+        captures = self._js_module_captures(
+            root_node, language, queries, module_captures
         )
-
-    def _ingest_prototype_inheritance_links(
-        self,
-        root_node: ASTNode,
-        module_qn: str,
-        language: cs.SupportedLanguage,
-        queries: dict[cs.SupportedLanguage, LanguageQueries],
-    ) -> None:
-        lang_queries = queries[language]
-
-        language_obj = lang_queries.get(cs.QUERY_LANGUAGE)
-        if not language_obj:
+        if captures is None:
             return
 
         try:
             self._process_prototype_inheritance_captures(
-                language_obj, root_node, module_qn
+                captures.get(cs.JsModulePattern.PROTOTYPE_INHERITANCE, {}), module_qn
             )
         except Exception as e:
             logger.debug(lg.JS_PROTOTYPE_INHERITANCE_FAILED.format(error=e))
 
-    def _process_prototype_inheritance_captures(
-        self, language_obj, root_node, module_qn
-    ):
-        query = Query(language_obj, cs.JS_PROTOTYPE_INHERITANCE_QUERY)
-        cursor = QueryCursor(query)
-        captures = cursor.captures(root_node)
+        try:
+            self._process_prototype_method_captures(
+                captures.get(cs.JsModulePattern.PROTOTYPE_METHOD, {}), module_qn
+            )
+        except Exception as e:
+            logger.debug(lg.JS_PROTOTYPE_METHODS_FAILED.format(error=e))
 
+    def _process_prototype_inheritance_captures(
+        self, captures: dict[str, list[ASTNode]], module_qn: str
+    ) -> None:
         child_classes = captures.get(cs.CAPTURE_CHILD_CLASS, [])
         parent_classes = captures.get(cs.CAPTURE_PARENT_CLASS, [])
 
@@ -110,10 +94,9 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
                 child_qn = f"{module_qn}{cs.SEPARATOR_DOT}{child_name}"
                 parent_qn = f"{module_qn}{cs.SEPARATOR_DOT}{parent_name}"
 
-                if child_qn not in self.class_inheritance:
-                    self.class_inheritance[child_qn] = []
-                if parent_qn not in self.class_inheritance[child_qn]:
-                    self.class_inheritance[child_qn].append(parent_qn)
+                parents = self.class_inheritance.get(child_qn, [])
+                if parent_qn not in parents:
+                    self.class_inheritance[child_qn] = [*parents, parent_qn]
 
                 self.ingestor.ensure_relationship_batch(
                     (cs.NodeLabel.FUNCTION, cs.KEY_QUALIFIED_NAME, child_qn),
@@ -127,29 +110,9 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
                     )
                 )
 
-    def _ingest_prototype_method_assignments(
-        self,
-        root_node: ASTNode,
-        module_qn: str,
-        language: cs.SupportedLanguage,
-        queries: dict[cs.SupportedLanguage, LanguageQueries],
+    def _process_prototype_method_captures(
+        self, method_captures: dict[str, list[ASTNode]], module_qn: str
     ) -> None:
-        lang_queries = queries[language]
-
-        language_obj = lang_queries.get(cs.QUERY_LANGUAGE)
-        if not language_obj:
-            return
-
-        try:
-            self._process_prototype_method_captures(language_obj, root_node, module_qn)
-        except Exception as e:
-            logger.debug(lg.JS_PROTOTYPE_METHODS_FAILED.format(error=e))
-
-    def _process_prototype_method_captures(self, language_obj, root_node, module_qn):
-        method_query = Query(language_obj, cs.JS_PROTOTYPE_METHOD_QUERY)
-        method_cursor = QueryCursor(method_query)
-        method_captures = method_cursor.captures(root_node)
-
         constructor_names = method_captures.get(cs.CAPTURE_CONSTRUCTOR_NAME, [])
         method_names = method_captures.get(cs.CAPTURE_METHOD_NAME, [])
         method_functions = method_captures.get(cs.CAPTURE_METHOD_FUNCTION, [])
@@ -201,33 +164,30 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
         module_qn: str,
         language: cs.SupportedLanguage,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
+        module_captures: JsModuleCaptures | None = None,
     ) -> None:
-        language_obj = get_js_ts_language_obj(language, queries)
-        if not language_obj:
+        captures = self._js_module_captures(
+            root_node, language, queries, module_captures
+        )
+        if captures is None:
             return
 
         lang_config = queries[language].get(cs.QUERY_CONFIG)
-        try:
-            for query_text in [cs.JS_OBJECT_METHOD_QUERY, cs.JS_METHOD_DEF_QUERY]:
-                self._process_object_method_query(
-                    language_obj, query_text, root_node, module_qn, lang_config
-                )
-        except Exception as e:
-            logger.debug(lg.JS_OBJECT_METHODS_DETECT_FAILED.format(error=e))
+        for pattern in (
+            cs.JsModulePattern.OBJECT_METHOD,
+            cs.JsModulePattern.METHOD_DEF,
+        ):
+            self._process_object_method_captures(
+                captures.get(pattern, {}), module_qn, lang_config
+            )
 
-    def _process_object_method_query(
+    def _process_object_method_captures(
         self,
-        language_obj,
-        query_text: str,
-        root_node: ASTNode,
+        captures: dict[str, list[ASTNode]],
         module_qn: str,
         lang_config,
     ) -> None:
         try:
-            query = Query(language_obj, query_text)
-            cursor = QueryCursor(query)
-            captures = cursor.captures(root_node)
-
             method_names = captures.get(cs.CAPTURE_METHOD_NAME, [])
             method_functions = captures.get(cs.CAPTURE_METHOD_FUNCTION, [])
 
@@ -335,38 +295,31 @@ class JsTsIngestMixin(JsTsModuleSystemMixin):
         module_qn: str,
         language: cs.SupportedLanguage,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
+        module_captures: JsModuleCaptures | None = None,
     ) -> None:
-        if language not in cs.JS_TS_LANGUAGES:
+        captures = self._js_module_captures(
+            root_node, language, queries, module_captures
+        )
+        if captures is None:
             return
 
-        try:
-            lang_query = queries[language][cs.QUERY_LANGUAGE]
-            lang_config = queries[language].get(cs.QUERY_CONFIG)
-
-            for query_text in [
-                cs.JS_OBJECT_ARROW_QUERY,
-                cs.JS_ASSIGNMENT_ARROW_QUERY,
-                cs.JS_ASSIGNMENT_FUNCTION_QUERY,
-            ]:
-                self._process_arrow_query(
-                    lang_query, query_text, root_node, module_qn, lang_config
-                )
-        except Exception as e:
-            logger.debug(lg.JS_ASSIGNMENT_ARROW_DETECT_FAILED.format(error=e))
+        lang_config = queries[language].get(cs.QUERY_CONFIG)
+        for pattern in (
+            cs.JsModulePattern.OBJECT_ARROW,
+            cs.JsModulePattern.ASSIGNMENT_ARROW,
+            cs.JsModulePattern.ASSIGNMENT_FUNCTION,
+        ):
+            self._process_arrow_captures(
+                captures.get(pattern, {}), module_qn, lang_config
+            )
 
-    def _process_arrow_query(
+    def _process_arrow_captures(
         self,
-        lang_query,
-        query_text: str,
-        root_node: ASTNode,
+        captures: dict[str, list[ASTNode]],
         module_qn: str,
         lang_config,
     ) -> None:
         try:
-            query = Query(lang_query, query_text)
-            cursor = QueryCursor(query)
-            captures = cursor.captures(root_node)
-
             method_names = captures.get(cs.CAPTURE_METHOD_NAME, [])
             member_exprs = captures.get(cs.CAPTURE_MEMBER_EXPR, [])
             arrow_functions = captures.get(cs.CAPTURE_ARROW_FUNCTION, [])
@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-import textwrap
 from abc import abstractmethod
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from loguru import logger
-from tree_sitter import Query, QueryCursor
 
 from ... import constants as cs
 from ... import logs as ls
@@ -16,12 +14,13 @@ from ..utils import (
     safe_decode_text,
     safe_decode_with_fallback,
 )
-from .utils import get_js_ts_language_obj
+from .utils import capture_js_module_patterns
 
 if TYPE_CHECKING:
     from ...services import IngestorProtocol
     from ...types_defs import (
         FunctionRegistryTrieProtocol,
+        JsModuleCaptures,
         LanguageQueries,
         SimpleNameLookup,
     )
@@ -46,35 +45,46 @@ class JsTsModuleSystemMixin:
     def __init__(self) -> None:
         self._processed_imports = set()
 
+    def _js_module_captures(
+        self,
+        root_node: ASTNode,
+        language: cs.SupportedLanguage,
+        queries: dict[cs.SupportedLanguage, LanguageQueries],
+        module_captures: JsModuleCaptures | None = None,
+    ) -> JsModuleCaptures | None:
+        if module_captures is not None:
+            return module_captures
+        if language not in cs.JS_TS_LANGUAGES:
+            return None
+        if not (module_query := queries[language].get(cs.QUERY_JS_MODULE)):
+            return None
+        try:
+            return capture_js_module_patterns(root_node, module_query)
+        except Exception as e:
+            logger.debug(ls.JS_MODULE_PATTERNS_FAILED.format(error=e))
+            return None
+
     def _ingest_missing_import_patterns(
         self,
         root_node: ASTNode,
         module_qn: str,
         language: cs.SupportedLanguage,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
+        module_captures: JsModuleCaptures | None = None,
     ) -> None:
-        language_obj = get_js_ts_language_obj(language, queries)
-        if not language_obj:
+        captures = self._js_module_captures(
+            root_node, language, queries, module_captures
+        )
+        if captures is None:
             return
 
         try:
-            try:
-                query = Query(language_obj, cs.JS_COMMONJS_DESTRUCTURE_QUERY)
-                cursor = QueryCursor(query)
-                captures = cursor.captures(root_node)
-
-                variable_declarators = captures.get(cs.CAPTURE_VARIABLE_DECLARATOR, [])
-
-                for declarator in variable_declarators:
-                    self._process_variable_declarator_for_commonjs(
-                        declarator, module_qn
-                    )
-
-            except Exception as e:
-                logger.debug(ls.JS_COMMONJS_DESTRUCTURE_FAILED.format(error=e))
+            pattern_captures = captures.get(cs.JsModulePattern.COMMONJS_DESTRUCTURE, {})
+            for declarator in pattern_captures.get(cs.CAPTURE_VARIABLE_DECLARATOR, []):
+                self._process_variable_declarator_for_commonjs(declarator, module_qn)
 
         except Exception as e:
-            logger.debug(ls.JS_MISSING_IMPORT_PATTERNS_FAILED.format(error=e))
+            logger.debug(ls.JS_COMMONJS_DESTRUCTURE_FAILED.format(error=e))
 
     def _extract_require_module_name(self, declarator: ASTNode) -> str | None:
         name_node = declarator.child_by_field_name(cs.FIELD_NAME)
@@ -267,37 +277,33 @@ class JsTsModuleSystemMixin:
         module_qn: str,
         language: cs.SupportedLanguage,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
+        module_captures: JsModuleCaptures | None = None,
     ) -> None:
-        if language not in cs.JS_TS_LANGUAGES:
-            return
-
-        language_obj = queries[language].get(cs.QUERY_LANGUAGE)
-        if not language_obj:
+        captures = self._js_module_captures(
+            root_node, language, queries, module_captures
+        )
+        if captures is None:
             return
 
-        query_texts = [
-            cs.JS_COMMONJS_EXPORTS_FUNCTION_QUERY,
-            cs.JS_COMMONJS_MODULE_EXPORTS_QUERY,
-        ]
-
-        for query_text in query_texts:
+        for pattern in (
+            cs.JsModulePattern.COMMONJS_EXPORTS,
+            cs.JsModulePattern.COMMONJS_MODULE_EXPORTS,
+        ):
             try:
-                captures = QueryCursor(Query(language_obj, query_text)).captures(
-                    root_node
-                )
+                pattern_captures = captures.get(pattern, {})
 
                 self._process_exports_pattern(
-                    captures.get(cs.CAPTURE_EXPORTS_OBJ, []),
-                    captures.get(cs.CAPTURE_EXPORT_NAME, []),
-                    captures.get(cs.CAPTURE_EXPORT_FUNCTION, []),
+                    pattern_captures.get(cs.CAPTURE_EXPORTS_OBJ, []),
+                    pattern_captures.get(cs.CAPTURE_EXPORT_NAME, []),
+                    pattern_captures.get(cs.CAPTURE_EXPORT_FUNCTION, []),
                     module_qn,
                 )
 
                 self._process_module_exports_pattern(
-                    captures.get(cs.CAPTURE_MODULE_OBJ, []),
-                    captures.get(cs.CAPTURE_EXPORTS_PROP, []),
-                    captures.get(cs.CAPTURE_EXPORT_NAME, []),
-                    captures.get(cs.CAPTURE_EXPORT_FUNCTION, []),
+                    pattern_captures.get(cs.CAPTURE_MODULE_OBJ, []),
+                    pattern_captures.get(cs.CAPTURE_EXPORTS_PROP, []),
+                    pattern_captures.get(cs.CAPTURE_EXPORT_NAME, []),
+                    pattern_captures.get(cs.CAPTURE_EXPORT_FUNCTION, []),
                     module_qn,
                 )
 
@@ -310,62 +316,57 @@ class JsTsModuleSystemMixin:
         module_qn: str,
         language: cs.SupportedLanguage,
         queries: dict[cs.SupportedLanguage, LanguageQueries],
+        module_captures: JsModuleCaptures | None = None,
     ) -> None:
-        try:
-            lang_query = queries[language][cs.QUERY_LANGUAGE]
-
-            for query_text in [
-                cs.JS_ES6_EXPORT_CONST_QUERY,
-                cs.JS_ES6_EXPORT_FUNCTION_QUERY,
-            ]:
-                try:
-                    cleaned_query = textwrap.dedent(query_text).strip()
-                    query = Query(lang_query, cleaned_query)
-                    cursor = QueryCursor(query)
-                    captures = cursor.captures(root_node)
-
-                    export_names = captures.get(cs.CAPTURE_EXPORT_NAME, [])
-                    export_functions = captures.get(cs.CAPTURE_EXPORT_FUNCTION, [])
-
-                    for export_name, export_function in zip(
-                        export_names, export_functions
-                    ):
-                        if export_name.text and export_function:
-                            if function_name := safe_decode_text(export_name):
-                                ingest_exported_function(
-                                    export_function,
-                                    function_name,
-                                    module_qn,
-                                    cs.JS_EXPORT_TYPE_ES6_FUNCTION,
-                                    self.ingestor,
-                                    self.function_registry,
-                                    self.simple_name_lookup,
-                                    self._get_docstring,
-                                    self._is_export_inside_function,
-                                )
-
-                    if not export_names:
-                        for export_function in export_functions:
-                            if export_function:
-                                if name_node := export_function.child_by_field_name(
-                                    cs.FIELD_NAME
-                                ):
-                                    if name_node.text:
-                                        if function_name := safe_decode_text(name_node):
-                                            ingest_exported_function(
-                                                export_function,
-                                                function_name,
-                                                module_qn,
-                                                cs.JS_EXPORT_TYPE_ES6_FUNCTION_DECL,
-                                                self.ingestor,
-                                                self.function_registry,
-                                                self.simple_name_lookup,
-                                                self._get_docstring,
-                                                self._is_export_inside_function,
-                                            )
-
-                except Exception as e:
-                    logger.debug(ls.JS_ES6_EXPORTS_QUERY_FAILED.format(error=e))
+        captures = self._js_module_captures(
+            root_node, language, queries, module_captures
+        )
+        if captures is None:
+            return
 
-        except Exception as e:
-            logger.debug(ls.JS_ES6_EXPORTS_DETECT_FAILED.format(error=e))
+        for pattern in (
+            cs.JsModulePattern.ES6_EXPORT_CONST,
+            cs.JsModulePattern.ES6_EXPORT_FUNCTION,
+        ):
+            try:
+                pattern_captures = captures.get(pattern, {})
+                export_names = pattern_captures.get(cs.CAPTURE_EXPORT_NAME, [])
+                export_functions = pattern_captures.get(cs.CAPTURE_EXPORT_FUNCTION, [])
+
+                for export_name, export_function in zip(export_names, export_functions):
+                    if export_name.text and export_function:
+                        if function_name := safe_decode_text(export_name):
+                            ingest_exported_function(
+                                export_function,
+                                function_name,
+                                module_qn,
+                                cs.JS_EXPORT_TYPE_ES6_FUNCTION,
+                                self.ingestor,
+                                self.function_registry,
+                                self.simple_name_lookup,
+                                self._get_docstring,
+                                self._is_export_inside_function,
+                            )
+
+                if not export_names:
+                    for export_function in export_functions:
+                        if export_function:
+                            if name_node := export_function.child_by_field_name(
+                                cs.FIELD_NAME
+                            ):
+                                if name_node.text:
+                                    if function_name := safe_decode_text(name_node):
+                                        ingest_exported_function(
+                                            export_function,
+                                            function_name,
+                                            module_qn,
+                                            cs.JS_EXPORT_TYPE_ES6_FUNCTION_DECL,
+                                            self.ingestor,
+                                            self.function_registry,
+                                            self.simple_name_lookup,
+                                            self._get_docstring,
+                                            self._is_export_inside_function,
+                                        )
+
+            except Exception as e:
+                logger.debug(ls.JS_ES6_EXPORTS_QUERY_FAILED.format(error=e))
@@ -4,7 +4,13 @@ from loguru import logger
 
 from ... import constants as cs
 from ... import logs as ls
-from ...types_defs import ASTNode, FunctionRegistryTrieProtocol, NodeType
+from ...types_defs import (
+    ASTNode,
+    FunctionRegistryTrieProtocol,
+    NodeType,
+    ScopeKey,
+    ScopeVariableTypes,
+)
 from ..import_processor import ImportProcessor
 from ..utils import safe_decode_text
 from . import utils as ut
@@ -22,57 +28,89 @@ class JsTypeInferenceEngine:
         self.function_registry = function_registry
         self.project_name = project_name
         self._find_method_ast_node = find_method_ast_node_func
+        self._method_return_type_cache: dict[str, str | None] = {}
+        self._scope_variable_types_cache: dict[
+            str, dict[ScopeKey, ScopeVariableTypes]
+        ] = {}
+
+    def clear_caches(self) -> None:
+        self._method_return_type_cache.clear()
+        self._scope_variable_types_cache.clear()
 
     def build_local_variable_type_map(
         self, caller_node: ASTNode, module_qn: str
     ) -> dict[str, str]:
-        local_var_types: dict[str, str] = {}
+        scope_types = self._scope_variable_types(caller_node, module_qn)
+        local_var_types = dict(scope_types.entries)
+
+        logger.debug(
+            ls.JS_VAR_TYPE_MAP_BUILT.format(
+                count=len(local_var_types), declarator_count=scope_types.declarators
+            )
+        )
+        return local_var_types
 
-        stack: list[ASTNode] = [caller_node]
+    def _scope_variable_types(
+        self, scope_node: ASTNode, module_qn: str
+    ) -> ScopeVariableTypes:
+        # (H) A declarator's type depends only on its own value, so function
+        # (H) scopes are cached by span and spliced into every enclosing scope
+        # (H) instead of re-walking and re-inferring their bodies.
+        if scope_node.type not in cs.JS_TS_FUNCTION_NODES:
+            return self._collect_variable_types(scope_node, module_qn)
+        key = (scope_node.start_byte, scope_node.end_byte, scope_node.type)
+        module_scopes = self._scope_variable_types_cache.setdefault(module_qn, {})
+        if (cached := module_scopes.get(key)) is None:
+            cached = module_scopes[key] = self._collect_variable_types(
+                scope_node, module_qn
+            )
+        return cached
 
+    def _collect_variable_types(
+        self, scope_node: ASTNode, module_qn: str
+    ) -> ScopeVariableTypes:
+        entries: list[tuple[str, str]] = []
         declarator_count = 0
+        stack: list[ASTNode] = [scope_node]
 
         while stack:
             current = stack.pop()
 
+            if current is not scope_node and current.type in cs.JS_TS_FUNCTION_NODES:
+                nested = self._scope_variable_types(current, module_qn)
+                entries.extend(nested.entries)
+                declarator_count += nested.declarators
+                continue
+
             if current.type == cs.TS_VARIABLE_DECLARATOR:
                 declarator_count += 1
-                name_node = current.child_by_field_name("name")
-                value_node = current.child_by_field_name("value")
-
-                if name_node and value_node:
-                    var_name_text = name_node.text
-                    if var_name_text:
-                        var_name = safe_decode_text(name_node)
-                        if var_name is not None:
-                            logger.debug(
-                                ls.JS_VAR_DECLARATOR_FOUND.format(
-                                    var_name=var_name, module_qn=module_qn
-                                )
-                            )
-
-                            if var_type := self._infer_js_variable_type_from_value(
-                                value_node, module_qn
-                            ):
-                                local_var_types[var_name] = var_type
-                                logger.debug(
-                                    ls.JS_VAR_INFERRED.format(
-                                        var_name=var_name, var_type=var_type
-                                    )
-                                )
-                            else:
-                                logger.debug(
-                                    ls.JS_VAR_INFER_FAILED.format(var_name=var_name)
-                                )
+                if declaration := self._infer_declarator_type(current, module_qn):
+                    entries.append(declaration)
 
             stack.extend(reversed(current.children))
 
+        return ScopeVariableTypes(tuple(entries), declarator_count)
+
+    def _infer_declarator_type(
+        self, declarator_node: ASTNode, module_qn: str
+    ) -> tuple[str, str] | None:
+        name_node = declarator_node.child_by_field_name("name")
+        value_node = declarator_node.child_by_field_name("value")
+        if not name_node or not value_node or not name_node.text:
+            return None
+        if (var_name := safe_decode_text(name_node)) is None:
+            return None
+
         logger.debug(
-            ls.JS_VAR_TYPE_MAP_BUILT.format(
-                count=len(local_var_types), declarator_count=declarator_count
-            )
+            ls.JS_VAR_DECLARATOR_FOUND.format(var_name=var_name, module_qn=module_qn)
         )
-        return local_var_types
+        if var_type := self._infer_js_variable_type_from_value(value_node, module_qn):
+            logger.debug(
+                ls.JS_VAR_INFERRED.format(var_name=var_name, var_type=var_type)
+            )
+            return var_name, var_type
+        logger.debug(ls.JS_VAR_INFER_FAILED.format(var_name=var_name))
+        return None
 
     def _infer_js_variable_type_from_value(
         self, value_node: ASTNode, module_qn: str
@@ -143,17 +181,22 @@ class JsTypeInferenceEngine:
         )
 
         method_qn = f"{class_qn}{cs.SEPARATOR_DOT}{method_name}"
+        if method_qn in self._method_return_type_cache:
+            return self._method_return_type_cache[method_qn]
         logger.debug(ls.JS_LOOKING_FOR_METHOD.format(method_qn=method_qn))
 
         method_node = self._find_method_ast_node(method_qn)
         if not method_node:
             logger.debug(ls.JS_METHOD_AST_NOT_FOUND.format(method_qn=method_qn))
-            return None
-
-        return_type = self._analyze_return_statements(method_node, method_qn)
-        logger.debug(
-            ls.JS_RETURN_ANALYZED.format(method_qn=method_qn, return_type=return_type)
-        )
+            return_type = None
+        else:
+            return_type = self._analyze_return_statements(method_node, method_qn)
+            logger.debug(
+                ls.JS_RETURN_ANALYZED.format(
+                    method_qn=method_qn, return_type=return_type
+                )
+            )
+        self._method_return_type_cache[method_qn] = return_type
         return return_type
 
     def _resolve_js_class_name(self, class_name: str, module_qn: str) -> str | None:
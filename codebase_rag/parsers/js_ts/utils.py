@@ -1,23 +1,24 @@
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
-from tree_sitter import Language, Node
+from tree_sitter import Node, QueryCursor
 
 from ... import constants as cs
 from ..utils import safe_decode_text
 
 if TYPE_CHECKING:
-    from ...types_defs import LanguageQueries
+    from ...types_defs import JsModuleCaptures, JsModuleQuery
 
 
-def get_js_ts_language_obj(
-    language: cs.SupportedLanguage,
-    queries: dict[cs.SupportedLanguage, "LanguageQueries"],
-) -> Language | None:
-    if language not in cs.JS_TS_LANGUAGES:
-        return None
-
-    lang_queries = queries[language]
-    return lang_queries.get(cs.QUERY_LANGUAGE)
+def capture_js_module_patterns(
+    root_node: Node, module_query: "JsModuleQuery"
+) -> "JsModuleCaptures":
+    grouped: JsModuleCaptures = defaultdict(lambda: defaultdict(list))
+    for pattern_index, captures in QueryCursor(module_query.query).matches(root_node):
+        target = grouped[module_query.patterns[pattern_index]]
+        for name, nodes in captures.items():
+            target[name].extend(nodes)
+    return grouped
 
 
 def _extract_class_qn(method_qn: str) -> str | None:
@@ -74,6 +75,40 @@ def find_method_in_ast(
     return None
 
 
+def index_methods_in_ast(root_node: Node) -> dict[tuple[str, str], Node]:
+    # (H) Mirrors find_method_in_ast for every (class, method) pair at once: the
+    # (H) first class with a body wins, then the first method of each name.
+    methods: dict[tuple[str, str], Node] = {}
+    indexed_classes: set[str] = set()
+    stack: list[Node] = [root_node]
+
+    while stack:
+        current = stack.pop()
+
+        if current.type == cs.TS_CLASS_DECLARATION:
+            name_node = current.child_by_field_name(cs.FIELD_NAME)
+            if (
+                name_node
+                and name_node.text
+                and (class_name := safe_decode_text(name_node)) is not None
+                and class_name not in indexed_classes
+                and (body_node := current.child_by_field_name(cs.FIELD_BODY))
+            ):
+                indexed_classes.add(class_name)
+                for child in body_node.children:
+                    if child.type != cs.TS_METHOD_DEFINITION:
+                        continue
+                    method_name_node = child.child_by_field_name(cs.FIELD_NAME)
+                    if method_name_node and method_name_node.text:
+                        method_name = safe_decode_text(method_name_node)
+                        if method_name is not None:
+                            methods.setdefault((class_name, method_name), child)
+
+        stack.extend(reversed(current.children))
+
+    return methods
+
+
 def find_return_statements(node: Node, return_nodes: list[Node]) -> None:
     stack: list[Node] = [node]
 
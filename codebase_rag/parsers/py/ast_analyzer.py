@@ -8,11 +8,18 @@ from tree_sitter import Node, QueryCursor
 
 from ... import constants as cs
 from ... import logs as lg
-from ...types_defs import LanguageQueries
-from ..js_ts.utils import find_method_in_ast as find_js_method_in_ast
-from ..utils import safe_decode_text
+from ...types_defs import (
+    LanguageQueries,
+    MethodSpanIndex,
+    NodeSpan,
+    ScopeKey,
+    ScopeStatements,
+)
+from ..js_ts.utils import index_methods_in_ast as index_js_methods_in_ast
+from ..utils import capture_span_index, find_node_by_span, safe_decode_text
 
 if TYPE_CHECKING:
+    from collections import OrderedDict
     from collections.abc import Callable
     from pathlib import Path
 
@@ -48,6 +55,8 @@ class PythonAstAnalyzerMixin(_AstBase):
     queries: dict[cs.SupportedLanguage, LanguageQueries]
     module_qn_to_file_path: dict[str, Path]
     ast_cache: ASTCacheProtocol
+    _method_spans: dict[Path, MethodSpanIndex]
+    _scope_statements_cache: OrderedDict[str, dict[ScopeKey, ScopeStatements]]
 
     _js_type_inference_getter: Callable[[], JsTypeInferenceEngine]
 
@@ -75,15 +84,64 @@ class PythonAstAnalyzerMixin(_AstBase):
     def _traverse_single_pass(
         self, node: Node, local_var_types: dict[str, str], module_qn: str
     ) -> None:
+        assignments, comprehensions, for_statements = self._scope_statements(
+            node, module_qn
+        )
+
+        for assignment in assignments:
+            self._process_assignment_simple(assignment, local_var_types, module_qn)
+
+        for assignment in assignments:
+            self._process_assignment_complex(assignment, local_var_types, module_qn)
+
+        for comp in comprehensions:
+            self._analyze_comprehension(comp, local_var_types, module_qn)
+
+        for for_stmt in for_statements:
+            self._analyze_for_loop(for_stmt, local_var_types, module_qn)
+
+        self._infer_instance_variable_types_from_assignments(
+            assignments, local_var_types, module_qn
+        )
+
+    def _scope_statements(self, scope_node: Node, module_qn: str) -> ScopeStatements:
+        # (H) Function bodies are collected once and spliced into every enclosing
+        # (H) scope, keeping the walk linear in deeply nested files. Only a few
+        # (H) modules are kept since the entries hold tree nodes.
+        if scope_node.type != cs.TS_PY_FUNCTION_DEFINITION:
+            return self._collect_scope_statements(scope_node, module_qn)
+        if (module_scopes := self._scope_statements_cache.get(module_qn)) is None:
+            module_scopes = self._scope_statements_cache[module_qn] = {}
+            if len(self._scope_statements_cache) > cs.PY_SCOPE_CACHE_MODULES:
+                self._scope_statements_cache.popitem(last=False)
+        else:
+            self._scope_statements_cache.move_to_end(module_qn)
+        key = (scope_node.start_byte, scope_node.end_byte, scope_node.type)
+        if (cached := module_scopes.get(key)) is None:
+            cached = module_scopes[key] = self._collect_scope_statements(
+                scope_node, module_qn
+            )
+        return cached
+
+    def _collect_scope_statements(
+        self, scope_node: Node, module_qn: str
+    ) -> ScopeStatements:
         assignments: list[Node] = []
         comprehensions: list[Node] = []
         for_statements: list[Node] = []
 
-        stack: list[Node] = [node]
+        stack: list[Node] = [scope_node]
         while stack:
             current = stack.pop()
             node_type = current.type
 
+            if current is not scope_node and node_type == cs.TS_PY_FUNCTION_DEFINITION:
+                nested = self._scope_statements(current, module_qn)
+                assignments.extend(nested.assignments)
+                comprehensions.extend(nested.comprehensions)
+                for_statements.extend(nested.for_statements)
+                continue
+
             if node_type == cs.TS_PY_ASSIGNMENT:
                 assignments.append(current)
             elif node_type == cs.TS_PY_LIST_COMPREHENSION:
@@ -93,20 +151,8 @@ class PythonAstAnalyzerMixin(_AstBase):
 
             stack.extend(reversed(current.children))
 
-        for assignment in assignments:
-            self._process_assignment_simple(assignment, local_var_types, module_qn)
-
-        for assignment in assignments:
-            self._process_assignment_complex(assignment, local_var_types, module_qn)
-
-        for comp in comprehensions:
-            self._analyze_comprehension(comp, local_var_types, module_qn)
-
-        for for_stmt in for_statements:
-            self._analyze_for_loop(for_stmt, local_var_types, module_qn)
-
-        self._infer_instance_variable_types_from_assignments(
-            assignments, local_var_types, module_qn
+        return ScopeStatements(
+            tuple(assignments), tuple(comprehensions), tuple(for_statements)
         )
 
     def _traverse_for_assignments(
@@ -179,73 +225,64 @@ class PythonAstAnalyzerMixin(_AstBase):
 
         expected_module = cs.SEPARATOR_DOT.join(qn_parts[:-2])
         file_path = self.module_qn_to_file_path.get(expected_module)
-        if not file_path or file_path not in self.ast_cache:
+        if not file_path or (entry := self.ast_cache.get_or_load(file_path)) is None:
             return None
 
-        root_node, language = self.ast_cache[file_path]
-        return self._find_method_in_ast(root_node, class_name, method_name, language)
+        root_node, language = entry
+        if (method_spans := self._method_spans.get(file_path)) is None:
+            method_spans = self._index_methods_in_ast(root_node, language)
+            self._method_spans[file_path] = method_spans
+        if (span := method_spans.get((class_name, method_name))) is None:
+            return None
+        return find_node_by_span(root_node, *span)
 
-    def _find_method_in_ast(
-        self,
-        root_node: Node,
-        class_name: str,
-        method_name: str,
-        language: cs.SupportedLanguage,
-    ) -> Node | None:
+    def _index_methods_in_ast(
+        self, root_node: Node, language: cs.SupportedLanguage
+    ) -> MethodSpanIndex:
+        # (H) Spans rather than nodes, so the index never pins a tree that the
+        # (H) bounded AST cache has already evicted.
         match language:
             case cs.SupportedLanguage.PYTHON:
-                return self._find_python_method_in_ast(
-                    root_node, class_name, method_name
-                )
+                methods = self._index_python_methods(root_node)
             case cs.SupportedLanguage.JS | cs.SupportedLanguage.TS:
-                return find_js_method_in_ast(root_node, class_name, method_name)
+                methods = index_js_methods_in_ast(root_node)
             case _:
-                return None
+                methods = {}
+        return {
+            key: NodeSpan(node.type, node.start_byte, node.end_byte)
+            for key, node in methods.items()
+        }
 
-    def _find_python_method_in_ast(
-        self, root_node: Node, class_name: str, method_name: str
-    ) -> Node | None:
+    def _index_python_methods(self, root_node: Node) -> dict[tuple[str, str], Node]:
         lang_queries = self.queries[cs.SupportedLanguage.PYTHON]
         class_query = lang_queries[cs.QUERY_KEY_CLASSES]
-        if not class_query:
-            return None
-        cursor = QueryCursor(class_query)
-        captures = cursor.captures(root_node)
-
         method_query = lang_queries[cs.QUERY_KEY_FUNCTIONS]
-        if not method_query:
-            return None
+        if not class_query or not method_query:
+            return {}
+        captures = QueryCursor(class_query).captures(root_node)
+        functions = capture_span_index(
+            method_query, root_node, cs.QUERY_CAPTURE_FUNCTION
+        )
 
+        methods: dict[tuple[str, str], Node] = {}
         for class_node in captures.get(cs.QUERY_CAPTURE_CLASS, []):
-            if not isinstance(class_node, Node):
-                continue
-
             name_node = class_node.child_by_field_name(cs.TS_FIELD_NAME)
             if not name_node or name_node.text is None:
                 continue
-
-            if safe_decode_text(name_node) != class_name:
-                continue
+            class_name = safe_decode_text(name_node)
 
             body_node = class_node.child_by_field_name(cs.TS_FIELD_BODY)
-            if not body_node:
+            if class_name is None or not body_node:
                 continue
 
-            method_cursor = QueryCursor(method_query)
-            method_captures = method_cursor.captures(body_node)
-
-            for method_node in method_captures.get(cs.QUERY_CAPTURE_FUNCTION, []):
-                if not isinstance(method_node, Node):
-                    continue
-
+            for method_node in functions.within(body_node):
                 method_name_node = method_node.child_by_field_name(cs.TS_FIELD_NAME)
                 if not method_name_node or method_name_node.text is None:
                     continue
+                if (method_name := safe_decode_text(method_name_node)) is not None:
+                    methods.setdefault((class_name, method_name), method_node)
 
-                if safe_decode_text(method_name_node) == method_name:
-                    return method_node
-
-        return None
+        return methods
 
     def _analyze_method_return_statements(
         self, method_node: Node, method_qn: str
@@ -235,12 +235,10 @@ class PythonExpressionAnalyzerMixin(_ExprBase):
         local_var_types: dict[str, str] | None = None,
     ) -> str | None:
         try:
-            if (
-                method_qn := self._resolve_method_qualified_name(
-                    method_call, module_qn, local_var_types
-                )
-            ) and (method_node := self._find_method_ast_node(method_qn)):
-                return self._analyze_method_return_statements(method_node, method_qn)
+            if method_qn := self._resolve_method_qualified_name(
+                method_call, module_qn, local_var_types
+            ):
+                return self._get_method_return_type_from_ast(method_qn)
             return None
         except Exception as e:
             logger.debug(lg.PY_INFER_RETURN_FAILED.format(method=method_call, error=e))
@@ -341,10 +339,13 @@ class PythonExpressionAnalyzerMixin(_ExprBase):
     ) -> str | None:
         try:
             file_path = self.module_qn_to_file_path.get(module_qn)
-            if not file_path or file_path not in self.ast_cache:
+            if (
+                not file_path
+                or (entry := self.ast_cache.get_or_load(file_path)) is None
+            ):
                 return None
 
-            root_node, language = self.ast_cache[file_path]
+            root_node, language = entry
             if language != cs.SupportedLanguage.PYTHON:
                 return None
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -9,8 +10,12 @@ from tree_sitter import Node
 from ... import constants as cs
 from ... import logs as lg
 from ...types_defs import (
+    ClassNameIndex,
     FunctionRegistryTrieProtocol,
     LanguageQueries,
+    MethodSpanIndex,
+    ScopeKey,
+    ScopeStatements,
     SimpleNameLookup,
 )
 from ..import_processor import ImportProcessor
@@ -56,6 +61,19 @@ class PythonTypeInferenceEngine(
 
         self._method_return_type_cache: dict[str, str | None] = {}
         self._type_inference_in_progress: set[str] = set()
+        self._method_spans: dict[Path, MethodSpanIndex] = {}
+        self._module_class_names: dict[str, ClassNameIndex] = {}
+        self._parameter_type_cache: dict[tuple[str, str], str | None] = {}
+        self._scope_statements_cache: OrderedDict[
+            str, dict[ScopeKey, ScopeStatements]
+        ] = OrderedDict()
+
+    def clear_caches(self) -> None:
+        self._method_return_type_cache.clear()
+        self._method_spans.clear()
+        self._module_class_names.clear()
+        self._parameter_type_cache.clear()
+        self._scope_statements_cache.clear()
 
     def build_local_variable_type_map(
         self, caller_node: Node, module_qn: str
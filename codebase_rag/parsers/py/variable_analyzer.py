@@ -6,7 +6,12 @@ from loguru import logger
 
 from ... import constants as cs
 from ... import logs as lg
-from ...types_defs import ASTNode, FunctionRegistryTrieProtocol, NodeType
+from ...types_defs import (
+    ASTNode,
+    ClassNameIndex,
+    FunctionRegistryTrieProtocol,
+    NodeType,
+)
 from ..import_processor import ImportProcessor
 from ..utils import safe_decode_text
 
@@ -22,9 +27,19 @@ else:
     _VarBase = object
 
 
+def _index_class_names(class_names: list[str]) -> ClassNameIndex:
+    lowered = [class_name.lower() for class_name in class_names]
+    exact: dict[str, str] = {}
+    for class_name, class_lower in zip(class_names, lowered):
+        exact.setdefault(class_lower, class_name)
+    return ClassNameIndex(class_names, lowered, exact)
+
+
 class PythonVariableAnalyzerMixin(_VarBase):
     import_processor: ImportProcessor
     function_registry: FunctionRegistryTrieProtocol
+    _module_class_names: dict[str, ClassNameIndex]
+    _parameter_type_cache: dict[tuple[str, str], str | None]
 
     def _infer_parameter_types(
         self, caller_node: ASTNode, local_var_types: dict[str, str], module_qn: str
@@ -102,12 +117,19 @@ class PythonVariableAnalyzerMixin(_VarBase):
     def _infer_type_from_parameter_name(
         self, param_name: str, module_qn: str
     ) -> str | None:
+        key = (module_qn, param_name)
+        if key in self._parameter_type_cache:
+            return self._parameter_type_cache[key]
         logger.debug(
             lg.PY_TYPE_INFER_ATTEMPT.format(param=param_name, module=module_qn)
         )
-        available_class_names = self._collect_available_classes(module_qn)
-        logger.debug(lg.PY_AVAILABLE_CLASSES.format(classes=available_class_names))
-        return self._find_best_class_match(param_name, available_class_names)
+        if (class_names := self._module_class_names.get(module_qn)) is None:
+            class_names = _index_class_names(self._collect_available_classes(module_qn))
+            self._module_class_names[module_qn] = class_names
+        logger.debug(lg.PY_AVAILABLE_CLASSES.format(classes=class_names.names))
+        result = self._match_class_name(param_name, class_names)
+        self._parameter_type_cache[key] = result
+        return result
 
     def _collect_available_classes(self, module_qn: str) -> list[str]:
         available_class_names: list[str] = []
@@ -130,16 +152,28 @@ class PythonVariableAnalyzerMixin(_VarBase):
 
     def _find_best_class_match(
         self, param_name: str, available_class_names: list[str]
+    ) -> str | None:
+        return self._match_class_name(
+            param_name, _index_class_names(available_class_names)
+        )
+
+    def _match_class_name(
+        self, param_name: str, class_names: ClassNameIndex
     ) -> str | None:
         param_lower = param_name.lower()
-        best_match = None
-        highest_score = 0
-
-        for class_name in available_class_names:
-            score = self._calculate_match_score(param_lower, class_name.lower())
-            if score > highest_score:
-                highest_score = score
-                best_match = class_name
+        best_match = class_names.exact.get(param_lower)
+        highest_score = cs.PY_SCORE_EXACT_MATCH if best_match else 0
+
+        # (H) Without an exact match a suffix match is the best possible score,
+        # (H) so the first one ends the scan.
+        if best_match is None:
+            for class_name, class_lower in zip(class_names.names, class_names.lowered):
+                score = self._calculate_match_score(param_lower, class_lower)
+                if score > highest_score:
+                    highest_score = score
+                    best_match = class_name
+                    if score >= cs.PY_SCORE_SUFFIX_MATCH:
+                        break
 
         logger.debug(
             lg.PY_BEST_MATCH.format(
@@ -4,9 +4,10 @@ from loguru import logger
 
 from .. import constants as cs
 from .. import logs
+from ..index_manifest import ManifestEntry
 from ..services import IngestorProtocol
-from ..types_defs import LanguageQueries, NodeIdentifier
-from ..utils.path_utils import should_skip_path
+from ..types_defs import LanguageQueries, NodeIdentifier, PropertyDict, RepoWalk
+from ..utils.path_utils import walk_repo
 
 
 class StructureProcessor:
@@ -36,16 +37,14 @@ class StructureProcessor:
             return (cs.NodeLabel.PACKAGE, cs.KEY_QUALIFIED_NAME, parent_container_qn)
         return (cs.NodeLabel.FOLDER, cs.KEY_PATH, str(parent_rel_path))
 
-    def identify_structure(self) -> None:
-        directories = {self.repo_path}
-        for path in self.repo_path.rglob(cs.GLOB_ALL):
-            if path.is_dir() and not should_skip_path(
-                path,
+    def identify_structure(self, repo_walk: RepoWalk | None = None) -> None:
+        if repo_walk is None:
+            repo_walk = walk_repo(
                 self.repo_path,
                 exclude_paths=self.exclude_paths,
                 unignore_paths=self.unignore_paths,
-            ):
-                directories.add(path)
+            )
+        directories = {self.repo_path, *repo_walk.directories}
 
         for root in sorted(directories):
             relative_root = root.relative_to(self.repo_path)
@@ -107,7 +106,12 @@ class StructureProcessor:
                     (cs.NodeLabel.FOLDER, cs.KEY_PATH, str(relative_root)),
                 )
 
-    def process_generic_file(self, file_path: Path, file_name: str) -> None:
+    def process_generic_file(
+        self,
+        file_path: Path,
+        file_name: str,
+        fingerprint: ManifestEntry | None = None,
+    ) -> None:
         relative_filepath = str(file_path.relative_to(self.repo_path))
         relative_root = file_path.parent.relative_to(self.repo_path)
 
@@ -116,14 +120,16 @@ class StructureProcessor:
             relative_root, parent_container_qn
         )
 
-        self.ingestor.ensure_node_batch(
-            cs.NodeLabel.FILE,
-            {
-                cs.KEY_PATH: relative_filepath,
-                cs.KEY_NAME: file_name,
-                cs.KEY_EXTENSION: file_path.suffix,
-            },
-        )
+        properties: PropertyDict = {
+            cs.KEY_PATH: relative_filepath,
+            cs.KEY_NAME: file_name,
+            cs.KEY_EXTENSION: file_path.suffix,
+        }
+        if fingerprint is not None:
+            properties[cs.KEY_CONTENT_HASH] = fingerprint.content_hash
+            properties[cs.KEY_SIZE] = fingerprint.size
+            properties[cs.KEY_MTIME_NS] = fingerprint.mtime_ns
+        self.ingestor.ensure_node_batch(cs.NodeLabel.FILE, properties)
 
         self.ingestor.ensure_relationship_batch(
             parent_identifier,
@@ -46,6 +46,14 @@ class TypeInferenceEngine:
         self._js_type_inference: JsTypeInferenceEngine | None = None
         self._python_type_inference: PythonTypeInferenceEngine | None = None
 
+    def clear_caches(self) -> None:
+        if self._java_type_inference is not None:
+            self._java_type_inference.clear_caches()
+        if self._js_type_inference is not None:
+            self._js_type_inference.clear_caches()
+        if self._python_type_inference is not None:
+            self._python_type_inference.clear_caches()
+
     @property
     def java_type_inference(self) -> JavaTypeInferenceEngine:
         if self._java_type_inference is None:
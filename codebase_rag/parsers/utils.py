@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
 from functools import lru_cache
-from typing import TYPE_CHECKING, NamedTuple
+from typing import TYPE_CHECKING
 
 from loguru import logger
 from tree_sitter import Node, Query, QueryCursor
@@ -11,7 +12,6 @@ from .. import constants as cs
 from .. import logs
 from ..types_defs import (
     ASTNode,
-    LanguageQueries,
     NodeType,
     PropertyDict,
     SimpleNameLookup,
@@ -24,27 +24,6 @@ if TYPE_CHECKING:
     from ..types_defs import FunctionRegistryTrieProtocol
 
 
-class FunctionCapturesResult(NamedTuple):
-    lang_config: LanguageSpec
-    captures: dict[str, list[ASTNode]]
-
-
-def get_function_captures(
-    root_node: ASTNode,
-    language: cs.SupportedLanguage,
-    queries: dict[cs.SupportedLanguage, LanguageQueries],
-) -> FunctionCapturesResult | None:
-    lang_queries = queries[language]
-    lang_config = lang_queries[cs.QUERY_CONFIG]
-
-    if not (query := lang_queries[cs.QUERY_FUNCTIONS]):
-        return None
-
-    cursor = QueryCursor(query)
-    captures = cursor.captures(root_node)
-    return FunctionCapturesResult(lang_config, captures)
-
-
 @lru_cache(maxsize=10000)
 def _cached_decode_bytes(text_bytes: bytes) -> str:
     return text_bytes.decode(cs.ENCODING_UTF8)
@@ -66,6 +45,41 @@ def safe_decode_with_fallback(node: ASTNode | None, fallback: str = "") -> str:
     return result if (result := safe_decode_text(node)) is not None else fallback
 
 
+def find_node_by_span(
+    root_node: ASTNode, node_type: str, start_byte: int, end_byte: int
+) -> ASTNode | None:
+    node = root_node.descendant_for_byte_range(start_byte, end_byte)
+    # (H) The smallest node covering the span may be a child with the same
+    # (H) extent, so climb until the recorded node type matches.
+    while node is not None and node.start_byte == start_byte:
+        if node.type == node_type and node.end_byte == end_byte:
+            return node
+        node = node.parent
+    return None
+
+
+class NodeSpanIndex:
+    def __init__(self, nodes: Iterable[ASTNode]) -> None:
+        self.nodes = sorted(nodes, key=lambda node: node.start_byte)
+        self._starts = [node.start_byte for node in self.nodes]
+
+    def within(self, container: ASTNode) -> list[ASTNode]:
+        end = container.end_byte
+        lo = bisect_left(self._starts, container.start_byte)
+        hi = bisect_right(self._starts, end, lo)
+        return [node for node in self.nodes[lo:hi] if node.end_byte <= end]
+
+
+def capture_span_index(
+    query: Query | None, root_node: ASTNode, capture_name: str
+) -> NodeSpanIndex:
+    # (H) One walk from the root replaces a cursor per enclosing node: whatever
+    # (H) a cursor on a subtree would capture is the slice inside its byte span.
+    if query is None:
+        return NodeSpanIndex(())
+    return NodeSpanIndex(QueryCursor(query).captures(root_node).get(capture_name, []))
+
+
 def contains_node(parent: ASTNode, target: ASTNode) -> bool:
     return parent == target or any(
         contains_node(child, target) for child in parent.children
@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from loguru import logger
+
+from . import constants as cs
+from . import logs as ls
+from .config import settings
+
+type ProfileArg = str | int
+type ProfileReport = dict[str, object]
+
+
+@dataclass
+class ProfileEvent:
+    name: str
+    category: cs.ProfileCategory
+    start: float
+    wall: float
+    cpu: float
+    pid: int
+    args: dict[str, ProfileArg] = field(default_factory=dict)
+
+
+@dataclass
+class ProfileTotal:
+    count: int = 0
+    wall: float = 0.0
+    cpu: float = 0.0
+
+    def add(self, count: int, wall: float, cpu: float) -> None:
+        self.count += count
+        self.wall += wall
+        self.cpu += cpu
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            cs.PROFILE_KEY_COUNT: self.count,
+            cs.PROFILE_KEY_WALL: round(self.wall, cs.PROFILE_DECIMALS),
+            cs.PROFILE_KEY_CPU: round(self.cpu, cs.PROFILE_DECIMALS),
+        }
+
+
+@dataclass
+class ProfileSample:
+    events: list[ProfileEvent]
+    totals: dict[tuple[cs.ProfileCategory, str], ProfileTotal]
+
+
+class IndexProfiler:
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.events: list[ProfileEvent] = []
+        self.totals: dict[tuple[cs.ProfileCategory, str], ProfileTotal] = defaultdict(
+            ProfileTotal
+        )
+
+    @contextmanager
+    def span(
+        self, name: str, category: cs.ProfileCategory, **args: ProfileArg
+    ) -> Iterator[None]:
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self.add(
+                ProfileEvent(
+                    name=name,
+                    category=category,
+                    start=start,
+                    wall=time.perf_counter() - start,
+                    cpu=time.process_time() - cpu_start,
+                    pid=os.getpid(),
+                    args=args,
+                )
+            )
+
+    def add(self, event: ProfileEvent) -> None:
+        self.totals[(event.category, event.name)].add(1, event.wall, event.cpu)
+        # (H) Hot per-call spans (stages, resolver strategies) are only summed;
+        # (H) keeping every one of them would make the trace itself a bottleneck.
+        if event.category in cs.PROFILE_TRACED_CATEGORIES:
+            self.events.append(event)
+
+    def drain(self) -> ProfileSample:
+        sample = ProfileSample(events=self.events, totals=dict(self.totals))
+        self.events = []
+        self.totals = defaultdict(ProfileTotal)
+        return sample
+
+    def merge(self, sample: ProfileSample) -> None:
+        self.events.extend(sample.events)
+        for key, total in sample.totals.items():
+            self.totals[key].add(total.count, total.wall, total.cpu)
+
+    def report(self, top_files: int | None = None) -> ProfileReport:
+        top_files = settings.PROFILE_TOP_FILES if top_files is None else top_files
+        languages: dict[ProfileArg, ProfileTotal] = defaultdict(ProfileTotal)
+        files: dict[ProfileArg, ProfileTotal] = defaultdict(ProfileTotal)
+        file_passes: dict[ProfileArg, dict[str, float]] = defaultdict(dict)
+        file_languages: dict[ProfileArg, ProfileArg] = {}
+        flush_batches: list[dict[str, object]] = []
+        for event in self.events:
+            if event.category == cs.ProfileCategory.FILE:
+                path = event.args.get(cs.PROFILE_ARG_PATH, "")
+                language = event.args.get(cs.PROFILE_ARG_LANGUAGE, "")
+                files[path].add(1, event.wall, event.cpu)
+                passes = file_passes[path]
+                passes[event.name] = passes.get(event.name, 0.0) + event.wall
+                file_languages[path] = language
+            elif event.category == cs.ProfileCategory.FLUSH:
+                flush_batches.append(
+                    {
+                        cs.PROFILE_KEY_NAME: event.name,
+                        cs.PROFILE_KEY_WALL: round(event.wall, cs.PROFILE_DECIMALS),
+                        cs.PROFILE_KEY_ARGS: event.args,
+                    }
+                )
+
+        for path, total in files.items():
+            languages[file_languages[path]].add(1, total.wall, total.cpu)
+        slowest = sorted(files.items(), key=lambda item: item[1].wall, reverse=True)
+        return {
+            cs.PROFILE_KEY_WALL: round(
+                time.perf_counter() - self.started, cs.PROFILE_DECIMALS
+            ),
+            cs.PROFILE_KEY_PASSES: self._totals_for(cs.ProfileCategory.PASS),
+            cs.PROFILE_KEY_LANGUAGES: {
+                str(language): {
+                    cs.PROFILE_KEY_FILES: total.count,
+                    cs.PROFILE_KEY_WALL: round(total.wall, cs.PROFILE_DECIMALS),
+                    cs.PROFILE_KEY_CPU: round(total.cpu, cs.PROFILE_DECIMALS),
+                }
+                for language, total in languages.items()
+            },
+            cs.PROFILE_KEY_SLOWEST_FILES: [
+                {
+                    cs.PROFILE_ARG_PATH: path,
+                    cs.PROFILE_ARG_LANGUAGE: file_languages[path],
+                    cs.PROFILE_KEY_WALL: round(total.wall, cs.PROFILE_DECIMALS),
+                    cs.PROFILE_KEY_CPU: round(total.cpu, cs.PROFILE_DECIMALS),
+                    cs.PROFILE_KEY_PASSES: {
+                        name: round(wall, cs.PROFILE_DECIMALS)
+                        for name, wall in file_passes[path].items()
+                    },
+                }
+                for path, total in slowest[:top_files]
+            ],
+            cs.PROFILE_KEY_STAGES: self._totals_for(cs.ProfileCategory.STAGE),
+            cs.PROFILE_KEY_RESOLVER: self._totals_for(cs.ProfileCategory.RESOLVER),
+            cs.PROFILE_KEY_FLUSHES: self._totals_for(cs.ProfileCategory.FLUSH),
+            cs.PROFILE_KEY_FLUSH_BATCHES: flush_batches,
+        }
+
+    def _totals_for(self, category: cs.ProfileCategory) -> dict[str, dict]:
+        return {
+            name: total.as_dict()
+            for (total_category, name), total in self.totals.items()
+            if total_category == category
+        }
+
+    def chrome_trace(self) -> ProfileReport:
+        return {
+            cs.CHROME_TRACE_EVENTS: [
+                {
+                    cs.PROFILE_KEY_NAME: event.name,
+                    cs.CHROME_TRACE_KEY_CATEGORY: str(event.category),
+                    cs.CHROME_TRACE_KEY_PHASE: cs.CHROME_TRACE_PHASE_COMPLETE,
+                    cs.CHROME_TRACE_KEY_TIMESTAMP: (event.start - self.started)
+                    * cs.MICROSECONDS_PER_SECOND,
+                    cs.CHROME_TRACE_KEY_DURATION: event.wall
+                    * cs.MICROSECONDS_PER_SECOND,
+                    cs.CHROME_TRACE_KEY_PID: event.pid,
+                    cs.CHROME_TRACE_KEY_TID: cs.CHROME_TRACE_THREAD_ID,
+                    cs.PROFILE_KEY_ARGS: event.args,
+                }
+                for event in self.events
+            ],
+            cs.CHROME_TRACE_UNIT: cs.CHROME_TRACE_UNIT_MS,
+            cs.CHROME_TRACE_OTHER: self.report(),
+        }
+
+    def write(self, path: Path, fmt: cs.ProfileFormat = cs.ProfileFormat.JSON) -> None:
+        payload = (
+            self.chrome_trace() if fmt == cs.ProfileFormat.CHROME else self.report()
+        )
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + cs.TMP_EXTENSION)
+        tmp_path.write_text(json.dumps(payload, indent=2), encoding=cs.ENCODING_UTF8)
+        tmp_path.replace(path)
+        logger.info(ls.PROFILE_WRITTEN.format(path=path))
+
+
+# (H) One profiler per process; hooks deep in the parsers and ingestors look it
+# (H) up here so profiling costs a single global read when it is switched off.
+_active: IndexProfiler | None = None
+
+
+def active_profiler() -> IndexProfiler | None:
+    return _active
+
+
+def set_active_profiler(profiler: IndexProfiler | None) -> None:
+    global _active
+    _active = profiler
+
+
+def profile_span(
+    name: str, category: cs.ProfileCategory, **args: ProfileArg
+) -> AbstractContextManager[None]:
+    if _active is None:
+        return nullcontext()
+    return _active.span(name, category, **args)
+
+
+@contextmanager
+def profiling_session(
+    path: Path | None, fmt: cs.ProfileFormat = cs.ProfileFormat.JSON
+) -> Iterator[IndexProfiler | None]:
+    if path is None:
+        yield None
+        return
+    profiler = IndexProfiler()
+    set_active_profiler(profiler)
+    try:
+        yield profiler
+    finally:
+        set_active_profiler(None)
+        profiler.write(path, fmt)
@@ -1,6 +1,7 @@
+from collections.abc import Sequence
 from typing import Protocol, runtime_checkable
 
-from ..types_defs import PropertyDict, PropertyValue, ResultRow
+from ..types_defs import NodesByLabel, PropertyDict, PropertyValue, ResultRow
 
 
 @runtime_checkable
@@ -18,6 +19,26 @@ class IngestorProtocol(Protocol):
     def flush_all(self) -> None: ...
 
 
+@runtime_checkable
+class BatchFlushingIngestorProtocol(Protocol):
+    def flush_nodes(self) -> None: ...
+
+    def flush_relationships(self) -> None: ...
+
+
+@runtime_checkable
+class IncrementalIngestorProtocol(Protocol):
+    def load_existing_graph(self) -> bool: ...
+
+    def delete_nodes(self, nodes: NodesByLabel) -> None: ...
+
+    def reset_nodes(self, nodes: NodesByLabel) -> None: ...
+
+    def delete_outgoing_calls(self, nodes: NodesByLabel) -> None: ...
+
+    def delete_file_nodes(self, paths: Sequence[str]) -> None: ...
+
+
 @runtime_checkable
 class QueryProtocol(Protocol):
     def fetch_all(
@@ -16,29 +16,39 @@ from ..constants import (
     KEY_CREATED,
     KEY_FROM_VAL,
     KEY_NAME,
+    KEY_PATHS,
     KEY_PROJECT_NAME,
     KEY_PROPS,
+    KEY_QUALIFIED_NAMES,
     KEY_TO_VAL,
     NODE_UNIQUE_CONSTRAINTS,
+    PROFILE_FLUSH_NODES,
+    PROFILE_FLUSH_RELATIONSHIPS,
     REL_TYPE_CALLS,
+    ProfileCategory,
 )
 from ..cypher_queries import (
     CYPHER_DELETE_ALL,
+    CYPHER_DELETE_FILES_BY_PATH,
     CYPHER_DELETE_PROJECT,
     CYPHER_EXPORT_NODES,
     CYPHER_EXPORT_RELATIONSHIPS,
     CYPHER_LIST_PROJECTS,
     build_constraint_query,
+    build_delete_nodes_by_qn_query,
+    build_delete_outgoing_by_qn_query,
     build_merge_node_query,
     build_merge_relationship_query,
     wrap_with_unwind,
 )
+from ..profiling import profile_span
 from ..types_defs import (
     BatchParams,
     BatchWrapper,
     GraphData,
     GraphMetadata,
     NodeBatchRow,
+    NodesByLabel,
     PropertyDict,
     PropertyValue,
     RelBatchRow,
@@ -177,6 +187,36 @@ class MemgraphIngestor:
         self._execute_query(CYPHER_DELETE_PROJECT, {KEY_PROJECT_NAME: project_name})
         logger.info(ls.MG_PROJECT_DELETED.format(project_name=project_name))
 
+    def load_existing_graph(self) -> bool:
+        return True
+
+    def delete_nodes(self, nodes: NodesByLabel) -> None:
+        for label, qualified_names in nodes.items():
+            self._execute_query(
+                build_delete_nodes_by_qn_query(label),
+                {KEY_QUALIFIED_NAMES: qualified_names},
+            )
+
+    def reset_nodes(self, nodes: NodesByLabel) -> None:
+        # (H) MERGE ... SET n += props refreshes properties on re-ingest, so only
+        # (H) the outgoing edges need clearing before the file is replayed.
+        for label, qualified_names in nodes.items():
+            self._execute_query(
+                build_delete_outgoing_by_qn_query(label),
+                {KEY_QUALIFIED_NAMES: qualified_names},
+            )
+
+    def delete_outgoing_calls(self, nodes: NodesByLabel) -> None:
+        for label, qualified_names in nodes.items():
+            self._execute_query(
+                build_delete_outgoing_by_qn_query(label, REL_TYPE_CALLS),
+                {KEY_QUALIFIED_NAMES: qualified_names},
+            )
+
+    def delete_file_nodes(self, paths: Sequence[str]) -> None:
+        if paths:
+            self._execute_query(CYPHER_DELETE_FILES_BY_PATH, {KEY_PATHS: list(paths)})
+
     def ensure_constraints(self) -> None:
         logger.info(ls.MG_ENSURING_CONSTRAINTS)
         for label, prop in NODE_UNIQUE_CONSTRAINTS.items():
@@ -256,7 +296,13 @@ class MemgraphIngestor:
             flushed_total += len(batch_rows)
 
             query = build_merge_node_query(label, id_key)
-            self._execute_batch(query, batch_rows)
+            with profile_span(
+                PROFILE_FLUSH_NODES,
+                ProfileCategory.FLUSH,
+                label=label,
+                rows=len(batch_rows),
+            ):
+                self._execute_batch(query, batch_rows)
         logger.info(
             ls.MG_NODES_FLUSHED.format(flushed=flushed_total, total=buffer_size)
         )
@@ -288,7 +334,13 @@ class MemgraphIngestor:
             )
 
             total_attempted += len(params_list)
-            results = self._execute_batch_with_return(query, params_list)
+            with profile_span(
+                PROFILE_FLUSH_RELATIONSHIPS,
+                ProfileCategory.FLUSH,
+                label=rel_type,
+                rows=len(params_list),
+            ):
+                results = self._execute_batch_with_return(query, params_list)
             batch_successful = 0
             for r in results:
                 created = r.get(KEY_CREATED, 0)
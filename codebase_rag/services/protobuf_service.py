@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from pathlib import Path
 
 from loguru import logger
@@ -8,7 +9,8 @@ import codec.schema_pb2 as pb
 
 from .. import constants as cs
 from .. import logs as ls
-from ..types_defs import PropertyDict, PropertyValue
+from ..profiling import profile_span
+from ..types_defs import NodesByLabel, PropertyDict, PropertyValue
 
 LABEL_TO_ONEOF_FIELD: dict[cs.NodeLabel, str] = {
     cs.NodeLabel.PROJECT: cs.ONEOF_PROJECT,
@@ -171,7 +173,83 @@ class ProtobufFileIngestor:
             )
         )
 
+    def load_existing_graph(self) -> bool:
+        index_paths = (
+            [
+                self.output_dir / cs.PROTOBUF_NODES_FILE,
+                self.output_dir / cs.PROTOBUF_RELS_FILE,
+            ]
+            if self.split_index
+            else [self.output_dir / cs.PROTOBUF_INDEX_FILE]
+        )
+        if not all(path.is_file() for path in index_paths):
+            return False
+
+        for path in index_paths:
+            index = pb.GraphCodeIndex()
+            index.ParseFromString(path.read_bytes())
+            for node in index.nodes:
+                payload_field_name = node.WhichOneof(cs.PROTOBUF_PAYLOAD_ONEOF)
+                if not payload_field_name:
+                    continue
+                label = ONEOF_FIELD_TO_LABEL[payload_field_name]
+                payload = getattr(node, payload_field_name)
+                properties: PropertyDict = {
+                    descriptor.name: value
+                    for descriptor, value in payload.ListFields()
+                    if isinstance(value, str)
+                }
+                if node_id := self._get_node_id(label, properties):
+                    self._nodes[node_id] = node
+            for rel in index.relationships:
+                self._relationships[(rel.source_id, rel.type, rel.target_id)] = rel
+
+        logger.info(
+            ls.PROTOBUF_LOADED_EXISTING.format(
+                nodes=len(self._nodes), rels=len(self._relationships)
+            )
+        )
+        return True
+
+    def delete_nodes(self, nodes: NodesByLabel) -> None:
+        self._delete_ids({qn for qns in nodes.values() for qn in qns})
+
+    def reset_nodes(self, nodes: NodesByLabel) -> None:
+        # (H) Existing payloads win in ensure_node_batch, so drop them to let the
+        # (H) re-ingested properties replace them; incoming edges stay intact.
+        ids = {qn for qns in nodes.values() for qn in qns}
+        for node_id in ids:
+            self._nodes.pop(node_id, None)
+        self._drop_relationships(lambda rel: rel.source_id in ids)
+
+    def delete_outgoing_calls(self, nodes: NodesByLabel) -> None:
+        ids = {qn for qns in nodes.values() for qn in qns}
+        calls_type = pb.Relationship.RelationshipType.CALLS
+        self._drop_relationships(
+            lambda rel: rel.type == calls_type and rel.source_id in ids
+        )
+
+    def delete_file_nodes(self, paths: Sequence[str]) -> None:
+        self._delete_ids(set(paths))
+
+    def _delete_ids(self, ids: set[str]) -> None:
+        for node_id in ids:
+            self._nodes.pop(node_id, None)
+        self._drop_relationships(
+            lambda rel: rel.source_id in ids or rel.target_id in ids
+        )
+
+    def _drop_relationships(self, predicate: Callable[[pb.Relationship], bool]) -> None:
+        self._relationships = {
+            key: rel for key, rel in self._relationships.items() if not predicate(rel)
+        }
+
     def flush_all(self) -> None:
         logger.info(ls.PROTOBUF_FLUSHING.format(path=self.output_dir))
 
-        return self._flush_split() if self.split_index else self._flush_joint()
+        with profile_span(
+            cs.PROFILE_FLUSH_PROTOBUF,
+            cs.ProfileCategory.FLUSH,
+            rows=len(self._nodes) + len(self._relationships),
+        ):
+            return self._flush_split() if self.split_index else self._flush_joint()
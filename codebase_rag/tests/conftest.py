@@ -13,8 +13,10 @@ from unittest.mock import MagicMock
 import pytest
 from loguru import logger
 
+from codebase_rag import constants as cs
 from codebase_rag.graph_updater import GraphUpdater
 from codebase_rag.parser_loader import load_parsers
+from codebase_rag.services import IngestorProtocol
 from codebase_rag.services.graph_service import MemgraphIngestor
 
 if TYPE_CHECKING:
@@ -35,6 +37,19 @@ class NodeProtocol(Protocol):
     def child_by_field_name(self, name: str) -> Self | None: ...
 
 
+class UpdaterFactory(Protocol):
+    def __call__(
+        self,
+        repo_path: Path,
+        ingestor: IngestorProtocol,
+        *,
+        workers: int | None = None,
+        manifest_path: Path | None = None,
+        streaming: bool | None = None,
+        track_dependencies: bool = False,
+    ) -> GraphUpdater: ...
+
+
 @dataclass
 class MockNode:
     node_type: str
@@ -125,6 +140,98 @@ def create_and_run_updater(
     return updater
 
 
+@pytest.fixture
+def build_updater() -> UpdaterFactory:
+    """Builds GraphUpdaters over freshly loaded parsers with the given run options."""
+
+    def build(
+        repo_path: Path,
+        ingestor: IngestorProtocol,
+        *,
+        workers: int | None = None,
+        manifest_path: Path | None = None,
+        streaming: bool | None = None,
+        track_dependencies: bool = False,
+    ) -> GraphUpdater:
+        parsers, queries = load_parsers()
+        return GraphUpdater(
+            ingestor=ingestor,
+            repo_path=repo_path,
+            parsers=parsers,
+            queries=queries,
+            workers=workers,
+            manifest_path=manifest_path,
+            streaming=streaming,
+            track_dependencies=track_dependencies,
+        )
+
+    return build
+
+
+@pytest.fixture
+def sample_repo(temp_repo: Path) -> Path:
+    """Writes a small Python and JavaScript project with cross-file calls."""
+    pkg = temp_repo / "pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (pkg / "models.py").write_text(
+        "class Base:\n"
+        "    pass\n\n"
+        "class User(Base):\n"
+        "    def greet(self):\n"
+        "        return self.name()\n\n"
+        "    def name(self):\n"
+        "        return 'user'\n",
+        encoding="utf-8",
+    )
+    (pkg / "helpers.py").write_text(
+        "import string\n\n"
+        "def normalize(value):\n"
+        "    return value.strip(string.whitespace)\n",
+        encoding="utf-8",
+    )
+    (pkg / "service.py").write_text(
+        "from pkg.helpers import normalize\n"
+        "from pkg.models import User\n\n"
+        "class Service(User):\n"
+        "    def greet(self):\n"
+        "        return normalize(super().greet())\n\n"
+        "def run(value):\n"
+        "    User().greet()\n"
+        "    return normalize(value)\n",
+        encoding="utf-8",
+    )
+    (pkg / "main.py").write_text(
+        "import os\n\n"
+        "from pkg.service import run\n\n"
+        "def main():\n"
+        "    run(os.getcwd())\n\n"
+        "main()\n",
+        encoding="utf-8",
+    )
+    web = temp_repo / "web"
+    web.mkdir()
+    (web / "math.js").write_text(
+        "export function add(a, b) { return a + b; }\n", encoding="utf-8"
+    )
+    (web / "app.js").write_text(
+        "import { add } from './math';\n"
+        "class App { total() { return add(1, 2); } }\n"
+        "function entry() { return new App().total(); }\n"
+        "entry();\n"
+        "export default App;\n",
+        encoding="utf-8",
+    )
+    (temp_repo / "README.md").write_text("# sample\n", encoding="utf-8")
+    return temp_repo
+
+
+def touch_later(path: Path) -> None:
+    """Moves a file's mtime one second forward so stat-based checks see a change."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
 def get_relationships(mock_ingestor: MagicMock, rel_type: str) -> list:
     """Extract relationships of a specific type from mock_ingestor calls."""
     return [
@@ -134,6 +241,14 @@ def get_relationships(mock_ingestor: MagicMock, rel_type: str) -> list:
     ]
 
 
+def get_call_pairs(mock_ingestor: MagicMock) -> set[tuple[str, str]]:
+    """Extract (caller, callee) pairs from the CALLS relationships."""
+    return {
+        (c.args[0][2], c.args[2][2])
+        for c in get_relationships(mock_ingestor, cs.RelationshipType.CALLS)
+    }
+
+
 def get_nodes(mock_ingestor: MagicMock, node_type: str) -> list:
     """Extract nodes of a specific type from mock_ingestor calls."""
     return [
@@ -175,6 +290,8 @@ def mock_updater(temp_repo: Path, mock_ingestor: MagicMock) -> MagicMock:
     )
 
     mock.ast_cache = {}
+    mock.patch_file.return_value = None
+    mock.call_scope.return_value = None
 
     return mock
 
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from tree_sitter import Node, Parser
+
+from codebase_rag import constants as cs
+from codebase_rag.config import settings
+from codebase_rag.graph_updater import BoundedASTCache
+from codebase_rag.parser_loader import load_parsers
+from codebase_rag.tests.conftest import UpdaterFactory
+from codebase_rag.types_defs import ASTCacheStats
+
+
+@pytest.fixture(scope="module")
+def python_parser() -> Parser:
+    parsers, _ = load_parsers()
+    return parsers[cs.SupportedLanguage.PYTHON]
+
+
+def _tree(parser: Parser, functions: int) -> tuple[Node, cs.SupportedLanguage]:
+    source = "".join(f"def f{i}(x):\n    return x + {i}\n" for i in range(functions))
+    return parser.parse(source.encode()).root_node, cs.SupportedLanguage.PYTHON
+
+
+def test_size_estimate_tracks_node_count(python_parser: Parser) -> None:
+    cache = BoundedASTCache(max_entries=10)
+    small, large = _tree(python_parser, 1), _tree(python_parser, 50)
+
+    cache[Path("a.py")] = small
+    cache[Path("b.py")] = large
+    cache[Path("a.py")] = small
+
+    expected = (
+        small[0].descendant_count + large[0].descendant_count
+    ) * settings.CACHE_BYTES_PER_NODE
+    assert cache.estimated_bytes == expected
+
+    del cache[Path("b.py")]
+
+    assert cache.estimated_bytes == small[0].descendant_count * (
+        settings.CACHE_BYTES_PER_NODE
+    )
+
+
+def test_memory_limit_evicts_least_recently_used(
+    python_parser: Parser, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tree = _tree(python_parser, 20)
+    monkeypatch.setattr(
+        settings, "CACHE_BYTES_PER_NODE", cs.BYTES_PER_MB // tree[0].descendant_count
+    )
+    cache = BoundedASTCache(max_entries=100, max_memory_mb=2)
+
+    for name in ("a.py", "b.py", "c.py"):
+        cache[Path(name)] = tree
+
+    assert list(cache.cache) == [Path("b.py"), Path("c.py")]
+    assert cache.stats.evictions == 1
+    assert cache.estimated_bytes <= cache.max_memory_bytes
+
+
+def test_oversized_tree_is_kept_until_replaced(python_parser: Parser) -> None:
+    cache = BoundedASTCache(max_entries=10, max_memory_mb=0)
+    tree = _tree(python_parser, 5)
+
+    cache[Path("a.py")] = tree
+    assert Path("a.py") in cache.cache
+
+    cache[Path("b.py")] = tree
+    assert list(cache.cache) == [Path("b.py")]
+
+
+def test_evicted_entries_are_reparsed_and_counted(python_parser: Parser) -> None:
+    loaded: list[Path] = []
+
+    def loader(path: Path) -> tuple[Node, cs.SupportedLanguage] | None:
+        loaded.append(path)
+        return _tree(python_parser, 2) if path.suffix == ".py" else None
+
+    cache = BoundedASTCache(max_entries=1, loader=loader)
+    cache[Path("a.py")] = _tree(python_parser, 2)
+    cache[Path("b.py")] = _tree(python_parser, 2)
+
+    assert Path("a.py") not in cache
+    assert cache.get_or_load(Path("a.py")) is not None
+    cache[Path("a.py")]
+    assert cache.get_or_load(Path("notes.md")) is None
+
+    assert loaded == [Path("a.py"), Path("notes.md")]
+    assert cache.stats == ASTCacheStats(
+        hits=1,
+        misses=2,
+        evictions=2,
+        reparses=1,
+        entries=1,
+        estimated_bytes=cache.estimated_bytes,
+    )
+
+
+def test_embedding_source_does_not_reparse_evicted_files(
+    temp_repo: Path, mock_ingestor: MagicMock, build_updater: UpdaterFactory
+) -> None:
+    (temp_repo / "main.py").write_text("def entry():\n    return 1\n", encoding="utf-8")
+    updater = build_updater(temp_repo, mock_ingestor)
+    updater.run()
+    updater.ast_cache.cache.clear()
+    loaded: list[Path] = []
+    updater.ast_cache.loader = lambda path: loaded.append(path)
+    misses = updater.ast_cache.stats.misses
+
+    source = updater._extract_source_code(
+        f"{temp_repo.name}.main.entry", "main.py", 1, 2
+    )
+
+    assert source == "def entry():\n    return 1"
+    assert loaded == []
+    assert updater.ast_cache.stats.misses == misses
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from codebase_rag import constants as cs
+from codebase_rag.benchmark import (
+    BenchmarkBaseline,
+    BenchmarkResult,
+    PassMetrics,
+    SyntheticRepoSpec,
+    benchmark_registry,
+    find_regressions,
+    generate_qualified_names,
+    generate_synthetic_repo,
+    run_benchmark,
+)
+
+
+def _snapshot(root: Path) -> dict[str, str]:
+    return {
+        path.relative_to(root).as_posix(): path.read_text(encoding="utf-8")
+        for path in sorted(root.rglob("*"))
+        if path.is_file()
+    }
+
+
+def _result(scenario: str, definitions: float, calls: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        scenario=scenario,
+        files=10,
+        nodes=100,
+        relationships=200,
+        calls=50,
+        passes={
+            cs.PROFILE_PASS_DEFINITIONS: PassMetrics(definitions, definitions, 80.0),
+            cs.PROFILE_PASS_CALLS: PassMetrics(calls, calls, 90.0),
+        },
+    )
+
+
+def test_generator_is_deterministic_per_seed(tmp_path: Path) -> None:
+    spec = SyntheticRepoSpec(
+        name="mixed",
+        modules=30,
+        languages={
+            cs.SupportedLanguage.PYTHON: 0.5,
+            cs.SupportedLanguage.JS: 0.3,
+            cs.SupportedLanguage.JAVA: 0.2,
+        },
+        seed=7,
+    )
+
+    assert generate_synthetic_repo(tmp_path / "a", spec) == 30
+    generate_synthetic_repo(tmp_path / "b", spec)
+
+    first = _snapshot(tmp_path / "a")
+    assert first == _snapshot(tmp_path / "b")
+    suffixes = {Path(rel).suffix for rel in first}
+    assert {".py", ".js", ".java"} <= suffixes
+
+
+def test_run_benchmark_reports_calls_and_gated_passes() -> None:
+    spec = SyntheticRepoSpec(name="tiny", modules=4, inheritance_depth=2)
+
+    result = run_benchmark(spec)
+
+    assert result.files == 4
+    assert result.calls > 0
+    assert set(cs.BENCHMARK_GATED_PASSES) <= set(result.passes)
+    assert result.files_per_second > 0
+    assert result.calls_per_second > 0
+
+
+def test_baseline_round_trips(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    baseline = BenchmarkBaseline(results={"small": _result("small", 1.0, 2.0)})
+
+    baseline.save(path)
+    loaded = BenchmarkBaseline.load(path)
+
+    assert loaded is not None
+    assert loaded.results == baseline.results
+    assert BenchmarkBaseline.load(tmp_path / "missing.json") is None
+
+
+def test_find_regressions_gates_on_threshold_and_noise_floor() -> None:
+    baseline = BenchmarkBaseline(
+        results={
+            "slow": _result("slow", 1.0, 2.0),
+            "tiny": _result("tiny", 0.001, 0.001),
+        }
+    )
+
+    regressions = find_regressions(
+        baseline,
+        [
+            _result("slow", 1.05, 2.5),
+            _result("tiny", 0.01, 0.01),
+            _result("unknown", 5.0, 5.0),
+        ],
+        threshold_pct=10.0,
+    )
+
+    assert [(r.scenario, r.pass_name) for r in regressions] == [
+        ("slow", cs.PROFILE_PASS_CALLS)
+    ]
+    assert round(regressions[0].change_pct) == 25
+
+
+def test_registry_benchmark_measures_both_implementations() -> None:
+    names = generate_qualified_names(500)
+    assert len(names) == len({qn for qn, _ in names}) == 500
+
+    results = {
+        implementation: benchmark_registry(implementation, entries=500, queries=20)
+        for implementation in cs.RegistryImplementation
+    }
+
+    for implementation, metrics in results.items():
+        assert metrics.implementation == implementation
+        assert metrics.entries == 500
+        assert metrics.memory_mb > 0
+        assert metrics.prefix_us > 0
+    assert (
+        results[cs.RegistryImplementation.COMPACT].memory_mb
+        < results[cs.RegistryImplementation.TRIE_LAST_SEGMENT].memory_mb
+        < results[cs.RegistryImplementation.TRIE].memory_mb
+    )
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag import constants as cs
+from codebase_rag.call_dependencies import CallDependencyIndex, definition_simple_name
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.tests.conftest import UpdaterFactory
+from codebase_rag.types_defs import CallerSites, CallSite, FileCallSites
+
+
+def _sites(*names: str) -> FileCallSites:
+    sites = tuple(CallSite(name, "call", 0, 0) for name in names)
+    caller = CallerSites("proj.a.run", "Function", None, "function", 0, 0, sites)
+    return FileCallSites("proj.a", cs.SupportedLanguage.PYTHON, (caller,))
+
+
+def test_index_maps_targets_and_names_back_to_files() -> None:
+    """Files are found through the targets they called and the names they used."""
+    index = CallDependencyIndex()
+    a, b = Path("/repo/a.py"), Path("/repo/b.py")
+
+    index.record_call_sites(a, _sites("self.repo.save", "helper"))
+    index.record_targets(a, ["proj.lib.helper"])
+    index.record_call_sites(b, _sites("helper"))
+
+    assert index.dependents({"proj.lib.helper"}, set()) == {a}
+    assert index.dependents(set(), {"save"}) == {a}
+    assert index.dependents(set(), {"helper"}) == {a, b}
+
+    index.record_call_sites(a, _sites("other"))
+    assert index.dependents(set(), {"save"}) == set()
+
+    index.forget(b)
+    assert index.dependents({"proj.lib.helper"}, {"helper"}) == {a}
+
+    index.clear()
+    assert index.dependents({"proj.lib.helper"}, {"other"}) == set()
+
+
+def test_definition_simple_name_strips_module_and_signature() -> None:
+    """The simple name drops the module path and any parameter signature."""
+    assert definition_simple_name("proj.pkg.Service.build(int,String)") == "build"
+    assert definition_simple_name("proj.util.helper") == "helper"
+
+
+@pytest.fixture
+def updater(tmp_path: Path, build_updater: UpdaterFactory) -> GraphUpdater:
+    (tmp_path / "lib.py").write_text("def helper():\n    return 1\n")
+    (tmp_path / "user.py").write_text(
+        "from lib import helper\n\ndef use():\n    return helper()\n"
+    )
+    (tmp_path / "later.py").write_text("def pending():\n    return fresh()\n")
+    (tmp_path / "other.py").write_text("def alone():\n    return len([])\n")
+    updater = build_updater(tmp_path, MagicMock(), track_dependencies=True)
+    updater.run()
+    return updater
+
+
+def test_call_scope_covers_callers_and_new_names(
+    updater: GraphUpdater, tmp_path: Path
+) -> None:
+    """The scope holds the changed file plus callers of its old and new names."""
+    lib = tmp_path / "lib.py"
+    old_qns = set(updater.file_definitions(lib))
+    new_qns = old_qns | {f"{updater.project_name}.lib.fresh"}
+
+    scope = updater.call_scope([lib], old_qns, old_qns)
+    assert scope is not None
+    assert set(scope.files) == {lib, tmp_path / "user.py"}
+    assert f"{updater.project_name}.user.use" in scope.callers[cs.NodeLabel.FUNCTION]
+    caller_qns = [qn for qns in scope.callers.values() for qn in qns]
+    assert all(".user" in qn for qn in caller_qns)
+
+    scope = updater.call_scope([lib], old_qns, new_qns)
+    assert scope is not None
+    assert set(scope.files) == {lib, tmp_path / "user.py", tmp_path / "later.py"}
+    assert tmp_path / "other.py" not in scope.files
+
+
+def test_call_scope_is_disabled_without_tracking(
+    tmp_path: Path, build_updater: UpdaterFactory
+) -> None:
+    """Without dependency tracking there is no call scope to narrow a rebuild."""
+    updater = build_updater(tmp_path, MagicMock())
+    assert updater.call_scope([tmp_path / "a.py"], set(), set()) is None
@@ -71,8 +71,7 @@ def mock_import_processor(temp_repo: Path) -> ImportProcessor:
 @pytest.fixture
 def mock_ast_cache() -> MagicMock:
     cache = MagicMock()
-    cache.__contains__ = MagicMock(return_value=False)
-    cache.__getitem__ = MagicMock(return_value=(None, None))
+    cache.get_or_load = MagicMock(return_value=None)
     cache.__setitem__ = MagicMock()
     return cache
 
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag.tests.conftest import UpdaterFactory, get_call_pairs
+from codebase_rag.types_defs import CallSite
+
+
+@pytest.fixture
+def call_repo(temp_repo: Path) -> Path:
+    (temp_repo / "helpers.py").write_text(
+        "def helper():\n    return 1\n", encoding="utf-8"
+    )
+    (temp_repo / "main.py").write_text(
+        "from helpers import helper\n\n"
+        "class Service:\n"
+        "    def run(self):\n"
+        "        return helper()\n\n"
+        "def entry():\n"
+        "    service = Service()\n"
+        "    return service.run()\n",
+        encoding="utf-8",
+    )
+    return temp_repo
+
+
+def test_call_sites_are_recorded_per_caller(
+    call_repo: Path, mock_ingestor: MagicMock, build_updater: UpdaterFactory
+) -> None:
+    """Each caller keeps the raw call names found in its body."""
+    updater = build_updater(call_repo, mock_ingestor)
+
+    updater.run()
+
+    project = call_repo.name
+    records = updater._call_sites[call_repo / "main.py"]
+    sites = {
+        caller.qualified_name: {site.name for site in caller.sites}
+        for caller in records.callers
+    }
+    assert records.module_qn == f"{project}.main"
+    assert sites[f"{project}.main.Service.run"] == {"helper"}
+    assert sites[f"{project}.main.entry"] == {"Service", "service.run"}
+    assert all(
+        isinstance(site, CallSite)
+        for caller in records.callers
+        for site in caller.sites
+    )
+
+
+def test_calls_resolve_after_trees_are_evicted(
+    call_repo: Path, mock_ingestor: MagicMock, build_updater: UpdaterFactory
+) -> None:
+    """Recorded call sites resolve the same CALLS once the trees are gone."""
+    updater = build_updater(call_repo, mock_ingestor)
+    updater.run()
+    expected = get_call_pairs(mock_ingestor)
+    project = call_repo.name
+    assert (
+        f"{project}.main.Service.run",
+        f"{project}.helpers.helper",
+    ) in expected
+
+    updater.ast_cache.cache.clear()
+    mock_ingestor.reset_mock()
+    updater._process_function_calls()
+
+    assert get_call_pairs(mock_ingestor) == expected
+
+
+def test_bare_name_callers_do_not_load_trees(
+    temp_repo: Path, mock_ingestor: MagicMock, build_updater: UpdaterFactory
+) -> None:
+    """Callers with only bare-name calls resolve without reparsing their file."""
+    (temp_repo / "main.py").write_text(
+        "def helper():\n    return 1\n\ndef entry():\n    return helper()\n",
+        encoding="utf-8",
+    )
+    updater = build_updater(temp_repo, mock_ingestor)
+    updater.run()
+    updater.ast_cache.cache.clear()
+    mock_ingestor.reset_mock()
+    loaded: list[Path] = []
+    updater.ast_cache.loader = lambda path: loaded.append(path)
+
+    updater._process_function_calls()
+
+    project = temp_repo.name
+    assert (f"{project}.main.entry", f"{project}.main.helper") in get_call_pairs(
+        mock_ingestor
+    )
+    assert loaded == []
+
+
+def test_languages_without_local_types_do_not_load_trees(
+    temp_repo: Path, mock_ingestor: MagicMock, build_updater: UpdaterFactory
+) -> None:
+    """Qualified calls skip the tree when the language has no local type map."""
+    (temp_repo / "main.rs").write_text(
+        "struct Counter { n: i32 }\n\n"
+        "impl Counter {\n"
+        "    fn new() -> Counter { Counter { n: 0 } }\n"
+        "}\n\n"
+        "fn main() {\n    let c = Counter::new();\n}\n",
+        encoding="utf-8",
+    )
+    updater = build_updater(temp_repo, mock_ingestor)
+    updater.run()
+    expected = get_call_pairs(mock_ingestor)
+    records = updater._call_sites[temp_repo / "main.rs"]
+    assert any(
+        updater.factory.call_processor._resolver.needs_local_types(site.name)
+        for caller in records.callers
+        for site in caller.sites
+    )
+    updater.ast_cache.cache.clear()
+    mock_ingestor.reset_mock()
+    loaded: list[Path] = []
+    updater.ast_cache.loader = lambda path: loaded.append(path)
+
+    updater._process_function_calls()
+
+    assert not updater.factory.call_processor.needs_tree(records)
+    assert get_call_pairs(mock_ingestor) == expected
+    assert loaded == []
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import pickle
+from collections import defaultdict
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from codebase_rag.parsers.class_ingest import ClassHierarchy
+from codebase_rag.parsers.class_ingest.method_override import (
+    process_all_method_overrides,
+)
+from codebase_rag.parsers.java.type_inference import JavaTypeInferenceEngine
+from codebase_rag.types_defs import NodeType
+
+
+def test_ancestors_are_breadth_first_and_deduplicated() -> None:
+    hierarchy = ClassHierarchy(
+        {
+            "Child": ["Left", "Right"],
+            "Left": ["Root"],
+            "Right": ["Root", "Mixin"],
+            "Root": ["Child"],
+        }
+    )
+
+    assert hierarchy.ancestors("Child") == ("Left", "Right", "Root", "Mixin")
+    assert hierarchy.ancestors("Unknown") == ()
+
+
+def test_ancestors_follow_changes_to_any_ancestor() -> None:
+    hierarchy = ClassHierarchy({"Child": ["Parent"], "Parent": ["Base"]})
+    assert hierarchy.ancestors("Child") == ("Parent", "Base")
+
+    hierarchy["Base"] = ["Object"]
+    assert hierarchy.ancestors("Child") == ("Parent", "Base", "Object")
+
+    hierarchy.update({"Parent": []})
+    assert hierarchy.ancestors("Child") == ("Parent",)
+
+    del hierarchy["Child"]
+    assert hierarchy.ancestors("Child") == ()
+
+
+def test_memo_is_reused_until_invalidated() -> None:
+    hierarchy = ClassHierarchy({"Child": ["Parent"]})
+    first = hierarchy.ancestors("Child")
+
+    hierarchy["Unrelated"] = ["Other"]
+
+    assert hierarchy.ancestors("Child") is first
+    assert pickle.loads(pickle.dumps(hierarchy)).ancestors("Child") == first
+
+
+def test_overrides_target_the_nearest_ancestor_definition() -> None:
+    registry = {
+        "m.Base.run": NodeType.METHOD,
+        "m.Middle.run": NodeType.METHOD,
+        "m.Leaf.run": NodeType.METHOD,
+        "m.Other.run": NodeType.METHOD,
+    }
+    ingestor = MagicMock()
+    registry_mock = MagicMock()
+    registry_mock.keys.return_value = list(registry)
+    registry_mock.__getitem__.side_effect = registry.__getitem__
+    registry_mock.__contains__.side_effect = registry.__contains__
+
+    process_all_method_overrides(
+        registry_mock,
+        {"m.Leaf": ["m.Middle"], "m.Middle": ["m.Base"], "m.Other": ["m.Base"]},
+        ingestor,
+    )
+
+    overrides = {
+        (call.args[0][2], call.args[2][2])
+        for call in ingestor.ensure_relationship_batch.call_args_list
+    }
+    assert overrides == {
+        ("m.Leaf.run", "m.Middle.run"),
+        ("m.Middle.run", "m.Base.run"),
+        ("m.Other.run", "m.Base.run"),
+    }
+
+
+def test_java_superclass_chain_is_looked_up_once_per_pass() -> None:
+    engine = JavaTypeInferenceEngine(
+        import_processor=MagicMock(import_mapping={}),
+        function_registry=MagicMock(),
+        repo_path=Path("/repo"),
+        project_name="repo",
+        ast_cache=MagicMock(),
+        queries={},
+        module_qn_to_file_path={},
+        class_inheritance={},
+        simple_name_lookup=defaultdict(set),
+    )
+    superclasses = {"p.Leaf": "p.Middle", "p.Middle": "p.Base"}
+    lookups: list[str] = []
+
+    def superclass_of(class_qn: str) -> str | None:
+        lookups.append(class_qn)
+        return superclasses.get(class_qn)
+
+    def method_in(class_qn: str, method_name: str, module_qn: str):
+        if class_qn == "p.Base":
+            return NodeType.METHOD, f"{class_qn}.{method_name}()"
+        return None
+
+    engine._get_superclass_name = superclass_of  # type: ignore[method-assign]
+    engine._find_method_with_any_signature = method_in  # type: ignore[method-assign]
+
+    for _ in range(3):
+        assert engine._find_inherited_method("p.Leaf", "greet", "p") == (
+            NodeType.METHOD,
+            "p.Base.greet()",
+        )
+    assert engine._find_inherited_method("p.Middle", "greet", "p") is not None
+    assert lookups == ["p.Leaf", "p.Middle", "p.Base"]
+
+    engine.clear_caches()
+    engine._find_inherited_method("p.Leaf", "greet", "p")
+    assert len(lookups) == 6
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from codebase_rag.config import settings
+from codebase_rag.graph_updater import (
+    CompactFunctionRegistryTrie,
+    FunctionRegistryTrie,
+    new_function_registry,
+)
+from codebase_rag.types_defs import NodeType
+
+SEGMENTS = ["proj", "pkg", "mod", "Foo", "bar", "baz", ""]
+
+
+def _random_qn(rng: random.Random, low: int = 1, high: int = 5) -> str:
+    return ".".join(rng.choice(SEGMENTS) for _ in range(rng.randint(low, high)))
+
+
+@pytest.mark.parametrize("suffix_trie", [True, False])
+@pytest.mark.parametrize("seed", range(3))
+def test_compact_registry_matches_trie(seed: int, suffix_trie: bool) -> None:
+    rng = random.Random(seed)
+    trie = FunctionRegistryTrie(suffix_trie=suffix_trie)
+    compact = CompactFunctionRegistryTrie()
+    inserted: list[str] = []
+
+    for _ in range(1500):
+        qn = _random_qn(rng)
+        node_type = rng.choice([NodeType.CLASS, NodeType.FUNCTION, NodeType.METHOD])
+        trie[qn] = node_type
+        compact[qn] = node_type
+        inserted.append(qn)
+        if rng.random() < 0.2:
+            removed = rng.choice(inserted)
+            del trie[removed]
+            del compact[removed]
+        if rng.random() < 0.1:
+            prefix = _random_qn(rng, 0, 3)
+            suffix = _random_qn(rng, 1, 2)
+            assert sorted(compact.find_with_prefix(prefix)) == sorted(
+                trie.find_with_prefix(prefix)
+            )
+            assert sorted(compact.find_ending_with(suffix)) == sorted(
+                trie.find_ending_with(suffix)
+            )
+            assert sorted(
+                compact.find_with_prefix_and_suffix(prefix, suffix)
+            ) == sorted(trie.find_with_prefix_and_suffix(prefix, suffix))
+
+    assert dict(compact.items()) == dict(trie.items())
+    assert len(compact) == len(trie)
+
+
+def test_compact_registry_queries() -> None:
+    registry = CompactFunctionRegistryTrie()
+    registry.insert("project.services.user.UserService", NodeType.CLASS)
+    registry.insert("project.services.user.UserService.create_user", NodeType.METHOD)
+    registry.insert("project.services.admin.AdminService.create_user", NodeType.METHOD)
+    registry.insert("other.SomeClass.create_user", NodeType.METHOD)
+
+    assert registry.find_with_prefix("project.services.user") == [
+        ("project.services.user.UserService", NodeType.CLASS),
+        ("project.services.user.UserService.create_user", NodeType.METHOD),
+    ]
+    assert set(registry.find_ending_with("UserService.create_user")) == {
+        "project.services.user.UserService.create_user"
+    }
+    assert set(registry.find_with_prefix_and_suffix("project", "create_user")) == {
+        "project.services.user.UserService.create_user",
+        "project.services.admin.AdminService.create_user",
+    }
+    assert registry.find_with_prefix("project.unknown") == []
+    assert registry.find_ending_with("unknown") == []
+
+    registry["project.services.user.UserService"] = NodeType.INTERFACE
+    del registry["other.SomeClass.create_user"]
+
+    assert registry["project.services.user.UserService"] == NodeType.INTERFACE
+    assert registry.find_with_prefix("other") == []
+    assert len(registry) == 3
+
+
+def test_compact_registry_batches_deletes_until_next_query() -> None:
+    registry = CompactFunctionRegistryTrie()
+    for name in ("a", "b", "c"):
+        registry.insert(f"pkg.mod.{name}", NodeType.FUNCTION)
+    assert len(registry.find_with_prefix("pkg")) == 3
+
+    del registry["pkg.mod.a"]
+    del registry["pkg.mod.b"]
+    registry.insert("pkg.mod.b", NodeType.METHOD)
+
+    assert len(registry._prefix_keys) == 3
+    assert registry.find_with_prefix("pkg") == [
+        ("pkg.mod.b", NodeType.METHOD),
+        ("pkg.mod.c", NodeType.FUNCTION),
+    ]
+    assert registry.find_ending_with("mod.a") == []
+    assert len(registry._prefix_keys) == len(registry._suffix_keys) == 2
+
+
+def test_compact_registry_prefers_simple_name_lookup() -> None:
+    lookup: dict[str, set[str]] = {"run": {"pkg.mod.run"}}
+    registry = CompactFunctionRegistryTrie(simple_name_lookup=lookup)
+    registry.insert("pkg.mod.run", NodeType.FUNCTION)
+    registry.insert("pkg.other.run", NodeType.FUNCTION)
+
+    assert registry.find_ending_with("run") == ["pkg.mod.run"]
+    assert set(registry.find_ending_with("other.run")) == {"pkg.other.run"}
+
+
+def test_new_function_registry_follows_setting(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "FUNCTION_REGISTRY_COMPACT", True)
+    assert isinstance(new_function_registry(), CompactFunctionRegistryTrie)
+
+    monkeypatch.setattr(settings, "FUNCTION_REGISTRY_COMPACT", False)
+    assert isinstance(new_function_registry(), FunctionRegistryTrie)
+
+
+def test_function_registry_suffix_trie_follows_setting(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "FUNCTION_REGISTRY_SUFFIX_TRIE", True)
+    assert FunctionRegistryTrie()._suffix_root is not None
+
+    monkeypatch.setattr(settings, "FUNCTION_REGISTRY_SUFFIX_TRIE", False)
+    assert FunctionRegistryTrie()._suffix_root is None
@@ -0,0 +1,43 @@
+from pathlib import Path
+
+import pytest
+
+from codebase_rag.utils.git_utils import git_changed_paths, parse_name_status
+
+REPO = Path("/repo")
+
+
+def test_parse_name_status_expands_renames_and_copies() -> None:
+    output = "M\0a.py\0R100\0old.py\0new.py\0C75\0src.py\0copy.py\0D\0gone.py\0"
+
+    assert parse_name_status(REPO, output) == [
+        REPO / "a.py",
+        REPO / "old.py",
+        REPO / "new.py",
+        REPO / "src.py",
+        REPO / "copy.py",
+        REPO / "gone.py",
+    ]
+
+
+def test_parse_name_status_accepts_empty_diff() -> None:
+    assert parse_name_status(REPO, "") == []
+
+
+@pytest.mark.parametrize(
+    "output",
+    [
+        "M\0a.py\0M\0b.py",
+        "M\0a.py\0R100\0old.py\0",
+        "M\0a.py\0D\0",
+    ],
+)
+def test_parse_name_status_rejects_truncated_output(output: str) -> None:
+    """A record cut short is an error rather than a silently dropped path."""
+    with pytest.raises(ValueError, match="mid-record"):
+        parse_name_status(REPO, output)
+
+
+def test_git_changed_paths_rejects_unknown_revision(temp_repo: Path) -> None:
+    with pytest.raises(ValueError, match="no-such-rev"):
+        git_changed_paths(temp_repo, "no-such-rev")
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 
 from codebase_rag.constants import NODE_UNIQUE_CONSTRAINTS
-from codebase_rag.cypher_queries import wrap_with_unwind
+from codebase_rag.cypher_queries import build_delete_nodes_by_qn_query, wrap_with_unwind
 from codebase_rag.services.graph_service import MemgraphIngestor
 
 
@@ -425,6 +425,45 @@ class TestFetchAllAndExecuteWrite:
             mock_exec.assert_called_once_with("CREATE (n:Test)", {"name": "test"})
 
 
+class TestIncrementalDeletes:
+    def test_delete_nodes_issues_one_labeled_query_per_label(self) -> None:
+        ingestor = MemgraphIngestor(host="localhost", port=7687)
+
+        with patch.object(ingestor, "_execute_query") as mock_exec:
+            ingestor.delete_nodes(
+                {"Function": ["proj.mod.run"], "Class": ["proj.mod.A", "proj.mod.B"]}
+            )
+
+        assert mock_exec.call_args_list == [
+            call(
+                build_delete_nodes_by_qn_query("Function"),
+                {"qualified_names": ["proj.mod.run"]},
+            ),
+            call(
+                build_delete_nodes_by_qn_query("Class"),
+                {"qualified_names": ["proj.mod.A", "proj.mod.B"]},
+            ),
+        ]
+
+    def test_outgoing_call_deletes_match_by_label(self) -> None:
+        ingestor = MemgraphIngestor(host="localhost", port=7687)
+
+        with patch.object(ingestor, "_execute_query") as mock_exec:
+            ingestor.delete_outgoing_calls({"Method": ["proj.mod.A.run"]})
+
+        query = mock_exec.call_args.args[0]
+        assert "MATCH (n:Method {qualified_name: qn})-[r:CALLS]->()" in query
+        assert query.startswith("UNWIND $qualified_names AS qn")
+
+    def test_empty_mapping_issues_no_queries(self) -> None:
+        ingestor = MemgraphIngestor(host="localhost", port=7687)
+
+        with patch.object(ingestor, "_execute_query") as mock_exec:
+            ingestor.reset_nodes({})
+
+        mock_exec.assert_not_called()
+
+
 class TestGetCurrentTimestamp:
     def test_returns_iso_format_timestamp(self) -> None:
         ingestor = MemgraphIngestor(host="localhost", port=7687)
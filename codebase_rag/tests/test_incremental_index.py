@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Protocol
+from unittest.mock import MagicMock
+
+import pytest
+
+import codec.schema_pb2 as pb
+from codebase_rag import constants as cs
+from codebase_rag.graph_updater import BoundedASTCache, GraphUpdater
+from codebase_rag.index_manifest import (
+    IndexManifest,
+    ManifestEntry,
+    find_dependents,
+    fingerprint_file,
+    manifest_filter_key,
+)
+from codebase_rag.services import IngestorProtocol
+from codebase_rag.services.protobuf_service import ProtobufFileIngestor
+from codebase_rag.tests.conftest import UpdaterFactory, touch_later
+from codebase_rag.utils.git_utils import git_changed_paths
+
+
+class ProtoUpdaterFactory(Protocol):
+    def __call__(
+        self, out_dir: Path, manifest: bool = True, workers: int = 1
+    ) -> GraphUpdater: ...
+
+
+@pytest.fixture
+def proto_updater(
+    sample_repo: Path, build_updater: UpdaterFactory
+) -> ProtoUpdaterFactory:
+    """Builds updaters over the sample repo that write a protobuf index to out_dir."""
+
+    def build(out_dir: Path, manifest: bool = True, workers: int = 1) -> GraphUpdater:
+        return build_updater(
+            sample_repo,
+            ProtobufFileIngestor(output_path=str(out_dir)),
+            workers=workers,
+            manifest_path=out_dir / cs.MANIFEST_FILE_NAME if manifest else None,
+        )
+
+    return build
+
+
+def _graph(out_dir: Path) -> tuple[set[tuple[str, str]], set[tuple[str, int, str]]]:
+    index = pb.GraphCodeIndex()
+    index.ParseFromString((out_dir / cs.PROTOBUF_INDEX_FILE).read_bytes())
+    nodes = set()
+    for node in index.nodes:
+        field_name = node.WhichOneof(cs.PROTOBUF_PAYLOAD_ONEOF)
+        payload = getattr(node, field_name)
+        for key in (cs.KEY_QUALIFIED_NAME, cs.KEY_PATH, cs.KEY_NAME):
+            if key in payload.DESCRIPTOR.fields_by_name and getattr(payload, key):
+                nodes.add((field_name, getattr(payload, key)))
+                break
+    rels = {(r.source_id, r.type, r.target_id) for r in index.relationships}
+    return nodes, rels
+
+
+def test_noop_reindex_skips_flush(
+    sample_repo: Path, proto_updater: ProtoUpdaterFactory, tmp_path: Path
+) -> None:
+    """Re-indexing an unchanged repo leaves the existing index untouched."""
+    out_dir = tmp_path / "out"
+    proto_updater(out_dir).run()
+    index_file = out_dir / cs.PROTOBUF_INDEX_FILE
+    written = index_file.stat().st_mtime_ns
+
+    proto_updater(out_dir).run()
+
+    assert index_file.stat().st_mtime_ns == written
+
+
+def test_incremental_update_matches_full_rebuild(
+    sample_repo: Path, proto_updater: ProtoUpdaterFactory, tmp_path: Path
+) -> None:
+    """Added, changed and removed files produce the same graph as a full rebuild."""
+    out_dir = tmp_path / "incremental"
+    proto_updater(out_dir).run()
+
+    helpers = sample_repo / "pkg" / "helpers.py"
+    helpers.write_text(
+        "def clean(value):\n    return value.strip()\n\n"
+        "def normalize(value):\n    return clean(value).lower()\n",
+        encoding="utf-8",
+    )
+    touch_later(helpers)
+    (sample_repo / "pkg" / "models.py").unlink()
+    (sample_repo / "pkg" / "extra.py").write_text(
+        "from pkg.helpers import clean\n\ndef tidy():\n    return clean(' x ')\n",
+        encoding="utf-8",
+    )
+    proto_updater(out_dir).run()
+    full_dir = tmp_path / "full"
+    proto_updater(full_dir, manifest=False).run()
+
+    nodes, rels = _graph(out_dir)
+    assert (nodes, rels) == _graph(full_dir)
+    project = sample_repo.name
+    assert (cs.ONEOF_FUNCTION, f"{project}.pkg.helpers.clean") in nodes
+    assert (cs.ONEOF_CLASS, f"{project}.pkg.models.User") not in nodes
+    assert (cs.ONEOF_FILE, "pkg/models.py") not in nodes
+    assert (
+        f"{project}.pkg.extra.tidy",
+        pb.Relationship.RelationshipType.CALLS,
+        f"{project}.pkg.helpers.clean",
+    ) in rels
+
+
+def test_incremental_update_prunes_unimported_external_module(
+    sample_repo: Path, proto_updater: ProtoUpdaterFactory, tmp_path: Path
+) -> None:
+    """An external module goes away once the last file importing it drops it."""
+    out_dir = tmp_path / "incremental"
+    proto_updater(out_dir).run()
+    assert (cs.ONEOF_MODULE, "string") in _graph(out_dir)[0]
+
+    helpers = sample_repo / "pkg" / "helpers.py"
+    helpers.write_text(
+        "def normalize(value):\n    return value.strip()\n", encoding="utf-8"
+    )
+    touch_later(helpers)
+    proto_updater(out_dir).run()
+    full_dir = tmp_path / "full"
+    proto_updater(full_dir, manifest=False).run()
+
+    nodes, rels = _graph(out_dir)
+    assert (nodes, rels) == _graph(full_dir)
+    assert (cs.ONEOF_MODULE, "string") not in nodes
+    assert (cs.ONEOF_MODULE, "os") in nodes
+    manifest = IndexManifest.load(
+        out_dir / cs.MANIFEST_FILE_NAME,
+        sample_repo.name,
+        manifest_filter_key(None, None),
+    )
+    assert manifest is not None
+    assert manifest.files["pkg/helpers.py"].external_modules == []
+    assert manifest.files["pkg/main.py"].external_modules == ["os"]
+
+
+def test_serial_pass_records_same_manifest_as_parallel(
+    sample_repo: Path,
+    proto_updater: ProtoUpdaterFactory,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Manifest runs keep the serial pass and still record per-file definitions."""
+    serial_dir, parallel_dir = tmp_path / "serial", tmp_path / "parallel"
+    proto_updater(parallel_dir, workers=2).run()
+
+    def isolated(*args: object) -> None:
+        raise AssertionError("serial manifest run took the isolated path")
+
+    monkeypatch.setattr("codebase_rag.graph_updater.iter_file_definitions", isolated)
+    proto_updater(serial_dir).run()
+
+    serial = IndexManifest.load(
+        serial_dir / cs.MANIFEST_FILE_NAME,
+        sample_repo.name,
+        manifest_filter_key(None, None),
+    )
+    parallel = IndexManifest.load(
+        parallel_dir / cs.MANIFEST_FILE_NAME,
+        sample_repo.name,
+        manifest_filter_key(None, None),
+    )
+    assert serial is not None and parallel is not None
+    assert serial.files == parallel.files
+    assert serial.files["pkg/models.py"].definitions
+    assert _graph(serial_dir) == _graph(parallel_dir)
+
+
+def test_changed_filters_force_full_run(
+    sample_repo: Path, proto_updater: ProtoUpdaterFactory, tmp_path: Path
+) -> None:
+    """A manifest built with different exclude filters is not reused."""
+    out_dir = tmp_path / "out"
+    proto_updater(out_dir).run()
+    manifest_path = out_dir / cs.MANIFEST_FILE_NAME
+
+    assert IndexManifest.load(
+        manifest_path, sample_repo.name, manifest_filter_key(None, None)
+    )
+    assert (
+        IndexManifest.load(
+            manifest_path,
+            sample_repo.name,
+            manifest_filter_key(frozenset({"pkg"}), None),
+        )
+        is None
+    )
+
+
+def test_manifest_records_call_targets(
+    sample_repo: Path, proto_updater: ProtoUpdaterFactory, tmp_path: Path
+) -> None:
+    """The manifest stores each file's language and resolved call targets."""
+    out_dir = tmp_path / "out"
+    proto_updater(out_dir).run()
+
+    manifest = IndexManifest.load(
+        out_dir / cs.MANIFEST_FILE_NAME,
+        sample_repo.name,
+        manifest_filter_key(None, None),
+    )
+
+    assert manifest is not None
+    entry = manifest.files["pkg/service.py"]
+    project = sample_repo.name
+    assert entry.language == cs.SupportedLanguage.PYTHON
+    assert f"{project}.pkg.helpers.normalize" in entry.call_targets
+    assert manifest.files["README.md"].language is None
+
+
+def test_ingestor_without_incremental_support_runs_full(
+    sample_repo: Path,
+    proto_updater: ProtoUpdaterFactory,
+    build_updater: UpdaterFactory,
+    tmp_path: Path,
+) -> None:
+    """Ingestors that cannot edit an existing graph always get a full run."""
+    out_dir = tmp_path / "out"
+    proto_updater(out_dir).run()
+    ingestor = MagicMock(spec=IngestorProtocol)
+
+    build_updater(
+        sample_repo, ingestor, manifest_path=out_dir / cs.MANIFEST_FILE_NAME
+    ).run()
+
+    ingestor.flush_all.assert_called_once()
+    assert ingestor.ensure_node_batch.call_count > 1
+
+
+def test_fingerprint_reuses_hash_when_stat_unchanged(tmp_path: Path) -> None:
+    """Files with unchanged size and mtime are not re-hashed."""
+    source = tmp_path / "a.py"
+    source.write_text("x = 1\n", encoding="utf-8")
+    entry = fingerprint_file(source, None)
+    stale = ManifestEntry("cached", entry.size, entry.mtime_ns)
+
+    assert fingerprint_file(source, stale).content_hash == "cached"
+    touch_later(source)
+    assert fingerprint_file(source, stale).content_hash == entry.content_hash
+
+
+def test_find_dependents_matches_calls_and_import_prefixes() -> None:
+    """Dependents are found through call targets and import prefixes."""
+    manifest = IndexManifest(project_name="proj", filter_key="")
+    manifest.files = {
+        "caller.py": ManifestEntry(
+            "h1", 1, 1, cs.SupportedLanguage.PYTHON, call_targets=["proj.lib.fn"]
+        ),
+        "importer.py": ManifestEntry(
+            "h2",
+            1,
+            1,
+            cs.SupportedLanguage.PYTHON,
+            import_mapping={"proj.importer": {"Thing": "proj.lib.Thing"}},
+        ),
+        "notes.md": ManifestEntry("h3", 1, 1),
+    }
+    candidates = list(manifest.files)
+
+    assert find_dependents(manifest, candidates, {"proj.lib.fn"}) == ["caller.py"]
+    assert find_dependents(manifest, candidates, {"proj.lib"}) == ["importer.py"]
+    assert (
+        find_dependents(manifest, candidates, {"proj.lib.fn"}, imports_only=True) == []
+    )
+
+
+def test_ast_cache_loader_parses_on_miss(tmp_path: Path) -> None:
+    """Only get_or_load falls back to the loader; membership checks stay pure."""
+    loaded: list[Path] = []
+    node = MagicMock()
+
+    def loader(path: Path) -> tuple[MagicMock, cs.SupportedLanguage] | None:
+        loaded.append(path)
+        return (node, cs.SupportedLanguage.PYTHON) if path.suffix == ".py" else None
+
+    cache = BoundedASTCache(max_entries=10, loader=loader)
+
+    assert tmp_path / "a.py" not in cache
+    assert not loaded and cache.stats.misses == 0
+
+    assert cache.get_or_load(tmp_path / "a.py") == (node, cs.SupportedLanguage.PYTHON)
+    assert tmp_path / "a.py" in cache
+    assert cache[tmp_path / "a.py"] == (node, cs.SupportedLanguage.PYTHON)
+    assert cache.get_or_load(tmp_path / "b.md") is None
+    assert loaded == [tmp_path / "a.py", tmp_path / "b.md"]
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.reparses) == (1, 2, 1)
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=cgr", "-c", "user.email=cgr@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_update_fingerprints_only_listed_paths(
+    sample_repo: Path, proto_updater: ProtoUpdaterFactory, tmp_path: Path
+) -> None:
+    """Files left out of an update keep their manifest entry, even if touched."""
+    out_dir = tmp_path / "out"
+    proto_updater(out_dir).run()
+    helpers = sample_repo / "pkg" / "helpers.py"
+    helpers.write_text(
+        "def normalize(value):\n    return value\n\ndef clean():\n    pass\n",
+        encoding="utf-8",
+    )
+    models = sample_repo / "pkg" / "models.py"
+    models.write_text("class Account:\n    pass\n", encoding="utf-8")
+    touch_later(helpers)
+    touch_later(models)
+
+    proto_updater(out_dir).update([helpers])
+
+    nodes, _ = _graph(out_dir)
+    project = sample_repo.name
+    assert (cs.ONEOF_FUNCTION, f"{project}.pkg.helpers.clean") in nodes
+    assert (cs.ONEOF_CLASS, f"{project}.pkg.models.User") in nodes
+    assert (cs.ONEOF_CLASS, f"{project}.pkg.models.Account") not in nodes
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_update_since_revision_matches_full_rebuild(
+    sample_repo: Path, proto_updater: ProtoUpdaterFactory, tmp_path: Path
+) -> None:
+    """Updating from git diff output yields the same graph as a full rebuild."""
+    _git(sample_repo, "init", "-q")
+    _git(sample_repo, "add", ".")
+    _git(sample_repo, "commit", "-q", "-m", "base")
+    out_dir = tmp_path / "update"
+    proto_updater(out_dir).run()
+
+    (sample_repo / "pkg" / "helpers.py").write_text(
+        "def normalize(value):\n    return value.lower()\n", encoding="utf-8"
+    )
+    _git(sample_repo, "mv", "pkg/models.py", "pkg/entities.py")
+    (sample_repo / "pkg" / "service.py").write_text(
+        "from pkg.entities import User\n\ndef run():\n    User().greet()\n",
+        encoding="utf-8",
+    )
+    (sample_repo / "README.md").unlink()
+    _git(sample_repo, "add", "-A")
+    _git(sample_repo, "commit", "-q", "-m", "change")
+
+    changed = git_changed_paths(sample_repo, "HEAD~1")
+    assert sorted(path.relative_to(sample_repo).as_posix() for path in changed) == [
+        "README.md",
+        "pkg/entities.py",
+        "pkg/helpers.py",
+        "pkg/models.py",
+        "pkg/service.py",
+    ]
+    proto_updater(out_dir).update(changed)
+    full_dir = tmp_path / "full"
+    proto_updater(full_dir, manifest=False).run()
+
+    nodes, rels = _graph(out_dir)
+    assert (nodes, rels) == _graph(full_dir)
+    assert (cs.ONEOF_CLASS, f"{sample_repo.name}.pkg.entities.User") in nodes
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag import constants as cs
+from codebase_rag.cypher_queries import (
+    build_delete_nodes_by_qn_query,
+    build_delete_outgoing_by_qn_query,
+    build_shift_lines_by_qn_query,
+)
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.parser_loader import load_parsers
+from codebase_rag.parsers.incremental import (
+    mask_source,
+    reparse,
+    source_edit,
+    top_level_patch,
+)
+from codebase_rag.types_defs import FileChange, SourceTree
+from realtime_updater import CodeChangeEventHandler
+
+SOURCE = """import os
+
+
+def first():
+    return os.getcwd()
+
+
+class Service:
+    def run(self):
+        return first()
+
+
+def last():
+    return Service().run()
+"""
+
+
+def _patch(old: str, new: str):
+    parsers, queries = load_parsers()
+    parser = parsers[cs.SupportedLanguage.PYTHON]
+    spec = queries[cs.SupportedLanguage.PYTHON][cs.QUERY_CONFIG]
+    previous = SourceTree(old.encode(), parser.parse(old.encode()))
+    tree, edit = reparse(parser, previous, new.encode())
+    return top_level_patch(previous, tree, new.encode(), edit, spec)
+
+
+def test_source_edit_spans_only_the_changed_bytes() -> None:
+    old = b"a" * 10_000 + b"middle" + b"z" * 10_000
+    new = b"a" * 10_000 + b"centre!" + b"z" * 10_000
+
+    edit = source_edit(old, new)
+
+    assert (edit.start_byte, edit.old_end_byte, edit.new_end_byte) == (
+        10_000,
+        10_006,
+        10_007,
+    )
+    assert source_edit(b"same", b"same") == (4, 4, 4)
+    assert source_edit(b"ab", b"aab") == (1, 1, 2)
+
+
+def test_mask_source_keeps_offsets_and_lines() -> None:
+    parsers, _ = load_parsers()
+    source = SOURCE.encode()
+    root = parsers[cs.SupportedLanguage.PYTHON].parse(source).root_node
+
+    masked = mask_source(source, [root.children[1]])
+
+    assert len(masked) == len(source)
+    assert masked.count(b"\n") == source.count(b"\n")
+    assert b"first" not in masked.split(b"class")[0]
+    assert masked[root.children[2].start_byte :].startswith(b"class Service")
+
+
+def test_body_edit_patches_the_enclosing_definition() -> None:
+    new = SOURCE.replace(
+        "        return first()", "        value = first()\n        return value"
+    )
+
+    patch = _patch(SOURCE, new)
+
+    assert patch is not None
+    assert patch.changed_names == ["Service"]
+    assert patch.shifted_names == ["last"]
+    assert patch.line_delta == 1
+    assert b"def first" not in patch.masked_source
+    assert b"def last" not in patch.masked_source
+    assert b"class Service" in patch.masked_source
+
+
+@pytest.mark.parametrize(
+    "new",
+    [
+        SOURCE.replace("import os", "import sys"),
+        SOURCE.replace("def last", "def final"),
+        SOURCE.replace("def last", "class last"),
+        SOURCE + "\n\nVALUE = 1\n",
+        SOURCE + "\n\ndef first():\n    pass\n",
+    ],
+    ids=["import", "rename", "kind", "statement", "duplicate"],
+)
+def test_edits_outside_whole_definitions_are_not_patched(new: str) -> None:
+    assert _patch(SOURCE, new) is None
+
+
+@pytest.fixture
+def updater(tmp_path: Path, mock_ingestor: MagicMock) -> GraphUpdater:
+    (tmp_path / "app.py").write_text(SOURCE, encoding="utf-8")
+    parsers, queries = load_parsers()
+    updater = GraphUpdater(
+        ingestor=mock_ingestor,
+        repo_path=tmp_path,
+        parsers=parsers,
+        queries=queries,
+        streaming=False,
+        track_dependencies=True,
+        incremental_parse=True,
+    )
+    updater.run()
+    return updater
+
+
+def test_patch_file_reextracts_only_changed_definitions(
+    updater: GraphUpdater, tmp_path: Path
+) -> None:
+    path = tmp_path / "app.py"
+    project = tmp_path.name
+    path.write_text(
+        SOURCE.replace(
+            "    def run(self):\n        return first()",
+            "    def start(self):\n        pass\n\n    def run(self):\n        return 1",
+        ),
+        encoding="utf-8",
+    )
+    ingestor = updater.ingestor
+    ingestor.reset_mock()
+
+    patch = updater.patch_file(path)
+
+    assert patch is not None
+    assert patch.reset == {
+        cs.NodeLabel.CLASS: [f"{project}.app.Service"],
+        cs.NodeLabel.METHOD: [f"{project}.app.Service.run"],
+    }
+    assert patch.deleted == {}
+    assert patch.shifted == {cs.NodeLabel.FUNCTION: [f"{project}.app.last"]}
+    assert patch.line_delta == 3
+    assert f"{project}.app.Service.start" in updater.function_registry
+    ingested = {
+        call.args[1][cs.KEY_QUALIFIED_NAME]
+        for call in ingestor.ensure_node_batch.call_args_list
+        if cs.KEY_QUALIFIED_NAME in call.args[1]
+    }
+    assert {
+        f"{project}.app.Service",
+        f"{project}.app.Service.start",
+        f"{project}.app.Service.run",
+    } <= ingested
+    assert f"{project}.app.first" not in ingested
+    assert f"{project}.app.last" not in ingested
+
+
+def test_watcher_applies_patch_without_deleting_module(
+    updater: GraphUpdater, tmp_path: Path
+) -> None:
+    path = tmp_path / "app.py"
+    project = tmp_path.name
+    path.write_text(
+        SOURCE.replace(
+            "def first():\n    return os.getcwd()", "def first():\n    x = 1"
+        ),
+        encoding="utf-8",
+    )
+    ingestor = updater.ingestor
+    ingestor.reset_mock()
+
+    CodeChangeEventHandler(updater).apply_changes(
+        [FileChange(path, cs.EventType.MODIFIED)]
+    )
+
+    queries = [call.args[0] for call in ingestor.execute_write.call_args_list]
+    assert cs.CYPHER_DELETE_MODULE not in queries
+    assert queries[0] == build_delete_outgoing_by_qn_query(cs.NodeLabel.FUNCTION)
+    assert build_delete_nodes_by_qn_query(cs.NodeLabel.FUNCTION) not in queries
+    assert build_shift_lines_by_qn_query(cs.NodeLabel.FUNCTION) not in queries
+    assert ingestor.execute_write.call_args_list[0].args[1] == {
+        cs.KEY_QUALIFIED_NAMES: [f"{project}.app.first"]
+    }
+    ingestor.flush_all.assert_called_once()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag import constants as cs
+from codebase_rag.parser_loader import load_parsers
+from codebase_rag.parsers.java.type_inference import JavaTypeInferenceEngine
+from codebase_rag.types_defs import NodeType
+
+JAVA_SOURCE = b"""
+package com.example;
+
+public class Service extends Base<String> implements Runnable, Cloneable {
+    public Service() {}
+    public Widget build() { return new Widget(); }
+    public Widget build(int size) { return new Widget(); }
+    public void run() {}
+
+    static class Helper extends Tool {
+        public Gadget build() { return null; }
+    }
+}
+
+class Other {
+    public int build() { return 0; }
+}
+"""
+
+FILE_PATH = Path("/repo/src/main/java/com/example/Service.java")
+
+
+@pytest.fixture
+def engine() -> JavaTypeInferenceEngine:
+    parsers, _ = load_parsers()
+    root = parsers[cs.SupportedLanguage.JAVA].parse(JAVA_SOURCE).root_node
+    ast_cache = MagicMock()
+    ast_cache.get_or_load = MagicMock(
+        side_effect=lambda path: (root, cs.SupportedLanguage.JAVA)
+        if path == FILE_PATH
+        else None
+    )
+    registry = MagicMock()
+    registry.__contains__ = MagicMock(return_value=False)
+    registry.find_with_prefix = MagicMock(
+        return_value=[
+            ("com.example.Service.Service()", cs.ENTITY_CONSTRUCTOR),
+            ("com.example.Service.build()", NodeType.METHOD),
+            ("com.example.Service.build(int)", NodeType.METHOD),
+            ("com.example.Service.Helper.build()", NodeType.METHOD),
+            ("com.example.ServiceImpl.run()", NodeType.METHOD),
+        ]
+    )
+    return JavaTypeInferenceEngine(
+        import_processor=MagicMock(import_mapping={}),
+        function_registry=registry,
+        repo_path=Path("/repo"),
+        project_name="repo",
+        ast_cache=ast_cache,
+        queries={},
+        module_qn_to_file_path={"com.example": FILE_PATH},
+        class_inheritance={},
+        simple_name_lookup=defaultdict(set),
+    )
+
+
+def test_class_index_records_supertypes_and_return_types(
+    engine: JavaTypeInferenceEngine,
+) -> None:
+    classes = engine._java_classes("com.example")
+
+    assert set(classes) == {"Service", "Helper", "Other"}
+    assert classes["Service"].superclass == "Base"
+    assert classes["Service"].interfaces == ("Runnable", "Cloneable")
+    assert classes["Service"].return_types == {"build": "Widget", "run": "void"}
+    assert engine._get_superclass_name("com.example.Helper") == "Tool"
+    assert engine._find_method_return_type("com.example.Other", "build") == "int"
+    assert engine._find_method_return_type("com.example.Helper", "build") == "Gadget"
+    assert engine._find_method_return_type("com.example.Service", "missing") is None
+    assert engine._java_classes("com.example") is classes
+
+
+def test_members_are_indexed_once_per_class(engine: JavaTypeInferenceEngine) -> None:
+    registry = engine.function_registry
+
+    assert engine._search_method_in_class("com.example.Service", "build") == (
+        NodeType.METHOD,
+        "com.example.Service.build()",
+    )
+    assert engine._search_method_in_class("com.example.Service", "Service") == (
+        cs.ENTITY_CONSTRUCTOR,
+        "com.example.Service.Service()",
+    )
+    assert engine._search_method_in_class("com.example.Service", "run") is None
+    assert engine._search_method_in_class("com.example.Service", "Helper") is None
+    assert registry.find_with_prefix.call_count == 1
+
+    engine.clear_caches()
+    engine._search_method_in_class("com.example.Service", "build")
+    assert registry.find_with_prefix.call_count == 2
+    assert not engine._class_index
+
+
+def test_module_callables_keep_first_overload(engine: JavaTypeInferenceEngine) -> None:
+    assert engine._resolve_static_or_local_method("build", "com.example") == (
+        NodeType.METHOD,
+        "com.example.Service.build()",
+    )
+    assert engine._resolve_static_or_local_method("run", "com.example") == (
+        NodeType.METHOD,
+        "com.example.ServiceImpl.run()",
+    )
+    assert engine._resolve_static_or_local_method("nope", "com.example") is None
+    assert engine.function_registry.find_with_prefix.call_count == 1
@@ -31,8 +31,7 @@ def mock_function_registry() -> MagicMock:
 @pytest.fixture
 def mock_ast_cache() -> MagicMock:
     cache = MagicMock()
-    cache.__contains__ = MagicMock(return_value=False)
-    cache.__getitem__ = MagicMock(return_value=(None, None))
+    cache.get_or_load = MagicMock(return_value=None)
     return cache
 
 
@@ -548,8 +547,9 @@ class TestJavaTypeResolverAstMethods:
 
         file_path = Path("/test/MyClass.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, None))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, None) if x == file_path else None
+        )
 
         result = type_inference_engine._get_superclass_name("com.example.MyClass")
         assert result == "ParentClass"
@@ -568,8 +568,9 @@ class TestJavaTypeResolverAstMethods:
 
         file_path = Path("/test/MyClass.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, None))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, None) if x == file_path else None
+        )
 
         result = type_inference_engine._get_superclass_name("com.example.MyClass")
         assert result is None
@@ -581,7 +582,7 @@ class TestJavaTypeResolverAstMethods:
     ) -> None:
         file_path = Path("/test/MyClass.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(return_value=False)
+        mock_ast_cache.get_or_load = MagicMock(return_value=None)
 
         result = type_inference_engine._get_superclass_name("com.example.MyClass")
         assert result is None
@@ -669,8 +670,9 @@ class TestJavaTypeResolverAstMethods:
 
         file_path = Path("/test/MyClass.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, None))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, None) if x == file_path else None
+        )
 
         result = type_inference_engine._get_implemented_interfaces(
             "com.example.MyClass"
@@ -691,8 +693,9 @@ class TestJavaTypeResolverAstMethods:
 
         file_path = Path("/test/MyClass.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, None))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, None) if x == file_path else None
+        )
 
         result = type_inference_engine._get_implemented_interfaces(
             "com.example.MyClass"
@@ -719,8 +722,9 @@ class TestJavaTypeResolverAstMethods:
 
         file_path = Path("/test/MyService.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, None))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, None) if x == file_path else None
+        )
 
         result = type_inference_engine._get_current_class_name("com.example")
         assert result == "com.example.MyService"
@@ -739,8 +743,9 @@ class TestJavaTypeResolverAstMethods:
 
         file_path = Path("/test/MyInterface.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, None))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, None) if x == file_path else None
+        )
 
         result = type_inference_engine._get_current_class_name("com.example")
         assert result == "com.example.MyInterface"
@@ -759,8 +764,9 @@ class TestJavaTypeResolverAstMethods:
 
         file_path = Path("/test/Status.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, None))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, None) if x == file_path else None
+        )
 
         result = type_inference_engine._get_current_class_name("com.example")
         assert result == "com.example.Status"
@@ -775,8 +781,9 @@ class TestJavaTypeResolverAstMethods:
 
         file_path = Path("/test/package-info.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, None))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, None) if x == file_path else None
+        )
 
         result = type_inference_engine._get_current_class_name("com.example")
         assert result is None
@@ -52,8 +52,7 @@ def mock_function_registry() -> MagicMock:
 @pytest.fixture
 def mock_ast_cache() -> MagicMock:
     cache = MagicMock()
-    cache.__contains__ = MagicMock(return_value=False)
-    cache.__getitem__ = MagicMock(return_value=(None, None))
+    cache.get_or_load = MagicMock(return_value=None)
     return cache
 
 
@@ -100,8 +99,9 @@ public class Child extends Parent {
 
         file_path = Path("/test/Child.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, java_code))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, java_code) if x == file_path else None
+        )
 
         result = type_inference_engine._get_superclass_name("com.example.Child")
         assert result == "Parent"
@@ -124,8 +124,9 @@ public class Simple {
 
         file_path = Path("/test/Simple.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, java_code))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, java_code) if x == file_path else None
+        )
 
         result = type_inference_engine._get_superclass_name("com.example.Simple")
         assert result is None
@@ -150,8 +151,9 @@ public class MyList extends ArrayList<String> {
 
         file_path = Path("/test/MyList.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, java_code))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, java_code) if x == file_path else None
+        )
 
         result = type_inference_engine._get_superclass_name("com.example.MyList")
         assert result == "ArrayList"
@@ -177,8 +179,9 @@ public class Worker implements Runnable {
 
         file_path = Path("/test/Worker.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, java_code))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, java_code) if x == file_path else None
+        )
 
         result = type_inference_engine._get_implemented_interfaces("com.example.Worker")
         assert "Runnable" in result
@@ -208,8 +211,9 @@ public class Data implements Serializable, Comparable<Data>, Cloneable {
 
         file_path = Path("/test/Data.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, java_code))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, java_code) if x == file_path else None
+        )
 
         result = type_inference_engine._get_implemented_interfaces("com.example.Data")
         assert "Serializable" in result
@@ -233,8 +237,9 @@ public class Plain {
 
         file_path = Path("/test/Plain.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, java_code))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, java_code) if x == file_path else None
+        )
 
         result = type_inference_engine._get_implemented_interfaces("com.example.Plain")
         assert result == []
@@ -257,8 +262,9 @@ public class MyService {
 
         file_path = Path("/test/MyService.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, java_code))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, java_code) if x == file_path else None
+        )
 
         result = type_inference_engine._get_current_class_name("com.example")
         assert result == "com.example.MyService"
@@ -282,8 +288,9 @@ public interface Repository {
 
         file_path = Path("/test/Repository.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, java_code))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, java_code) if x == file_path else None
+        )
 
         result = type_inference_engine._get_current_class_name("com.example")
         assert result == "com.example.Repository"
@@ -308,8 +315,9 @@ public enum Status {
 
         file_path = Path("/test/Status.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, java_code))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, java_code) if x == file_path else None
+        )
 
         result = type_inference_engine._get_current_class_name("com.example")
         assert result == "com.example.Status"
@@ -373,8 +381,9 @@ public class Employee extends Person implements Comparable<Employee>, Serializab
 
         file_path = Path("/test/Employee.java")
         type_inference_engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(side_effect=lambda x: x == file_path)
-        mock_ast_cache.__getitem__ = MagicMock(return_value=(root_node, java_code))
+        mock_ast_cache.get_or_load = MagicMock(
+            side_effect=lambda x: (root_node, java_code) if x == file_path else None
+        )
 
         superclass = type_inference_engine._get_superclass_name("com.example.Employee")
         assert superclass == "Person"
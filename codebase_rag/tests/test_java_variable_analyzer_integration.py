@@ -52,8 +52,7 @@ def mock_function_registry() -> MagicMock:
 @pytest.fixture
 def mock_ast_cache() -> MagicMock:
     cache = MagicMock()
-    cache.__contains__ = MagicMock(return_value=False)
-    cache.__getitem__ = MagicMock(return_value=(None, None))
+    cache.get_or_load = MagicMock(return_value=None)
     return cache
 
 
@@ -30,8 +30,7 @@ def mock_function_registry() -> MagicMock:
 @pytest.fixture
 def mock_ast_cache() -> MagicMock:
     cache = MagicMock()
-    cache.__contains__ = MagicMock(return_value=False)
-    cache.__getitem__ = MagicMock(return_value=(None, None))
+    cache.get_or_load = MagicMock(return_value=None)
     return cache
 
 
@@ -764,7 +763,7 @@ class TestDoVariableTypeLookup:
     ) -> None:
         file_path = Path("/test/Example.java")
         engine.module_qn_to_file_path = {"com.example": file_path}
-        mock_ast_cache.__contains__ = MagicMock(return_value=False)
+        mock_ast_cache.get_or_load = MagicMock(return_value=None)
 
         result = engine._do_variable_type_lookup("varName", "com.example")
 
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag import constants as cs
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.parser_loader import load_parsers
+from codebase_rag.parsers.js_ts.utils import find_method_in_ast, index_methods_in_ast
+from codebase_rag.parsers.py.type_inference import PythonTypeInferenceEngine
+
+PY_SOURCE = """
+class Builder:
+    def create(self):
+        return Widget()
+
+    def reset(self):
+        def create():
+            return None
+        return self
+
+class Widget:
+    class Inner:
+        def create(self):
+            return Builder()
+
+class Builder:
+    def late(self):
+        return Widget()
+"""
+
+JS_SOURCE = """
+class Shape {
+  area() { return 0; }
+  area() { return 1; }
+}
+class Empty;
+class Shape {
+  perimeter() { return 2; }
+}
+class Circle extends Shape {
+  constructor() { super(); }
+  area() { return new Circle(); }
+}
+"""
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> PythonTypeInferenceEngine:
+    (tmp_path / "shapes.py").write_text(PY_SOURCE, encoding="utf-8")
+    (tmp_path / "shapes.js").write_text(JS_SOURCE, encoding="utf-8")
+    parsers, queries = load_parsers()
+    updater = GraphUpdater(
+        ingestor=MagicMock(),
+        repo_path=tmp_path,
+        parsers=parsers,
+        queries=queries,
+    )
+    updater.run()
+    return updater.factory.type_inference.python_type_inference
+
+
+def _method_text(engine: PythonTypeInferenceEngine, method_qn: str) -> str | None:
+    node = engine._find_method_ast_node(method_qn)
+    return node.text.decode() if node and node.text else None
+
+
+def test_python_lookups_share_one_index_per_file(
+    engine: PythonTypeInferenceEngine, tmp_path: Path
+) -> None:
+    project = tmp_path.name
+    create = _method_text(engine, f"{project}.shapes.Builder.create")
+    nested = _method_text(engine, f"{project}.shapes.Widget.create")
+    late = _method_text(engine, f"{project}.shapes.Builder.late")
+
+    assert create is not None and create.startswith("def create(self):")
+    assert "Widget()" in create
+    assert nested is not None and "Builder()" in nested
+    assert late is not None and late.startswith("def late")
+    assert _method_text(engine, f"{project}.shapes.Widget.missing") is None
+    assert list(engine._method_spans) == [tmp_path / "shapes.py"]
+
+
+def test_js_index_matches_per_method_search(engine: PythonTypeInferenceEngine) -> None:
+    parsers, _ = load_parsers()
+    root = parsers[cs.SupportedLanguage.JS].parse(JS_SOURCE.encode()).root_node
+
+    index = index_methods_in_ast(root)
+
+    for class_name in ("Shape", "Circle", "Empty", "Missing"):
+        for method_name in ("area", "perimeter", "constructor"):
+            assert index.get((class_name, method_name)) == find_method_in_ast(
+                root, class_name, method_name
+            )
+    assert ("Shape", "perimeter") not in index
+
+
+def test_return_types_are_memoized_until_cleared(
+    engine: PythonTypeInferenceEngine, tmp_path: Path
+) -> None:
+    method_qn = f"{tmp_path.name}.shapes.Builder.create"
+    engine._method_return_type_cache.clear()
+    engine._analyze_method_return_statements = MagicMock(  # type: ignore[method-assign]
+        return_value="Widget"
+    )
+
+    assert engine._get_method_return_type_from_ast(method_qn) == "Widget"
+    assert engine._get_method_return_type_from_ast(method_qn) == "Widget"
+    assert engine._analyze_method_return_statements.call_count == 1
+
+    engine.clear_caches()
+    assert not engine._method_spans
+    assert engine._get_method_return_type_from_ast(method_qn) == "Widget"
+    assert engine._analyze_method_return_statements.call_count == 2
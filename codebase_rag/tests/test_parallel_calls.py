@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag import constants as cs
+from codebase_rag import parallel
+from codebase_rag.services.graph_service import MemgraphIngestor
+from codebase_rag.tests.conftest import UpdaterFactory, get_relationships
+
+pytestmark = pytest.mark.skipif(
+    not parallel.fork_available(), reason="fork start method not available"
+)
+
+
+def _calls(ingestor: MagicMock) -> list:
+    return get_relationships(ingestor, cs.RelationshipType.CALLS)
+
+
+def test_parallel_call_pass_matches_serial_edge_for_edge(
+    sample_repo: Path, build_updater: UpdaterFactory
+) -> None:
+    """Forked call resolution emits the serial CALLS edges in the same order."""
+    ingestor = MagicMock(spec=MemgraphIngestor)
+    updater = build_updater(sample_repo, ingestor, workers=1)
+    updater.factory.structure_processor.identify_structure()
+    updater._process_files()
+    cached_order = [path for path, _ in updater.ast_cache.items()]
+
+    updater._process_function_calls()
+    serial_calls = _calls(ingestor)
+
+    for path in cached_order:
+        updater.ast_cache[path]
+    ingestor.reset_mock()
+    updater.workers = 2
+    updater._process_function_calls()
+    parallel_calls = _calls(ingestor)
+
+    assert serial_calls
+    assert parallel_calls == serial_calls
+
+
+def test_parallel_call_pass_leaves_snapshot_cleared(
+    sample_repo: Path, build_updater: UpdaterFactory
+) -> None:
+    """The shared call snapshot is dropped and the real ingestor restored."""
+    ingestor = MagicMock(spec=MemgraphIngestor)
+    updater = build_updater(sample_repo, ingestor, workers=1)
+    updater.workers = 2
+
+    updater.run()
+
+    assert parallel._call_snapshot is None
+    assert updater.factory.call_processor.ingestor is ingestor
+    assert _calls(ingestor)
+
+
+def test_falls_back_to_serial_without_fork(
+    sample_repo: Path,
+    build_updater: UpdaterFactory,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Without the fork start method the call pass never starts a pool."""
+    ingestor = MagicMock(spec=MemgraphIngestor)
+    updater = build_updater(sample_repo, ingestor, workers=1)
+    updater.factory.structure_processor.identify_structure()
+    updater._process_files()
+    updater.workers = 2
+    monkeypatch.setattr("codebase_rag.graph_updater.fork_available", lambda: False)
+    pool = MagicMock()
+    monkeypatch.setattr("codebase_rag.graph_updater.ProcessPoolExecutor", pool)
+
+    updater._process_function_calls()
+
+    pool.assert_not_called()
+    assert _calls(ingestor)
+
+
+def test_resolve_file_calls_requires_snapshot() -> None:
+    """Workers refuse to resolve calls before a snapshot is installed."""
+    with pytest.raises(RuntimeError):
+        parallel.resolve_file_calls(Path("missing.py"))
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag import constants as cs
+from codebase_rag.config import AppConfig
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.parallel import (
+    RowRecordingIngestor,
+    _DefinitionWorker,
+    parallel_chunk_size,
+    replay_rows,
+)
+from codebase_rag.services.graph_service import MemgraphIngestor
+from codebase_rag.tests.conftest import UpdaterFactory
+from codebase_rag.types_defs import ImportsRow, RelationshipRow
+
+
+def _call_set(mock_method: MagicMock) -> set[str]:
+    return {repr(c) for c in mock_method.call_args_list}
+
+
+def _site_sets(updater: GraphUpdater) -> dict[Path, set]:
+    return {
+        path: {
+            (caller.qualified_name, frozenset(caller.sites)) for caller in sites.callers
+        }
+        for path, sites in updater._call_sites.items()
+    }
+
+
+def _run(
+    build_updater: UpdaterFactory, repo: Path, workers: int
+) -> tuple[GraphUpdater, MagicMock]:
+    ingestor = MagicMock(spec=MemgraphIngestor)
+    updater = build_updater(repo, ingestor, workers=workers)
+    updater.run()
+    return updater, ingestor
+
+
+def test_parallel_pass_matches_serial_graph(
+    sample_repo: Path, build_updater: UpdaterFactory
+) -> None:
+    """Worker processes produce the same nodes, edges and registries as one process."""
+    serial, serial_ingestor = _run(build_updater, sample_repo, workers=1)
+    parallel, parallel_ingestor = _run(build_updater, sample_repo, workers=2)
+
+    assert _call_set(parallel_ingestor.ensure_node_batch) == _call_set(
+        serial_ingestor.ensure_node_batch
+    )
+    assert _call_set(parallel_ingestor.ensure_relationship_batch) == _call_set(
+        serial_ingestor.ensure_relationship_batch
+    )
+    assert dict(parallel.function_registry.items()) == dict(
+        serial.function_registry.items()
+    )
+    assert parallel.simple_name_lookup == serial.simple_name_lookup
+    assert (
+        parallel.factory.import_processor.import_mapping
+        == serial.factory.import_processor.import_mapping
+    )
+    assert (
+        parallel.factory.definition_processor.class_inheritance
+        == serial.factory.definition_processor.class_inheritance
+    )
+    assert _site_sets(parallel) == _site_sets(serial)
+
+
+def _inherits_set(ingestor: MagicMock) -> set[tuple[str, str, str]]:
+    return {
+        (str(c.args[1]), str(c.args[0][2]), str(c.args[2][2]))
+        for c in ingestor.ensure_relationship_batch.call_args_list
+        if c.args[1] in (cs.RelationshipType.INHERITS, cs.RelationshipType.IMPLEMENTS)
+    }
+
+
+def test_parallel_pass_resolves_parents_from_other_files(
+    temp_repo: Path, build_updater: UpdaterFactory
+) -> None:
+    """Parents defined in another file without an import resolve as in a serial run."""
+    package = temp_repo / "src" / "com" / "example"
+    package.mkdir(parents=True)
+    (package / "Alpha.java").write_text(
+        "package com.example;\npublic interface Alpha { void go(); }\n",
+        encoding="utf-8",
+    )
+    (package / "Base.java").write_text(
+        "package com.example;\npublic class Base { }\n", encoding="utf-8"
+    )
+    (package / "Mid.java").write_text(
+        "package com.example;\n"
+        "public class Mid extends Base implements Alpha { public void go() { } }\n",
+        encoding="utf-8",
+    )
+    pkg = temp_repo / "pkg"
+    pkg.mkdir()
+    (pkg / "a.py").write_text("class Shared:\n    pass\n", encoding="utf-8")
+    (pkg / "b.py").write_text(
+        "class Child(Shared):\n    pass\n\n"
+        "class Early(Late):\n    pass\n\n"
+        "class Late:\n    pass\n",
+        encoding="utf-8",
+    )
+
+    serial, serial_ingestor = _run(build_updater, temp_repo, workers=1)
+    parallel, parallel_ingestor = _run(build_updater, temp_repo, workers=2)
+
+    java = f"{temp_repo.name}.src.com.example"
+    assert (
+        str(cs.RelationshipType.INHERITS),
+        f"{java}.Mid.Mid",
+        f"{java}.Base.Base",
+    ) in _inherits_set(serial_ingestor)
+    assert _inherits_set(parallel_ingestor) == _inherits_set(serial_ingestor)
+    assert (
+        parallel.factory.definition_processor.class_inheritance
+        == serial.factory.definition_processor.class_inheritance
+    )
+
+
+def test_worker_defers_import_relationships(sample_repo: Path) -> None:
+    """Workers record IMPORTS as a row to replay instead of resolving them."""
+    service_file = sample_repo / "pkg" / "service.py"
+
+    worker = _DefinitionWorker(sample_repo, sample_repo.name, {})
+    definitions = worker.extract(service_file, cs.SupportedLanguage.PYTHON)
+
+    module_qn = f"{sample_repo.name}.pkg.service"
+    assert definitions.parsed
+    assert ImportsRow(module_qn, cs.SupportedLanguage.PYTHON) in definitions.rows
+    assert not any(
+        isinstance(row, RelationshipRow) and row.rel_type == cs.RelationshipType.IMPORTS
+        for row in definitions.rows
+    )
+    assert definitions.import_mapping[module_qn] == {
+        "User": f"{sample_repo.name}.pkg.models.User",
+        "normalize": f"{sample_repo.name}.pkg.helpers.normalize",
+    }
+    assert definitions.module_qns == [module_qn]
+
+
+def test_replay_rows_preserves_call_shape() -> None:
+    """Replayed rows keep their positional arguments and optional properties."""
+    recorder = RowRecordingIngestor()
+    recorder.ensure_node_batch("Module", {"qualified_name": "proj.mod"})
+    recorder.ensure_relationship_batch(
+        ("Module", "qualified_name", "proj.mod"),
+        "DEFINES",
+        ("Function", "qualified_name", "proj.mod.fn"),
+    )
+    recorder.ensure_relationship_batch(
+        ("Project", "name", "proj"),
+        "DEPENDS_ON_EXTERNAL",
+        ("ExternalPackage", "name", "requests"),
+        {"version_spec": ">=2"},
+    )
+    ingestor = MagicMock(spec=MemgraphIngestor)
+
+    replay_rows(recorder.rows, ingestor, MagicMock())
+
+    ingestor.ensure_node_batch.assert_called_once_with(
+        "Module", {"qualified_name": "proj.mod"}
+    )
+    first, second = ingestor.ensure_relationship_batch.call_args_list
+    assert len(first.args) == 3
+    assert second.args[3] == {"version_spec": ">=2"}
+
+
+@pytest.mark.parametrize(
+    ("file_count", "workers", "expected"),
+    [(0, 4, 1), (10, 4, 1), (320, 4, 20), (100_000, 8, cs.PARALLEL_MAX_CHUNK_SIZE)],
+)
+def test_parallel_chunk_size_bounds(
+    file_count: int, workers: int, expected: int
+) -> None:
+    """Chunks grow with the file count per worker and stay within bounds."""
+    assert parallel_chunk_size(file_count, workers) == expected
+
+
+def test_resolve_workers_defaults_and_validates() -> None:
+    """The worker count falls back to the setting and rejects zero."""
+    config = AppConfig(INDEX_WORKERS=3)
+
+    assert config.resolve_workers(None) == 3
+    assert config.resolve_workers(5) == 5
+    with pytest.raises(ValueError):
+        config.resolve_workers(0)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+from contextlib import nullcontext
+from pathlib import Path
+
+import pytest
+
+from codebase_rag import constants as cs
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.parser_loader import load_parsers
+from codebase_rag.profiling import (
+    active_profiler,
+    profile_span,
+    profiling_session,
+)
+from codebase_rag.services.protobuf_service import ProtobufFileIngestor
+
+
+@pytest.fixture
+def profiled_repo(temp_repo: Path) -> Path:
+    (temp_repo / "helpers.py").write_text(
+        "def helper():\n    return 1\n", encoding="utf-8"
+    )
+    (temp_repo / "main.py").write_text(
+        "from helpers import helper\n\n"
+        "class Service:\n"
+        "    def run(self):\n"
+        "        return helper()\n\n"
+        "def entry():\n"
+        "    service = Service()\n"
+        "    return service.run()\n",
+        encoding="utf-8",
+    )
+    (temp_repo / "app.js").write_text(
+        "function greet() { return 1; }\ngreet();\n", encoding="utf-8"
+    )
+    return temp_repo
+
+
+def _index(repo: Path, output: Path, workers: int = 1) -> None:
+    parsers, queries = load_parsers()
+    GraphUpdater(
+        ingestor=ProtobufFileIngestor(output_path=str(output)),
+        repo_path=repo,
+        parsers=parsers,
+        queries=queries,
+        workers=workers,
+    ).run()
+
+
+def test_json_report_covers_passes_files_resolver_and_flushes(
+    profiled_repo: Path, tmp_path: Path
+) -> None:
+    report_path = tmp_path / "profile.json"
+
+    with profiling_session(report_path):
+        _index(profiled_repo, tmp_path / "out")
+
+    report = json.loads(report_path.read_text(encoding="utf-8"))
+    assert active_profiler() is None
+    assert {
+        cs.PROFILE_PASS_STRUCTURE,
+        cs.PROFILE_PASS_DEFINITIONS,
+        cs.PROFILE_PASS_CALLS,
+        cs.PROFILE_PASS_FLUSH,
+    } <= report[cs.PROFILE_KEY_PASSES].keys()
+    assert (
+        report[cs.PROFILE_KEY_LANGUAGES][cs.SupportedLanguage.PYTHON][
+            cs.PROFILE_KEY_FILES
+        ]
+        == 2
+    )
+    slowest = {
+        entry[cs.PROFILE_ARG_PATH]: entry
+        for entry in report[cs.PROFILE_KEY_SLOWEST_FILES]
+    }
+    assert {"main.py", "helpers.py", "app.js"} <= slowest.keys()
+    assert cs.PROFILE_PASS_CALLS in slowest["main.py"][cs.PROFILE_KEY_PASSES]
+    assert {cs.PROFILE_STAGE_PARSE, cs.PROFILE_STAGE_IMPORTS} <= report[
+        cs.PROFILE_KEY_STAGES
+    ].keys()
+    assert "try_resolve_via_imports" in report[cs.PROFILE_KEY_RESOLVER]
+    assert [
+        batch[cs.PROFILE_KEY_NAME] for batch in report[cs.PROFILE_KEY_FLUSH_BATCHES]
+    ] == [cs.PROFILE_FLUSH_PROTOBUF]
+
+
+def test_chrome_trace_contains_complete_events(
+    profiled_repo: Path, tmp_path: Path
+) -> None:
+    trace_path = tmp_path / "trace.json"
+
+    with profiling_session(trace_path, cs.ProfileFormat.CHROME):
+        _index(profiled_repo, tmp_path / "out")
+
+    trace = json.loads(trace_path.read_text(encoding="utf-8"))
+    events = trace[cs.CHROME_TRACE_EVENTS]
+    assert events
+    assert {event[cs.CHROME_TRACE_KEY_PHASE] for event in events} == {
+        cs.CHROME_TRACE_PHASE_COMPLETE
+    }
+    assert all(event[cs.CHROME_TRACE_KEY_DURATION] >= 0 for event in events)
+    assert cs.PROFILE_KEY_PASSES in trace[cs.CHROME_TRACE_OTHER]
+
+
+def test_worker_spans_are_merged_into_parent_report(
+    profiled_repo: Path, tmp_path: Path
+) -> None:
+    with profiling_session(tmp_path / "profile.json") as profiler:
+        _index(profiled_repo, tmp_path / "out", workers=2)
+        assert profiler is not None
+        report = profiler.report()
+
+    file_events = [e for e in profiler.events if e.category == cs.ProfileCategory.FILE]
+    assert {
+        (e.name, e.args[cs.PROFILE_ARG_PATH])
+        for e in file_events
+        if e.args[cs.PROFILE_ARG_PATH] == "main.py"
+    } == {
+        (cs.PROFILE_PASS_DEFINITIONS, "main.py"),
+        (cs.PROFILE_PASS_CALLS, "main.py"),
+    }
+    assert len({e.pid for e in file_events}) > 1
+    assert report[cs.PROFILE_KEY_RESOLVER]
+
+
+def test_spans_are_noops_without_an_active_profiler() -> None:
+    assert active_profiler() is None
+    assert isinstance(
+        profile_span(cs.PROFILE_PASS_CALLS, cs.ProfileCategory.PASS), nullcontext
+    )
@@ -32,8 +32,7 @@ def mock_function_registry() -> MagicMock:
 @pytest.fixture
 def mock_ast_cache() -> MagicMock:
     cache = MagicMock()
-    cache.__contains__ = MagicMock(return_value=False)
-    cache.__getitem__ = MagicMock(return_value=(None, None))
+    cache.get_or_load = MagicMock(return_value=None)
     return cache
 
 
@@ -114,6 +113,48 @@ class TestFindBestClassMatch:
         result = engine._find_best_class_match("user", ["AppUser", "User"])
         assert result == "User"
 
+    def test_contains_match_prefers_longest_then_first(
+        self, engine: PythonTypeInferenceEngine
+    ) -> None:
+        assert (
+            engine._find_best_class_match("my_userrepo_x", ["Repo", "UserRepo"])
+            == "UserRepo"
+        )
+        assert engine._find_best_class_match("the_user_repo_x", ["Repo", "User"]) == (
+            "Repo"
+        )
+
+
+class TestParameterNameCache:
+    def test_classes_are_collected_once_per_module(
+        self, engine: PythonTypeInferenceEngine, mock_function_registry: MagicMock
+    ) -> None:
+        mock_function_registry.find_with_prefix.return_value = [
+            ("test.module.User", NodeType.CLASS),
+            ("test.module.AppService", NodeType.CLASS),
+        ]
+
+        assert engine._infer_type_from_parameter_name("user", "test.module") == "User"
+        assert (
+            engine._infer_type_from_parameter_name("service", "test.module")
+            == "AppService"
+        )
+        assert engine._infer_type_from_parameter_name("user", "test.module") == "User"
+        assert mock_function_registry.find_with_prefix.call_count == 1
+
+    def test_clear_caches_sees_new_classes(
+        self, engine: PythonTypeInferenceEngine, mock_function_registry: MagicMock
+    ) -> None:
+        assert engine._infer_type_from_parameter_name("user", "test.module") is None
+
+        mock_function_registry.find_with_prefix.return_value = [
+            ("test.module.User", NodeType.CLASS)
+        ]
+        assert engine._infer_type_from_parameter_name("user", "test.module") is None
+
+        engine.clear_caches()
+        assert engine._infer_type_from_parameter_name("user", "test.module") == "User"
+
 
 class TestExtractVariableName:
     def test_extracts_identifier(self, engine: PythonTypeInferenceEngine) -> None:
@@ -1,15 +1,19 @@
+import time
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 from watchdog.events import (
     DirCreatedEvent,
+    FileClosedEvent,
     FileCreatedEvent,
     FileDeletedEvent,
     FileModifiedEvent,
+    FileMovedEvent,
 )
 
-from realtime_updater import CodeChangeEventHandler
+from codebase_rag.constants import CYPHER_DELETE_MODULE
+from realtime_updater import CodeChangeEventHandler, WatchEventQueue
 
 
 @pytest.fixture
@@ -116,3 +120,75 @@ def test_unsupported_file_types_are_ignored(
     assert mock_updater.ingestor.execute_write.call_count == 2
     mock_updater.factory.definition_processor.process_file.assert_not_called()
     mock_updater.ingestor.flush_all.assert_called_once()
+
+
+def _processed_files(mock_updater: MagicMock) -> list[str]:
+    return [
+        call.args[0].name
+        for call in mock_updater.factory.definition_processor.process_file.call_args_list
+    ]
+
+
+def test_queue_coalesces_events_into_one_update(
+    event_handler: CodeChangeEventHandler, mock_updater: MagicMock, temp_repo: Path
+) -> None:
+    """Test that a burst of events is deduplicated per path and applied once."""
+    paths = {name: str(temp_repo / name) for name in ("a.py", "b.py", "c.py", "d.py")}
+    queue = WatchEventQueue(event_handler, debounce_seconds=60)
+    for event in (
+        FileCreatedEvent(paths["a.py"]),
+        FileModifiedEvent(paths["a.py"]),
+        FileModifiedEvent(paths["b.py"]),
+        FileModifiedEvent(paths["b.py"]),
+        FileClosedEvent(paths["b.py"]),
+        FileCreatedEvent(paths["c.py"]),
+        FileDeletedEvent(paths["c.py"]),
+        FileDeletedEvent(paths["d.py"]),
+        FileCreatedEvent(paths["d.py"]),
+    ):
+        queue.dispatch(event)
+
+    queue.start()
+    queue.stop()
+
+    assert _processed_files(mock_updater) == ["a.py", "b.py", "d.py"]
+    assert mock_updater.ingestor.execute_write.call_count == 4
+    mock_updater._process_function_calls.assert_called_once()
+    mock_updater.ingestor.flush_all.assert_called_once()
+
+
+def test_queue_applies_batch_after_debounce_window(
+    event_handler: CodeChangeEventHandler, mock_updater: MagicMock, temp_repo: Path
+) -> None:
+    """Test that the worker applies queued changes once the window closes."""
+    queue = WatchEventQueue(event_handler, debounce_seconds=0.01)
+    queue.start()
+    try:
+        queue.dispatch(FileModifiedEvent(str(temp_repo / "module.py")))
+        deadline = time.monotonic() + 5
+        while not mock_updater.ingestor.flush_all.called:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+    finally:
+        queue.stop()
+
+    assert _processed_files(mock_updater) == ["module.py"]
+
+
+def test_move_is_a_delete_and_a_create(
+    event_handler: CodeChangeEventHandler, mock_updater: MagicMock, temp_repo: Path
+) -> None:
+    """Test that renaming a file removes the old module and parses the new one."""
+    source = temp_repo / "old_name.py"
+    target = temp_repo / "new_name.py"
+
+    event_handler.dispatch(FileMovedEvent(str(source), str(target)))
+
+    deleted_paths = [
+        call.args[1]["path"]
+        for call in mock_updater.ingestor.execute_write.call_args_list
+        if call.args[0] == CYPHER_DELETE_MODULE
+    ]
+    assert deleted_paths == ["old_name.py", "new_name.py"]
+    assert _processed_files(mock_updater) == ["new_name.py"]
+    mock_updater.ingestor.flush_all.assert_called_once()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag.tests.conftest import create_and_run_updater
+
+
+class _NoScanLookup(dict[str, set[str]]):
+    def items(self):  # type: ignore[override]
+        raise AssertionError("full index scan")
+
+
+def _write_repo(repo: Path) -> None:
+    pkg = repo / "pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (pkg / "alpha.py").write_text(
+        "class Shared:\n    def run(self):\n        return 1\n\n"
+        "def helper():\n    return Shared().run()\n",
+        encoding="utf-8",
+    )
+    (pkg / "beta.py").write_text(
+        "class Shared:\n    def run(self):\n        return 2\n",
+        encoding="utf-8",
+    )
+
+
+def test_remove_file_drops_only_that_files_symbols(
+    temp_repo: Path, mock_ingestor: MagicMock
+) -> None:
+    _write_repo(temp_repo)
+    updater = create_and_run_updater(temp_repo, mock_ingestor)
+    project = temp_repo.name
+    alpha, beta = f"{project}.pkg.alpha", f"{project}.pkg.beta"
+
+    updater.remove_file_from_state(temp_repo / "pkg" / "alpha.py")
+
+    assert not [qn for qn in updater.function_registry.keys() if alpha in qn]
+    assert f"{beta}.Shared.run" in updater.function_registry
+    assert updater.simple_name_lookup["run"] == {f"{beta}.Shared.run"}
+    assert updater.simple_name_lookup["Shared"] == {f"{beta}.Shared"}
+    assert "helper" not in updater.simple_name_lookup
+
+
+def test_remove_file_does_not_scan_the_whole_index(
+    temp_repo: Path, mock_ingestor: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write_repo(temp_repo)
+    updater = create_and_run_updater(temp_repo, mock_ingestor)
+    dotted = f"{temp_repo.name}.pkg.beta.Shared.[Symbol.iterator]"
+    updater.function_registry[dotted] = updater.function_registry[
+        f"{temp_repo.name}.pkg.beta.Shared.run"
+    ]
+    updater.simple_name_lookup["[Symbol.iterator]"].add(dotted)
+
+    def fail(*_: object) -> None:
+        raise AssertionError("full index scan")
+
+    monkeypatch.setattr(updater.function_registry, "keys", fail)
+    monkeypatch.setattr(updater.function_registry, "items", fail)
+    monkeypatch.setattr(
+        updater, "simple_name_lookup", _NoScanLookup(updater.simple_name_lookup)
+    )
+
+    updater.remove_file_from_state(temp_repo / "pkg" / "beta.py")
+
+    assert dotted not in updater.function_registry
+    assert "[Symbol.iterator]" not in updater.simple_name_lookup
+
+
+def test_remove_file_drops_java_method_names(
+    temp_repo: Path, mock_ingestor: MagicMock
+) -> None:
+    package = temp_repo / "src" / "com" / "example"
+    package.mkdir(parents=True)
+    (package / "Foo.java").write_text(
+        "package com.example;\n"
+        "public class Foo {\n"
+        "    public void bar() { }\n"
+        "    public int baz(int a, String b) { return a; }\n"
+        "}\n",
+        encoding="utf-8",
+    )
+    updater = create_and_run_updater(temp_repo, mock_ingestor, "java")
+    assert updater.function_registry.find_ending_with("bar")
+
+    updater.remove_file_from_state(package / "Foo.java")
+
+    assert updater.function_registry.find_ending_with("bar") == []
+    assert updater.function_registry.find_ending_with("baz") == []
+    assert "bar" not in updater.simple_name_lookup
+    assert "baz" not in updater.simple_name_lookup
+    assert "Foo" not in updater.simple_name_lookup
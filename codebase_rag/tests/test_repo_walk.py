@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.parser_loader import load_parsers
+from codebase_rag.services.graph_service import MemgraphIngestor
+from codebase_rag.utils import path_utils
+from codebase_rag.utils.path_utils import should_skip_path, walk_repo
+
+
+def _make_tree(root: Path) -> None:
+    for rel in (
+        "src/app.py",
+        "src/app.pyc",
+        "src/generated/schema_pb2.py",
+        "node_modules/left-pad/index.js",
+        "node_modules/@scope/tool/index.js",
+        ".git/config",
+        "vendor/lib.py",
+        "docs/guide.md",
+        "bundle.min.js",
+    ):
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+
+
+def _rel(paths: list[Path], root: Path) -> set[str]:
+    return {p.relative_to(root).as_posix() for p in paths}
+
+
+def _rglob_reference(
+    root: Path,
+    exclude_paths: frozenset[str] | None,
+    unignore_paths: frozenset[str] | None,
+) -> tuple[set[str], set[str]]:
+    directories = [
+        p
+        for p in root.rglob("*")
+        if p.is_dir() and not should_skip_path(p, root, exclude_paths, unignore_paths)
+    ]
+    files = [
+        p
+        for p in root.rglob("*")
+        if p.is_file() and not should_skip_path(p, root, exclude_paths, unignore_paths)
+    ]
+    return _rel(directories, root), _rel(files, root)
+
+
+@pytest.mark.parametrize(
+    ("exclude_paths", "unignore_paths"),
+    [
+        (None, None),
+        (frozenset({"vendor", "src/generated"}), None),
+        (None, frozenset({"node_modules/@scope"})),
+        (frozenset({"*.min.js", "src/gen*"}), frozenset({"node_modules/left-*"})),
+    ],
+)
+def test_walk_matches_should_skip_path(
+    tmp_path: Path,
+    exclude_paths: frozenset[str] | None,
+    unignore_paths: frozenset[str] | None,
+) -> None:
+    _make_tree(tmp_path)
+
+    walk = walk_repo(tmp_path, exclude_paths, unignore_paths)
+
+    assert (_rel(walk.directories, tmp_path), _rel(walk.files, tmp_path)) == (
+        _rglob_reference(tmp_path, exclude_paths, unignore_paths)
+    )
+
+
+def test_glob_patterns_exclude_and_unignore(tmp_path: Path) -> None:
+    _make_tree(tmp_path)
+
+    walk = walk_repo(
+        tmp_path,
+        exclude_paths=frozenset({"*.min.js", "src/gen*"}),
+        unignore_paths=frozenset({"node_modules/@scope/*"}),
+    )
+
+    assert _rel(walk.files, tmp_path) == {
+        "src/app.py",
+        "docs/guide.md",
+        "node_modules/@scope/tool/index.js",
+    }
+
+
+def test_ignored_directories_are_not_descended(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _make_tree(tmp_path)
+    scanned: list[str] = []
+    real_scandir = os.scandir
+
+    def recording_scandir(path: Path) -> os._ScandirIterator[str]:
+        scanned.append(Path(path).relative_to(tmp_path).as_posix())
+        return real_scandir(path)
+
+    monkeypatch.setattr(path_utils.os, "scandir", recording_scandir)
+
+    walk_repo(tmp_path, unignore_paths=frozenset({"node_modules/@scope"}))
+
+    assert "node_modules" in scanned
+    assert "node_modules/@scope" in scanned
+    assert "node_modules/left-pad" not in scanned
+    assert ".git" not in scanned
+
+
+def test_symlinked_directories_are_listed_but_not_followed(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    outside = tmp_path / "outside"
+    (repo / "src").mkdir(parents=True)
+    outside.mkdir()
+    (outside / "external.py").write_text("", encoding="utf-8")
+    (repo / "linked").symlink_to(outside, target_is_directory=True)
+
+    walk = walk_repo(repo)
+
+    assert _rel(walk.directories, repo) == {"linked", "src"}
+    assert walk.files == []
+
+
+def test_graph_updater_walks_repository_once(
+    temp_repo: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (temp_repo / "pkg").mkdir()
+    (temp_repo / "pkg" / "__init__.py").write_text("", encoding="utf-8")
+    (temp_repo / "pkg" / "mod.py").write_text("def f():\n    pass\n")
+    calls: list[Path] = []
+    real_walk_repo = path_utils.walk_repo
+
+    def counting_walk_repo(repo_path: Path, *args: object, **kwargs: object):
+        calls.append(repo_path)
+        return real_walk_repo(repo_path, *args, **kwargs)
+
+    monkeypatch.setattr("codebase_rag.graph_updater.walk_repo", counting_walk_repo)
+    parsers, queries = load_parsers()
+    updater = GraphUpdater(
+        ingestor=MagicMock(spec=MemgraphIngestor),
+        repo_path=temp_repo,
+        parsers=parsers,
+        queries=queries,
+    )
+
+    updater.run()
+
+    assert calls == [temp_repo]
+    assert Path("pkg") in updater.factory.structure_processor.structural_elements
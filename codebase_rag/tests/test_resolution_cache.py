@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.parser_loader import load_parsers
+from codebase_rag.parsers.call_resolver import CallResolver
+from codebase_rag.tests.conftest import create_and_run_updater
+from codebase_rag.types_defs import NodeType
+
+
+@pytest.fixture
+def resolver() -> CallResolver:
+    parsers, queries = load_parsers()
+    updater = GraphUpdater(
+        ingestor=MagicMock(),
+        repo_path=Path("/proj"),
+        parsers=parsers,
+        queries=queries,
+    )
+    for qn, node_type in (
+        ("proj.models.User", NodeType.CLASS),
+        ("proj.models.User.save", NodeType.METHOD),
+        ("proj.models.Admin", NodeType.CLASS),
+        ("proj.models.Admin.save", NodeType.METHOD),
+        ("proj.utils.helper", NodeType.FUNCTION),
+    ):
+        updater.function_registry[qn] = node_type
+    updater.factory.import_processor.import_mapping["proj.app"] = {}
+    return updater.factory.call_processor._resolver
+
+
+def test_repeated_lookups_hit_the_cache(resolver: CallResolver) -> None:
+    first = resolver.resolve_function_call("helper", "proj.app")
+    second = resolver.resolve_function_call("helper", "proj.app")
+
+    assert first == second == (NodeType.FUNCTION, "proj.utils.helper")
+    assert resolver.cache_stats.hits == 1
+    assert resolver.cache_stats.misses == 1
+    assert resolver.cache_stats.entries == 1
+
+
+def test_receiver_types_are_part_of_the_key(resolver: CallResolver) -> None:
+    as_user = resolver.resolve_function_call(
+        "obj.save", "proj.app", {"obj": "proj.models.User", "other": "x"}
+    )
+    as_admin = resolver.resolve_function_call(
+        "obj.save", "proj.app", {"obj": "proj.models.Admin"}
+    )
+    unrelated_change = resolver.resolve_function_call(
+        "obj.save", "proj.app", {"obj": "proj.models.User", "other": "y"}
+    )
+
+    assert as_user == (NodeType.METHOD, "proj.models.User.save")
+    assert as_admin == (NodeType.METHOD, "proj.models.Admin.save")
+    assert unrelated_change == as_user
+    assert resolver.cache_stats.hits == 1
+
+
+def test_clear_cache_sees_registry_changes(resolver: CallResolver) -> None:
+    assert resolver.resolve_function_call("late", "proj.app") is None
+
+    resolver.function_registry["proj.app.late"] = NodeType.FUNCTION
+    assert resolver.resolve_function_call("late", "proj.app") is None
+
+    resolver.clear_cache()
+    assert resolver.resolve_function_call("late", "proj.app") == (
+        NodeType.FUNCTION,
+        "proj.app.late",
+    )
+
+
+def test_each_call_pass_starts_with_a_fresh_cache(
+    temp_repo: Path, mock_ingestor: MagicMock
+) -> None:
+    (temp_repo / "app.py").write_text(
+        "def main():\n    return late()\n", encoding="utf-8"
+    )
+    updater = create_and_run_updater(temp_repo, mock_ingestor)
+    late_qn = f"{temp_repo.name}.app.late"
+    assert updater.factory.call_processor.resolution_cache_stats.entries == 1
+
+    updater.function_registry[late_qn] = NodeType.FUNCTION
+    mock_ingestor.reset_mock()
+    updater._process_function_calls()
+
+    assert any(
+        call.args[2][2] == late_qn
+        for call in mock_ingestor.ensure_relationship_batch.call_args_list
+    )
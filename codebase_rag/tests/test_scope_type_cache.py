@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag import constants as cs
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.parser_loader import load_parsers
+from codebase_rag.parsers.type_inference import TypeInferenceEngine
+
+PY_SOURCE = b"""
+class Service:
+    pass
+
+class Client:
+    pass
+
+def outer():
+    svc = Service()
+    def inner():
+        svc = Client()
+        return svc
+    items = [x for x in range(3)]
+    return inner
+"""
+
+JS_SOURCE = b"""
+class Service {}
+class Client {}
+function outer() {
+  const svc = new Service();
+  function inner() {
+    const svc = new Client();
+    const other = new Service();
+  }
+  const late = new Client();
+}
+"""
+
+
+@pytest.fixture
+def type_inference(tmp_path: Path) -> TypeInferenceEngine:
+    parsers, queries = load_parsers()
+    updater = GraphUpdater(
+        ingestor=MagicMock(),
+        repo_path=tmp_path,
+        parsers=parsers,
+        queries=queries,
+    )
+    return updater.factory.type_inference
+
+
+def _functions(root) -> dict[str, object]:
+    found = {}
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        if node.type in (cs.TS_PY_FUNCTION_DEFINITION, "function_declaration"):
+            found[node.child_by_field_name(cs.FIELD_NAME).text.decode()] = node
+        stack.extend(node.children)
+    return found
+
+
+def test_js_parent_scope_reuses_nested_declarations(
+    type_inference: TypeInferenceEngine,
+) -> None:
+    parsers, _ = load_parsers()
+    root = parsers[cs.SupportedLanguage.JS].parse(JS_SOURCE).root_node
+    functions = _functions(root)
+    engine = type_inference.js_type_inference
+    infer = MagicMock(wraps=engine._infer_js_variable_type_from_value)
+    engine._infer_js_variable_type_from_value = infer  # type: ignore[method-assign]
+
+    outer = engine.build_local_variable_type_map(functions["outer"], "proj.app")
+    inner = engine.build_local_variable_type_map(functions["inner"], "proj.app")
+    module = engine.build_local_variable_type_map(root, "proj.app")
+
+    assert outer == {"svc": "Client", "other": "Service", "late": "Client"}
+    assert inner == {"svc": "Client", "other": "Service"}
+    assert module == outer
+    assert infer.call_count == 4
+
+    engine.clear_caches()
+    engine.build_local_variable_type_map(functions["inner"], "proj.app")
+    assert infer.call_count == 6
+
+
+def test_python_scope_statements_are_collected_once(
+    type_inference: TypeInferenceEngine,
+) -> None:
+    parsers, _ = load_parsers()
+    root = parsers[cs.SupportedLanguage.PYTHON].parse(PY_SOURCE).root_node
+    functions = _functions(root)
+    engine = type_inference.python_type_inference
+
+    outer = engine._scope_statements(functions["outer"], "proj.app")
+    inner = engine._scope_statements(functions["inner"], "proj.app")
+
+    assert inner is engine._scope_statements(functions["inner"], "proj.app")
+    assert [node.text.decode() for node in outer.assignments] == [
+        "svc = Service()",
+        "svc = Client()",
+        "items = [x for x in range(3)]",
+    ]
+    assert outer.assignments[1:2] == inner.assignments
+    assert len(outer.comprehensions) == 1 and not inner.comprehensions
+
+    for index in range(cs.PY_SCOPE_CACHE_MODULES):
+        engine._scope_statements(root, f"proj.other{index}")
+    assert "proj.app" not in engine._scope_statements_cache
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from tree_sitter import QueryCursor
+
+from codebase_rag import constants as cs
+from codebase_rag.parser_loader import load_parsers
+from codebase_rag.parsers.js_ts.utils import capture_js_module_patterns
+from codebase_rag.parsers.utils import capture_span_index
+from codebase_rag.tests.conftest import get_nodes, run_updater
+
+PY_SOURCE = b"""
+class Outer:
+    def first(self):
+        def helper():
+            return len([])
+        return helper()
+
+    class Inner:
+        def second(self):
+            return print("x")
+
+def free():
+    return Outer().first()
+"""
+
+JS_SOURCE = b"""
+const { readFile } = require('fs');
+inst.min = (value) => inst.check(value);
+inst.max = (value) => inst.check(value);
+Child.prototype = Object.create(Parent.prototype);
+Child.prototype.run = function () { return 1; };
+export function shout() { return 2; }
+"""
+
+
+def test_span_index_matches_subtree_cursors() -> None:
+    parsers, queries = load_parsers()
+    lang_queries = queries[cs.SupportedLanguage.PYTHON]
+    root = parsers[cs.SupportedLanguage.PYTHON].parse(PY_SOURCE).root_node
+    functions = capture_span_index(
+        lang_queries[cs.QUERY_FUNCTIONS], root, cs.CAPTURE_FUNCTION
+    )
+    calls = capture_span_index(lang_queries[cs.QUERY_CALLS], root, cs.CAPTURE_CALL)
+
+    def spans(nodes: list) -> list[tuple[int, int]]:
+        return sorted((node.start_byte, node.end_byte) for node in nodes)
+
+    for container in functions.nodes:
+        subtree = QueryCursor(lang_queries[cs.QUERY_CALLS]).captures(container)
+        assert spans(calls.within(container)) == spans(subtree.get(cs.CAPTURE_CALL, []))
+    for class_node in QueryCursor(lang_queries[cs.QUERY_CLASSES]).captures(root)[
+        cs.CAPTURE_CLASS
+    ]:
+        body = class_node.child_by_field_name(cs.FIELD_BODY)
+        subtree = QueryCursor(lang_queries[cs.QUERY_FUNCTIONS]).captures(body)
+        assert spans(functions.within(body)) == spans(
+            subtree.get(cs.CAPTURE_FUNCTION, [])
+        )
+
+
+def test_js_module_patterns_share_one_walk() -> None:
+    parsers, queries = load_parsers()
+    module_query = queries[cs.SupportedLanguage.JS][cs.QUERY_JS_MODULE]
+    root = parsers[cs.SupportedLanguage.JS].parse(JS_SOURCE).root_node
+
+    assert module_query is not None
+    captures = capture_js_module_patterns(root, module_query)
+
+    def texts(pattern: cs.JsModulePattern, name: str) -> list[str]:
+        return [node.text.decode() for node in captures[pattern][name]]
+
+    assert len(captures[cs.JsModulePattern.COMMONJS_DESTRUCTURE][cs.CAPTURE_FUNC]) == 1
+    assert texts(cs.JsModulePattern.ASSIGNMENT_ARROW, cs.CAPTURE_MEMBER_EXPR) == [
+        "inst.min",
+        "inst.max",
+    ]
+    assert texts(cs.JsModulePattern.PROTOTYPE_INHERITANCE, cs.CAPTURE_CHILD_CLASS) == [
+        "Child"
+    ]
+    assert texts(cs.JsModulePattern.PROTOTYPE_METHOD, cs.CAPTURE_METHOD_NAME) == ["run"]
+    assert (
+        len(
+            captures[cs.JsModulePattern.ES6_EXPORT_FUNCTION][cs.CAPTURE_EXPORT_FUNCTION]
+        )
+        == 1
+    )
+    assert cs.JsModulePattern.OBJECT_METHOD not in captures
+
+
+def test_queries_are_compiled_once_per_process() -> None:
+    _, first = load_parsers()
+    _, second = load_parsers()
+
+    for language in (cs.SupportedLanguage.PYTHON, cs.SupportedLanguage.TS):
+        for key in (cs.QUERY_FUNCTIONS, cs.QUERY_CLASSES, cs.QUERY_CALLS):
+            assert first[language][key] is second[language][key]
+    ts_module, ts_module_again = (
+        queries[cs.SupportedLanguage.TS][cs.QUERY_JS_MODULE]
+        for queries in (first, second)
+    )
+    assert ts_module is not None and ts_module_again is not None
+    assert ts_module.query is ts_module_again.query
+    assert first[cs.SupportedLanguage.PYTHON][cs.QUERY_JS_MODULE] is None
+
+
+def test_assignment_arrows_keep_their_own_lines(
+    temp_repo: Path, mock_ingestor: MagicMock
+) -> None:
+    (temp_repo / "schemas.js").write_text(JS_SOURCE.decode(), encoding="utf-8")
+
+    run_updater(temp_repo, mock_ingestor)
+
+    lines = {
+        node[0][1]["name"]: node[0][1]["start_line"]
+        for node in get_nodes(mock_ingestor, cs.NodeLabel.FUNCTION)
+        if node[0][1]["name"] in ("min", "max")
+    }
+    assert lines == {"min": 3, "max": 4}
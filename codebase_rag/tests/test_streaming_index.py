@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from codebase_rag.config import settings
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.parallel import bounded_map
+from codebase_rag.services.graph_service import MemgraphIngestor
+from codebase_rag.services.protobuf_service import ProtobufFileIngestor
+from codebase_rag.tests.conftest import UpdaterFactory, get_call_pairs
+
+
+def _write_chain_repo(repo: Path, modules: int) -> None:
+    pkg = repo / "pkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    for i in range(modules):
+        target = (i + 1) % modules
+        (pkg / f"mod{i}.py").write_text(
+            f"from pkg.mod{target} import step{target}\n\n"
+            f"def step{i}():\n"
+            f"    return step{target}()\n",
+            encoding="utf-8",
+        )
+
+
+def _run(
+    build_updater: UpdaterFactory, repo: Path, streaming: bool, workers: int = 1
+) -> tuple[GraphUpdater, set[tuple[str, str]]]:
+    ingestor = MagicMock(spec=MemgraphIngestor)
+    updater = build_updater(repo, ingestor, workers=workers, streaming=streaming)
+    updater.run()
+    return updater, get_call_pairs(ingestor)
+
+
+def test_streaming_matches_default_mode(
+    temp_repo: Path, build_updater: UpdaterFactory
+) -> None:
+    """Streaming the definition pass resolves the same CALLS as the default."""
+    _write_chain_repo(temp_repo, modules=4)
+
+    _, default_calls = _run(build_updater, temp_repo, streaming=False)
+    _, streaming_calls = _run(build_updater, temp_repo, streaming=True)
+
+    assert default_calls
+    assert streaming_calls == default_calls
+
+
+def test_streaming_resolves_calls_beyond_ast_cache_limit(
+    temp_repo: Path, build_updater: UpdaterFactory, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Calls across a cycle resolve even when the AST cache holds two trees."""
+    monkeypatch.setattr(settings, "STREAMING_AST_CACHE_ENTRIES", 2)
+    _write_chain_repo(temp_repo, modules=6)
+
+    updater, calls = _run(build_updater, temp_repo, streaming=True)
+
+    project = temp_repo.name
+    assert {
+        (f"{project}.pkg.mod{i}.step{i}", f"{project}.pkg.mod{j}.step{j}")
+        for i, j in ((i, (i + 1) % 6) for i in range(6))
+    } <= calls
+    assert len(updater.ast_cache.cache) <= 2
+
+
+def test_streaming_with_workers_matches_serial(
+    temp_repo: Path, build_updater: UpdaterFactory
+) -> None:
+    """Streaming with worker processes matches streaming in one process."""
+    _write_chain_repo(temp_repo, modules=4)
+
+    _, serial_calls = _run(build_updater, temp_repo, streaming=True)
+    _, parallel_calls = _run(build_updater, temp_repo, streaming=True, workers=2)
+
+    assert parallel_calls == serial_calls
+
+
+def test_streaming_needs_an_ingestor_that_flushes_in_batches(
+    temp_repo: Path, build_updater: UpdaterFactory, tmp_path: Path
+) -> None:
+    """Protobuf output buffers the whole graph, so it runs without streaming."""
+    proto = ProtobufFileIngestor(output_path=str(tmp_path / "out"))
+    memgraph = MagicMock(spec=MemgraphIngestor)
+
+    assert not build_updater(temp_repo, proto, streaming=True).streaming
+    assert build_updater(temp_repo, memgraph, streaming=True).streaming
+
+
+def test_bounded_map_limits_tasks_in_flight() -> None:
+    """bounded_map never has more than its window of tasks submitted at once."""
+    submitted: list[int] = []
+    in_flight_at_yield: list[int] = []
+
+    def work(value: int) -> int:
+        return value * 2
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        original_submit = pool.submit
+
+        def recording_submit(fn, *args):
+            submitted.append(args[0])
+            return original_submit(fn, *args)
+
+        pool.submit = recording_submit  # type: ignore[method-assign]
+        results = []
+        for result in bounded_map(pool, work, range(10), window=3):
+            in_flight_at_yield.append(len(submitted) - len(results))
+            results.append(result)
+
+    assert results == [value * 2 for value in range(10)]
+    assert max(in_flight_at_yield) <= 3
@@ -8,6 +8,14 @@ from codebase_rag.parser_loader import load_parsers
 from codebase_rag.types_defs import NodeType
 
 
+class _NoScanEntries(dict[str, NodeType]):
+    def keys(self):  # type: ignore[override]
+        raise AssertionError("full registry scan")
+
+    def __iter__(self):  # type: ignore[override]
+        raise AssertionError("full registry scan")
+
+
 class TestTrieOptimization:
     """Test the Trie optimization for function registry lookups."""
 
@@ -64,6 +72,48 @@ class TestTrieOptimization:
         results = trie.find_ending_with("info")
         assert results == ["project.utils.logger.Logger.info"]
 
+    @pytest.mark.parametrize("suffix_trie", [True, False])
+    def test_find_ending_with_uses_suffix_index(self, suffix_trie: bool) -> None:
+        """Test that suffix lookups never scan the whole registry."""
+        trie = FunctionRegistryTrie(suffix_trie=suffix_trie)
+        trie.insert("proj.geometry.Foo.bar", NodeType.METHOD)
+        trie.insert("proj.geometry.Baz.bar", NodeType.METHOD)
+        trie.insert("proj.other.xFoo.bar", NodeType.METHOD)
+        trie.insert("proj.iter.Seq.[Symbol.iterator]", NodeType.METHOD)
+        trie._entries = _NoScanEntries(trie._entries)
+
+        assert trie.find_ending_with("bar") == [
+            "proj.geometry.Foo.bar",
+            "proj.geometry.Baz.bar",
+            "proj.other.xFoo.bar",
+        ]
+        assert trie.find_ending_with("Foo.bar") == ["proj.geometry.Foo.bar"]
+        assert trie.find_ending_with("[Symbol.iterator]") == [
+            "proj.iter.Seq.[Symbol.iterator]"
+        ]
+        assert trie.find_ending_with("missing") == []
+
+        del trie["proj.geometry.Foo.bar"]
+        assert trie.find_ending_with("Foo.bar") == []
+        assert len(trie.find_ending_with("bar")) == 2
+
+    @pytest.mark.parametrize("suffix_trie", [True, False])
+    def test_find_ending_with_matches_whole_segments(self, suffix_trie: bool) -> None:
+        """Test that suffixes match on segment boundaries and prune on delete."""
+        trie = FunctionRegistryTrie(suffix_trie=suffix_trie)
+        trie.insert("proj.a.run", NodeType.FUNCTION)
+        trie.insert("proj.b.rerun", NodeType.FUNCTION)
+        trie.insert("run", NodeType.FUNCTION)
+
+        assert trie.find_ending_with("run") == ["proj.a.run"]
+        assert trie.find_ending_with("a.run") == ["proj.a.run"]
+        assert trie.find_ending_with("proj.a.run") == []
+
+        for qn in ["proj.a.run", "proj.b.rerun", "run"]:
+            del trie[qn]
+        assert not trie._suffix_root
+        assert not trie._last_segment_index
+
     def test_trie_performance_optimization(self) -> None:
         """Test that Trie provides performance benefits over naive search."""
         trie = FunctionRegistryTrie()
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Protocol
+
+import pytest
+
+from codebase_rag import constants as cs
+from codebase_rag.cypher_queries import (
+    CYPHER_DELETE_FILES_BY_PATH,
+    CYPHER_PROJECT_CALLS,
+    CYPHER_PROJECT_DEFINITIONS,
+    CYPHER_PROJECT_FILE_FINGERPRINTS,
+    CYPHER_PROJECT_INHERITANCE,
+    CYPHER_PROJECT_MODULE_PATHS,
+)
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.index_manifest import fingerprint_file
+from codebase_rag.tests.conftest import UpdaterFactory, touch_later
+from codebase_rag.types_defs import (
+    FileChange,
+    NodesByLabel,
+    PropertyDict,
+    PropertyValue,
+    ResultRow,
+)
+from realtime_updater import CodeChangeEventHandler
+
+DEFINITION_LABELS = {
+    cs.NodeLabel.FUNCTION,
+    cs.NodeLabel.METHOD,
+    cs.NodeLabel.CLASS,
+}
+
+
+class GraphStore:
+    """In-memory stand-in for the graph that answers the warm-start queries."""
+
+    def __init__(self) -> None:
+        self.nodes: dict[tuple[str, PropertyValue], PropertyDict] = {}
+        self.relationships: set[tuple[PropertyValue, str, PropertyValue]] = set()
+        self.writes: list[tuple[str, PropertyDict | None]] = []
+
+    def ensure_node_batch(self, label: str, properties: PropertyDict) -> None:
+        key = (
+            properties.get(cs.KEY_QUALIFIED_NAME)
+            or properties.get(cs.KEY_PATH)
+            or properties.get(cs.KEY_NAME)
+        )
+        self.nodes.setdefault((label, key), {}).update(properties)
+
+    def ensure_relationship_batch(
+        self,
+        from_spec: tuple[str, str, PropertyValue],
+        rel_type: str,
+        to_spec: tuple[str, str, PropertyValue],
+        properties: PropertyDict | None = None,
+    ) -> None:
+        self.relationships.add((from_spec[2], rel_type, to_spec[2]))
+
+    def flush_all(self) -> None:
+        pass
+
+    def execute_write(self, query: str, params: PropertyDict | None = None) -> None:
+        self.writes.append((query, params))
+
+    def fetch_all(
+        self, query: str, params: PropertyDict | None = None
+    ) -> list[ResultRow]:
+        if query == CYPHER_PROJECT_FILE_FINGERPRINTS:
+            return [
+                props
+                for (label, _), props in self.nodes.items()
+                if label == cs.NodeLabel.FILE and cs.KEY_CONTENT_HASH in props
+            ]
+        if query == CYPHER_PROJECT_MODULE_PATHS:
+            prefix = str((params or {})[cs.KEY_PREFIX])
+            return [
+                props
+                for (label, key), props in self.nodes.items()
+                if label == cs.NodeLabel.MODULE
+                and str(key).startswith(prefix)
+                and props.get(cs.KEY_PATH) is not None
+            ]
+        if query == CYPHER_PROJECT_DEFINITIONS:
+            return [
+                {**props, cs.KEY_LABEL: label}
+                for (label, _), props in self.nodes.items()
+                if label in DEFINITION_LABELS
+            ]
+        rel_type = {
+            CYPHER_PROJECT_INHERITANCE: cs.RelationshipType.INHERITS,
+            CYPHER_PROJECT_CALLS: cs.RelationshipType.CALLS,
+        }.get(query)
+        return [
+            {cs.KEY_FROM_VAL: source, cs.KEY_TO_VAL: target}
+            for source, rel, target in self.relationships
+            if rel == rel_type
+        ]
+
+
+class IncrementalGraphStore(GraphStore):
+    """GraphStore that also accepts the incremental ingestor calls."""
+
+    def load_existing_graph(self) -> bool:
+        return True
+
+    def delete_nodes(self, nodes: NodesByLabel) -> None:
+        pass
+
+    def reset_nodes(self, nodes: NodesByLabel) -> None:
+        pass
+
+    def delete_outgoing_calls(self, nodes: NodesByLabel) -> None:
+        pass
+
+    def delete_file_nodes(self, paths: Sequence[str]) -> None:
+        pass
+
+
+class StoreUpdaterFactory(Protocol):
+    def __call__(
+        self, store: GraphStore, manifest_path: Path | None = None
+    ) -> GraphUpdater: ...
+
+
+@pytest.fixture
+def store_updater(
+    sample_repo: Path, build_updater: UpdaterFactory
+) -> StoreUpdaterFactory:
+    """Builds dependency-tracking updaters over the sample repo backed by a store."""
+
+    def build(store: GraphStore, manifest_path: Path | None = None) -> GraphUpdater:
+        return build_updater(
+            sample_repo,
+            store,
+            manifest_path=manifest_path,
+            streaming=False,
+            track_dependencies=True,
+        )
+
+    return build
+
+
+@pytest.fixture
+def indexed(store_updater: StoreUpdaterFactory) -> tuple[GraphUpdater, GraphStore]:
+    store = GraphStore()
+    full = store_updater(store)
+    full.run()
+    return full, store
+
+
+def test_file_nodes_carry_fingerprint(
+    sample_repo: Path, indexed: tuple[GraphUpdater, GraphStore]
+) -> None:
+    """File nodes store the content hash, size and mtime used by the manifest."""
+    _, store = indexed
+    entry = fingerprint_file(sample_repo / "pkg" / "helpers.py", None)
+
+    props = store.nodes[(cs.NodeLabel.FILE, "pkg/helpers.py")]
+
+    assert props[cs.KEY_CONTENT_HASH] == entry.content_hash
+    assert props[cs.KEY_SIZE] == entry.size
+    assert props[cs.KEY_MTIME_NS] == entry.mtime_ns
+
+
+def test_warm_start_restores_state_of_full_run(
+    sample_repo: Path,
+    store_updater: StoreUpdaterFactory,
+    indexed: tuple[GraphUpdater, GraphStore],
+) -> None:
+    """An unchanged repo is restored from the graph without parsing any file."""
+    full, store = indexed
+    warm = store_updater(store)
+
+    assert warm.warm_start() == []
+
+    assert dict(warm.function_registry.items()) == dict(full.function_registry.items())
+    assert {k: v for k, v in warm.simple_name_lookup.items() if v} == {
+        k: v for k, v in full.simple_name_lookup.items() if v
+    }
+    assert warm.factory.module_qn_to_file_path == full.factory.module_qn_to_file_path
+    project = sample_repo.name
+    assert warm.factory.definition_processor.class_inheritance[
+        f"{project}.pkg.models.User"
+    ] == [f"{project}.pkg.models.Base"]
+    assert warm.call_dependencies is not None and full.call_dependencies is not None
+    assert warm.call_dependencies._targets == full.call_dependencies._targets
+    assert not warm.ast_cache.items()
+    assert sample_repo / "pkg" / "service.py" in warm._restored_files
+
+
+def test_warm_start_reports_changed_files(
+    sample_repo: Path,
+    store_updater: StoreUpdaterFactory,
+    indexed: tuple[GraphUpdater, GraphStore],
+) -> None:
+    """Changed, deleted and new files are reported; touched-only files are not."""
+    _, store = indexed
+    helpers = sample_repo / "pkg" / "helpers.py"
+    helpers.write_text(
+        "def normalize(value):\n    return value.strip().lower()\n",
+        encoding="utf-8",
+    )
+    touch_later(helpers)
+    (sample_repo / "pkg" / "models.py").unlink()
+    (sample_repo / "pkg" / "extra.py").write_text("def tidy():\n    pass\n")
+    touch_later(sample_repo / "README.md")
+    store.writes.clear()
+
+    changes = store_updater(store).warm_start()
+
+    assert changes is not None
+    assert set(changes) == {
+        FileChange(helpers, cs.EventType.MODIFIED),
+        FileChange(sample_repo / "pkg" / "models.py", cs.EventType.DELETED),
+        FileChange(sample_repo / "pkg" / "extra.py", cs.EventType.CREATED),
+    }
+    assert store.writes == [
+        (CYPHER_DELETE_FILES_BY_PATH, {cs.KEY_PATHS: ["pkg/models.py"]})
+    ]
+    readme = store.nodes[(cs.NodeLabel.FILE, "README.md")]
+    assert readme[cs.KEY_MTIME_NS] == (sample_repo / "README.md").stat().st_mtime_ns
+
+
+def test_warm_start_without_fingerprints_returns_none(
+    store_updater: StoreUpdaterFactory,
+) -> None:
+    """An empty graph cannot be warm started and asks for a full run."""
+    assert store_updater(GraphStore()).warm_start() is None
+
+
+def test_changed_names_hydrate_restored_dependents(
+    sample_repo: Path,
+    store_updater: StoreUpdaterFactory,
+    indexed: tuple[GraphUpdater, GraphStore],
+) -> None:
+    """Restored files mentioning a changed name are parsed before CALLS rebuild."""
+    _, store = indexed
+    warm = store_updater(store)
+    warm.warm_start()
+    helpers = sample_repo / "pkg" / "helpers.py"
+    helpers.write_text(
+        "def normalize(value):\n    return value.strip()\n\ndef run():\n    pass\n",
+        encoding="utf-8",
+    )
+
+    CodeChangeEventHandler(warm).apply_changes(
+        [FileChange(helpers, cs.EventType.MODIFIED)]
+    )
+
+    service = sample_repo / "pkg" / "service.py"
+    models = sample_repo / "pkg" / "models.py"
+    assert service not in warm._restored_files
+    assert service in warm._call_sites
+    assert models in warm._restored_files
+    assert f"{sample_repo.name}.pkg.service" in (
+        warm.factory.import_processor.import_mapping
+    )
+
+
+def test_manifest_ignored_once_graph_is_cleared(
+    sample_repo: Path, store_updater: StoreUpdaterFactory, tmp_path: Path
+) -> None:
+    """A wiped graph is rebuilt in full instead of being reported up to date."""
+    manifest_path = tmp_path / cs.MANIFEST_FILE_NAME
+    store = IncrementalGraphStore()
+    store_updater(store, manifest_path).run()
+    indexed_nodes = dict(store.nodes)
+
+    store.nodes.clear()
+    store_updater(store, manifest_path).run()
+    assert store.nodes.keys() >= {
+        (cs.NodeLabel.FILE, "pkg/helpers.py"),
+        (cs.NodeLabel.FUNCTION, f"{sample_repo.name}.pkg.helpers.normalize"),
+    }
+    assert store.nodes.keys() == indexed_nodes.keys()
+
+    store.nodes.clear()
+    store.nodes.update(indexed_nodes)
+    store.relationships.clear()
+    store_updater(store, manifest_path).run()
+    assert not store.relationships
@@ -9,10 +9,17 @@ from typing import TYPE_CHECKING, NamedTuple, Protocol, TypedDict
 
 from prompt_toolkit.styles import Style
 
-from .constants import NodeLabel, RelationshipType, SupportedLanguage
+from .constants import (
+    SEPARATOR_DOT,
+    EventType,
+    JsModulePattern,
+    NodeLabel,
+    RelationshipType,
+    SupportedLanguage,
+)
 
 if TYPE_CHECKING:
-    from tree_sitter import Language, Node, Parser, Query
+    from tree_sitter import Language, Node, Parser, Query, Tree
 
     from .models import LanguageSpec
 
@@ -48,6 +55,185 @@ class RelBatchRow(TypedDict):
 BatchParams = NodeBatchRow | RelBatchRow | PropertyDict
 
 
+class NodeRow(NamedTuple):
+    label: str
+    properties: PropertyDict
+
+
+class RelationshipRow(NamedTuple):
+    from_spec: tuple[str, str, PropertyValue]
+    rel_type: str
+    to_spec: tuple[str, str, PropertyValue]
+    properties: PropertyDict | None
+
+
+class ImportsRow(NamedTuple):
+    module_qn: str
+    language: SupportedLanguage
+
+
+class DefinitionMarks(NamedTuple):
+    registered: int
+    modules: int
+    classes: int
+
+
+class DeferredClassName(str):
+    name: str
+    module_qn: str
+
+    def __new__(cls, name: str, module_qn: str) -> DeferredClassName:
+        value = super().__new__(cls, f"{module_qn}{SEPARATOR_DOT}{name}")
+        value.name = name
+        value.module_qn = module_qn
+        return value
+
+    def __getnewargs__(self) -> tuple[str, str]:  # type: ignore[override]
+        return self.name, self.module_qn
+
+
+class InheritsRow(NamedTuple):
+    class_qn: str
+    module_qn: str
+    node_type: NodeType
+    is_exported: bool
+    language: SupportedLanguage
+    parent_classes: list[str]
+    interfaces: list[str]
+    registered: int
+    named: int
+
+
+type IngestRow = NodeRow | RelationshipRow | ImportsRow | InheritsRow
+
+
+class CallSite(NamedTuple):
+    name: str
+    node_type: str
+    start_byte: int
+    end_byte: int
+
+
+class NodeSpan(NamedTuple):
+    node_type: str
+    start_byte: int
+    end_byte: int
+
+
+type MethodSpanIndex = dict[tuple[str, str], NodeSpan]
+
+
+class SourceTree(NamedTuple):
+    source: bytes
+    tree: Tree
+
+
+class SourceEdit(NamedTuple):
+    start_byte: int
+    old_end_byte: int
+    new_end_byte: int
+
+
+class TopLevelPatch(NamedTuple):
+    root_node: Node
+    masked_source: bytes
+    changed_names: list[str]
+    shifted_names: list[str]
+    line_delta: int
+
+
+class FileChange(NamedTuple):
+    path: Path
+    event_type: EventType
+
+
+type NodesByLabel = dict[str, list[QualifiedName]]
+
+
+class CallScope(NamedTuple):
+    files: list[Path]
+    callers: NodesByLabel
+
+
+class FilePatch(NamedTuple):
+    reset: NodesByLabel
+    deleted: NodesByLabel
+    shifted: NodesByLabel
+    line_delta: int
+
+
+class WatchBatch(NamedTuple):
+    changes: tuple[FileChange, ...]
+    events: int
+    first_event_at: float
+
+
+class CallerSites(NamedTuple):
+    qualified_name: str
+    label: str
+    class_context: str | None
+    node_type: str
+    start_byte: int
+    end_byte: int
+    sites: tuple[CallSite, ...]
+
+
+class FileCallSites(NamedTuple):
+    module_qn: str
+    language: SupportedLanguage
+    callers: tuple[CallerSites, ...]
+
+
+class ScopeVariableTypes(NamedTuple):
+    entries: tuple[tuple[str, str], ...]
+    declarators: int
+
+
+class ScopeStatements(NamedTuple):
+    assignments: tuple[ASTNode, ...]
+    comprehensions: tuple[ASTNode, ...]
+    for_statements: tuple[ASTNode, ...]
+
+
+type ScopeKey = tuple[int, int, str]
+
+
+class ClassNameIndex(NamedTuple):
+    names: list[str]
+    lowered: list[str]
+    exact: dict[str, str]
+
+
+class ResolutionCacheKey(NamedTuple):
+    call_name: str
+    module_qn: str
+    class_context: str | None
+    receiver_types: tuple[tuple[str, str], ...]
+
+
+class ResolutionCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    entries: int
+
+
+class ASTCacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    reparses: int
+    entries: int
+    estimated_bytes: int
+
+
+class BenchmarkRegression(NamedTuple):
+    scenario: str
+    pass_name: str
+    baseline_seconds: float
+    current_seconds: float
+    change_pct: float
+
+
 class BatchWrapper(TypedDict):
     batch: Sequence[BatchParams]
 
@@ -60,6 +246,7 @@ NodeIdentifier = tuple[NodeLabel | str, str, str | None]
 
 
 type ASTNode = Node
+type JsModuleCaptures = dict[JsModulePattern, dict[str, list[ASTNode]]]
 
 
 class NodeType(StrEnum):
@@ -91,6 +278,9 @@ class FunctionRegistryTrieProtocol(Protocol):
     def items(self) -> ItemsView[QualifiedName, NodeType]: ...
     def find_with_prefix(self, prefix: str) -> list[tuple[QualifiedName, NodeType]]: ...
     def find_ending_with(self, suffix: str) -> list[QualifiedName]: ...
+    def find_with_prefix_and_suffix(
+        self, prefix: str, suffix: str
+    ) -> list[QualifiedName]: ...
 
 
 class ASTCacheProtocol(Protocol):
@@ -98,6 +288,7 @@ class ASTCacheProtocol(Protocol):
     def __getitem__(self, key: Path) -> tuple[Node, SupportedLanguage]: ...
     def __delitem__(self, key: Path) -> None: ...
     def __contains__(self, key: Path) -> bool: ...
+    def get_or_load(self, key: Path) -> tuple[Node, SupportedLanguage] | None: ...
     def items(self) -> ItemsView[Path, tuple[Node, SupportedLanguage]]: ...
 
 
@@ -207,6 +398,16 @@ class JavaClassInfo(TypedDict):
     type_parameters: list[str]
 
 
+class JavaClassMembers(NamedTuple):
+    superclass: str | None
+    interfaces: tuple[str, ...]
+    return_types: dict[str, str]
+
+
+type JavaClassIndex = dict[str, JavaClassMembers]
+type JavaMemberIndex = dict[str, tuple[str, str]]
+
+
 class JavaMethodInfo(TypedDict):
     name: str | None
     type: str
@@ -244,6 +445,11 @@ class CgrignorePatterns(NamedTuple):
     unignore: frozenset[str]
 
 
+class RepoWalk(NamedTuple):
+    directories: list[Path]
+    files: list[Path]
+
+
 class AgentLoopUI(NamedTuple):
     status_message: str
     cancelled_log: str
@@ -321,12 +527,18 @@ class RawToolArgs:
 ToolArgs = ReplaceCodeArgs | CreateFileArgs | ShellCommandArgs
 
 
+class JsModuleQuery(NamedTuple):
+    query: Query
+    patterns: tuple[JsModulePattern, ...]
+
+
 class LanguageQueries(TypedDict):
     functions: Query | None
     classes: Query | None
     calls: Query | None
     imports: Query | None
     locals: Query | None
+    js_module: JsModuleQuery | None
     config: LanguageSpec
     language: Language
     parser: Parser
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from .. import constants as cs
+from .. import exceptions as ex
+
+
+def parse_name_status(repo_path: Path, output: str) -> list[Path]:
+    # (H) Renames and copies carry the source and the destination path.
+    *fields, tail = output.split(cs.GIT_FIELD_SEPARATOR)
+    if tail:
+        raise ValueError(ex.GIT_DIFF_TRUNCATED.format(record=tail))
+    paths: list[Path] = []
+    index = 0
+    while index < len(fields):
+        status = fields[index]
+        count = 2 if status[:1] in (cs.GIT_STATUS_RENAMED, cs.GIT_STATUS_COPIED) else 1
+        names = fields[index + 1 : index + 1 + count]
+        if len(names) < count:
+            raise ValueError(ex.GIT_DIFF_TRUNCATED.format(record=status))
+        paths.extend(repo_path / name for name in names)
+        index += 1 + count
+    return paths
+
+
+def git_changed_paths(repo_path: Path, revision: str) -> list[Path]:
+    try:
+        result = subprocess.run(
+            [*cs.GIT_DIFF_NAME_STATUS, revision],
+            cwd=repo_path,
+            capture_output=True,
+            check=True,
+            encoding=cs.ENCODING_UTF8,
+        )
+    except (OSError, subprocess.CalledProcessError) as e:
+        error = getattr(e, "stderr", None) or e
+        raise ValueError(
+            ex.GIT_DIFF_FAILED.format(revision=revision, error=str(error).strip())
+        ) from e
+    return parse_name_status(repo_path, result.stdout)
@@ -1,6 +1,153 @@
-from pathlib import Path
+import os
+import re
+from fnmatch import translate
+from functools import lru_cache
+from pathlib import Path, PurePath
 
 from .. import constants as cs
+from ..types_defs import RepoWalk
+
+
+def _is_glob(pattern: str) -> bool:
+    return any(char in pattern for char in cs.GLOB_CHARS)
+
+
+def _compile_globs(patterns: list[str]) -> re.Pattern[str] | None:
+    if not patterns:
+        return None
+    return re.compile(cs.REGEX_ALTERNATION.join(translate(p) for p in patterns))
+
+
+def _glob_anchor(pattern: str) -> str:
+    match = re.search(cs.GLOB_CHARS_PATTERN, pattern)
+    return pattern if match is None else pattern[: match.start()]
+
+
+def _ancestors_or_self(parts: tuple[str, ...]) -> list[str]:
+    return [cs.SEPARATOR_SLASH.join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+
+class PathMatcher:
+    def __init__(
+        self,
+        exclude_paths: frozenset[str] | None = None,
+        unignore_paths: frozenset[str] | None = None,
+    ) -> None:
+        exclude = exclude_paths or frozenset()
+        unignore = unignore_paths or frozenset()
+        self.exclude_literals = frozenset(p for p in exclude if not _is_glob(p))
+        # (H) Globs without a slash match any single path component, like a
+        # (H) bare name does; globs with a slash match the path from the root.
+        self.exclude_name_globs = _compile_globs(
+            [p for p in exclude if _is_glob(p) and cs.SEPARATOR_SLASH not in p]
+        )
+        self.exclude_path_globs = _compile_globs(
+            [p for p in exclude if _is_glob(p) and cs.SEPARATOR_SLASH in p]
+        )
+        self.unignore_literals = frozenset(p for p in unignore if not _is_glob(p))
+        self.unignore_globs = _compile_globs([p for p in unignore if _is_glob(p)])
+        self.unignore_anchors = tuple(
+            _glob_anchor(p) if _is_glob(p) else p for p in unignore
+        )
+
+    def _excluded_entry(self, name: str, rel_path: str, is_dir: bool) -> bool:
+        if rel_path in self.exclude_literals or (
+            is_dir and name in self.exclude_literals
+        ):
+            return True
+        if self.exclude_name_globs and self.exclude_name_globs.match(name):
+            return True
+        return bool(self.exclude_path_globs and self.exclude_path_globs.match(rel_path))
+
+    def _unignored_entry(self, rel_path: str) -> bool:
+        return rel_path in self.unignore_literals or bool(
+            self.unignore_globs and self.unignore_globs.match(rel_path)
+        )
+
+    def _may_unignore_below(self, rel_path: str) -> bool:
+        prefix = f"{rel_path}{cs.SEPARATOR_SLASH}"
+        return any(
+            anchor.startswith(prefix) or prefix.startswith(anchor)
+            for anchor in self.unignore_anchors
+        )
+
+    def should_skip(self, rel_path: PurePath, is_file: bool) -> bool:
+        if is_file and rel_path.suffix in cs.IGNORE_SUFFIXES:
+            return True
+        parts = rel_path.parts
+        dir_parts = parts[:-1] if is_file else parts
+        prefixes = _ancestors_or_self(parts)
+        if any(
+            self._excluded_entry(name, prefix, is_dir=i < len(dir_parts))
+            for i, (name, prefix) in enumerate(zip(parts, prefixes))
+        ):
+            return True
+        if any(self._unignored_entry(prefix) for prefix in prefixes):
+            return False
+        return not cs.IGNORE_PATTERNS.isdisjoint(dir_parts)
+
+    def walk(self, repo_path: Path) -> RepoWalk:
+        directories: list[Path] = []
+        files: list[Path] = []
+        # (H) (path, relative path, under an ignored dir, under an unignored dir)
+        stack: list[tuple[Path, str, bool, bool]] = [(repo_path, "", False, False)]
+        while stack:
+            current, current_rel, ignored, unignored = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = sorted(it, key=lambda entry: entry.name)
+            except OSError:
+                continue
+
+            subdirs: list[tuple[Path, str, bool, bool]] = []
+            for entry in entries:
+                name = entry.name
+                rel_path = (
+                    f"{current_rel}{cs.SEPARATOR_SLASH}{name}" if current_rel else name
+                )
+                path = current / name
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    continue
+                if is_dir:
+                    if self._excluded_entry(name, rel_path, is_dir=True):
+                        continue
+                    entry_unignored = unignored or self._unignored_entry(rel_path)
+                    entry_ignored = ignored or name in cs.IGNORE_PATTERNS
+                    if not entry_ignored or entry_unignored:
+                        directories.append(path)
+                    elif not self._may_unignore_below(rel_path):
+                        continue
+                    # (H) Like Path.rglob, list symlinked dirs but never follow them.
+                    if not entry.is_symlink():
+                        subdirs.append((path, rel_path, entry_ignored, entry_unignored))
+                elif entry.is_file():
+                    if os.path.splitext(name)[1] in cs.IGNORE_SUFFIXES:
+                        continue
+                    if self._excluded_entry(name, rel_path, is_dir=False):
+                        continue
+                    if ignored and not (unignored or self._unignored_entry(rel_path)):
+                        continue
+                    files.append(path)
+            stack.extend(reversed(subdirs))
+        return RepoWalk(directories=directories, files=files)
+
+
+@lru_cache(maxsize=32)
+def get_path_matcher(
+    exclude_paths: frozenset[str] | None = None,
+    unignore_paths: frozenset[str] | None = None,
+) -> PathMatcher:
+    return PathMatcher(exclude_paths, unignore_paths)
+
+
+def walk_repo(
+    repo_path: Path,
+    exclude_paths: frozenset[str] | None = None,
+    unignore_paths: frozenset[str] | None = None,
+) -> RepoWalk:
+    return get_path_matcher(exclude_paths, unignore_paths).walk(repo_path)
 
 
 def should_skip_path(
@@ -9,19 +156,6 @@ def should_skip_path(
     exclude_paths: frozenset[str] | None = None,
     unignore_paths: frozenset[str] | None = None,
 ) -> bool:
-    if path.is_file() and path.suffix in cs.IGNORE_SUFFIXES:
-        return True
-    rel_path = path.relative_to(repo_path)
-    rel_path_str = str(rel_path)
-    dir_parts = rel_path.parent.parts if path.is_file() else rel_path.parts
-    if exclude_paths and (
-        not exclude_paths.isdisjoint(dir_parts)
-        or rel_path_str in exclude_paths
-        or any(rel_path_str.startswith(f"{p}/") for p in exclude_paths)
-    ):
-        return True
-    if unignore_paths and any(
-        rel_path_str == p or rel_path_str.startswith(f"{p}/") for p in unignore_paths
-    ):
-        return False
-    return not cs.IGNORE_PATTERNS.isdisjoint(dir_parts)
+    return get_path_matcher(exclude_paths, unignore_paths).should_skip(
+        path.relative_to(repo_path), path.is_file()
+    )
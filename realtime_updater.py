@@ -1,5 +1,7 @@
 import sys
+import threading
 import time
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Annotated
 
@@ -17,23 +19,49 @@ from codebase_rag.constants import (
     CYPHER_DELETE_MODULE,
     IGNORE_PATTERNS,
     IGNORE_SUFFIXES,
+    KEY_LINE_DELTA,
     KEY_PATH,
+    KEY_QUALIFIED_NAMES,
     LOG_LEVEL_INFO,
+    PROFILE_PASS_WATCH_EVENT,
     REALTIME_LOGGER_FORMAT,
+    REL_TYPE_CALLS,
     WATCHER_SLEEP_INTERVAL,
+    WATCHER_THREAD_NAME,
     EventType,
+    ProfileCategory,
+    ProfileFormat,
     SupportedLanguage,
 )
+from codebase_rag.cypher_queries import (
+    build_delete_nodes_by_qn_query,
+    build_delete_outgoing_by_qn_query,
+    build_shift_lines_by_qn_query,
+)
 from codebase_rag.graph_updater import GraphUpdater
 from codebase_rag.language_spec import get_language_spec
 from codebase_rag.parser_loader import load_parsers
+from codebase_rag.profiling import (
+    IndexProfiler,
+    active_profiler,
+    profile_span,
+    set_active_profiler,
+)
 from codebase_rag.services import QueryProtocol
 from codebase_rag.services.graph_service import MemgraphIngestor
+from codebase_rag.types_defs import FileChange, FilePatch, WatchBatch
 
 
 class CodeChangeEventHandler(FileSystemEventHandler):
-    def __init__(self, updater: GraphUpdater):
+    def __init__(
+        self,
+        updater: GraphUpdater,
+        profile_path: Path | None = None,
+        profile_format: ProfileFormat = ProfileFormat.JSON,
+    ):
         self.updater = updater
+        self.profile_path = profile_path
+        self.profile_format = profile_format
         self.ignore_patterns = IGNORE_PATTERNS
         self.ignore_suffixes = IGNORE_SUFFIXES
         logger.info(logs.WATCHER_ACTIVE)
@@ -44,75 +72,279 @@ class CodeChangeEventHandler(FileSystemEventHandler):
             return False
         return all(part not in self.ignore_patterns for part in path.parts)
 
+    def changes_from_event(self, event: FileSystemEvent) -> list[FileChange]:
+        if event.is_directory or event.event_type not in EventType:
+            return []
+
+        # (H) A move is the deletion of its source and the creation of its target.
+        if event.event_type == EventType.MOVED:
+            candidates = [
+                (event.src_path, EventType.DELETED),
+                (event.dest_path, EventType.CREATED),
+            ]
+        else:
+            candidates = [(event.src_path, EventType(event.event_type))]
+
+        changes: list[FileChange] = []
+        for src_path, event_type in candidates:
+            if isinstance(src_path, bytes):
+                src_path = src_path.decode()
+            if src_path and self._is_relevant(src_path):
+                changes.append(FileChange(Path(src_path), event_type))
+        return changes
+
     def dispatch(self, event: FileSystemEvent) -> None:
+        if changes := self.changes_from_event(event):
+            self.apply_changes(changes)
+
+    def apply_changes(self, changes: Sequence[FileChange]) -> None:
         # (H) ┌─────────────────────────────────────────────────────────────────────┐
         # (H) │                      Real-Time Graph Update Steps                   │
         # (H) ├─────────────────────────────────────────────────────────────────────┤
-        # (H) │ Step 1: Delete all old data from the graph for this file           │
+        # (H) │ Step 1: Delete all old data from the graph for each changed file   │
         # (H) │         Provides a clean slate for the updated information         │
         # (H) │ Step 2: Clear the specific in-memory state for the file            │
         # (H) │         Prevents stale in-memory representations                   │
         # (H) │ Step 3: Re-parse the file if it was modified or created            │
         # (H) │         Rebuilds in-memory state (AST, function registry)          │
-        # (H) │ Step 4: Re-process all function calls across the entire codebase   │
+        # (H) │         Edits inside whole definitions re-extract only those       │
+        # (H) │ Step 4: Re-process calls in changed files and their dependents     │
         # (H) │         Fixes "island" problem - changes reflect in all relations  │
         # (H) │ Step 5: Flush all collected changes to the database                │
         # (H) └─────────────────────────────────────────────────────────────────────┘
-        src_path = event.src_path
-        if isinstance(src_path, bytes):
-            src_path = src_path.decode()
-
-        if event.is_directory or not self._is_relevant(src_path):
-            return
-
         ingestor = self.updater.ingestor
         if not isinstance(ingestor, QueryProtocol):
             logger.warning(logs.WATCHER_SKIP_NO_QUERY)
             return
 
-        path = Path(src_path)
-        relative_path_str = str(path.relative_to(self.updater.repo_path))
+        old_qns: set[str] = set()
+        new_qns: set[str] = set()
+        patched: list[Path] = []
+        with profile_span(
+            PROFILE_PASS_WATCH_EVENT, ProfileCategory.PASS, files=len(changes)
+        ):
+            for path, event_type in changes:
+                relative_path_str = str(path.relative_to(self.updater.repo_path))
+                logger.warning(
+                    logs.CHANGE_DETECTED.format(event_type=event_type, path=path)
+                )
+                old_qns.update(self.updater.file_definitions(path))
+                if event_type != EventType.DELETED:
+                    self.updater.ingest_file_node(path)
 
-        logger.warning(
-            logs.CHANGE_DETECTED.format(event_type=event.event_type, path=path)
-        )
+                # (H) Steps 1-3 for an edit confined to whole top-level definitions
+                if event_type == EventType.MODIFIED and (
+                    patch := self.updater.patch_file(path)
+                ):
+                    self._apply_patch(ingestor, patch)
+                    patched.append(path)
+                    new_qns.update(self.updater.file_definitions(path))
+                    continue
+
+                # (H) Step 1
+                ingestor.execute_write(
+                    CYPHER_DELETE_MODULE, {KEY_PATH: relative_path_str}
+                )
+                logger.debug(logs.DELETION_QUERY.format(path=relative_path_str))
+
+                # (H) Step 2
+                self.updater.remove_file_from_state(path)
+                if event_type == EventType.DELETED:
+                    self.updater.factory.definition_processor.forget_source(path)
+
+                # (H) Step 3
+                if event_type in (EventType.MODIFIED, EventType.CREATED):
+                    self._reparse_file(path)
+                    new_qns.update(self.updater.file_definitions(path))
+
+            # (H) Step 4
+            scope = self.updater.call_scope(
+                [change.path for change in changes], old_qns, new_qns, patched
+            )
+            if scope is None:
+                logger.info(logs.RECALC_CALLS)
+                ingestor.execute_write(CYPHER_DELETE_CALLS)
+                self.updater._process_function_calls()
+            else:
+                for label, caller_qns in scope.callers.items():
+                    ingestor.execute_write(
+                        build_delete_outgoing_by_qn_query(label, REL_TYPE_CALLS),
+                        {KEY_QUALIFIED_NAMES: caller_qns},
+                    )
+                self.updater._process_function_calls(scope.files)
 
-        # (H) Step 1
-        ingestor.execute_write(CYPHER_DELETE_MODULE, {KEY_PATH: relative_path_str})
-        logger.debug(logs.DELETION_QUERY.format(path=relative_path_str))
+            # (H) Step 5
+            self.updater.ingestor.flush_all()
+        if len(changes) == 1:
+            logger.success(logs.GRAPH_UPDATED.format(name=changes[0].path.name))
+        else:
+            logger.success(logs.GRAPH_UPDATED_BATCH.format(count=len(changes)))
+        self.write_profile()
 
-        # (H) Step 2
-        self.updater.remove_file_from_state(path)
+    def _apply_patch(self, ingestor: QueryProtocol, patch: FilePatch) -> None:
+        # (H) Re-extracted definitions are merged back at flush time, so only
+        # (H) their stale edges, vanished nodes and shifted lines need writes.
+        for label, qualified_names in patch.reset.items():
+            ingestor.execute_write(
+                build_delete_outgoing_by_qn_query(label),
+                {KEY_QUALIFIED_NAMES: qualified_names},
+            )
+        for label, qualified_names in patch.deleted.items():
+            ingestor.execute_write(
+                build_delete_nodes_by_qn_query(label),
+                {KEY_QUALIFIED_NAMES: qualified_names},
+            )
+        for label, qualified_names in patch.shifted.items():
+            ingestor.execute_write(
+                build_shift_lines_by_qn_query(label),
+                {
+                    KEY_QUALIFIED_NAMES: qualified_names,
+                    KEY_LINE_DELTA: patch.line_delta,
+                },
+            )
 
-        # (H) Step 3
-        if event.event_type in (EventType.MODIFIED, EventType.CREATED):
-            lang_config = get_language_spec(path.suffix)
-            if (
-                lang_config
-                and isinstance(lang_config.language, SupportedLanguage)
-                and lang_config.language in self.updater.parsers
+    def _reparse_file(self, path: Path) -> None:
+        lang_config = get_language_spec(path.suffix)
+        if (
+            lang_config
+            and isinstance(lang_config.language, SupportedLanguage)
+            and lang_config.language in self.updater.parsers
+        ):
+            if result := self.updater.factory.definition_processor.process_file(
+                path,
+                lang_config.language,
+                self.updater.queries,
+                self.updater.factory.structure_processor.structural_elements,
             ):
-                if result := self.updater.factory.definition_processor.process_file(
-                    path,
-                    lang_config.language,
-                    self.updater.queries,
-                    self.updater.factory.structure_processor.structural_elements,
+                self.updater.add_file_to_state(path, *result)
+
+    def write_profile(self) -> None:
+        if self.profile_path is not None and (profiler := active_profiler()):
+            profiler.write(self.profile_path, self.profile_format)
+
+
+def _coalesce_change(
+    previous: EventType | None, current: EventType
+) -> EventType | None:
+    match previous, current:
+        case EventType.CREATED, EventType.DELETED:
+            return None
+        case EventType.CREATED, _:
+            return EventType.CREATED
+        case EventType.DELETED, EventType.CREATED | EventType.MODIFIED:
+            return EventType.MODIFIED
+        case _:
+            return current
+
+
+class WatchEventQueue(FileSystemEventHandler):
+    # (H) Collects events on the observer thread and hands them to a worker in
+    # (H) batches: the window opens with the first event and everything that
+    # (H) arrives within it is deduplicated per path and applied together.
+    def __init__(
+        self,
+        handler: CodeChangeEventHandler,
+        debounce_seconds: float = settings.WATCHER_DEBOUNCE_SECONDS,
+    ):
+        self.handler = handler
+        self.debounce_seconds = debounce_seconds
+        self._pending: dict[Path, EventType] = {}
+        self._events = 0
+        self._first_event_at: float | None = None
+        self._stopped = False
+        self._condition = threading.Condition()
+        self._worker = threading.Thread(
+            target=self._run, name=WATCHER_THREAD_NAME, daemon=True
+        )
+
+    def dispatch(self, event: FileSystemEvent) -> None:
+        if not (changes := self.handler.changes_from_event(event)):
+            return
+        with self._condition:
+            for path, event_type in changes:
+                merged = _coalesce_change(self._pending.get(path), event_type)
+                if merged is None:
+                    self._pending.pop(path, None)
+                else:
+                    self._pending[path] = merged
+                logger.debug(
+                    logs.WATCHER_EVENT_QUEUED.format(
+                        event_type=event_type, path=path, depth=len(self._pending)
+                    )
+                )
+            self._events += len(changes)
+            if self._first_event_at is None:
+                self._first_event_at = time.monotonic()
+            self._condition.notify()
+
+    def start(self) -> None:
+        self._worker.start()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+        self._worker.join()
+
+    def _next_batch(self) -> WatchBatch | None:
+        with self._condition:
+            while True:
+                while self._first_event_at is None and not self._stopped:
+                    self._condition.wait()
+                if self._first_event_at is None:
+                    return None
+
+                deadline = self._first_event_at + self.debounce_seconds
+                while (
+                    not self._stopped and (remaining := deadline - time.monotonic()) > 0
                 ):
-                    root_node, language = result
-                    self.updater.ast_cache[path] = (root_node, language)
+                    self._condition.wait(remaining)
 
-        # (H) Step 4
-        logger.info(logs.RECALC_CALLS)
-        ingestor.execute_write(CYPHER_DELETE_CALLS)
-        self.updater._process_function_calls()
+                batch = WatchBatch(
+                    tuple(FileChange(*item) for item in self._pending.items()),
+                    self._events,
+                    self._first_event_at,
+                )
+                self._pending = {}
+                self._events = 0
+                self._first_event_at = None
+                if batch.changes:
+                    return batch
 
-        # (H) Step 5
-        self.updater.ingestor.flush_all()
-        logger.success(logs.GRAPH_UPDATED.format(name=path.name))
+    def _run(self) -> None:
+        while (batch := self._next_batch()) is not None:
+            started_at = time.monotonic()
+            count = len(batch.changes)
+            logger.info(
+                logs.WATCHER_BATCH_READY.format(
+                    count=count,
+                    events=batch.events,
+                    waited=started_at - batch.first_event_at,
+                )
+            )
+            try:
+                self.handler.apply_changes(batch.changes)
+            except Exception as e:
+                logger.exception(logs.WATCHER_BATCH_FAILED.format(count=count, error=e))
+                continue
+            finished_at = time.monotonic()
+            logger.info(
+                logs.WATCHER_BATCH_APPLIED.format(
+                    count=count,
+                    seconds=finished_at - started_at,
+                    latency=finished_at - batch.first_event_at,
+                )
+            )
 
 
 def start_watcher(
-    repo_path: str, host: str, port: int, batch_size: int | None = None
+    repo_path: str,
+    host: str,
+    port: int,
+    batch_size: int | None = None,
+    profile_path: Path | None = None,
+    profile_format: ProfileFormat = ProfileFormat.JSON,
+    warm_start: bool = False,
 ) -> None:
     repo_path_obj = Path(repo_path).resolve()
     parsers, queries = load_parsers()
@@ -124,20 +356,58 @@ def start_watcher(
         port=port,
         batch_size=effective_batch_size,
     ) as ingestor:
-        _run_watcher_loop(ingestor, repo_path_obj, parsers, queries)
+        _run_watcher_loop(
+            ingestor,
+            repo_path_obj,
+            parsers,
+            queries,
+            profile_path,
+            profile_format,
+            warm_start,
+        )
 
 
-def _run_watcher_loop(ingestor, repo_path_obj, parsers, queries):
-    updater = GraphUpdater(ingestor, repo_path_obj, parsers, queries)
+def _run_watcher_loop(
+    ingestor,
+    repo_path_obj,
+    parsers,
+    queries,
+    profile_path: Path | None = None,
+    profile_format: ProfileFormat = ProfileFormat.JSON,
+    warm_start: bool = False,
+):
+    updater = GraphUpdater(
+        ingestor,
+        repo_path_obj,
+        parsers,
+        queries,
+        streaming=False,
+        track_dependencies=True,
+        incremental_parse=True,
+    )
+    if profile_path is not None:
+        set_active_profiler(IndexProfiler())
 
-    # (H) Initial full scan builds the complete context for real-time updates
-    logger.info(logs.INITIAL_SCAN)
-    updater.run()
+    event_handler = CodeChangeEventHandler(updater, profile_path, profile_format)
+    # (H) A warm start replays only what changed since the graph was written;
+    # (H) otherwise the initial full scan builds the context for real-time updates.
+    if warm_start and (changes := updater.warm_start()) is not None:
+        if changes:
+            event_handler.apply_changes(changes)
+    else:
+        logger.info(logs.INITIAL_SCAN)
+        updater.run()
     logger.success(logs.INITIAL_SCAN_DONE)
+    # (H) Event handlers run on watchdog threads, where forking workers is unsafe.
+    updater.workers = 1
 
-    event_handler = CodeChangeEventHandler(updater)
+    # (H) The report is rewritten after every update, so it stays current even
+    # (H) when the watcher is killed rather than interrupted.
+    event_handler.write_profile()
+    event_queue = WatchEventQueue(event_handler)
+    event_queue.start()
     observer = Observer()
-    observer.schedule(event_handler, str(repo_path_obj), recursive=True)
+    observer.schedule(event_queue, str(repo_path_obj), recursive=True)
     observer.start()
     logger.info(logs.WATCHING.format(path=repo_path_obj))
 
@@ -147,6 +417,7 @@ def _run_watcher_loop(ingestor, repo_path_obj, parsers, queries):
     except KeyboardInterrupt:
         observer.stop()
     observer.join()
+    event_queue.stop()
 
 
 def _validate_positive_int(value: int | None) -> int | None:
@@ -172,11 +443,23 @@ def main(
             callback=_validate_positive_int,
         ),
     ] = None,
+    profile: Annotated[
+        Path | None, typer.Option("--profile", help=ch.HELP_PROFILE)
+    ] = None,
+    profile_format: Annotated[
+        ProfileFormat,
+        typer.Option("--profile-format", help=ch.HELP_PROFILE_FORMAT),
+    ] = ProfileFormat.JSON,
+    warm_start: Annotated[
+        bool, typer.Option("--warm-start", help=ch.HELP_WARM_START)
+    ] = False,
 ) -> None:
     logger.remove()
     logger.add(sys.stdout, format=REALTIME_LOGGER_FORMAT, level=LOG_LEVEL_INFO)
     logger.info(logs.LOGGER_CONFIGURED)
-    start_watcher(repo_path, host, port, batch_size)
+    start_watcher(
+        repo_path, host, port, batch_size, profile, profile_format, warm_start
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from loguru import logger
+
+from codebase_rag import constants as cs
+from codebase_rag import logs as ls
+from codebase_rag.benchmark import (
+    SCENARIOS,
+    BenchmarkBaseline,
+    SyntheticRepoSpec,
+    find_regressions,
+    log_result,
+    run_benchmark_isolated,
+)
+from codebase_rag.config import settings
+
+CUSTOM_SCENARIO = "custom"
+
+
+def _parse_languages(value: str) -> dict[cs.SupportedLanguage, float]:
+    languages: dict[cs.SupportedLanguage, float] = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        languages[cs.SupportedLanguage(name.strip())] = float(weight or 1)
+    return languages
+
+
+def _custom_spec(args: argparse.Namespace) -> SyntheticRepoSpec:
+    return SyntheticRepoSpec(
+        name=CUSTOM_SCENARIO,
+        modules=args.modules,
+        classes_per_module=args.classes,
+        methods_per_class=args.methods,
+        functions_per_module=args.functions,
+        call_density=args.call_density,
+        inheritance_depth=args.inheritance_depth,
+        languages=args.languages,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Index synthetic repositories and report files/sec, CALLS edges/sec "
+            "and peak RSS per pass, optionally gated against a saved baseline."
+        )
+    )
+    parser.add_argument(
+        "--scenario",
+        nargs="+",
+        choices=[str(scenario) for scenario in cs.BenchmarkScenario],
+        help="Preset scenarios to run (default: all presets)",
+    )
+    parser.add_argument(
+        "--modules", type=int, help="Run a custom scenario with this many modules"
+    )
+    parser.add_argument("--classes", type=int, default=3)
+    parser.add_argument("--methods", type=int, default=3)
+    parser.add_argument("--functions", type=int, default=3)
+    parser.add_argument("--call-density", type=int, default=2)
+    parser.add_argument("--inheritance-depth", type=int, default=4)
+    parser.add_argument(
+        "--languages",
+        type=_parse_languages,
+        default={cs.SupportedLanguage.PYTHON: 1.0},
+        help="Language mix such as python=0.6,javascript=0.3,java=0.1",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    parser.add_argument("--baseline", type=Path, help="Baseline JSON to compare with")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store these results as the new baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=settings.BENCHMARK_REGRESSION_THRESHOLD_PCT,
+        help="Allowed slowdown of a gated pass, in percent",
+    )
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="SUCCESS", format="{message}")
+
+    if args.modules is not None:
+        specs = [_custom_spec(args)]
+    else:
+        specs = [
+            SCENARIOS[cs.BenchmarkScenario(name)]
+            for name in (args.scenario or list(cs.BenchmarkScenario))
+        ]
+
+    results = []
+    for spec in specs:
+        result = run_benchmark_isolated(spec, args.workers, args.repeat)
+        log_result(result)
+        results.append(result)
+
+    if args.output:
+        args.output.write_text(
+            json.dumps([result.to_dict() for result in results], indent=2),
+            encoding=cs.ENCODING_UTF8,
+        )
+
+    if args.baseline is None:
+        return
+    if args.update_baseline:
+        baseline = BenchmarkBaseline.load(args.baseline) or BenchmarkBaseline()
+        baseline.results.update({result.scenario: result for result in results})
+        baseline.save(args.baseline)
+        return
+
+    baseline = BenchmarkBaseline.load(args.baseline) or BenchmarkBaseline()
+    regressions = find_regressions(baseline, results, args.threshold)
+    for regression in regressions:
+        logger.error(
+            ls.BENCHMARK_REGRESSION.format(
+                scenario=regression.scenario,
+                name=regression.pass_name,
+                baseline=regression.baseline_seconds,
+                current=regression.current_seconds,
+                change=regression.change_pct,
+            )
+        )
+    if regressions:
+        sys.exit(1)
+    logger.success(ls.BENCHMARK_NO_REGRESSIONS.format(threshold=args.threshold))
+
+
+if __name__ == "__main__":
+    main()
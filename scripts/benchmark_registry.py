@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
+from loguru import logger
+
+from codebase_rag import constants as cs
+from codebase_rag.benchmark import benchmark_registry, log_registry_metrics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=(
+            "Compare memory and lookup latency of the function registry "
+            "implementations on synthetic qualified names."
+        )
+    )
+    parser.add_argument("--entries", type=int, nargs="+", default=[100_000])
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--implementation",
+        nargs="+",
+        choices=[str(impl) for impl in cs.RegistryImplementation],
+        help="Registry implementations to measure (default: all)",
+    )
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="SUCCESS", format="{message}")
+
+    implementations = [
+        cs.RegistryImplementation(name)
+        for name in (args.implementation or list(cs.RegistryImplementation))
+    ]
+    results = []
+    for entries in args.entries:
+        for implementation in implementations:
+            metrics = benchmark_registry(
+                implementation, entries, args.queries, args.seed
+            )
+            log_registry_metrics(metrics)
+            results.append(metrics)
+
+    if args.output:
+        args.output.write_text(
+            json.dumps([asdict(metrics) for metrics in results], indent=2),
+            encoding=cs.ENCODING_UTF8,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from codebase_rag.benchmark import CountingIngestor
+from codebase_rag.graph_updater import GraphUpdater
+from codebase_rag.parser_loader import load_parsers
+
+DEFAULT_WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def run_once(repo_path: Path, workers: int) -> tuple[float, CountingIngestor]:
+    parsers, queries = load_parsers()
+    ingestor = CountingIngestor()
+    updater = GraphUpdater(
+        ingestor=ingestor,
+        repo_path=repo_path,
+        parsers=parsers,
+        queries=queries,
+        workers=workers,
+    )
+    start = time.perf_counter()
+    updater.run()
+    return time.perf_counter() - start, ingestor
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Measure indexing wall time for different --workers values."
+    )
+    parser.add_argument("repo_path", type=Path)
+    parser.add_argument(
+        "--workers", type=int, nargs="+", default=list(DEFAULT_WORKER_COUNTS)
+    )
+    args = parser.parse_args()
+    repo_path = args.repo_path.resolve()
+
+    logger.remove()
+    logger.add(sys.stderr, level="SUCCESS", format="{message}")
+    baseline: float | None = None
+    for workers in args.workers:
+        elapsed, ingestor = run_once(repo_path, workers)
+        baseline = baseline or elapsed
+        logger.success(
+            f"workers={workers:<3} time={elapsed:8.2f}s "
+            f"speedup={baseline / elapsed:5.2f}x "
+            f"nodes={ingestor.nodes} relationships={ingestor.relationships}"
+        )
+
+
+if __name__ == "__main__":
+    main()